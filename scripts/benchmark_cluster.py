@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# This script benchmarks the server when scaled out across multiple worker processes on a single machine.
+# Each worker runs in its own process (on its own port), sharing clients through an SQLite-backed message queue and sessions through a
+# shared SQLite database. Clients are distributed across all workers and measure the round-trip throughput of PING commands; afterwards,
+# it is verified that session values set through one worker can be read through another one.
+#
+# Run it from the repository root; the server requirements (including 'gunicorn' and 'gevent-websocket') must be installed.
+#
+# Usage: benchmark_cluster.py [--workers N] [--clients N] [--pings N] [--port N]
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, "./src")
+
+import socketio
+
+from common.py.api.network import PingCommand, PingReply
+from common.py.api.session import (
+    GetSessionValueCommand,
+    GetSessionValueReply,
+    SetSessionValueCommand,
+)
+from common.py.component import ComponentType, ComponentUnit
+from common.py.core.messaging import Channel, Command, CommandReply
+from common.py.core.messaging.codecs import encode_message, decode_message
+from common.py.utils import UnitID
+
+SERVER_ID = UnitID(ComponentType.INFRASTRUCTURE, ComponentUnit.SERVER)
+
+
+def start_workers(count: int, port: int, data_dir: str) -> list[subprocess.Popen]:
+    """
+    Starts all server worker processes.
+    """
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.path.abspath("./src"),
+        "RDS_NETWORK_SERVER_CLIENT_MANAGER": f"sqlite:///{data_dir}/broker.db",
+        "RDS_SESSION_DRIVER": "database",
+        "RDS_STORAGE_DRIVER": "database",
+        "RDS_STORAGE_DATABASE_ENGINE": "sqlite",
+        "RDS_STORAGE_DATABASE_SQLITE_FILE": f"{data_dir}/storage.db",
+        "RDS_DEBUG": "0",
+    }
+
+    return [
+        subprocess.Popen(
+            [
+                "gunicorn",
+                "-k",
+                "geventwebsocket.gunicorn.workers.GeventWebSocketWorker",
+                "--workers",
+                "1",
+                "-b",
+                f"127.0.0.1:{port + index}",
+                "main:app",
+            ],
+            cwd="./src/server",
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for index in range(count)
+    ]
+
+
+def wait_for_workers(count: int, port: int, timeout: float = 60.0) -> None:
+    """
+    Waits until all server worker processes accept connections.
+    """
+    deadline = time.time() + timeout
+
+    for index in range(count):
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port + index), 1.0).close()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise TimeoutError(f"Worker {index} did not start in time")
+
+                time.sleep(0.25)
+
+
+class BenchmarkClient:
+    """
+    A minimal client sending commands to the server and waiting for their replies.
+    """
+
+    def __init__(self, comp_id: UnitID, port: int):
+        self._comp_id = comp_id
+
+        self._client = socketio.Client()
+        self._client.on("*", self._on_message)
+
+        self._replies: dict[str, object] = {}
+        self._condition = threading.Condition()
+
+        self._client.connect(
+            f"http://127.0.0.1:{port}",
+            auth={"component_id": str(comp_id)},
+            wait_timeout=10,
+        )
+
+    def request(self, cmd_type: type[Command], **kwargs) -> object:
+        """
+        Sends a command and waits for its reply.
+        """
+        cmd = cmd_type(
+            origin=self._comp_id,
+            sender=self._comp_id,
+            target=Channel.direct(SERVER_ID),
+            **kwargs,
+        )
+
+        with self._condition:
+            self._client.emit(cmd.name, data=(encode_message(cmd), {}))
+            self._condition.wait_for(lambda: str(cmd.unique) in self._replies, 10.0)
+            return self._replies.pop(str(cmd.unique), None)
+
+    def close(self) -> None:
+        """
+        Disconnects the client.
+        """
+        self._client.disconnect()
+
+    def _on_message(self, msg_name: str, data: str, _) -> None:
+        try:
+            reply = decode_message(msg_name, data)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return  # Ignore any messages not understood by the benchmark
+
+        if not isinstance(reply, CommandReply):
+            return
+
+        with self._condition:
+            self._replies[str(reply.unique)] = reply
+            self._condition.notify_all()
+
+
+def benchmark_pings(args: argparse.Namespace) -> None:
+    """
+    Measures the PING throughput of all clients.
+    """
+    clients = [
+        BenchmarkClient(
+            UnitID(ComponentType.WEB, ComponentUnit.FRONTEND, f"bench-{index}"),
+            args.port + index % args.workers,
+        )
+        for index in range(args.clients)
+    ]
+
+    def _run(client: BenchmarkClient) -> None:
+        for _ in range(args.pings):
+            if not isinstance(client.request(PingCommand), PingReply):
+                print("A PING command has not been replied to", flush=True)
+
+    threads = [threading.Thread(target=_run, args=(client,)) for client in clients]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - start
+
+    for client in clients:
+        client.close()
+
+    total = args.clients * args.pings
+    print(
+        f"{args.workers} worker(s), {args.clients} client(s): {total} round trips in {duration:.2f}s ({total / duration:.1f}/s)"
+    )
+
+
+def verify_shared_sessions(args: argparse.Namespace) -> None:
+    """
+    Verifies that a session value set through the first worker can be read through the last one.
+    """
+    comp_id = UnitID(ComponentType.WEB, ComponentUnit.FRONTEND, "bench-session")
+
+    client = BenchmarkClient(comp_id, args.port)
+    client.request(SetSessionValueCommand, key="benchmark", value=42)
+    client.close()
+
+    client = BenchmarkClient(comp_id, args.port + args.workers - 1)
+    reply = client.request(GetSessionValueCommand, key="benchmark")
+    client.close()
+
+    shared = isinstance(reply, GetSessionValueReply) and reply.value == 42
+    print(f"Sessions shared among workers: {'yes' if shared else 'NO'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks a scaled out server")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--pings", type=int, default=200)
+    parser.add_argument("--port", type=int, default=7100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        workers = start_workers(args.workers, args.port, data_dir)
+
+        try:
+            wait_for_workers(args.workers, args.port)
+
+            benchmark_pings(args)
+            verify_shared_sessions(args)
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.wait()
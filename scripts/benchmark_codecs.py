@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# This script compares the precompiled message codecs with the previous encoding and decoding path, which used dataclasses_json
+# directly: Messages were encoded via ``to_json`` and decoded via a schema built anew for each received message. A few representative
+# messages are measured: a ping, a command starting a project job and an event listing the project summaries of a user. Before
+# measuring, the script verifies that both paths produce the same JSON and decode to equal messages.
+#
+# Run it from the repository root; all components need to be importable (i.e., their requirements must be installed).
+#
+# Usage: benchmark_codecs.py [--iterations N] [--projects N]
+
+import argparse
+import json
+import sys
+import timeit
+import typing
+import uuid
+
+sys.path.insert(0, "./src")
+
+from common.py.api.network import PingCommand
+from common.py.api.project import ProjectsListEvent, StartProjectJobCommand
+from common.py.core.messaging import Channel, Message, MessageTypesCatalog
+from common.py.core.messaging.codecs import encode_message, decode_message
+from common.py.data.entities.project import Project, create_project_summary
+from common.py.data.entities.resource import ResourcesBrokerToken
+from common.py.data.entities.user import UserToken
+from common.py.utils import UnitID
+
+
+def create_messages(projects: int) -> typing.Dict[str, Message]:
+    """
+    Creates the messages to benchmark.
+    """
+    comp_id = UnitID("infra", "server", "default")
+    project_list = [
+        Project(
+            project_id=project_id,
+            user_id="user",
+            creation_time=1.0,
+            resources_path=f"/projects/{project_id}",
+            title=f"Project {project_id}",
+            description="A project description " * 5,
+        )
+        for project_id in range(1, projects + 1)
+    ]
+
+    return {
+        "PingCommand": PingCommand(
+            origin=comp_id, sender=comp_id, target=Channel.local()
+        ),
+        "StartProjectJobCommand": StartProjectJobCommand(
+            origin=comp_id,
+            sender=comp_id,
+            target=Channel.direct("infra/server/default"),
+            project=project_list[0],
+            connector_instance=uuid.uuid4(),
+            user_token=UserToken(user_id="user", user_name="User"),
+            broker_token=ResourcesBrokerToken(
+                broker="webdav", config={"host": "localhost"}
+            ),
+        ),
+        f"ProjectsListEvent ({projects} projects)": ProjectsListEvent(
+            origin=comp_id,
+            sender=comp_id,
+            target=Channel.direct("web/frontend/default"),
+            projects=[create_project_summary(project) for project in project_list],
+        ),
+    }
+
+
+def decode_message_schema(msg_name: str, data: str) -> Message:
+    """
+    Decodes a message the way it was done before the codecs were introduced.
+    """
+    msg_type = MessageTypesCatalog.find_item(msg_name)
+    return typing.cast(Message, msg_type.schema().loads(data))
+
+
+def measure(func: typing.Callable[[], typing.Any], iterations: int) -> float:
+    """
+    Measures the duration (in µs) of a single call.
+    """
+    return timeit.timeit(func, number=iterations) / iterations * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the message codecs")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = create_messages(args.projects)
+
+    for name, msg in messages.items():
+        data = msg.to_json()
+        if json.loads(encode_message(msg)) != json.loads(data):
+            sys.exit(f"{name}: The codec encodes the message differently")
+        if decode_message(msg.name, data) != decode_message_schema(msg.name, data):
+            sys.exit(f"{name}: The codec decodes the message differently")
+
+    print(
+        f"{'Message':<32} {'Size':>8} {'Encode (old)':>14} {'Encode (new)':>14} "
+        f"{'Decode (old)':>14} {'Decode (new)':>14}"
+    )
+    for name, msg in messages.items():
+        data = msg.to_json()
+        timings = [
+            measure(msg.to_json, args.iterations),
+            measure(lambda: encode_message(msg), args.iterations),
+            measure(lambda: decode_message_schema(msg.name, data), args.iterations),
+            measure(lambda: decode_message(msg.name, data), args.iterations),
+        ]
+        print(
+            f"{name:<32} {len(data):>8} "
+            + " ".join(f"{timing:>11.1f} µs" for timing in timings)
+        )
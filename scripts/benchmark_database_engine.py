@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# This script benchmarks the database storage using the engine created from the server settings, based on an SQLite database file.
+# Each worker thread repeatedly emulates a handler context: It creates a storage pool, performs a few typical reads (and occasionally
+# a write) and closes the pool again. The workload is run using two engine setups:
+#   - single connection: All threads share one connection to the database file (the former behavior).
+#   - pooled (WAL): Each pool uses its own connection from a connection pool; the database uses WAL journaling.
+#
+# Run it from the repository root; the server requirements must be installed.
+#
+# Usage: benchmark_database_engine.py [--threads N [N ...]] [--contexts N] [--write-ratio N]
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, "./src")
+
+from sqlalchemy import Engine, StaticPool, create_engine
+
+from common.py.data.entities.project import Project
+from common.py.data.entities.user import User
+from common.py.settings import get_default_settings
+from common.py.utils.config import Configuration
+from server.data.storage.database import DatabaseStoragePool
+from server.settings import get_server_settings
+from server.settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+USERS = 50
+PROJECTS_PER_USER = 10
+
+
+def create_config(filename: str, pool_size: int) -> Configuration:
+    """
+    Creates the server configuration using the given database file.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: filename,
+            DatabaseStorageSettingIDs.POOL_SIZE: pool_size,
+        }
+    )
+    return config
+
+
+def create_single_connection_engine(filename: str) -> Engine:
+    """
+    Creates an engine sharing a single connection among all threads.
+    """
+    return create_engine(
+        f"sqlite:///{filename}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def use_engine(engine: Engine) -> None:
+    """
+    Lets all storage pools use the given engine.
+    """
+    # pylint: disable=protected-access
+    DatabaseStoragePool._engine = engine
+    DatabaseStoragePool._shares_connection = isinstance(engine.pool, StaticPool)
+
+
+def fill_storage() -> None:
+    """
+    Fills the storage with test data.
+    """
+    pool = DatabaseStoragePool()
+    for user_index in range(USERS):
+        user_id = f"user-{user_index}"
+        pool.user_storage.add(User(user_id=user_id, name=user_id))
+
+        for project_index in range(PROJECTS_PER_USER):
+            project_id = user_index * PROJECTS_PER_USER + project_index + 1
+            pool.project_storage.add(
+                Project(
+                    project_id=project_id,
+                    user_id=user_id,
+                    creation_time=time.time(),
+                    resources_path="",
+                    title=f"Project {project_id}",
+                    description="",
+                )
+            )
+    pool.close()
+
+
+def run_workload(threads: int, contexts: int, write_ratio: int) -> float:
+    """
+    Runs the handler workload using the given number of threads.
+
+    Returns:
+        The number of handler contexts processed per second.
+    """
+
+    def _run(worker: int) -> None:
+        for index in range(contexts):
+            user_id = f"user-{(worker + index) % USERS}"
+
+            pool = DatabaseStoragePool()
+            pool.begin()
+
+            pool.user_storage.get(user_id)
+            projects = pool.project_storage.filter_by_user(user_id)
+            project = pool.project_storage.get(projects[0].project_id)
+
+            if write_ratio > 0 and index % write_ratio == 0 and project is not None:
+                project.description = f"Modified by worker {worker}"
+                pool.project_storage.add(project)
+
+            pool.close()
+
+    workers = [threading.Thread(target=_run, args=(i,)) for i in range(threads)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return threads * contexts / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the database engine")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--contexts", type=int, default=100)
+    parser.add_argument("--write-ratio", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        filename = os.path.join(data_dir, "storage.db")
+
+        DatabaseStoragePool.prepare(create_config(filename, max(args.threads)))
+        pooled_engine = DatabaseStoragePool._engine  # pylint: disable=protected-access
+        single_engine = create_single_connection_engine(filename)
+
+        fill_storage()
+
+        print(
+            f"{'Threads':>8} {'Single connection':>20} {'Pooled (WAL)':>14} {'Gain':>7}"
+        )
+
+        for threads in args.threads:
+            use_engine(single_engine)
+            single = run_workload(threads, args.contexts, args.write_ratio)
+
+            use_engine(pooled_engine)
+            pooled = run_workload(threads, args.contexts, args.write_ratio)
+
+            print(
+                f"{threads:>8} {single:>18.1f}/s {pooled:>12.1f}/s {pooled / single:>6.2f}x"
+            )
+
+        single_engine.dispose()
+        pooled_engine.dispose()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# This script benchmarks the persistence of the in-memory storage pool against the SQLite database driver.
+#   - Write overhead: Each handler context creates a storage pool, reads a user's projects, modifies one of them and closes the
+#     pool again. The memory storage is run without persistence, with a journal synced to disk on every write, and with an unsynced
+#     journal; the database storage uses an SQLite database file.
+#   - Recovery: The time to start the storage with all projects; the memory storage is restored once from its journal only and
+#     once from a snapshot. Each recovery is run in a separate process.
+#   - Restore check: Connectors are written by a process using a different hash seed than the one restoring them. Their unit IDs
+#     must still be usable as dictionary keys, and reading them mustn't cause any journal entries.
+#
+# Run it from the repository root; the server requirements must be installed. The script exits with a non-zero status if the
+# restore check fails.
+#
+# Usage: benchmark_memory_persistence.py [--projects N] [--contexts N]
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, "./src")
+
+from common.py.data.entities.connector import Connector
+from common.py.data.entities.project import Project
+from common.py.data.entities.user import User
+from common.py.data.storage import StoragePool
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+from server.settings import (
+    get_server_settings,
+    DatabaseStorageSettingIDs,
+    MemoryStorageSettingIDs,
+)
+
+PROJECTS_PER_USER = 10
+CONNECTORS = 100
+
+
+def create_config(data_dir: str, sync: bool = True) -> Configuration:
+    """
+    Creates the server configuration storing all data in the given folder.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            MemoryStorageSettingIDs.PERSISTENCE_PATH: os.path.join(data_dir, "memory"),
+            MemoryStorageSettingIDs.SNAPSHOT_THRESHOLD: 1000000000,
+            MemoryStorageSettingIDs.SYNC: sync,
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: os.path.join(data_dir, "storage.db"),
+        }
+    )
+    return config
+
+
+def fill_storage(pool_type: type[StoragePool], projects: int) -> None:
+    """
+    Fills the storage with test data, using one pool per user.
+    """
+    for user_index in range(projects // PROJECTS_PER_USER):
+        user_id = f"user-{user_index}"
+
+        pool = pool_type()
+        pool.user_storage.add(User(user_id=user_id, name=user_id))
+
+        for project_index in range(PROJECTS_PER_USER):
+            pool.project_storage.add(
+                Project(
+                    project_id=0,
+                    user_id=user_id,
+                    creation_time=time.time(),
+                    resources_path="",
+                    title=f"Project {project_index}",
+                    description="",
+                )
+            )
+
+        pool.close()
+
+
+def run_workload(pool_type: type[StoragePool], users: int, contexts: int) -> float:
+    """
+    Runs the handler workload.
+
+    Returns:
+        The number of handler contexts processed per second.
+    """
+    start = time.perf_counter()
+
+    for index in range(contexts):
+        user_id = f"user-{index * 7919 % users}"
+
+        pool = pool_type()
+        pool.begin()
+
+        pool.user_storage.get(user_id)
+        projects = pool.project_storage.filter_by_user(user_id)
+        projects[index % len(projects)].description = f"Modified {index}"
+
+        pool.close()
+
+    return contexts / (time.perf_counter() - start)
+
+
+def run_mode(data_dir: str, mode: str, projects: int, contexts: int) -> float:
+    """
+    Fills a storage and runs the workload in a separate process.
+
+    Returns:
+        The number of handler contexts processed per second.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--run",
+            mode,
+            "--data",
+            data_dir,
+            "--projects",
+            str(projects),
+            "--contexts",
+            str(contexts),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def run(data_dir: str, mode: str, projects: int, contexts: int) -> None:
+    """
+    Fills a storage and runs the workload, printing the processed contexts per second.
+    """
+    from server.data.storage.database import DatabaseStoragePool
+    from server.data.storage.memory import MemoryStoragePool
+
+    pool_type = DatabaseStoragePool if mode == "sqlite" else MemoryStoragePool
+    pool_type.prepare(create_config(data_dir, mode != "memory-unsynced"))
+
+    if mode == "memory-volatile":
+        MemoryStoragePool._persistence = None  # pylint: disable=protected-access
+
+    fill_storage(pool_type, projects)
+    print(run_workload(pool_type, projects // PROJECTS_PER_USER, contexts))
+
+
+def measure_recovery(data_dir: str, driver: str) -> float:
+    """
+    Measures the time to start a storage in a separate process.
+    """
+    output = subprocess.run(
+        [sys.executable, __file__, "--recover", "--data", data_dir, "--driver", driver],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def recover(data_dir: str, driver: str) -> None:
+    """
+    Starts a storage and prints the elapsed time; all projects are read to make sure that the storage is usable.
+    """
+    from server.data.storage import StoragePoolsCatalog
+
+    pool_type = StoragePoolsCatalog.find_item(driver)
+
+    start = time.perf_counter()
+    pool_type.prepare(create_config(data_dir))
+    pool = pool_type()
+    pool.project_storage.list()
+    pool.close(False)
+    print(time.perf_counter() - start)
+
+
+def run_with_hash_seed(data_dir: str, step: str, seed: int) -> str:
+    """
+    Runs a step of the restore check in a separate process using the given hash seed.
+    """
+    return subprocess.run(
+        [sys.executable, __file__, "--check", step, "--data", data_dir],
+        env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def write_connectors(data_dir: str) -> None:
+    """
+    Adds connectors to the memory storage; their unit IDs are hashed before being written.
+    """
+    from server.data.storage.memory import MemoryStoragePool
+
+    MemoryStoragePool.prepare(create_config(data_dir))
+
+    pool = MemoryStoragePool()
+    for index in range(CONNECTORS):
+        connector = Connector(
+            connector_id=f"connector-{index}",
+            connector_address=UnitID("connector", f"instance-{index}"),
+            name=f"Connector {index}",
+            description="",
+            category="repository",
+            announce_timestamp=0.0,
+        )
+        hash(connector.connector_address)
+        pool.connector_storage.add(connector)
+    pool.close()
+
+
+def check_connectors(data_dir: str) -> None:
+    """
+    Restores the memory storage and checks the unit IDs of all connectors, printing the number of journal bytes written meanwhile.
+    """
+    from server.data.storage.memory import MemoryStoragePool
+
+    MemoryStoragePool.prepare(create_config(data_dir))
+
+    journal_dir = os.path.join(data_dir, "memory")
+    journal_size = lambda: sum(
+        os.path.getsize(os.path.join(journal_dir, filename))
+        for filename in os.listdir(journal_dir)
+        if filename.startswith("journal-")
+    )
+    written = journal_size()
+
+    addresses = {
+        UnitID("connector", f"instance-{index}"): index for index in range(CONNECTORS)
+    }
+
+    pool = MemoryStoragePool()
+    connectors = pool.connector_storage.list()
+    assert len(connectors) == CONNECTORS
+    for connector in connectors:
+        assert addresses.get(connector.connector_address) is not None
+        assert connector.connector_address in addresses
+        str(connector.connector_address)
+    pool.close()
+
+    print(journal_size() - written)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the memory storage persistence"
+    )
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--contexts", type=int, default=2000)
+    parser.add_argument("--run", type=str, default="", help=argparse.SUPPRESS)
+    parser.add_argument("--recover", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--check", type=str, default="", help=argparse.SUPPRESS)
+    parser.add_argument("--data", type=str, default="", help=argparse.SUPPRESS)
+    parser.add_argument("--driver", type=str, default="", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Database entities are mapped globally, so each storage needs to run in its own process
+    if args.run != "":
+        run(args.data, args.run, args.projects, args.contexts)
+    elif args.recover:
+        recover(args.data, args.driver)
+    elif args.check == "write":
+        write_connectors(args.data)
+    elif args.check == "read":
+        check_connectors(args.data)
+    else:
+        print(f"Write overhead ({args.projects} projects, {args.contexts} contexts):")
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            for mode in (
+                "memory-volatile",
+                "memory-synced",
+                "memory-unsynced",
+                "sqlite",
+            ):
+                mode_dir = os.path.join(data_dir, mode)
+                result = run_mode(mode_dir, mode, args.projects, args.contexts)
+                print(f"  {mode:<24} {result:>10.1f}/s")
+
+            print("Recovery:")
+            # The first restart replays the journal and writes a snapshot, which is used by the second one
+            for name, mode, driver in (
+                ("memory (journal)", "memory-synced", "memory"),
+                ("memory (snapshot)", "memory-synced", "memory"),
+                ("sqlite", "sqlite", "database"),
+            ):
+                mode_dir = os.path.join(data_dir, mode)
+                print(f"  {name:<24} {measure_recovery(mode_dir, driver):>10.3f}s")
+
+            print("Restore check:")
+            check_dir = os.path.join(data_dir, "check")
+            run_with_hash_seed(check_dir, "write", 1)
+            try:
+                written = int(run_with_hash_seed(check_dir, "read", 2).splitlines()[-1])
+            except subprocess.CalledProcessError as exc:
+                print(f"  Restored connectors are unusable:\n{exc.stderr}")
+                sys.exit(1)
+
+            if written != 0:
+                print(f"  Reading restored connectors wrote {written} journal bytes")
+                sys.exit(1)
+
+            print(f"  {CONNECTORS} connectors restored using a different hash seed")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# This script benchmarks lookups in the in-memory storage pool for a growing number of entities. Each user owns a fixed number of
+# projects (with one job each), so the result size of a lookup stays the same while the storage grows. The indexed lookups of the
+# storages are compared against a full scan over all entities (the former behavior).
+#
+# Run it from the repository root; the server requirements must be installed.
+#
+# Usage: benchmark_memory_storage.py [--entities N [N ...]] [--lookups N]
+
+import argparse
+import sys
+import time
+import uuid
+
+sys.path.insert(0, "./src")
+
+from common.py.data.entities.project import Project, ProjectJob
+from server.data.storage.memory import MemoryStoragePool
+
+PROJECTS_PER_USER = 10
+
+
+def fill_storage(pool: MemoryStoragePool, start: int, end: int) -> None:
+    """
+    Adds the projects (and their jobs) with the given index range.
+    """
+    connector_instance = uuid.uuid4()
+
+    for index in range(start, end):
+        user_id = f"user-{index // PROJECTS_PER_USER}"
+        project_id = pool.project_storage.add(
+            Project(
+                project_id=0,
+                user_id=user_id,
+                creation_time=time.time(),
+                resources_path="",
+                title=f"Project {index}",
+                description="",
+            )
+        )
+        pool.project_job_storage.add(
+            ProjectJob(
+                user_id=user_id,
+                project_id=project_id,
+                connector_instance=connector_instance,
+            )
+        )
+
+
+def measure(lookup, lookups: int, users: int) -> float:
+    """
+    Measures the average duration of a lookup (in microseconds).
+    """
+    start = time.perf_counter()
+    for index in range(lookups):
+        lookup(f"user-{index * 7919 % users}")
+    return (time.perf_counter() - start) / lookups * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the in-memory storage")
+    parser.add_argument(
+        "--entities", type=int, nargs="+", default=[100, 1000, 10000, 100000]
+    )
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    pool = MemoryStoragePool()
+
+    def _scan_projects(user_id: str) -> list[Project]:
+        return [proj for proj in pool.project_storage.list() if proj.user_id == user_id]
+
+    def _scan_jobs(user_id: str) -> list[ProjectJob]:
+        return [
+            job for job in pool.project_job_storage.list() if job.user_id == user_id
+        ]
+
+    print(
+        f"{'Entities':>9} {'Projects (scan)':>16} {'Projects (index)':>17} {'Jobs (scan)':>12} {'Jobs (index)':>13}"
+    )
+
+    count = 0
+    for entities in sorted(args.entities):
+        fill_storage(pool, count, entities)
+        count = entities
+        users = max(1, entities // PROJECTS_PER_USER)
+
+        # Full scans get expensive quickly, so fewer lookups are performed for them
+        scan_lookups = max(10, min(args.lookups, 1000000 // entities))
+        results = [
+            measure(_scan_projects, scan_lookups, users),
+            measure(pool.project_storage.filter_by_user, args.lookups, users),
+            measure(_scan_jobs, scan_lookups, users),
+            measure(pool.project_job_storage.filter_by_user, args.lookups, users),
+        ]
+
+        print(
+            f"{entities:>9} "
+            + " ".join(
+                f"{result:>{width - 3}.1f} us"
+                for result, width in zip(results, (16, 17, 12, 13))
+            )
+        )
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# This script measures the construction costs and memory footprint of messages and unit identifiers.
+# Run it from the repository root; all components need to be importable (i.e., their requirements must be installed).
+
+import dataclasses
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, "./src")
+
+from common.py.api.network import PingCommand
+from common.py.core.messaging import Channel
+from common.py.core.messaging.codecs import encode_message, decode_message
+from common.py.utils import UnitID
+
+ITERATIONS = 100_000
+
+
+def report(title: str, seconds: float) -> None:
+    """
+    Prints the per-call duration of a benchmark.
+    """
+    print(f"{title:<40} {seconds / ITERATIONS * 1_000_000:8.3f} µs/call")
+
+
+def create_message(comp_id: UnitID) -> PingCommand:
+    """
+    Creates a typical command message.
+    """
+    return PingCommand(origin=comp_id, sender=comp_id, target=Channel.local())
+
+
+def measure_allocations(comp_id: UnitID, count: int = 10_000) -> None:
+    """
+    Measures the memory allocated per message.
+    """
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    messages = [create_message(comp_id) for _ in range(count)]
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(
+        stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "lineno")
+    )
+    print(f"{'Allocations per message':<40} {allocated / len(messages):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    comp_id = UnitID("infra", "server", "default")
+    msg = create_message(comp_id)
+    encoded = encode_message(msg)
+
+    report(
+        "Message construction",
+        timeit.timeit(lambda: create_message(comp_id), number=ITERATIONS),
+    )
+    report(
+        "Message replacement (rerouting)",
+        timeit.timeit(
+            lambda: dataclasses.replace(msg, sender=comp_id), number=ITERATIONS
+        ),
+    )
+    report(
+        "Message encoding",
+        timeit.timeit(lambda: encode_message(msg), number=ITERATIONS),
+    )
+    report(
+        "Message decoding",
+        timeit.timeit(lambda: decode_message(msg.name, encoded), number=ITERATIONS),
+    )
+    report(
+        "UnitID to string",
+        timeit.timeit(lambda: str(comp_id), number=ITERATIONS),
+    )
+    report(
+        "UnitID from string",
+        timeit.timeit(
+            lambda: UnitID.from_string("infra/server/default"), number=ITERATIONS
+        ),
+    )
+    report(
+        "UnitID hashing",
+        timeit.timeit(lambda: hash(comp_id), number=ITERATIONS),
+    )
+
+    measure_allocations(comp_id)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# This script benchmarks the storage cache on top of the database storage, based on an SQLite database file.
+# Each iteration emulates a handler context: It creates a storage pool, accesses the current user a few times (as done through the
+# handler context), lists all connectors and reads the user's authorization tokens. The workload is run both with and without the
+# caching storage pool; afterward, the cache hit ratio is printed.
+#
+# Run it from the repository root; the server requirements must be installed.
+#
+# Usage: benchmark_storage_cache.py [--contexts N] [--user-accesses N]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, "./src")
+
+from common.py.data.entities.connector import Connector
+from common.py.data.entities.user import User
+from common.py.data.storage import StoragePool
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+from server.data.storage.caching import CachingStoragePool
+from server.data.storage.database import DatabaseStoragePool
+from server.settings import get_server_settings
+from server.settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+USERS = 50
+CONNECTORS = 10
+
+
+def create_config(filename: str) -> Configuration:
+    """
+    Creates the server configuration using the given database file.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: filename,
+        }
+    )
+    return config
+
+
+def fill_storage() -> None:
+    """
+    Fills the storage with test data.
+    """
+    pool = DatabaseStoragePool()
+    for user_index in range(USERS):
+        user_id = f"user-{user_index}"
+        pool.user_storage.add(User(user_id=user_id, name=user_id))
+
+    for connector_index in range(CONNECTORS):
+        connector_id = f"connector-{connector_index}"
+        pool.connector_storage.add(
+            Connector(
+                connector_id=connector_id,
+                connector_address=UnitID("connector", connector_id),
+                name=connector_id,
+                description="",
+                category="repository",
+            )
+        )
+    pool.close()
+
+
+def run_workload(
+    create_pool: typing.Callable[[], StoragePool], contexts: int, user_accesses: int
+) -> float:
+    """
+    Runs the handler workload.
+
+    Returns:
+        The number of handler contexts processed per second.
+    """
+    start = time.perf_counter()
+
+    for index in range(contexts):
+        user_id = f"user-{index % USERS}"
+
+        pool = create_pool()
+        pool.begin()
+
+        for _ in range(user_accesses):
+            pool.user_storage.get(user_id)
+        pool.connector_storage.list()
+        pool.authorization_token_storage.filter_by_user(user_id)
+
+        pool.close()
+
+    return contexts / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the storage cache")
+    parser.add_argument("--contexts", type=int, default=2000)
+    parser.add_argument("--user-accesses", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        config = create_config(os.path.join(data_dir, "storage.db"))
+
+        DatabaseStoragePool.prepare(config)
+        CachingStoragePool.prepare(config)
+
+        fill_storage()
+
+        uncached = run_workload(DatabaseStoragePool, args.contexts, args.user_accesses)
+        cached = run_workload(
+            lambda: CachingStoragePool(DatabaseStoragePool()),
+            args.contexts,
+            args.user_accesses,
+        )
+
+        print(f"{'Uncached':>10} {'Cached':>10} {'Gain':>7}")
+        print(f"{uncached:>8.1f}/s {cached:>8.1f}/s {cached / uncached:>6.2f}x")
+
+        for name, cache in CachingStoragePool.caches().items():
+            total = cache.hits + cache.misses
+            ratio = cache.hits / total if total else 0.0
+            print(f"{name}: {cache.hits} hits, {cache.misses} misses ({ratio:.1%})")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# This script benchmarks concurrent access to the database storage by multiple message handlers.
+# Each worker thread repeatedly emulates a handler context: It creates a storage pool, performs a few typical reads and closes the pool again.
+# The workload is run against two backends, both based on the same SQLite database file:
+#   - sqlite-wal: The database in WAL mode, using a regular connection pool.
+#   - postgresql-like: The same database, but with an artificial latency added to each statement to emulate the network round trips
+#     to a database server.
+# For comparison, each workload is also run with a single global lock around all storage operations (the former behavior).
+#
+# Run it from the repository root; the server requirements must be installed.
+#
+# Usage: benchmark_storage_concurrency.py [--threads N [N ...]] [--contexts N] [--latency MS]
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, "./src")
+
+from sqlalchemy import Engine, QueuePool, create_engine, event
+
+from common.py.data.entities.project import Project
+from common.py.data.entities.user import User
+from server.data.storage.database import DatabaseStoragePool
+from server.data.storage.database.schema import DatabaseSchema
+
+USERS = 50
+PROJECTS_PER_USER = 10
+
+
+class Latency:
+    """
+    The artificial latency (in seconds) added to each statement.
+    """
+
+    value = 0.0
+
+
+def create_benchmark_engine(filename: str, pool_size: int) -> Engine:
+    """
+    Creates an engine for an SQLite database file in WAL mode, adding the current latency to each statement.
+    """
+    engine = create_engine(
+        f"sqlite:///{filename}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=pool_size,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _) -> None:
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+        dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+        dbapi_connection.execute("PRAGMA busy_timeout=5000")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(*_) -> None:
+        if Latency.value > 0.0:
+            time.sleep(Latency.value)
+
+    return engine
+
+
+def prepare_storage(engine: Engine) -> None:
+    """
+    Prepares the database storage pool to use the given engine and fills it with test data.
+    """
+    # pylint: disable=protected-access
+    DatabaseStoragePool._engine = engine
+    DatabaseStoragePool._schema = DatabaseSchema(engine)
+    DatabaseStoragePool._shares_connection = False
+
+    pool = DatabaseStoragePool()
+    for user_index in range(USERS):
+        user_id = f"user-{user_index}"
+        pool.user_storage.add(User(user_id=user_id, name=user_id))
+
+        for project_index in range(PROJECTS_PER_USER):
+            project_id = user_index * PROJECTS_PER_USER + project_index + 1
+            pool.project_storage.add(
+                Project(
+                    project_id=project_id,
+                    user_id=user_id,
+                    creation_time=time.time(),
+                    resources_path="",
+                    title=f"Project {project_id}",
+                    description="",
+                )
+            )
+    pool.close()
+
+
+def run_workload(threads: int, contexts: int, global_lock: bool) -> float:
+    """
+    Runs the handler workload using the given number of threads.
+
+    Returns:
+        The number of handler contexts processed per second.
+    """
+    lock = threading.Lock()
+
+    def _guard():
+        return lock if global_lock else contextlib.nullcontext()
+
+    def _run(worker: int) -> None:
+        for index in range(contexts):
+            user_id = f"user-{(worker + index) % USERS}"
+
+            pool = DatabaseStoragePool()
+            pool.begin()
+
+            with _guard():
+                pool.user_storage.get(user_id)
+            with _guard():
+                projects = pool.project_storage.filter_by_user(user_id)
+            with _guard():
+                pool.project_storage.get(projects[0].project_id)
+
+            pool.close(False)
+
+    workers = [threading.Thread(target=_run, args=(i,)) for i in range(threads)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return threads * contexts / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks concurrent database storage access"
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--contexts", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=2.0)
+    args = parser.parse_args()
+
+    backends = {"sqlite-wal": 0.0, "postgresql-like": args.latency / 1000.0}
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # The schema maps the entity classes globally, so it can only be created once
+        engine = create_benchmark_engine(
+            os.path.join(data_dir, "storage.db"), max(args.threads)
+        )
+        prepare_storage(engine)
+
+        for backend, latency in backends.items():
+            Latency.value = latency
+
+            print(f"Backend: {backend}")
+            print(f"{'Threads':>8} {'Global lock':>14} {'Per session':>14} {'Gain':>7}")
+
+            for threads in args.threads:
+                serialized = run_workload(threads, args.contexts, True)
+                concurrent = run_workload(threads, args.contexts, False)
+                print(
+                    f"{threads:>8} {serialized:>12.1f}/s {concurrent:>12.1f}/s {concurrent / serialized:>6.2f}x"
+                )
+
+        engine.dispose()
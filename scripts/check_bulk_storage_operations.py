@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# This script verifies that the bulk operations of the database storage don't depend on the number of affected entities: Fetching
+# connectors by their IDs, removing a list of authorization tokens, removing obsolete connectors and removing all jobs of a project
+# (including committing the changes) must always issue the same number of SQL statements. An in-memory SQLite database is used.
+#
+# Run it from the repository root; the server requirements must be installed. The script exits with a non-zero status on failure.
+#
+# Usage: check_bulk_storage_operations.py [--entities N [N ...]]
+
+import argparse
+import sys
+import time
+import uuid
+
+sys.path.insert(0, "./src")
+
+from common.py.data.entities.authorization import AuthorizationToken
+from common.py.data.entities.connector import Connector
+from common.py.data.entities.project import Project, ProjectJob
+from common.py.data.entities.user import User
+from common.py.data.storage import StorageCondition
+from common.py.settings import get_default_settings
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+from server.data.storage.database import DatabaseStoragePool
+from server.data.storage.database.engines import QueryCounter
+from server.settings import get_server_settings
+from server.settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+
+def create_config() -> Configuration:
+    """
+    Creates the server configuration using an in-memory database.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: ":memory:",
+        }
+    )
+    return config
+
+
+def fill_storage(prefix: str, entities: int) -> int:
+    """
+    Adds the given number of connectors (all of them obsolete), authorization tokens and jobs of a single project.
+
+    Returns:
+        The ID of the project.
+    """
+    pool = DatabaseStoragePool()
+    pool.user_storage.add(User(user_id=prefix, name=prefix))
+
+    pool.connector_storage.add_many(
+        Connector(
+            connector_id=f"{prefix}-connector-{index}",
+            connector_address=UnitID("connector", f"{prefix}-{index}"),
+            name=f"Connector {index}",
+            description="",
+            category="repository",
+            announce_timestamp=0.0,
+        )
+        for index in range(entities)
+    )
+
+    pool.authorization_token_storage.add_many(
+        AuthorizationToken(
+            user_id=prefix,
+            auth_id=f"auth-{index}",
+            auth_type="",
+            auth_issuer="",
+            auth_bearer="",
+            state=AuthorizationToken.TokenState.VALID,
+            timestamp=time.time(),
+            expiration_timestamp=0.0,
+            refresh_attempts=0,
+            strategy="",
+            token={},
+            data={},
+        )
+        for index in range(entities)
+    )
+
+    project_id = pool.project_storage.add(
+        Project(
+            project_id=0,
+            user_id=prefix,
+            creation_time=time.time(),
+            resources_path="",
+            title=prefix,
+            description="",
+        )
+    )
+    pool.project_job_storage.add_many(
+        ProjectJob(
+            user_id=prefix, project_id=project_id, connector_instance=uuid.uuid4()
+        )
+        for _ in range(entities)
+    )
+
+    pool.close()
+    return project_id
+
+
+def count_queries(prefix: str, entities: int, project_id: int) -> dict[str, int]:
+    """
+    Counts the statements issued by the bulk operations; each operation uses its own pool and commits its changes.
+    """
+    # pylint: disable=protected-access
+    engine = DatabaseStoragePool._engine
+    counts: dict[str, int] = {}
+
+    connector_ids = [f"{prefix}-connector-{index}" for index in range(entities)]
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        connectors = pool.connector_storage.get_many(connector_ids)
+    counts["get connectors"] = counter.count
+    pool.close(False)
+    assert len(connectors) == entities
+
+    pool = DatabaseStoragePool()
+    tokens = pool.authorization_token_storage.filter_by_user(prefix)
+    with QueryCounter(engine) as counter:
+        pool.authorization_token_storage.remove_many(tokens)
+        pool.close()
+    counts["remove tokens"] = counter.count
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        removed = pool.connector_storage.remove_where(
+            StorageCondition(
+                "connector_id", StorageCondition.Operator.IN, connector_ids
+            ),
+            StorageCondition(
+                "announce_timestamp", StorageCondition.Operator.LESS, time.time()
+            ),
+        )
+        pool.close()
+    counts["remove connectors"] = counter.count
+    assert removed == entities
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        removed = pool.project_job_storage.remove_where(
+            StorageCondition("project_id", StorageCondition.Operator.EQUAL, project_id)
+        )
+        pool.close()
+    counts["remove jobs"] = counter.count
+    assert removed == entities
+
+    pool = DatabaseStoragePool()
+    assert pool.connector_storage.get_many(connector_ids) == []
+    assert pool.authorization_token_storage.filter_by_user(prefix) == []
+    assert pool.project_job_storage.filter_by_project(project_id) == []
+    pool.close(False)
+
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Checks the bulk operation query counts"
+    )
+    parser.add_argument("--entities", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    DatabaseStoragePool.prepare(create_config())
+
+    results = {}
+    for entities in args.entities:
+        prefix = f"bulk-{entities}"
+        project_id = fill_storage(prefix, entities)
+        results[entities] = count_queries(prefix, entities, project_id)
+
+    print(
+        f"{'Entities':>8} "
+        + " ".join(f"{name:>17}" for name in results[args.entities[0]])
+    )
+    for entities, counts in results.items():
+        print(f"{entities:>8} " + " ".join(f"{count:>17}" for count in counts.values()))
+
+    failed = [
+        name
+        for name in results[args.entities[0]]
+        if len({counts[name] for counts in results.values()}) != 1
+    ]
+    if failed:
+        print(f"Query counts depend on the number of entities: {', '.join(failed)}")
+        sys.exit(1)
+
+    print("Query counts are constant")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# This script verifies that the hot queries of the database storage use indexes, and that existing databases gain these indexes
+# through the schema migrations. An SQLite database file is first turned into a database of an older schema version (by dropping all
+# secondary indexes and the recorded migrations) and filled with a large fixture. The query plans of the hot queries are then shown
+# before and after the migrations have been applied.
+#
+# Run it from the repository root; the server requirements must be installed. The script exits with a non-zero status on failure.
+#
+# Usage: check_database_indexes.py [--rows N]
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import typing
+import uuid
+
+sys.path.insert(0, "./src")
+
+from sqlalchemy import Engine, Select, insert, select, text
+
+from common.py.settings import get_default_settings
+from common.py.utils.config import Configuration
+from server.data.storage.database import DatabaseStoragePool
+from server.settings import get_server_settings
+from server.settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+USERS = 10000
+BATCH_SIZE = 50000
+
+
+def create_config(filename: str) -> Configuration:
+    """
+    Creates the server configuration using the given database file.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: filename,
+        }
+    )
+    return config
+
+
+def downgrade_database(engine: Engine) -> None:
+    """
+    Turns the database into one of the initial schema version.
+    """
+    # pylint: disable=protected-access
+    metadata = DatabaseStoragePool._schema._metadata
+
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.drop(conn)
+
+        conn.execute(text("DELETE FROM schema_migrations"))
+
+
+def fill_database(engine: Engine, rows: int) -> None:
+    """
+    Fills the database with the given number of projects, project jobs, job history records and authorization tokens.
+    """
+    schema = DatabaseStoragePool._schema  # pylint: disable=protected-access
+
+    def _insert(table: typing.Any, values: typing.Callable[[int], dict]) -> None:
+        with engine.begin() as conn:
+            for start in range(0, rows, BATCH_SIZE):
+                conn.execute(
+                    insert(table),
+                    [values(i) for i in range(start, min(start + BATCH_SIZE, rows))],
+                )
+
+    now = time.time()
+
+    with engine.begin() as conn:
+        conn.execute(
+            insert(schema.users_table),
+            [{"user_id": f"user-{i}", "name": f"User {i}"} for i in range(USERS)],
+        )
+
+    _insert(
+        schema.projects_table,
+        lambda i: {
+            "project_id": i + 1,
+            "user_id": f"user-{i % USERS}",
+            "creation_time": now,
+            "title": f"Project {i}",
+        },
+    )
+    _insert(
+        schema.project_job_history_table,
+        lambda i: {"record": 1, "project_id": i + 1, "timestamp": now},
+    )
+    _insert(
+        schema.project_jobs_table,
+        lambda i: {
+            "user_id": f"user-{i % USERS}",
+            "project_id": i + 1,
+            "connector_instance": uuid.uuid4(),
+            "timestamp": now,
+        },
+    )
+    _insert(
+        schema.authorization_tokens_table,
+        lambda i: {
+            "user_id": f"user-{i % USERS}",
+            "auth_id": f"auth-{i}",
+            "timestamp": now,
+            # Only very few tokens have expired at any time
+            "expiration_timestamp": now + (-60 if i % 10000 == 0 else 3600),
+        },
+    )
+
+
+def hot_queries() -> typing.Dict[str, Select]:
+    """
+    The queries issued most frequently by the database storage.
+    """
+    schema = DatabaseStoragePool._schema  # pylint: disable=protected-access
+    projects = schema.projects_table
+    history = schema.project_job_history_table
+    jobs = schema.project_jobs_table
+    tokens = schema.authorization_tokens_table
+
+    return {
+        "projects by user": select(projects).where(projects.c.user_id == "user-42"),
+        "job history by projects": select(history).where(
+            history.c.project_id.in_([42, 4242, 42424])
+        ),
+        "jobs by user": select(jobs).where(jobs.c.user_id == "user-42"),
+        "jobs by project": select(jobs).where(jobs.c.project_id == 42),
+        "tokens by user": select(tokens).where(tokens.c.user_id == "user-42"),
+        "expired tokens": select(tokens).where(
+            (tokens.c.expiration_timestamp > 0)
+            & (tokens.c.expiration_timestamp <= time.time())
+        ),
+    }
+
+
+def analyze_queries(engine: Engine) -> typing.Dict[str, typing.Tuple[str, float]]:
+    """
+    Gets the query plan and the median execution time of all hot queries.
+    """
+    results: typing.Dict[str, typing.Tuple[str, float]] = {}
+
+    with engine.connect() as conn:
+        for name, query in hot_queries().items():
+            sql = str(
+                query.compile(engine, compile_kwargs={"literal_binds": True})
+            ).replace("\n", " ")
+            plan = "; ".join(
+                row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            )
+
+            durations = []
+            for _ in range(5):
+                start = time.perf_counter()
+                conn.execute(query).fetchall()
+                durations.append(time.perf_counter() - start)
+
+            results[name] = (plan, statistics.median(durations))
+
+    return results
+
+
+def print_results(title: str, results: typing.Dict[str, typing.Tuple[str, float]]):
+    """
+    Prints the query plans and execution times.
+    """
+    print(title)
+    for name, (plan, duration) in results.items():
+        print(f"  {name:<25} {duration * 1000:>9.2f} ms  {plan}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checks the database indexes")
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        DatabaseStoragePool.prepare(create_config(os.path.join(data_dir, "storage.db")))
+        engine = DatabaseStoragePool._engine  # pylint: disable=protected-access
+
+        downgrade_database(engine)
+
+        start = time.perf_counter()
+        fill_database(engine, args.rows)
+        print(f"Filled database with {args.rows} rows per table", end=" ")
+        print(f"in {time.perf_counter() - start:.1f}s")
+
+        print_results("Before migration:", analyze_queries(engine))
+
+        start = time.perf_counter()
+        DatabaseStoragePool._schema.prepare(purge_transient_data=False)
+        print(f"Migrated database in {time.perf_counter() - start:.1f}s")
+
+        results = analyze_queries(engine)
+        print_results("After migration:", results)
+
+        engine.dispose()
+
+    failed = [name for name, (plan, _) in results.items() if "SCAN" in plan]
+    if failed:
+        print(f"Queries not using an index: {', '.join(failed)}")
+        sys.exit(1)
+
+    print("All hot queries use an index")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# This script verifies the bookkeeping of the deadlines heap used by the message meta information list: Entries are added, removed,
+# re-added and expired in random order, and after every step the number of stale heap entries tracked by the list must match the
+# actual number of heap entries whose message has been removed (or re-added) in the meantime. Every timed out entry must also be
+# reported exactly once.
+#
+# Run it from the repository root. The script exits with a non-zero status on failure.
+#
+# Usage: check_message_meta_list.py [--rounds N] [--entries N] [--seed N]
+
+import argparse
+import random
+import sys
+import time
+import uuid
+
+sys.path.insert(0, "./src")
+
+from common.py.core.messaging.meta import (
+    MessageMetaInformation,
+    MessageMetaInformationList,
+)
+
+TIMEOUT = 0.02
+
+
+def count_stale_deadlines(meta_list: MessageMetaInformationList) -> int:
+    """
+    Counts the heap entries that don't belong to a listed entry anymore.
+    """
+    # pylint: disable=protected-access
+    return sum(
+        0 if meta_list._is_live_deadline(deadline) else 1
+        for deadline in meta_list._deadlines
+    )
+
+
+def verify(meta_list: MessageMetaInformationList, step: str) -> bool:
+    """
+    Compares the tracked number of stale heap entries with the actual one.
+    """
+    # pylint: disable=protected-access
+    tracked = meta_list._stale_deadlines
+    actual = count_stale_deadlines(meta_list)
+    if tracked != actual:
+        print(f"{step}: {tracked} stale heap entries tracked, but {actual} found")
+        return False
+    return True
+
+
+def run_round(
+    meta_list: MessageMetaInformationList, entries: int, rnd: random.Random
+) -> bool:
+    """
+    Adds, removes, re-adds and expires entries, verifying the bookkeeping after each step.
+    """
+    meta = MessageMetaInformation(entrypoint=MessageMetaInformation.Entrypoint.LOCAL)
+    traces = [uuid.uuid4() for _ in range(entries)]
+    ok = True
+
+    for trace in traces:
+        meta_list.add(trace, meta, TIMEOUT if rnd.random() < 0.8 else 0.0)
+    ok &= verify(meta_list, "insert")
+
+    removed = rnd.sample(traces, entries // 2)
+    for trace in removed:
+        meta_list.remove(trace)
+    ok &= verify(meta_list, "remove")
+
+    # Re-added entries get a new deadline, so their previous heap entries must stay stale
+    readded = rnd.sample(removed, len(removed) // 2)
+    for trace in readded:
+        meta_list.add(trace, meta, TIMEOUT)
+    ok &= verify(meta_list, "re-add")
+
+    time.sleep(TIMEOUT * 2)
+    timed_out = meta_list.find_timed_out_entries()
+    ok &= verify(meta_list, "expire")
+
+    if len(timed_out) != len(set(timed_out)):
+        print("expire: entries were reported more than once")
+        ok = False
+    if meta_list.find_timed_out_entries():
+        print("expire: entries were reported again")
+        ok = False
+
+    # Timed out entries are removed by the caller; they mustn't leave any stale heap entries behind
+    for trace in timed_out:
+        meta_list.remove(trace)
+    ok &= verify(meta_list, "remove expired")
+
+    for trace in traces:
+        meta_list.remove(trace)
+    ok &= verify(meta_list, "remove all")
+
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Checks the deadlines bookkeeping of the message meta information list"
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    meta_list = MessageMetaInformationList()
+
+    failed = 0
+    for _ in range(args.rounds):
+        if not run_round(meta_list, args.entries, rnd):
+            failed += 1
+
+    # pylint: disable=protected-access
+    print(
+        f"{args.rounds} rounds, {failed} failed; "
+        f"{len(meta_list._deadlines)} heap entries left, {meta_list._stale_deadlines} tracked as stale"
+    )
+    sys.exit(1 if failed > 0 else 0)
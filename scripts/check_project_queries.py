@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# This script verifies that loading projects from the database storage doesn't suffer from N+1 queries: The number of SQL statements
+# issued when listing the projects of a user (including all of their features and logbooks), listing their summaries and retrieving a
+# single project must not depend on the number of projects. An in-memory SQLite database is used.
+#
+# Run it from the repository root; the server requirements must be installed. The script exits with a non-zero status on failure.
+#
+# Usage: check_project_queries.py [--projects N [N ...]]
+
+import argparse
+import sys
+import time
+import uuid
+
+sys.path.insert(0, "./src")
+
+from common.py.data.entities.project import Project
+from common.py.data.entities.project.logbook import ProjectJobHistoryRecord
+from common.py.data.entities.user import User
+from common.py.settings import get_default_settings
+from common.py.utils.config import Configuration
+from server.data.storage.database import DatabaseStoragePool
+from server.data.storage.database.engines import QueryCounter
+from server.settings import get_server_settings
+from server.settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+JOBS_PER_PROJECT = 3
+
+
+def create_config() -> Configuration:
+    """
+    Creates the server configuration using an in-memory database.
+    """
+    config = Configuration()
+    config.add_defaults(get_default_settings())
+    config.add_defaults(get_server_settings())
+    config.add_defaults(
+        {
+            DatabaseStorageSettingIDs.ENGINE: "sqlite",
+            DatabaseStorageSettingIDs.SQLite.FILE: ":memory:",
+        }
+    )
+    return config
+
+
+def fill_storage(user_id: str, projects: int) -> None:
+    """
+    Adds a user owning the given number of projects, each with a few job history records.
+    """
+    pool = DatabaseStoragePool()
+    pool.user_storage.add(User(user_id=user_id, name=user_id))
+
+    connector_instance = uuid.uuid4()
+
+    for index in range(projects):
+        project = Project(
+            project_id=0,
+            user_id=user_id,
+            creation_time=time.time(),
+            resources_path="",
+            title=f"Project {index}",
+            description="",
+        )
+        project.features.project_metadata.metadata = [{"title": f"Project {index}"}]
+        project.logbook.job_history = [
+            ProjectJobHistoryRecord(
+                record=record + 1, connector_instance=connector_instance
+            )
+            for record in range(JOBS_PER_PROJECT)
+        ]
+        pool.project_storage.add(project)
+
+    pool.close()
+
+
+def count_queries(user_id: str) -> dict[str, int]:
+    """
+    Counts the statements issued by the typical project accesses of a user.
+    """
+    # pylint: disable=protected-access
+    engine = DatabaseStoragePool._engine
+    counts: dict[str, int] = {}
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        for project in pool.project_storage.filter_by_user(user_id):
+            # Touch everything that is sent to the client
+            _ = project.features.project_metadata.metadata
+            _ = project.features.resources_metadata.metadata
+            _ = project.features.dmp.plan
+            _ = [record.success for record in project.logbook.job_history]
+    counts["list projects"] = counter.count
+    pool.close(False)
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        pool.project_storage.filter_summaries_by_user(user_id)
+    counts["list summaries"] = counter.count
+    pool.close(False)
+
+    pool = DatabaseStoragePool()
+    project_id = pool.project_storage.filter_by_user(user_id)[0].project_id
+    pool.close(False)
+
+    pool = DatabaseStoragePool()
+    with QueryCounter(engine) as counter:
+        project = pool.project_storage.get(project_id)
+        _ = project.features.project_metadata.metadata
+        _ = project.logbook.job_history
+    counts["get project"] = counter.count
+    pool.close(False)
+
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Checks the project query counts")
+    parser.add_argument("--projects", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    DatabaseStoragePool.prepare(create_config())
+
+    results = {}
+    for projects in args.projects:
+        user_id = f"user-{projects}"
+        fill_storage(user_id, projects)
+        results[projects] = count_queries(user_id)
+
+    print(
+        f"{'Projects':>8} "
+        + " ".join(f"{name:>15}" for name in results[args.projects[0]])
+    )
+    for projects, counts in results.items():
+        print(f"{projects:>8} " + " ".join(f"{count:>15}" for count in counts.values()))
+
+    failed = [
+        name
+        for name in results[args.projects[0]]
+        if len({counts[name] for counts in results.values()}) != 1
+    ]
+    if failed:
+        print(f"Query counts depend on the number of projects: {', '.join(failed)}")
+        sys.exit(1)
+
+    print("Query counts are constant")
@@ -1,5 +1,4 @@
 from .component_events import (
     ComponentInformation,
     ComponentInformationEvent,
-    ComponentProcessEvent,
 )
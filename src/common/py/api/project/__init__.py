@@ -3,6 +3,8 @@ from .project_commands import (
     CreateProjectReply,
     DeleteProjectCommand,
     DeleteProjectReply,
+    GetProjectDetailsCommand,
+    GetProjectDetailsReply,
     ListProjectsCommand,
     ListProjectsReply,
     MarkProjectLogbookSeenCommand,
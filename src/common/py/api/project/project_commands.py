@@ -14,6 +14,7 @@ from ...core.messaging.composers import (
 from ...data.entities.project import (
     Project,
     ProjectID,
+    ProjectSummary,
 )
 from ...data.entities.project.logbook import RecordID, ProjectLogbookType
 
@@ -23,6 +24,8 @@ class ListProjectsCommand(Command):
     """
     Command to fetch all projects of the current user.
 
+    Only project summaries are sent; the details of a project can be fetched using ``GetProjectDetailsCommand``.
+
     Notes:
         Requires a ``ListProjectsReply`` reply.
     """
@@ -43,17 +46,17 @@ class ListProjectsReply(CommandReply):
     Reply to ``ListProjectsCommand``.
 
     Args:
-        projects: List of all projects.
+        projects: List of all project summaries.
     """
 
-    projects: typing.List[Project] = dataclasses.field(default_factory=list)
+    projects: typing.List[ProjectSummary] = dataclasses.field(default_factory=list)
 
     @staticmethod
     def build(
         message_builder: MessageBuilder,
         cmd: ListProjectsCommand,
         *,
-        projects: typing.List[Project],
+        projects: typing.List[ProjectSummary],
         success: bool = True,
         message: str = "",
     ) -> CommandReplyComposer:
@@ -65,6 +68,76 @@ class ListProjectsReply(CommandReply):
         )
 
 
+@Message.define("command/project/details")
+class GetProjectDetailsCommand(Command):
+    """
+    Command to fetch the details of a project of the current user, which aren't part of its summary.
+
+    Args:
+        project_id: The ID of the project.
+
+    Notes:
+        Requires a ``GetProjectDetailsReply`` reply.
+    """
+
+    project_id: ProjectID
+
+    @staticmethod
+    def build(
+        message_builder: MessageBuilder,
+        *,
+        project_id: ProjectID,
+        chain: Message | None = None,
+    ) -> CommandComposer:
+        """
+        Helper function to easily build this message.
+        """
+        return message_builder.build_command(
+            GetProjectDetailsCommand, chain, project_id=project_id
+        )
+
+
+@Message.define("command/project/details/reply")
+class GetProjectDetailsReply(CommandReply):
+    """
+    Reply to ``GetProjectDetailsCommand``.
+
+    Args:
+        project_id: The ID of the project.
+        features: All project features.
+        logbook: The project's logbook.
+    """
+
+    project_id: ProjectID
+
+    features: Project.Features = dataclasses.field(default_factory=Project.Features)
+    logbook: Project.Logbook = dataclasses.field(default_factory=Project.Logbook)
+
+    @staticmethod
+    def build(
+        message_builder: MessageBuilder,
+        cmd: GetProjectDetailsCommand,
+        *,
+        project_id: ProjectID,
+        features: Project.Features | None = None,
+        logbook: Project.Logbook | None = None,
+        success: bool = True,
+        message: str = "",
+    ) -> CommandReplyComposer:
+        """
+        Helper function to easily build this message.
+        """
+        return message_builder.build_command_reply(
+            GetProjectDetailsReply,
+            cmd,
+            success,
+            message,
+            project_id=project_id,
+            features=features or Project.Features(),
+            logbook=logbook or Project.Logbook(),
+        )
+
+
 @Message.define("command/project/create")
 class CreateProjectCommand(Command):
     """
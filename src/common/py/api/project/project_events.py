@@ -9,7 +9,7 @@ from ...core.messaging.composers import (
     MessageBuilder,
     EventComposer,
 )
-from ...data.entities.project import Project, ProjectID
+from ...data.entities.project import Project, ProjectID, ProjectSummary
 
 
 @Message.define("event/project/list")
@@ -18,16 +18,16 @@ class ProjectsListEvent(Event):
     Emitted whenever the user's projects list has been updated.
 
     Args:
-        projects: List of all projects.
+        projects: List of all project summaries.
     """
 
-    projects: typing.List[Project] = dataclasses.field(default_factory=list)
+    projects: typing.List[ProjectSummary] = dataclasses.field(default_factory=list)
 
     @staticmethod
     def build(
         message_builder: MessageBuilder,
         *,
-        projects: typing.List[Project],
+        projects: typing.List[ProjectSummary],
         chain: Message | None = None
     ) -> EventComposer:
         """
@@ -1,7 +1,7 @@
 import dataclasses
 import typing
 
-from ...core.messaging import Command, CommandReply, Message
+from ...core.messaging import Command, CommandReply, Message, PayloadStream
 from ...core.messaging.composers import (
     CommandComposer,
     CommandReplyComposer,
@@ -122,7 +122,7 @@ class ExportProjectReply(CommandReply):
         return self.payload.get("data") if "data" in self.payload else None
 
     @data.setter
-    def data(self, data: bytes) -> None:
+    def data(self, data: bytes | PayloadStream) -> None:
         """
         Sets the data of the export result.
 
@@ -137,7 +137,7 @@ class ExportProjectReply(CommandReply):
         cmd: ExportProjectCommand,
         *,
         mimetype: str,
-        data: bytes,
+        data: bytes | PayloadStream,
         success: bool = True,
         message: str = "",
     ) -> CommandReplyComposer:
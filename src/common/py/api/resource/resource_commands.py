@@ -6,6 +6,7 @@ from ...core.messaging import (
     Command,
     CommandReply,
     Message,
+    PayloadStream,
 )
 from ...core.messaging.composers import (
     MessageBuilder,
@@ -198,7 +199,7 @@ class GetResourceReply(CommandReply):
         return self.payload.get("data") if "data" in self.payload else None
 
     @data.setter
-    def data(self, data: bytes) -> None:
+    def data(self, data: bytes | PayloadStream) -> None:
         """
         Sets the data of the resource.
 
@@ -213,7 +214,7 @@ class GetResourceReply(CommandReply):
         cmd: GetResourceCommand,
         *,
         resource: Resource,
-        data: bytes,
+        data: bytes | PayloadStream,
         success: bool = True,
         message: str = "",
     ) -> CommandReplyComposer:
@@ -8,6 +8,7 @@ from ..utils.config import Configuration
 
 if typing.TYPE_CHECKING:
     from ..core import Core
+    from ..core.messaging.executors import HandlerLane
     from ..services import ServiceContextType, Service
 
 
@@ -112,6 +113,7 @@ class BackendComponent:
         name: str,
         *,
         context_type: type["ServiceContextType"] | None = None,
+        lane: "HandlerLane | None" = None,
     ) -> "Service":
         """
         Creates and registers a new service.
@@ -120,20 +122,28 @@ class BackendComponent:
             name: The name of the service.
             context_type: Can be used to override the default ``ServiceContext`` type. All message handlers
                 associated with the new service will then receive instances of this type for their service context.
+            lane: The default lane (executor) asynchronous message handlers of the new service are run in; defaults to the interactive lane.
 
         Returns:
             The newly created service.
         """
+        from ..core.messaging.executors import HandlerLane
         from ..services import Service, ServiceContext
 
         if context_type is None:
             context_type = ServiceContext
 
+        if lane is None:
+            lane = HandlerLane.INTERACTIVE
+
         svc = Service(
             self._data.comp_id,
             name,
             message_bus=self._core.message_bus,
+            scheduler=self._core.scheduler,
+            config=self._data.config,
             context_type=context_type,
+            lane=lane,
         )
         self._core.register_service(svc)
         return svc
@@ -187,6 +197,44 @@ class BackendComponent:
             ),
         )
 
+        # All metrics are exported in the Prometheus text format
+        self._core.flask.add_url_rule("/metrics", view_func=self._render_metrics)
+
+        # Statistics of the handler executors (per lane and handler) help to size their pools
+        self._core.flask.add_url_rule(
+            "/executors",
+            endpoint="executors",
+            view_func=lambda: json.dumps(
+                {
+                    lane.name.lower(): {
+                        handler: {
+                            "queued": stats.queued,
+                            "running": stats.running,
+                            "completed": stats.completed,
+                            "rejected": stats.rejected,
+                            "average_wait_time": stats.average_wait_time,
+                            "max_wait_time": stats.max_wait_time,
+                            "average_run_time": stats.average_run_time,
+                            "max_run_time": stats.max_run_time,
+                        }
+                        for handler, stats in handlers.items()
+                    }
+                    for lane, handlers in self._core.message_bus.executors.statistics().items()
+                }
+            ),
+        )
+
+    @staticmethod
+    def _render_metrics() -> typing.Any:
+        import flask
+
+        from ..core.metrics import MetricsRegistry
+
+        return flask.Response(
+            MetricsRegistry().render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     @staticmethod
     def instance() -> "BackendComponent":
         """
@@ -3,6 +3,7 @@ import flask
 from .logging import info, debug, set_level
 from .messaging import MessageBus
 from .messaging.handlers import MessageService
+from .scheduling import Scheduler
 from ..component import BackendComponentData
 
 
@@ -36,6 +37,9 @@ class Core:
         debug("Creating Flask server", scope="core", module_name=module_name)
         self._flask = self._create_flask(module_name)
         
+        debug("Creating scheduler", scope="core")
+        self._scheduler = Scheduler()
+
         debug("Creating message bus", scope="core")
         self._message_bus = self._create_message_bus()
     
@@ -50,7 +54,7 @@ class Core:
         return flsk
     
     def _create_message_bus(self) -> MessageBus:
-        return MessageBus(self._comp_data)
+        return MessageBus(self._comp_data, self._scheduler)
     
     def _enable_debug_mode(self) -> None:
         import logging as log
@@ -88,6 +92,7 @@ class Core:
         """
         Starts periodic background tasks.
         """
+        self._scheduler.run()
         self._message_bus.run()
         
     @property
@@ -97,6 +102,13 @@ class Core:
         """
         return self._message_bus
     
+    @property
+    def scheduler(self) -> Scheduler:
+        """
+        The global ``Scheduler`` instance.
+        """
+        return self._scheduler
+    
     @property
     def flask(self) -> flask.Flask:
         """
@@ -10,62 +10,80 @@ _logger = typing.cast(Logger, logging.getLogger("rds_logger"))
 logging.setLoggerClass(logging.Logger)
 
 
-def set_level(level: int) -> None:
+def set_level(level: int, scope: str | None = None) -> None:
     """
     Sets the global logging level.
 
     Args:
         level: The logging level.
+        scope: If set, the level only applies to entries of this scope.
     """
-    _logger.setLevel(level)
+    _logger.setLevel(level, scope)
 
 
-def debug(msg: str, *, scope: str | None = None, **kwargs):
+def is_enabled(level: int, scope: str | None = None) -> bool:
+    """
+    Checks whether entries of the given level (and scope) will be logged.
+
+    This can be used to skip costly preparations of log entries that would be discarded anyway.
+
+    Args:
+        level: The logging level.
+        scope: The scope of the entry.
+    """
+    return _logger.is_enabled(level, scope)
+
+
+def debug(msg: str, *args, scope: str | None = None, **kwargs):
     """
     Logs a debugging message.
 
     Args:
         msg: The text to log.
+        *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
         scope: The scope of the entry.
         **kwargs: Any additional parameters.
     """
-    _logger.debug(msg, scope=scope, **kwargs)
+    _logger.debug(msg, *args, scope=scope, **kwargs)
 
 
-def info(msg: str, *, scope: str | None = None, **kwargs):
+def info(msg: str, *args, scope: str | None = None, **kwargs):
     """
     Logs an information message.
 
     Args:
         msg: The text to log.
+        *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
         scope: The scope of the entry.
         **kwargs: Any additional parameters.
     """
-    _logger.info(msg, scope=scope, **kwargs)
+    _logger.info(msg, *args, scope=scope, **kwargs)
 
 
-def warning(msg: str, *, scope: str | None = None, **kwargs):
+def warning(msg: str, *args, scope: str | None = None, **kwargs):
     """
     Logs a warning message.
 
     Args:
         msg: The text to log.
+        *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
         scope: The scope of the entry.
         **kwargs: Any additional parameters.
     """
-    _logger.warning(msg, scope=scope, **kwargs)
+    _logger.warning(msg, *args, scope=scope, **kwargs)
 
 
-def error(msg: str, *, scope: str | None = None, **kwargs):
+def error(msg: str, *args, scope: str | None = None, **kwargs):
     """
     Logs an error message.
 
     Args:
     msg: The text to log.
+    *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
     scope: The scope of the entry.
     **kwargs: Any additional parameters.
     """
-    _logger.error(msg, scope=scope, **kwargs)
+    _logger.error(msg, *args, scope=scope, **kwargs)
 
 
 def default_logger() -> Logger:
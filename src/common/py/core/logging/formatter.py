@@ -41,7 +41,7 @@ class Formatter(logging.Formatter):
             self._color_wrap(record.levelname, self._get_level_color(record.levelno), bold=True),
             "|" + self._color_wrap(scope, self._colors["scope"]) if scope != "" else "",
             "] ",
-            record.msg,
+            record.getMessage(),
             f" ({'; '.join(params)})" if len(params) > 0 else "",
         ]
         return "".join(tokens)
@@ -8,6 +8,9 @@ class Logger(logging.Logger):
 
     This logger and its corresponding ``Formatter`` display the log level, scope, as well as a parameters listing
     in a color-rich format for easy readability.
+
+    Messages can be formatted lazily by passing *%*-style arguments alongside the message text (e.g., ``logger.debug("Sending: %s", msg)``);
+    these are only converted to strings if the entry is actually logged. Besides the global level, levels can also be set per scope.
     """
 
     def __init__(self, name: str, level: int = logging.INFO):
@@ -18,79 +21,112 @@ class Logger(logging.Logger):
         """
         super().__init__(name, level)
 
+        self._scope_levels: typing.Dict[str, int] = {}
+
         self.addHandler(self._create_default_handler())
 
     def _create_default_handler(self) -> logging.Handler:
         import sys
         from .formatter import Formatter
 
+        # Filtering by level is done by the logger itself (taking scopes into account)
         handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(self.level)
+        handler.setLevel(logging.NOTSET)
         handler.setFormatter(Formatter())
         return handler
 
-    def setLevel(self, level: int) -> None:
+    def setLevel(self, level: int, scope: str | None = None) -> None:
         """
         Sets the logging level of this logger.
 
         Args:
             level: The maximum level for entries to be logged.
+            scope: If set, the level only applies to entries of this scope.
         """
-        super().setLevel(level)
-        for handler in self.handlers:
-            handler.setLevel(level)
+        if scope is not None:
+            self._scope_levels = self._scope_levels | {scope.lower(): level}
+        else:
+            super().setLevel(level)
+
+    def is_enabled(self, level: int, scope: str | None = None) -> bool:
+        """
+        Checks whether entries of the given level (and scope) will be logged.
+
+        Args:
+            level: The logging level.
+            scope: The scope of the entry.
+        """
+        if (
+            scope is not None
+            and (scope_level := self._scope_levels.get(scope.lower(), None)) is not None
+        ):
+            return level >= scope_level
+
+        return self.isEnabledFor(level)
 
     # pylint: disable=arguments-differ
-    def debug(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def debug(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs a debugging message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        super().debug(msg, extra=self._pack_extra_params(scope, **kwargs))
-        self._flush()
+        self._log_entry(logging.DEBUG, msg, args, scope, kwargs)
 
     # pylint: disable=arguments-differ
-    def info(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def info(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs an information message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        super().info(msg, extra=self._pack_extra_params(scope, **kwargs))
-        self._flush()
+        self._log_entry(logging.INFO, msg, args, scope, kwargs)
 
     # pylint: disable=arguments-differ
-    def warning(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def warning(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs a warning message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        super().warning(msg, extra=self._pack_extra_params(scope, **kwargs))
-        self._flush()
+        self._log_entry(logging.WARNING, msg, args, scope, kwargs)
 
     # pylint: disable=arguments-differ
-    def error(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def error(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs an error message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        super().error(msg, extra=self._pack_extra_params(scope, **kwargs))
-        self._flush()
+        self._log_entry(logging.ERROR, msg, args, scope, kwargs)
+
+    def _log_entry(
+        self,
+        level: int,
+        msg: str,
+        args: typing.Tuple[typing.Any, ...],
+        scope: str | None,
+        kwargs: typing.Dict[str, typing.Any],
+    ) -> None:
+        if self.is_enabled(level, scope):
+            self._log(level, msg, args, extra=self._pack_extra_params(scope, **kwargs))
+            self._flush()
 
     def _pack_extra_params(
         self, scope: str | None, **kwargs
@@ -6,7 +6,7 @@ class LoggerProtocol(Protocol):
     """
     Defines the general interface for our extended ``Logger``.
     """
-    def debug(self, msg: str, *, scope: str | None = None, **kwargs) -> None: ...
-    def info(self, msg: str, *, scope: str | None = None, **kwargs) -> None: ...
-    def warning(self, msg: str, *, scope: str | None = None, **kwargs) -> None: ...
-    def error(self, msg: str, *, scope: str | None = None, **kwargs) -> None: ...
+    def debug(self, msg: str, *args, scope: str | None = None, **kwargs) -> None: ...
+    def info(self, msg: str, *args, scope: str | None = None, **kwargs) -> None: ...
+    def warning(self, msg: str, *args, scope: str | None = None, **kwargs) -> None: ...
+    def error(self, msg: str, *args, scope: str | None = None, **kwargs) -> None: ...
@@ -48,46 +48,50 @@ class LoggerProxy:
         """
         self._auto_params = {}
 
-    def debug(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def debug(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs a debugging message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        self._logger.debug(msg, scope=scope, **(kwargs | self._auto_params))
+        self._logger.debug(msg, *args, scope=scope, **(kwargs | self._auto_params))
 
-    def info(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def info(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs an information message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        self._logger.info(msg, scope=scope, **(kwargs | self._auto_params))
+        self._logger.info(msg, *args, scope=scope, **(kwargs | self._auto_params))
 
-    def warning(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def warning(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs a warning message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        self._logger.warning(msg, scope=scope, **(kwargs | self._auto_params))
+        self._logger.warning(msg, *args, scope=scope, **(kwargs | self._auto_params))
 
-    def error(self, msg: str, *, scope: str | None = None, **kwargs) -> None:
+    def error(self, msg: str, *args, scope: str | None = None, **kwargs) -> None:
         """
         Logs an error message.
 
         Args:
             msg: The text to log.
+            *args: Arguments lazily merged into ``msg`` using *%*-style formatting.
             scope: The scope of the entry.
             **kwargs: Any additional parameters.
         """
-        self._logger.error(msg, scope=scope, **(kwargs | self._auto_params))
+        self._logger.error(msg, *args, scope=scope, **(kwargs | self._auto_params))
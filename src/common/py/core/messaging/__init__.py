@@ -1,4 +1,5 @@
 from .channel import Channel
+from .payload_stream import PayloadStream
 from .message_payload import MessagePayload, Payload, PayloadData
 from .message import MessageName, Trace, Message, MessageType
 from .command import Command, CommandType
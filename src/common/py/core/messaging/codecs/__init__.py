@@ -0,0 +1,4 @@
+from .dataclass_codec import DataclassCodec
+from .message_codec import MessageCodec
+from .message_codecs_catalog import MessageCodecsCatalog
+from .message_codec_utils import encode_message, decode_message
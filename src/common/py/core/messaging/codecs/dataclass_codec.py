@@ -0,0 +1,259 @@
+import dataclasses
+import enum
+import threading
+import types
+import typing
+import uuid
+
+from ....utils import UnitID
+
+ValueEncoder = typing.Callable[[typing.Any], typing.Any]
+ValueDecoder = typing.Callable[[typing.Any], typing.Any]
+
+
+class DataclassCodec:
+    """
+    Converts dataclass instances from and to plain (JSON-compatible) dictionaries.
+
+    Instead of inspecting a dataclass each time an instance is converted (as *dataclasses_json* does), an encoder and decoder
+    is generated once per field from the dataclass' type hints. The produced data is identical to the one of ``to_dict``/``from_dict``
+    for all types used by messages and entities (primitives, UUIDs, enums, lists, dictionaries, unions and nested dataclasses).
+
+    Codecs are created and cached using ``DataclassCodec.for_type``.
+
+    Raises:
+        TypeError: If the dataclass uses features not supported by the codec (like custom *dataclasses_json* field configurations).
+    """
+
+    _codecs: typing.Dict[type, "DataclassCodec"] = {}
+    _pending_codecs: typing.Dict[type, "DataclassCodec"] = {}
+    _lock = threading.RLock()
+
+    def __init__(self, dataclass_type: type):
+        """
+        Args:
+            dataclass_type: The dataclass type.
+        """
+        if getattr(dataclass_type, "dataclass_json_config", None) is not None:
+            raise TypeError(
+                f"The dataclass {dataclass_type} uses a custom dataclasses_json configuration"
+            )
+
+        self._dataclass_type = dataclass_type
+
+        self._encoders: typing.List[typing.Tuple[str, ValueEncoder]] = []
+        self._decoders: typing.List[typing.Tuple[str, ValueDecoder]] = []
+
+    @staticmethod
+    def for_type(dataclass_type: type) -> "DataclassCodec":
+        """
+        Gets the (cached) codec for a dataclass type.
+
+        Args:
+            dataclass_type: The dataclass type.
+
+        Returns:
+            The codec.
+
+        Raises:
+            TypeError: If no codec can be generated for the dataclass.
+        """
+        if (codec := DataclassCodec._codecs.get(dataclass_type, None)) is None:
+            with DataclassCodec._lock:
+                if (codec := DataclassCodec._codecs.get(dataclass_type, None)) is None:
+                    # Nested dataclasses referring to a codec that is currently being compiled get the pending instance
+                    if (
+                        codec := DataclassCodec._pending_codecs.get(
+                            dataclass_type, None
+                        )
+                    ) is not None:
+                        return codec
+
+                    codec = DataclassCodec(dataclass_type)
+                    DataclassCodec._pending_codecs[dataclass_type] = codec
+                    try:
+                        codec._compile()
+                        DataclassCodec._codecs[dataclass_type] = codec
+                    finally:
+                        DataclassCodec._pending_codecs.pop(dataclass_type)
+
+        return codec
+
+    def _compile(self) -> None:
+        hints = typing.get_type_hints(self._dataclass_type)
+        encoders: typing.List[typing.Tuple[str, ValueEncoder]] = []
+        decoders: typing.List[typing.Tuple[str, ValueDecoder]] = []
+
+        for field in dataclasses.fields(self._dataclass_type):
+            if "dataclasses_json" in field.metadata:
+                raise TypeError(
+                    f"The field {field.name} of {self._dataclass_type} uses a custom dataclasses_json configuration"
+                )
+
+            encoders.append((field.name, _create_encoder(hints[field.name])))
+            if field.init:
+                decoders.append((field.name, _create_decoder(hints[field.name])))
+
+        self._decoders = decoders
+        self._encoders = encoders
+
+    def encode(self, obj: typing.Any) -> typing.Dict[str, typing.Any]:
+        """
+        Encodes a dataclass instance into a dictionary.
+
+        Args:
+            obj: The dataclass instance.
+
+        Returns:
+            The encoded data.
+        """
+        return {name: encoder(getattr(obj, name)) for name, encoder in self._encoders}
+
+    def decode(self, data: typing.Dict[str, typing.Any]) -> typing.Any:
+        """
+        Decodes a dataclass instance from a dictionary.
+
+        Missing values are filled using the field defaults; unknown values are ignored.
+
+        Args:
+            data: The encoded data.
+
+        Returns:
+            The new dataclass instance.
+
+        Raises:
+            TypeError: If a required value is missing.
+        """
+        return self._dataclass_type(
+            **{
+                name: decoder(data[name])
+                for name, decoder in self._decoders
+                if name in data
+            }
+        )
+
+    @property
+    def dataclass_type(self) -> type:
+        """
+        The dataclass type.
+        """
+        return self._dataclass_type
+
+
+def _encode_any(value: typing.Any) -> typing.Any:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        # Enums derived from int or str need to be unpacked as well
+        return value.value if isinstance(value, enum.Enum) else value
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _encode_any(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode_any(val) for val in value]
+    if dataclasses.is_dataclass(value):
+        return _encode_dataclass(value)
+
+    return value
+
+
+def _encode_dataclass(value: typing.Any) -> typing.Any:
+    # The actual type might be a subclass of the declared one
+    try:
+        return DataclassCodec.for_type(type(value)).encode(value)
+    except TypeError:
+        return value.to_dict(encode_json=False)
+
+
+def _create_encoder(tp: typing.Any) -> ValueEncoder:
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if tp in (str, bool, int, float):
+        return lambda value: value
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return lambda value: value.value if isinstance(value, enum.Enum) else value
+    if tp is uuid.UUID:
+        return lambda value: str(value) if value is not None else None
+    if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+        DataclassCodec.for_type(tp)  # Make sure that the declared type is supported
+        return lambda value: _encode_dataclass(value) if value is not None else None
+    if origin in (list, tuple, set, frozenset) and len(args) == 1:
+        item_encoder = _create_encoder(args[0])
+        return lambda value: (
+            [item_encoder(item) for item in value] if value is not None else None
+        )
+    if origin is dict and len(args) == 2 and args[1] is not typing.Any:
+        value_encoder = _create_encoder(args[1])
+        return lambda value: (
+            {key: value_encoder(val) for key, val in value.items()}
+            if value is not None
+            else None
+        )
+
+    return _encode_any
+
+
+def _create_decoder(tp: typing.Any) -> ValueDecoder:
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if tp is float:
+        return lambda value: float(value) if isinstance(value, int) else value
+    if tp in (str, bool, int) or tp is typing.Any or tp is Ellipsis:
+        return lambda value: value
+    if isinstance(tp, type) and issubclass(tp, enum.Enum):
+        return lambda value: tp(value) if value is not None else None
+    if tp is uuid.UUID:
+        return lambda value: uuid.UUID(value) if isinstance(value, str) else value
+    if tp is UnitID:
+        # Unit IDs are interned, so that all messages from the same component share a single instance
+        return lambda value: (
+            UnitID.intern(value["type"], value["unit"], value.get("instance", None))
+            if isinstance(value, dict)
+            else value
+        )
+    if isinstance(tp, type) and dataclasses.is_dataclass(tp):
+        codec = DataclassCodec.for_type(tp)
+        return lambda value: codec.decode(value) if isinstance(value, dict) else value
+    if origin in (list, set, frozenset) and len(args) == 1:
+        item_decoder = _create_decoder(args[0])
+        return lambda value: (
+            origin(item_decoder(item) for item in value) if value is not None else None
+        )
+    if origin is dict and len(args) == 2:
+        key_decoder = _create_decoder(args[0])
+        value_decoder = _create_decoder(args[1])
+        return lambda value: (
+            {key_decoder(key): value_decoder(val) for key, val in value.items()}
+            if value is not None
+            else None
+        )
+    if origin in (typing.Union, types.UnionType):
+        return _create_union_decoder(args)
+
+    raise TypeError(f"Unsupported field type {tp}")
+
+
+def _create_union_decoder(args: typing.Tuple[typing.Any, ...]) -> ValueDecoder:
+    candidates = [arg for arg in args if arg is not type(None)]
+    if len(candidates) == 1:
+        decoder = _create_decoder(candidates[0])
+        return lambda value: decoder(value) if value is not None else None
+
+    decoders = [(arg, _create_decoder(arg)) for arg in candidates]
+
+    def _decode(value: typing.Any) -> typing.Any:
+        if value is None:
+            return None
+
+        for arg, decoder in decoders:
+            if (isinstance(value, dict) and dataclasses.is_dataclass(arg)) or (
+                isinstance(arg, type) and isinstance(value, arg)
+            ):
+                return decoder(value)
+
+        return value
+
+    return _decode
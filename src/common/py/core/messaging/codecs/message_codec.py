@@ -0,0 +1,84 @@
+import json
+import threading
+import typing
+
+from .dataclass_codec import DataclassCodec
+from ..message import Message, MessageType
+
+
+class MessageCodec:
+    """
+    Encodes and decodes messages of a single type for network transmission.
+
+    The codec is built once per message type when the type is registered (see ``Message.define``). It uses a ``DataclassCodec`` generated
+    from the message fields; if this isn't possible for a message type, the codec falls back to a (cached) *dataclasses_json* schema.
+    """
+
+    def __init__(self, msg_type: type[MessageType]):
+        """
+        Args:
+            msg_type: The message type.
+        """
+        self._msg_type = msg_type
+
+        try:
+            self._codec: DataclassCodec | None = DataclassCodec.for_type(msg_type)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._codec = None
+
+        self._schema: typing.Any = None
+        self._lock = threading.Lock()
+
+    def encode(self, msg: Message) -> str:
+        """
+        Encodes a message as *JSON*.
+
+        Args:
+            msg: The message to encode.
+
+        Returns:
+            The encoded message.
+        """
+        if self._codec is not None:
+            return json.dumps(self._codec.encode(msg))
+
+        return msg.to_json()
+
+    def decode(self, data: str) -> MessageType:
+        """
+        Decodes a message from *JSON*.
+
+        Args:
+            data: The encoded message.
+
+        Returns:
+            The decoded message.
+
+        Raises:
+            Exception: If the data couldn't be decoded.
+        """
+        if self._codec is not None:
+            return typing.cast(MessageType, self._codec.decode(json.loads(data)))
+
+        return typing.cast(MessageType, self._get_schema().loads(data))
+
+    def _get_schema(self) -> typing.Any:
+        with self._lock:
+            if self._schema is None:
+                self._schema = self._msg_type.schema()
+
+            return self._schema
+
+    @property
+    def message_type(self) -> type[MessageType]:
+        """
+        The message type.
+        """
+        return self._msg_type
+
+    @property
+    def is_generated(self) -> bool:
+        """
+        Whether the codec uses a generated ``DataclassCodec``.
+        """
+        return self._codec is not None
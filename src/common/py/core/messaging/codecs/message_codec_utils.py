@@ -0,0 +1,38 @@
+from .message_codecs_catalog import MessageCodecsCatalog
+from ..message import Message, MessageName
+
+
+def encode_message(msg: Message) -> str:
+    """
+    Encodes a message as *JSON* using the codec registered for its type.
+
+    Args:
+        msg: The message to encode.
+
+    Returns:
+        The encoded message.
+    """
+    if (msg_codec := MessageCodecsCatalog.find_item(msg.name)) is not None:
+        return msg_codec.encode(msg)
+
+    return msg.to_json()
+
+
+def decode_message(msg_name: MessageName, data: str) -> Message:
+    """
+    Decodes a message from *JSON* using the codec registered for the message name.
+
+    Args:
+        msg_name: The name of the message.
+        data: The encoded message.
+
+    Returns:
+        The decoded message.
+
+    Raises:
+        RuntimeError: If the message type is unknown.
+    """
+    if (msg_codec := MessageCodecsCatalog.find_item(msg_name)) is None:
+        raise RuntimeError(f"The message type '{msg_name}' is unknown")
+
+    return msg_codec.decode(data)
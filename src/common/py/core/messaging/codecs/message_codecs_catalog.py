@@ -0,0 +1,11 @@
+from .message_codec import MessageCodec
+from ....utils import ItemsCatalog
+
+
+@ItemsCatalog.define()
+class MessageCodecsCatalog(ItemsCatalog[MessageCodec]):
+    """
+    Global catalog of the codecs of all registered message types.
+
+    Codecs are registered alongside their message types in the ``MessageTypesCatalog``, associated with the same message names.
+    """
@@ -1,8 +1,7 @@
 import typing
-import uuid
 from dataclasses import dataclass, field
 
-from .message import Message, Trace
+from .message import Message, Trace, generate_trace
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -19,7 +18,9 @@ class Command(Message):
     Attributes:
         unique: A unique identifier for each issued command.
     """
-    unique: Trace = field(default_factory=uuid.uuid4)
+    __slots__ = ()
+    
+    unique: Trace = field(default_factory=generate_trace)
 
 
 CommandType = typing.TypeVar("CommandType", bound=Command)  # pylint: disable=invalid-name
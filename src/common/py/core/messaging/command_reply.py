@@ -1,9 +1,8 @@
 import typing
-import uuid
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
 
-from .message import Message, Trace
+from .message import Message, Trace, generate_trace
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -20,6 +19,8 @@ class CommandReply(Message):
         message: Arbitrary text, usually used to describe reasons for failures.
         unique: The unique identifier of its corresponding command.
     """
+    __slots__ = ()
+    
     class FailType(IntEnum):
         """
         Used when a command failed.
@@ -32,7 +33,7 @@ class CommandReply(Message):
     success: bool = True
     message: str = ""
     
-    unique: Trace = field(default_factory=uuid.uuid4)
+    unique: Trace = field(default_factory=generate_trace)
 
 
 CommandReplyType = typing.TypeVar("CommandReplyType", bound=CommandReply)  # pylint: disable=invalid-name
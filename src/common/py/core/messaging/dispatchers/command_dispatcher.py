@@ -3,6 +3,7 @@ import typing
 from .message_dispatcher import MessageDispatcher
 from .. import Trace, CommandReply
 from ..command import Command
+from ..executors import HandlerLane, ExecutorRejectedError
 from ..handlers import MessageContextType
 from ..meta import CommandMetaInformation, CommandReplyMetaInformation
 
@@ -16,11 +17,11 @@ class CommandDispatcher(MessageDispatcher[Command]):
     def __init__(self):
         super().__init__(CommandMetaInformation)
 
-    def process(self) -> None:
+    def process_timeouts(self) -> None:
         """
         Takes care of checking whether issued commands have already timed out.
         """
-        super().process()
+        super().process_timeouts()
 
         for unique in MessageDispatcher._meta_information_list.find_timed_out_entries():
             CommandDispatcher.invoke_reply_callbacks(
@@ -41,7 +42,7 @@ class CommandDispatcher(MessageDispatcher[Command]):
         from ...logging import debug
 
         if not msg_meta.suppress_logging:
-            debug(f"Dispatching command: {msg}", scope="bus")
+            debug("Dispatching command: %s", msg, scope="bus")
 
         super().pre_dispatch(msg, msg_meta)
 
@@ -61,6 +62,22 @@ class CommandDispatcher(MessageDispatcher[Command]):
         )
         MessageDispatcher._meta_information_list.remove(msg.unique)
 
+    @staticmethod
+    def is_pending(unique: Trace) -> bool:
+        """
+        Checks whether a command issued by this component is still awaiting its reply.
+
+        Args:
+            unique: The unique trace of the command.
+
+        Returns:
+            Whether the command is pending.
+        """
+        return isinstance(
+            MessageDispatcher._meta_information_list.find(unique),
+            CommandMetaInformation,
+        )
+
     @staticmethod
     def invoke_reply_callbacks(
         unique: Trace,
@@ -109,9 +126,17 @@ class CommandDispatcher(MessageDispatcher[Command]):
             def _invoke(callbacks, is_async, *args):
                 if len(callbacks) > 0:
                     if is_async:
-                        MessageDispatcher._thread_pool.submit(
-                            _invoke_reply_callbacks, callbacks, *args
-                        )
+                        try:
+                            MessageDispatcher._executors.submit(
+                                HandlerLane.CONTROL,
+                                "reply_callbacks",
+                                _invoke_reply_callbacks,
+                                callbacks,
+                                *args,
+                            )
+                        except ExecutorRejectedError:
+                            # Replies must never get lost, so invoke the callbacks directly instead
+                            _invoke_reply_callbacks(callbacks, *args)
                     else:
                         _invoke_reply_callbacks(callbacks, *args)
 
@@ -26,7 +26,7 @@ class CommandReplyDispatcher(MessageDispatcher[CommandReply]):
         from ...logging import debug
 
         if not msg_meta.suppress_logging:
-            debug(f"Dispatching command reply: {msg}", scope="bus")
+            debug("Dispatching command reply: %s", msg, scope="bus")
 
         super().pre_dispatch(msg, msg_meta)
 
@@ -23,6 +23,6 @@ class EventDispatcher(MessageDispatcher[Event]):
         from ...logging import debug
 
         if not msg_meta.suppress_logging:
-            debug(f"Dispatching event: {msg}", scope="bus")
+            debug("Dispatching event: %s", msg, scope="bus")
 
         super().pre_dispatch(msg, msg_meta)
@@ -1,11 +1,13 @@
 import abc
 import atexit
+import time
 import typing
-from concurrent.futures import ThreadPoolExecutor
 
+from ..executors import HandlerExecutors, ExecutorRejectedError
 from ..handlers import MessageHandlerMapping, MessageContextType
 from ..message import MessageType
 from ..meta import MessageMetaInformationType, MessageMetaInformationList
+from ...metrics import MetricsRegistry
 
 
 class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
@@ -14,9 +16,12 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
 
     Dispatching a message (locally) is done by passing the message to one or more registered message handlers within a ``Service``.
     The message dispatcher also performs pre- and post-dispatching tasks and takes care of catching errors raised in a handler.
+
+    Asynchronous handlers are run by the executor of their lane; if it rejects a handler, this is treated like an exception raised
+    within the handler. The time each handler waits for its execution and its run time are recorded as metrics.
     """
 
-    _thread_pool = ThreadPoolExecutor()
+    _executors = HandlerExecutors()
     _meta_information_list = MessageMetaInformationList()
 
     def __init__(self, meta_information_type: type[MessageMetaInformationType]):
@@ -31,6 +36,11 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
         Called to perform periodic tasks.
         """
 
+    def process_timeouts(self) -> None:
+        """
+        Called to check for timed out messages; this happens more frequently than ``process``.
+        """
+
     def pre_dispatch(
         self, msg: MessageType, msg_meta: MessageMetaInformationType
     ) -> None:
@@ -76,6 +86,9 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
             RuntimeError: If the handler requires a different message type.
         """
 
+        metrics = MetricsRegistry()
+        dispatched = time.perf_counter()
+
         # Callback wrapper for proper exception handling, even when used asynchronously
         def _dispatch(
             msg: MessageType,
@@ -83,19 +96,65 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
             handler: MessageHandlerMapping,
             ctx: MessageContextType,
         ) -> None:
+            started = time.perf_counter()
+            metrics.histogram(
+                "rds_handler_queue_wait_seconds",
+                "Time message handlers waited for their execution",
+                handler=handler.name,
+                lane=handler.lane.name.lower() if handler.is_async else "sync",
+            ).observe(started - dispatched)
+
             try:
                 with ctx(requires_reply=msg_meta.requires_reply):
                     # The service context will not suppress exceptions so that the dispatcher can react to them
                     act_msg = typing.cast(handler.message_type, msg)
                     handler.handler(act_msg, ctx)
             except Exception as exc:  # pylint: disable=broad-exception-caught
+                metrics.counter(
+                    "rds_handler_failures_total",
+                    "Number of message handler executions that raised an exception",
+                    handler=handler.name,
+                    message=msg.name,
+                ).inc()
+
                 self._context_exception(exc, msg, msg_meta, ctx)
+            finally:
+                metrics.histogram(
+                    "rds_handler_duration_seconds",
+                    "Execution time of message handlers",
+                    handler=handler.name,
+                    message=msg.name,
+                ).observe(time.perf_counter() - started)
 
         if isinstance(msg, handler.message_type):
             if handler.is_async:
-                MessageDispatcher._thread_pool.submit(
-                    _dispatch, msg, msg_meta, handler, ctx
-                )
+                try:
+                    MessageDispatcher._executors.submit(
+                        handler.lane,
+                        handler.name,
+                        _dispatch,
+                        msg,
+                        msg_meta,
+                        handler,
+                        ctx,
+                    )
+                except ExecutorRejectedError as exc:
+                    from ...logging import error
+
+                    metrics.counter(
+                        "rds_handler_rejections_total",
+                        "Number of message handlers rejected by their executor",
+                        handler=handler.name,
+                        lane=handler.lane.name.lower(),
+                    ).inc()
+
+                    error(
+                        f"Handler rejected: {str(exc)}",
+                        scope="bus",
+                        handler=handler.name,
+                        message=str(msg),
+                    )
+                    self._context_exception(exc, msg, msg_meta, ctx)
             else:
                 _dispatch(msg, msg_meta, handler, ctx)
         else:
@@ -125,7 +184,14 @@ class MessageDispatcher(abc.ABC, typing.Generic[MessageType]):
     ) -> None:
         pass
 
+    @staticmethod
+    def executors() -> HandlerExecutors:
+        """
+        The executors running asynchronous handlers.
+        """
+        return MessageDispatcher._executors
+
     @staticmethod
     @atexit.register
     def _terminate() -> None:
-        MessageDispatcher._thread_pool.shutdown(True, cancel_futures=True)
+        MessageDispatcher._executors.shutdown(True)
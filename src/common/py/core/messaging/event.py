@@ -12,5 +12,7 @@ class Event(Message):
     Events are simple notifications that do not require a reply nor will *execute* anything.
     """
 
+    __slots__ = ()
+
 
 EventType = typing.TypeVar("EventType", bound=Event)  # pylint: disable=invalid-name
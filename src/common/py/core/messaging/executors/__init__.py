@@ -0,0 +1,8 @@
+from .handler_executor import (
+    HandlerExecutor,
+    HandlerStatistics,
+    RejectionPolicy,
+    ExecutorRejectedError,
+)
+from .handler_executors import HandlerExecutors
+from .handler_lane import HandlerLane
@@ -0,0 +1,270 @@
+import dataclasses
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum, auto
+
+
+class RejectionPolicy(IntEnum):
+    """
+    Defines what happens if a task is submitted to an executor whose queue is full.
+    """
+
+    BLOCK = (
+        auto()
+    )  # The caller waits for a free slot (applying backpressure); the task is rejected after a timeout
+    REJECT = auto()  # The task is rejected right away
+    CALLER_RUNS = auto()  # The task is run synchronously in the calling thread
+
+
+class ExecutorRejectedError(RuntimeError):
+    """
+    Raised if an executor rejects a task.
+    """
+
+
+@dataclasses.dataclass(kw_only=True)
+class HandlerStatistics:
+    """
+    Statistics of a single handler run by a ``HandlerExecutor``.
+
+    Attributes:
+        queued: The number of tasks currently waiting for a worker.
+        running: The number of tasks currently running.
+        completed: The number of completed tasks.
+        rejected: The number of rejected tasks.
+        total_wait_time: The accumulated time (in seconds) tasks waited for a worker.
+        max_wait_time: The longest time (in seconds) a task waited for a worker.
+        total_run_time: The accumulated run time (in seconds) of all completed tasks.
+        max_run_time: The longest run time (in seconds) of a task.
+    """
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    rejected: int = 0
+
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        The average time (in seconds) tasks waited for a worker.
+        """
+        started = self.completed + self.running
+        return self.total_wait_time / started if started > 0 else 0.0
+
+    @property
+    def average_run_time(self) -> float:
+        """
+        The average run time (in seconds) of all completed tasks.
+        """
+        return self.total_run_time / self.completed if self.completed > 0 else 0.0
+
+
+class HandlerExecutor:
+    """
+    A thread pool with a bounded queue that keeps statistics for each handler it runs.
+
+    At most ``max_workers + max_queue_size`` tasks are accepted at once; once this limit is reached, the rejection policy decides
+    whether the caller has to wait, the task is rejected or run in the calling thread instead. Tasks are submitted along with a key
+    (usually the name of the message handler) for which the queue depth, wait and run times are recorded.
+
+    Notes:
+        The executor is thread-safe. Tasks submitted by one of the executor's own workers never block: If the queue is full, they are
+        run in the submitting worker instead, since waiting for a slot only this executor can free might stall it indefinitely.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_workers: int,
+        max_queue_size: int = 0,
+        policy: RejectionPolicy = RejectionPolicy.BLOCK,
+        block_timeout: float = 0.0,
+    ):
+        """
+        Args:
+            name: The name of the executor.
+            max_workers: The number of worker threads.
+            max_queue_size: The maximum number of waiting tasks; set to 0 for an unbounded queue.
+            policy: The policy to apply if the queue is full.
+            block_timeout: The time (in seconds) a caller waits for a free slot if blocking; set to 0 to wait indefinitely.
+        """
+        self._name = name
+        self._max_workers = max(max_workers, 1)
+        self._max_queue_size = max(max_queue_size, 0)
+
+        self._policy = policy
+        self._block_timeout = block_timeout
+
+        self._workers = threading.local()
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix=f"executor-{name}",
+            initializer=self._mark_worker,
+        )
+        self._slots: threading.BoundedSemaphore | None = (
+            threading.BoundedSemaphore(self._max_workers + self._max_queue_size)
+            if self._max_queue_size > 0
+            else None
+        )
+
+        self._statistics: typing.Dict[str, HandlerStatistics] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, key: str, func: typing.Callable[..., None], /, *args: typing.Any
+    ) -> None:
+        """
+        Submits a new task.
+
+        Args:
+            key: The key (e.g., a handler name) to record statistics for.
+            func: The function to run.
+            *args: The arguments passed to the function.
+
+        Raises:
+            ExecutorRejectedError: If the task was rejected.
+        """
+        if not self._acquire_slot():
+            if self._policy == RejectionPolicy.CALLER_RUNS or (
+                self._policy == RejectionPolicy.BLOCK and self._is_worker()
+            ):
+                self._run(key, time.time(), False, func, *args)
+                return
+
+            with self._lock:
+                self._get_statistics(key).rejected += 1
+
+            raise ExecutorRejectedError(
+                f"The {self._name} executor is saturated ({self._max_queue_size} tasks queued)"
+            )
+
+        with self._lock:
+            self._get_statistics(key).queued += 1
+
+        try:
+            self._thread_pool.submit(self._run, key, time.time(), True, func, *args)
+        except RuntimeError as exc:  # The thread pool has already been shut down
+            with self._lock:
+                self._get_statistics(key).queued -= 1
+            self._release_slot()
+
+            raise ExecutorRejectedError(
+                f"The {self._name} executor has been shut down"
+            ) from exc
+
+    def statistics(self) -> typing.Dict[str, HandlerStatistics]:
+        """
+        Gets a snapshot of the statistics of all handlers.
+
+        Returns:
+            A dictionary mapping the handler keys to their statistics.
+        """
+        with self._lock:
+            return {
+                key: dataclasses.replace(stats)
+                for key, stats in self._statistics.items()
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts the executor down; queued tasks are cancelled.
+
+        Args:
+            wait: Whether to wait for running tasks to finish.
+        """
+        self._thread_pool.shutdown(wait, cancel_futures=True)
+
+    def _run(
+        self,
+        key: str,
+        submitted: float,
+        pooled: bool,
+        func: typing.Callable[..., None],
+        *args: typing.Any,
+    ) -> None:
+        started = time.time()
+
+        with self._lock:
+            stats = self._get_statistics(key)
+            if pooled:
+                stats.queued -= 1
+            stats.running += 1
+            stats.total_wait_time += started - submitted
+            stats.max_wait_time = max(stats.max_wait_time, started - submitted)
+
+        try:
+            func(*args)
+        finally:
+            run_time = time.time() - started
+
+            with self._lock:
+                stats.running -= 1
+                stats.completed += 1
+                stats.total_run_time += run_time
+                stats.max_run_time = max(stats.max_run_time, run_time)
+
+            if pooled:
+                self._release_slot()
+
+    def _acquire_slot(self) -> bool:
+        if self._slots is None:
+            return True
+
+        if self._policy == RejectionPolicy.BLOCK and not self._is_worker():
+            return self._slots.acquire(
+                timeout=self._block_timeout if self._block_timeout > 0.0 else None
+            )
+
+        return self._slots.acquire(blocking=False)
+
+    def _release_slot(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def _mark_worker(self) -> None:
+        self._workers.is_worker = True
+
+    def _is_worker(self) -> bool:
+        return getattr(self._workers, "is_worker", False)
+
+    def _get_statistics(self, key: str) -> HandlerStatistics:
+        if (stats := self._statistics.get(key, None)) is None:
+            stats = HandlerStatistics()
+            self._statistics[key] = stats
+        return stats
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the executor.
+        """
+        return self._name
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The number of worker threads.
+        """
+        return self._max_workers
+
+    @property
+    def max_queue_size(self) -> int:
+        """
+        The maximum number of waiting tasks (0 if unbounded).
+        """
+        return self._max_queue_size
+
+    @property
+    def policy(self) -> RejectionPolicy:
+        """
+        The policy applied if the queue is full.
+        """
+        return self._policy
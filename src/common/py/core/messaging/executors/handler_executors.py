@@ -0,0 +1,143 @@
+import os
+import threading
+import typing
+
+from .handler_executor import HandlerExecutor, HandlerStatistics, RejectionPolicy
+from .handler_lane import HandlerLane
+from ....utils.config import Configuration
+
+
+class HandlerExecutors:
+    """
+    Holds the executors of all handler lanes.
+
+    Until the executors have been configured, each lane uses an unbounded executor with a default number of workers.
+
+    Notes:
+        The executors list is thread-safe.
+    """
+
+    def __init__(self):
+        self._executors: typing.Dict[HandlerLane, HandlerExecutor] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: Configuration) -> None:
+        """
+        (Re-)Creates the executors of all lanes based on the global configuration.
+
+        Args:
+            config: The global configuration.
+
+        Raises:
+            ValueError: If an invalid rejection policy has been configured.
+        """
+        from ....settings import ExecutorsSettingIDs
+
+        lane_settings = {
+            HandlerLane.CONTROL: (
+                ExecutorsSettingIDs.CONTROL_WORKERS,
+                ExecutorsSettingIDs.CONTROL_QUEUE_SIZE,
+                ExecutorsSettingIDs.CONTROL_POLICY,
+            ),
+            HandlerLane.INTERACTIVE: (
+                ExecutorsSettingIDs.INTERACTIVE_WORKERS,
+                ExecutorsSettingIDs.INTERACTIVE_QUEUE_SIZE,
+                ExecutorsSettingIDs.INTERACTIVE_POLICY,
+            ),
+            HandlerLane.BULK: (
+                ExecutorsSettingIDs.BULK_WORKERS,
+                ExecutorsSettingIDs.BULK_QUEUE_SIZE,
+                ExecutorsSettingIDs.BULK_POLICY,
+            ),
+        }
+
+        executors: typing.Dict[HandlerLane, HandlerExecutor] = {}
+        for lane, (workers, queue_size, policy) in lane_settings.items():
+            executors[lane] = HandlerExecutor(
+                lane.name.lower(),
+                max_workers=config.value(workers),
+                max_queue_size=config.value(queue_size),
+                policy=self._parse_policy(config.value(policy)),
+                block_timeout=config.value(ExecutorsSettingIDs.BLOCK_TIMEOUT),
+            )
+
+        with self._lock:
+            previous = self._executors
+            self._executors = executors
+
+        for executor in previous.values():
+            executor.shutdown(False)
+
+    def submit(
+        self,
+        lane: HandlerLane,
+        key: str,
+        func: typing.Callable[..., None],
+        /,
+        *args: typing.Any,
+    ) -> None:
+        """
+        Submits a new task to the executor of a lane.
+
+        Args:
+            lane: The lane to use.
+            key: The key (e.g., a handler name) to record statistics for.
+            func: The function to run.
+            *args: The arguments passed to the function.
+
+        Raises:
+            ExecutorRejectedError: If the task was rejected.
+        """
+        self.executor(lane).submit(key, func, *args)
+
+    def executor(self, lane: HandlerLane) -> HandlerExecutor:
+        """
+        Gets the executor of a lane.
+
+        Args:
+            lane: The lane.
+
+        Returns:
+            The executor of the lane.
+        """
+        with self._lock:
+            if (executor := self._executors.get(lane, None)) is None:
+                executor = HandlerExecutor(
+                    lane.name.lower(), max_workers=min(32, (os.cpu_count() or 1) + 4)
+                )
+                self._executors[lane] = executor
+            return executor
+
+    def statistics(
+        self,
+    ) -> typing.Dict[HandlerLane, typing.Dict[str, HandlerStatistics]]:
+        """
+        Gets a snapshot of the statistics of all lanes.
+
+        Returns:
+            A dictionary mapping each lane to the statistics of its handlers.
+        """
+        with self._lock:
+            executors = list(self._executors.items())
+
+        return {lane: executor.statistics() for lane, executor in executors}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts all executors down.
+
+        Args:
+            wait: Whether to wait for running tasks to finish.
+        """
+        with self._lock:
+            executors = list(self._executors.values())
+
+        for executor in executors:
+            executor.shutdown(wait)
+
+    @staticmethod
+    def _parse_policy(policy: str) -> RejectionPolicy:
+        try:
+            return RejectionPolicy[policy.strip().upper()]
+        except KeyError as exc:
+            raise ValueError(f"Invalid rejection policy: {policy}") from exc
@@ -0,0 +1,15 @@
+from enum import IntEnum, auto
+
+
+class HandlerLane(IntEnum):
+    """
+    The lanes (i.e., separate executors) asynchronous message handlers are run in.
+
+    Each lane has its own workers and queue, so long-running handlers can't delay latency-sensitive ones.
+    """
+
+    CONTROL = (
+        auto()
+    )  # Short, latency-sensitive handlers (e.g., authentication or network events)
+    INTERACTIVE = auto()  # Regular handlers serving user requests
+    BULK = auto()  # Long-running handlers (e.g., exports or resource listings)
@@ -1,6 +1,7 @@
 import typing
 from dataclasses import dataclass
 
+from ..executors import HandlerLane
 from ..message import MessageType
 from .message_context import MessageContextType
 
@@ -17,11 +18,20 @@ class MessageHandlerMapping:
         handler: The message handler.
         message_type: The message type the handler expects.
         is_async: Whether the handler should be invoked asynchronously in its own thread.
+        lane: The lane (executor) an asynchronous handler is run in.
     """
     filter: str
     handler: MessageHandler
     message_type: type[MessageType]
     is_async: bool = False
+    lane: HandlerLane = HandlerLane.INTERACTIVE
+    
+    @property
+    def name(self) -> str:
+        """
+        The qualified name of the handler function.
+        """
+        return f"{self.handler.__module__}.{self.handler.__name__}"
     
     def __str__(self) -> str:
         return f"{self.filter} -> {str(self.handler)} [{str(self.message_type)}]"
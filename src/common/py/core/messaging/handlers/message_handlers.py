@@ -1,6 +1,9 @@
+import re
 import threading
+import typing
 from pathlib import PurePosixPath
 
+from ..executors import HandlerLane
 from ..message import MessageName, Message, MessageType
 from .message_handler import (
     MessageHandler,
@@ -12,11 +15,31 @@ from .message_handler import (
 class MessageHandlers:
     """
     Holds mappings for message handlers.
+
+    Filters are matched like paths (see ``PurePosixPath.match``), so relative filters match the trailing parts of a message name.
+    Handlers registered using relative filters without wildcards are kept in a dictionary, which is looked up for every trailing part
+    of a message name, while all other filters are compiled into regular expressions once when being added. The results of all lookups are cached per message name; this
+    cache is invalidated whenever a new handler is added.
+
+    Notes:
+        The handlers list is thread-safe.
     """
 
+    _WILDCARD_CHARS = "*?["
+
     def __init__(self):
         self._handlers: MessageHandlerMappings = []
 
+        self._exact_handlers: typing.Dict[
+            MessageName, typing.List[typing.Tuple[int, MessageHandlerMapping]]
+        ] = {}
+        self._wildcard_handlers: typing.List[
+            typing.Tuple[int, typing.Pattern, MessageHandlerMapping]
+        ] = []
+        self._lookup_cache: typing.Dict[
+            MessageName, typing.Tuple[MessageHandlerMapping, ...]
+        ] = {}
+
         self._lock = threading.Lock()
 
     def add_handler(
@@ -25,6 +48,7 @@ class MessageHandlers:
         handler: MessageHandler,
         message_type: type[MessageType] = Message,
         is_async: bool = True,
+        lane: HandlerLane = HandlerLane.INTERACTIVE,
     ) -> None:
         """
         Adds a new message handler mapping.
@@ -34,11 +58,27 @@ class MessageHandlers:
             handler: The message handler.
             message_type: The message type the handler expects.
             is_async: Whether the handler should be invoked asynchronously in its own thread.
+            lane: The lane (executor) an asynchronous handler is run in.
         """
+        mapping = MessageHandlerMapping(fltr, handler, message_type, is_async, lane)
+
         with self._lock:
-            self._handlers.append(
-                MessageHandlerMapping(fltr, handler, message_type, is_async)
-            )
+            index = len(self._handlers)
+            self._handlers.append(mapping)
+
+            path = PurePosixPath(fltr)
+            if path.is_absolute() or any(
+                char in fltr for char in MessageHandlers._WILDCARD_CHARS
+            ):
+                self._wildcard_handlers.append(
+                    (index, self._compile_filter(fltr), mapping)
+                )
+            else:
+                self._exact_handlers.setdefault("/".join(path.parts), []).append(
+                    (index, mapping)
+                )
+
+            self._lookup_cache = {}
 
     def find_handlers(self, msg_name: MessageName) -> MessageHandlerMappings:
         """
@@ -52,12 +92,59 @@ class MessageHandlers:
         Returns:
             A list of all found message handlers.
         """
-        handlers: MessageHandlerMappings = []
-        with self._lock:
-            for mapping in self._handlers:
-                if PurePosixPath(msg_name).match(mapping.filter):
-                    handlers.append(mapping)
-        return handlers
+        if (handlers := self._lookup_cache.get(msg_name, None)) is None:
+            with self._lock:
+                handlers = self._lookup(msg_name)
+                self._lookup_cache[msg_name] = handlers
+
+        return list(handlers)
+
+    def _lookup(
+        self, msg_name: MessageName
+    ) -> typing.Tuple[MessageHandlerMapping, ...]:
+        parts = PurePosixPath(msg_name).parts
+        matches = [
+            match
+            for start in range(len(parts))
+            for match in self._exact_handlers.get("/".join(parts[start:]), [])
+        ] + [
+            (index, mapping)
+            for index, pattern, mapping in self._wildcard_handlers
+            if pattern.match(msg_name)
+        ]
+
+        # Keep the order in which the handlers were added
+        return tuple(mapping for _, mapping in sorted(matches, key=lambda m: m[0]))
+
+    @staticmethod
+    def _compile_filter(fltr: str) -> typing.Pattern:
+        # Wildcards never cross a path separator, and relative filters are matched from the right (just like PurePosixPath.match)
+        def _translate(part: str) -> str:
+            pattern = ""
+            i = 0
+            while i < len(part):
+                char = part[i]
+                i += 1
+                if char == "*":
+                    pattern += "[^/]*"
+                elif char == "?":
+                    pattern += "[^/]"
+                elif char == "[" and (end := part.find("]", i + 1)) != -1:
+                    chars = part[i:end]
+                    pattern += (
+                        "["
+                        + ("^" + chars[1:] if chars.startswith("!") else chars)
+                        + "]"
+                    )
+                    i = end + 1
+                else:
+                    pattern += re.escape(char)
+            return pattern
+
+        path = PurePosixPath(fltr)
+        parts = path.parts[1:] if path.is_absolute() else path.parts
+        prefix = "/" if path.is_absolute() else "(?:.*/)?"
+        return re.compile(prefix + "/".join(map(_translate, parts)) + r"\Z")
 
     def __str__(self) -> str:
         return "; ".join(map(str, self._handlers))
@@ -1,6 +1,7 @@
 import abc
 import collections.abc
 import dataclasses
+import random
 import typing
 import uuid
 from dataclasses import dataclass, field
@@ -14,6 +15,29 @@ from ...utils import UnitID
 MessageName = str
 Trace = uuid.UUID
 
+_TRACE_VERSION_MASK = ~((0xC000 << 48) | (0xF000 << 64))
+_TRACE_VERSION_BITS = (0x8000 << 48) | (0x4000 << 64)
+
+
+def generate_trace() -> Trace:
+    """
+    Generates a new random (version 4) trace.
+
+    Unlike ``uuid.uuid4``, this neither reads from the system's random source nor validates its input, making it considerably cheaper; traces
+    only need to be unique, not unpredictable.
+
+    Returns:
+        The new trace.
+    """
+    trace = object.__new__(uuid.UUID)
+    object.__setattr__(
+        trace,
+        "int",
+        (random.getrandbits(128) & _TRACE_VERSION_MASK) | _TRACE_VERSION_BITS,
+    )
+    object.__setattr__(trace, "is_safe", uuid.SafeUUID.unknown)
+    return trace
+
 
 @dataclass_json
 @dataclass(frozen=True, kw_only=True)
@@ -29,6 +53,9 @@ class Message(abc.ABC):
         class MyCommand(Command):
             some_number: int = 0
 
+    All message classes use slots instead of an instance dictionary: The base classes only declare (empty) slots, while ``define`` turns
+    each concrete message into a slotted dataclass holding all of its fields.
+
     Attributes:
           name: The name of the message.
           origin: The initial source component of the message.
@@ -39,6 +66,8 @@ class Message(abc.ABC):
           api_key: An optional API key to access protected resources.
     """
 
+    __slots__ = ("_payload",)
+
     name: MessageName
 
     origin: UnitID
@@ -47,7 +76,7 @@ class Message(abc.ABC):
 
     hops: typing.List[UnitID] = field(default_factory=list)
 
-    trace: Trace = field(default_factory=uuid.uuid4)
+    trace: Trace = field(default_factory=generate_trace)
 
     api_key: str = ""
 
@@ -70,8 +99,9 @@ class Message(abc.ABC):
         """
         Defines a new message.
 
-        The decorator takes care of wrapping the new class as a dataclass, passing the correct message
-        name to its constructor. It also registers the new message type in the global ``MessageTypesCatalog``.
+        The decorator takes care of wrapping the new class as a slotted dataclass, using the message name as the (fixed) value
+        of its ``name`` field. It also registers the new message type in the global ``MessageTypesCatalog``, along with its codec
+        in the ``MessageCodecsCatalog``.
 
         Examples::
 
@@ -85,24 +115,25 @@ class Message(abc.ABC):
         """
 
         def decorator(cls):
-            cls = dataclasses.dataclass(frozen=True, kw_only=True)(
+            # The name is turned into a field that can't be passed to the constructor, but always defaults to the message name
+            cls.__annotations__ = {
+                "name": MessageName,
+                **cls.__dict__.get("__annotations__", {}),
+            }
+            cls.name = field(default=MessageName(name), init=False)
+
+            cls = dataclasses.dataclass(frozen=True, kw_only=True, slots=True)(
                 cls
             )  # Wrap the class in a dataclass
-            __init__ = cls.__init__
-
-            def __new_init__(self, *args, **kwargs):
-                if "name" in kwargs:
-                    del kwargs["name"]
-
-                __init__(self, *args, name=MessageName(name), **kwargs)
 
-            setattr(cls, "__init__", __new_init__)
             setattr(cls, "message_name", lambda *args, **kwargs: name)
             setattr(cls, "is_protected", lambda *args, **kwargs: is_protected)
 
             from .message_types_catalog import MessageTypesCatalog
+            from .codecs import MessageCodec, MessageCodecsCatalog
 
             MessageTypesCatalog.register_item(name, cls)
+            MessageCodecsCatalog.register_item(name, MessageCodec(cls))
 
             return cls
 
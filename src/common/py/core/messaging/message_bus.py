@@ -2,12 +2,15 @@ import threading
 import typing
 
 from .dispatchers import MessageDispatcher
+from .executors import HandlerExecutors
 from .handlers import MessageService, MessageContextType
-from .message import Message, MessageType
+from .message import Message, MessageType, Trace
 from .message_router import MessageRouter
 from .meta import MessageMetaInformationType, MessageMetaInformation
 from .networking import NetworkEngine
 from ..logging import LoggerProxy, default_logger, error, debug, warning
+from ..metrics import MetricsRegistry
+from ..scheduling import Scheduler
 from ...component import BackendComponentData
 
 
@@ -29,10 +32,11 @@ class MessageBus:
         The message bus is thread-safe.
     """
 
-    def __init__(self, comp_data: BackendComponentData):
+    def __init__(self, comp_data: BackendComponentData, scheduler: Scheduler):
         """
         Args:
             comp_data: The global component data.
+            scheduler: The global scheduler used to perform periodic tasks.
         """
         from .dispatchers import (
             CommandDispatcher,
@@ -45,6 +49,14 @@ class MessageBus:
         from ...settings import NetworkSettingIDs
 
         self._comp_data = comp_data
+        self._scheduler = scheduler
+
+        debug("Configuring handler executors", scope="bus")
+        MessageDispatcher.executors().configure(comp_data.config)
+
+        # The executors are shared by all buses, so their metrics are only collected once
+        self._metrics = MetricsRegistry()
+        self._metrics.add_collector(MessageBus._collect_executor_metrics)
 
         debug("Creating network engine", scope="bus")
         self._network_engine = self._create_network_engine()
@@ -55,6 +67,10 @@ class MessageBus:
             CommandReply: CommandReplyDispatcher(),
             Event: EventDispatcher(),
         }
+        self._dispatchers_table: typing.Dict[
+            type[Message],
+            typing.List[typing.Tuple[type[MessageType], MessageDispatcher]],
+        ] = {}
         self._router = MessageRouter(
             comp_data.comp_id, comp_data.config.value(NetworkSettingIDs.API_KEY)
         )
@@ -102,8 +118,18 @@ class MessageBus:
         """
         Initiates periodic tasks performed by the bus.
         """
+        from ...settings import NetworkSettingIDs
+
         self._network_engine.run()
-        self._process()
+
+        # The bus ticks must not be delayed by slow jobs (e.g., HTTP requests) occupying the shared scheduler workers
+        self._scheduler.schedule("bus/process", self._process, 1.0, dedicated=True)
+        self._scheduler.schedule(
+            "bus/timeouts",
+            self._process_timeouts,
+            self._comp_data.config.value(NetworkSettingIDs.COMMAND_TIMEOUT_RESOLUTION),
+            dedicated=True,
+        )
 
     def dispatch(self, msg: Message, msg_meta: MessageMetaInformationType) -> None:
         """
@@ -116,9 +142,21 @@ class MessageBus:
             msg: The message to be dispatched.
             msg_meta: The message meta information.
         """
+        self._metrics.counter(
+            "rds_bus_messages_total",
+            "Number of messages dispatched by the message bus",
+            message=msg.name,
+        ).inc()
+
         try:
             self._router.verify_message(msg, msg_meta)
         except MessageRouter.RoutingError as exc:
+            self._metrics.counter(
+                "rds_bus_routing_errors_total",
+                "Number of messages that couldn't be routed by the message bus",
+                message=msg.name,
+            ).inc()
+
             error(
                 f"A routing error occurred: {str(exc)}", scope="bus", message=str(msg)
             )
@@ -129,30 +167,43 @@ class MessageBus:
             # The local dispatchers are always invoked for their pre- and post-steps
             self._local_dispatch(msg, msg_meta)
 
+    def has_pending_command(self, unique: Trace) -> bool:
+        """
+        Checks whether a command issued by this component is still awaiting its reply.
+
+        Args:
+            unique: The unique trace of the command.
+
+        Returns:
+            Whether the command is pending.
+        """
+        from .dispatchers import CommandDispatcher
+
+        return CommandDispatcher.is_pending(unique)
+
     def _process(self) -> None:
         self._network_engine.process()
 
         for _, dispatcher in self._dispatchers.items():
             dispatcher.process()
 
-        from ..messaging import Channel
-        from ..messaging.composers import MessageBuilder
-        from ...api.component.component_events import ComponentProcessEvent
-
-        ComponentProcessEvent.build(MessageBuilder(self._comp_data.comp_id, self)).emit(
-            Channel.local(), suppress_logging=True
-        )
-
-        threading.Timer(1.0, self._process).start()
+    def _process_timeouts(self) -> None:
+        for _, dispatcher in self._dispatchers.items():
+            dispatcher.process_timeouts()
 
     def _local_dispatch(
         self, msg: Message, msg_meta: MessageMetaInformationType
     ) -> None:
         local_routing = self._router.check_local_routing(msg, msg_meta)
-        for msg_type, dispatcher in self._dispatchers.items():
-            if not isinstance(msg, msg_type):
-                continue
-
+        if (
+            local_routing
+            and msg_meta.entrypoint == MessageMetaInformation.Entrypoint.LOCAL
+        ):
+            # Local handlers might run after the sender has already closed the sources of streamed items; streams received from the
+            # network are owned by the message itself, though, and are read on demand
+            msg.payload.read_streams()
+
+        for msg_type, dispatcher in self._lookup_dispatchers(type(msg)):
             dispatcher.pre_dispatch(msg, msg_meta)
 
             if local_routing:
@@ -171,6 +222,20 @@ class MessageBus:
 
             dispatcher.post_dispatch(msg, msg_meta)
 
+    def _lookup_dispatchers(
+        self, msg_type: type[Message]
+    ) -> typing.List[typing.Tuple[type[MessageType], MessageDispatcher]]:
+        # The dispatchers responsible for a message type never change, so they are only determined once per type
+        if (dispatchers := self._dispatchers_table.get(msg_type, None)) is None:
+            dispatchers = [
+                (disp_type, dispatcher)
+                for disp_type, dispatcher in self._dispatchers.items()
+                if issubclass(msg_type, disp_type)
+            ]
+            self._dispatchers_table[msg_type] = dispatchers
+
+        return dispatchers
+
     def _remote_dispatch(
         self, msg: Message, msg_meta: MessageMetaInformationType
     ) -> None:
@@ -204,6 +269,20 @@ class MessageBus:
 
         return msg_dispatched
 
+    @staticmethod
+    def _collect_executor_metrics(metrics: MetricsRegistry) -> None:
+        for lane, handlers in MessageDispatcher.executors().statistics().items():
+            metrics.gauge(
+                "rds_executor_queued_handlers",
+                "Number of message handlers waiting for a worker",
+                lane=lane.name.lower(),
+            ).set(sum(stats.queued for stats in handlers.values()))
+            metrics.gauge(
+                "rds_executor_running_handlers",
+                "Number of message handlers currently running",
+                lane=lane.name.lower(),
+            ).set(sum(stats.running for stats in handlers.values()))
+
     def _create_context(
         self, msg: Message, msg_meta: MessageMetaInformation, svc: MessageService
     ) -> MessageContextType:
@@ -218,6 +297,13 @@ class MessageBus:
             config=self._comp_data.config,
         )
 
+    @property
+    def executors(self) -> HandlerExecutors:
+        """
+        The executors running asynchronous message handlers.
+        """
+        return MessageDispatcher.executors()
+
     @property
     def network(self) -> NetworkEngine:
         """
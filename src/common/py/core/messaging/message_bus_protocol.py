@@ -1,6 +1,6 @@
 from typing import Protocol
 
-from .message import Message
+from .message import Message, Trace
 from .meta import MessageMetaInformationType
 
 
@@ -10,3 +10,5 @@ class MessageBusProtocol(Protocol):
     Defines the general interface for the ``MessageBus``.
     """
     def dispatch(self, msg: Message, msg_meta: MessageMetaInformationType) -> None: ...
+
+    def has_pending_command(self, unique: Trace) -> bool: ...
@@ -1,5 +1,7 @@
 import typing
 
+from .payload_stream import PayloadStream
+
 PayloadData = typing.Any
 Payload = typing.Dict[str, PayloadData]
 
@@ -7,6 +9,9 @@ Payload = typing.Dict[str, PayloadData]
 class MessagePayload:
     """
     Class holding arbitrary payload data (as key-value pairs) of a message.
+
+    Large binary items can be stored as a ``PayloadStream`` so that they are transmitted in chunks; the same applies to plain binary
+    items exceeding the transmission chunk size.
     """
 
     def __init__(self):
@@ -26,13 +31,38 @@ class MessagePayload:
         """
         Retrieves a payload item.
 
+        Streamed items are returned as their complete data.
+
         Args:
             key: The key of the item.
 
         Returns:
             The item data or *None* otherwise.
         """
-        return self._payload[key] if self.contains(key) else None
+        if not self.contains(key):
+            return None
+
+        data = self._payload[key]
+        return data.read() if isinstance(data, PayloadStream) else data
+
+    def stream(self, key: str) -> PayloadStream | None:
+        """
+        Retrieves a binary payload item as a stream, so that its data can be read chunk by chunk.
+
+        Items received as streams (usually large ones) are only held in memory as a whole when read completely; other binary items are
+        wrapped in a stream.
+
+        Args:
+            key: The key of the item.
+
+        Returns:
+            The item stream or *None* if the item doesn't exist or isn't binary.
+        """
+        data = self._payload.get(key, None)
+        if isinstance(data, (bytes, bytearray)):
+            return PayloadStream(data)
+
+        return data if isinstance(data, PayloadStream) else None
 
     def contains(self, key: str) -> bool:
         """
@@ -59,6 +89,16 @@ class MessagePayload:
         else:
             self._payload = {}
 
+    def read_streams(self) -> None:
+        """
+        Replaces all streamed items with their complete data.
+
+        This detaches the payload from the sources of its streams (e.g., files that are closed once the message has been sent).
+        """
+        for key, data in self._payload.items():
+            if isinstance(data, PayloadStream):
+                self._payload[key] = data.read()
+
     def encode(self) -> Payload:
         """
         Encodes the payload for message passing.
@@ -77,5 +117,19 @@ class MessagePayload:
         """
         self._payload = payload
 
+    @property
+    def size(self) -> int:
+        """
+        The total size (in bytes) of all binary items; other items are not taken into account.
+        """
+        return sum(
+            (
+                data.size
+                if isinstance(data, PayloadStream)
+                else len(data) if isinstance(data, (bytes, bytearray)) else 0
+            )
+            for data in self._payload.values()
+        )
+
     def __str__(self) -> str:
         return ", ".join(self._payload.keys()) if bool(self._payload) else "(empty)"
@@ -1,4 +1,5 @@
 import dataclasses
+import heapq
 import threading
 import time
 import typing
@@ -11,6 +12,11 @@ class MessageMetaInformationList:
     """
     List to store message meta information objects.
 
+    Entries with a timeout are additionally kept in a heap ordered by their deadlines, so timed out entries can be found without
+    scanning the entire list. Removing an entry only drops it from the list; its heap entry is discarded once it becomes due, or when
+    the heap is compacted after too many entries have become stale. Each heap entry carries a sequence number that is also stored in
+    its list entry, so heap entries of removed (or since re-added) messages are always recognized as stale.
+
     Notes:
         The list is thread-safe.
     """
@@ -22,19 +28,30 @@ class MessageMetaInformationList:
         timeout: float = 0.0
         timestamp: float = dataclasses.field(default_factory=lambda: time.time())
 
+        sequence: int = (
+            0  # The sequence number of the entry's heap entry; 0 if it has none (anymore)
+        )
+
+        @property
+        def deadline(self) -> float:
+            """
+            The time at which the message times out.
+            """
+            return self.timestamp + self.timeout
+
         def has_timed_out(self) -> bool:
             """
             Whether the message has timed out.
             """
-            return (
-                time.time() - self.timestamp > self.timeout
-                if self.timeout > 0.0
-                else False
-            )
+            return time.time() > self.deadline if self.timeout > 0.0 else False
 
     def __init__(self):
         self._list: typing.Dict[Trace, MessageMetaInformationList._Entry] = {}
 
+        self._deadlines: typing.List[typing.Tuple[float, int, Trace]] = []
+        self._deadlines_counter = 0
+        self._stale_deadlines = 0
+
         self._lock = threading.Lock()
 
     def add(self, unique: Trace, meta: MessageMetaInformation, timeout: float) -> None:
@@ -48,9 +65,18 @@ class MessageMetaInformationList:
         """
         with self._lock:
             if unique not in self._list:
-                self._list[unique] = MessageMetaInformationList._Entry(
-                    meta, timeout=timeout
-                )
+                entry = MessageMetaInformationList._Entry(meta, timeout=timeout)
+
+                if timeout > 0.0:
+                    # The counter also keeps entries with identical deadlines from being compared by their traces
+                    self._deadlines_counter += 1
+                    entry = dataclasses.replace(entry, sequence=self._deadlines_counter)
+                    heapq.heappush(
+                        self._deadlines,
+                        (entry.deadline, entry.sequence, unique),
+                    )
+
+                self._list[unique] = entry
 
     def remove(self, unique: Trace) -> None:
         """
@@ -60,8 +86,11 @@ class MessageMetaInformationList:
             unique: The unique trace identifying the message.
         """
         with self._lock:
-            if unique in self._list:
-                self._list.pop(unique)
+            if (
+                entry := self._list.pop(unique, None)
+            ) is not None and entry.sequence != 0:
+                self._stale_deadlines += 1
+                self._compact_deadlines()
 
     def find(self, unique: Trace) -> MessageMetaInformation | None:
         """
@@ -78,19 +107,49 @@ class MessageMetaInformationList:
 
     def find_timed_out_entries(self) -> typing.List[Trace]:
         """
-        Finds all entries that have timed out already.
+        Finds all entries that have timed out since the last call.
+
+        Each timed out entry is only reported once; it stays in the list until it is removed, though.
 
         Returns:
             A list of all timed out entries.
         """
+        timed_out: typing.List[Trace] = []
+
         with self._lock:
-            return [
-                unique for unique, entry in self._list.items() if entry.has_timed_out()
-            ]
+            now = time.time()
+
+            while self._deadlines and self._deadlines[0][0] < now:
+                _, sequence, unique = heapq.heappop(self._deadlines)
+
+                if (entry := self._list.get(unique, None)) is not None and (
+                    entry.sequence == sequence
+                ):
+                    # The entry no longer has a heap entry, so removing it later on leaves nothing stale behind
+                    self._list[unique] = dataclasses.replace(entry, sequence=0)
+                    timed_out.append(unique)
+                else:
+                    self._stale_deadlines -= 1
+
+        return timed_out
 
     def _find(self, unique: Trace) -> _Entry | None:
         with self._lock:
-            if unique in self._list:
-                return self._list[unique]
+            return self._list.get(unique, None)
+
+    def _compact_deadlines(self) -> None:
+        # Rebuild the heap once most of its entries are stale; this keeps removals amortized constant
+        if self._stale_deadlines > 64 and self._stale_deadlines * 2 > len(
+            self._deadlines
+        ):
+            self._deadlines = [
+                deadline
+                for deadline in self._deadlines
+                if self._is_live_deadline(deadline)
+            ]
+            heapq.heapify(self._deadlines)
+            self._stale_deadlines = 0
 
-        return None
+    def _is_live_deadline(self, deadline: typing.Tuple[float, int, Trace]) -> bool:
+        entry = self._list.get(deadline[2], None)
+        return entry is not None and entry.sequence == deadline[1]
@@ -4,7 +4,10 @@ import typing
 import socketio
 
 from .. import Message, Payload
+from ..codecs import encode_message
 from ..composers import MessageBuilder
+from .payload_stream_receiver import PayloadStreamReceiver
+from .payload_stream_sender import PayloadStreamSender, STREAM_CHUNK_EVENT
 from ...logging import info, warning, error, debug
 from ....utils import UnitID
 from ....utils.config import Configuration
@@ -31,7 +34,7 @@ class Client(socketio.Client):
 
         self._message_builder = message_builder
 
-        from ....settings import NetworkClientSettingIDs
+        from ....settings import NetworkSettingIDs, NetworkClientSettingIDs
 
         self._server_address: str = self._config.value(
             NetworkClientSettingIDs.SERVER_ADDRESS
@@ -44,6 +47,16 @@ class Client(socketio.Client):
 
         self._message_handler: ClientMessageHandler | None = None
 
+        self._stream_sender = PayloadStreamSender(
+            chunk_size=self._config.value(NetworkSettingIDs.TRANSMISSION_CHUNK_SIZE),
+            window_size=self._config.value(NetworkSettingIDs.TRANSMISSION_WINDOW_SIZE),
+            timeout=self._config.value(NetworkSettingIDs.REGULAR_COMMAND_TIMEOUT),
+        )
+        self._stream_receiver = PayloadStreamReceiver(
+            timeout=self._config.value(NetworkSettingIDs.REGULAR_COMMAND_TIMEOUT),
+            spool_size=self._config.value(NetworkSettingIDs.TRANSMISSION_SPOOL_SIZE),
+        )
+
         self._lock = threading.RLock()
 
         self._connect_events()
@@ -52,6 +65,7 @@ class Client(socketio.Client):
         self.on("connect", self._on_connect)
         self.on("connect_error", self._on_connect_error)
         self.on("disconnect", self._on_disconnect)
+        self.on(STREAM_CHUNK_EVENT, self._on_stream_chunk)
         self.on("*", self._on_message)
 
     def set_message_handler(self, msg_handler: ClientMessageHandler) -> None:
@@ -73,6 +87,7 @@ class Client(socketio.Client):
         """
         Periodically performs certain tasks.
         """
+        self._stream_receiver.purge()
 
     def connect_to_server(self) -> None:
         """
@@ -98,15 +113,33 @@ class Client(socketio.Client):
         """
         Sends a message to the server (if connected).
 
-        For this, the message will be encoded as *JSON* first.
+        For this, the message will be encoded as *JSON* first. Large binary payload items are streamed in chunks beforehand; the lock is
+        not held while streaming.
 
         Args:
             msg: The message to send.
         """
         if self.connected:
-            debug(f"Sending message: {msg}", scope="client")
+            debug("Sending message: %s", msg, scope="client")
+
+            payload, streams = self._stream_sender.prepare(msg.payload)
+
+            try:
+                self._stream_sender.send(
+                    lambda chunk, callback: self.emit(
+                        STREAM_CHUNK_EVENT, data=chunk, callback=callback
+                    ),
+                    streams,
+                )
+            except TimeoutError as exc:
+                error(
+                    f"Unable to stream the payload of message {msg.name}: {str(exc)}",
+                    scope="client",
+                )
+                return
+
             with self._lock:
-                self.emit(msg.name, data=(msg.to_json(), msg.payload.encode()))
+                self.emit(msg.name, data=(encode_message(msg), payload))
 
     def _on_connect(self) -> None:
         with self._lock:
@@ -135,9 +168,26 @@ class Client(socketio.Client):
 
             ClientDisconnectedEvent.build(self._message_builder).emit(Channel.local())
 
+            self._stream_receiver.discard("")
+
             info("Disconnected from server", scope="client")
 
+    def _on_stream_chunk(self, stream_id: str, index: int, chunk: bytes) -> bool:
+        try:
+            self._stream_receiver.add_chunk(stream_id, index, chunk)
+        except ValueError as exc:
+            warning(str(exc), scope="client")
+            return False
+
+        return True
+
     def _on_message(self, msg_name: str, data: str, payload: Payload) -> None:
+        try:
+            payload = self._stream_receiver.resolve(payload)
+        except ValueError as exc:
+            error(f"Dropping message {msg_name}: {str(exc)}", scope="client")
+            return
+
         with self._lock:
             if self._message_handler is not None:
                 self._message_handler(msg_name, data, payload)
@@ -0,0 +1,3 @@
+from .client_managers import create_client_manager
+from .cluster_manager import ClusterManager, ForwardHandler
+from .sqlite_manager import SQLiteManager
@@ -0,0 +1,53 @@
+import typing
+
+import socketio
+
+from .cluster_manager import ClusterManager
+
+
+def _get_manager_type(url: str) -> type[socketio.PubSubManager]:
+    scheme = url.split(":", 1)[0].lower()
+
+    if scheme in ("redis", "rediss", "valkey", "valkeys", "redis+sentinel"):
+        return socketio.RedisManager
+    if scheme in ("amqp", "amqps", "kombu"):
+        return socketio.KombuManager
+    if scheme == "kafka":
+        return socketio.KafkaManager
+    if scheme.startswith("zmq"):
+        return socketio.ZmqManager
+    if scheme == "sqlite":
+        from .sqlite_manager import SQLiteManager
+
+        return SQLiteManager
+
+    raise ValueError(f"Unsupported client manager URL: {url}")
+
+
+def create_client_manager(url: str) -> socketio.PubSubManager | None:
+    """
+    Creates a client manager that shares all clients among multiple server processes.
+
+    The type of the manager is determined by the scheme of the given URL; supported are *Redis/Valkey* (``redis://``), *AMQP*
+    (``amqp://``), *Kafka* (``kafka://``), *ZeroMQ* (``zmq+tcp://``) and *SQLite* (``sqlite://``). The latter is only meant for
+    running multiple processes on a single machine. The created manager always supports forwarding messages between processes
+    (see ``ClusterManager``).
+
+    Args:
+        url: The URL of the message queue; if empty, no manager is created.
+
+    Returns:
+        The new client manager, if any.
+
+    Raises:
+        ValueError: If the URL isn't supported.
+    """
+    if url == "":
+        return None
+
+    manager_type = _get_manager_type(url)
+    cluster_type = typing.cast(
+        type[socketio.PubSubManager],
+        type(f"Cluster{manager_type.__name__}", (ClusterManager, manager_type), {}),
+    )
+    return cluster_type(url=url, channel="rds-ng")
@@ -0,0 +1,72 @@
+import base64
+import typing
+
+from socketio.packet import Packet
+
+from ... import Payload
+
+ForwardHandler = typing.Callable[[str, str, Payload], None]
+
+FORWARD_EVENT = "$rds/forward"
+
+
+class ClusterManager:
+    """
+    Mixin for ``socketio.PubSubManager`` backends that allows forwarding incoming messages to all other server processes.
+
+    Clients are bound to the process they are connected to, so messages sent *by* a client always arrive at that process. Some of these
+    messages can only be handled by a different process, though (e.g., replies to commands issued by another process). These are
+    forwarded through the pub/sub backend, using an event name that is never emitted to actual clients.
+
+    Notes:
+        This class must precede the actual manager class in the list of base classes.
+    """
+
+    _forward_handler: ForwardHandler | None = None
+
+    def set_forward_handler(self, handler: ForwardHandler) -> None:
+        """
+        Sets a handler that gets called when a message forwarded by another process arrives.
+
+        Args:
+            handler: The handler to be called.
+        """
+        self._forward_handler = handler
+
+    def forward(self, msg_name: str, data: str, payload: Payload) -> None:
+        """
+        Forwards a message to all other server processes.
+
+        Args:
+            msg_name: The message name.
+            data: The encoded message.
+            payload: The message payload.
+        """
+        typing.cast(typing.Any, self).emit(
+            FORWARD_EVENT, (msg_name, data, payload), namespace="/"
+        )
+
+    @property
+    def process_id(self) -> str:
+        """
+        The unique identifier of the current server process.
+        """
+        return typing.cast(typing.Any, self).host_id
+
+    def _handle_emit(self, message: typing.Dict[str, typing.Any]) -> None:
+        if message.get("event", None) != FORWARD_EVENT:
+            typing.cast(typing.Any, super())._handle_emit(message)
+            return
+
+        # Forwarded messages are never handled by the process that sent them
+        if message.get("host_id", None) == self.process_id:
+            return
+
+        if self._forward_handler is not None:
+            data = message["data"]
+            if message.get("binary", False):
+                attachments = [base64.b64decode(item) for item in data[1:]]
+                data = Packet.reconstruct_binary(data[0], attachments)
+
+            msg_name, msg_data, payload = data
+            self._forward_handler(msg_name, msg_data, payload)
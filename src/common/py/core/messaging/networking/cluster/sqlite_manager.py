@@ -0,0 +1,105 @@
+import sqlite3
+import threading
+import time
+import typing
+
+import socketio
+
+
+class SQLiteManager(socketio.PubSubManager):
+    """
+    Client manager that uses a shared SQLite database file as its message queue.
+
+    Published messages are appended to a table which is polled by all processes sharing the same file. This is only meant as a
+    stand-in for a proper message queue (like *Redis*) to run multiple server processes on a single machine, e.g., for testing
+    and benchmarking.
+
+    Notes:
+        Messages are kept for a short period of time only; a process that stalls for longer than that will miss messages.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        url: str = "sqlite:///rds-broker.db",
+        channel: str = "socketio",
+        write_only: bool = False,
+        logger: typing.Any = None,
+        json: typing.Any = None,
+        *,
+        poll_interval: float = 0.01,
+        retention: float = 60.0,
+    ):
+        """
+        Args:
+            url: The URL of the database file, either *sqlite:///relative/file.db* or *sqlite:////absolute/file.db*.
+            channel: The channel name on which the server sends and receives notifications.
+            write_only: Whether to only emit events.
+            logger: A custom logger to use.
+            json: An alternative JSON module to use.
+            poll_interval: The interval (in seconds) in which new messages are polled.
+            retention: The time (in seconds) after which messages are deleted.
+        """
+        super().__init__(
+            channel=channel, write_only=write_only, logger=logger, json=json
+        )
+
+        self._filename = url.removeprefix("sqlite://").removeprefix("/")
+        self._poll_interval = poll_interval
+        self._retention = retention
+
+        self._connection = self._connect()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._filename, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS messages (id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, data TEXT NOT NULL, timestamp REAL NOT NULL)"
+        )
+        return connection
+
+    def _publish(self, data: typing.Any) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO messages (channel, data, timestamp) VALUES (?, ?, ?)",
+                (self.channel, self.json.dumps(data), time.time()),
+            )
+
+    def _listen(self) -> typing.Generator[str, None, None]:
+        with self._lock:
+            (last_id,) = self._connection.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM messages"
+            ).fetchone()
+
+        last_purge = time.time()
+
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    "SELECT id, data FROM messages WHERE id > ? AND channel = ? ORDER BY id",
+                    (last_id, self.channel),
+                ).fetchall()
+
+                if time.time() - last_purge >= self._retention:
+                    self._connection.execute(
+                        "DELETE FROM messages WHERE timestamp < ?",
+                        (time.time() - self._retention,),
+                    )
+                    last_purge = time.time()
+
+            for msg_id, data in rows:
+                last_id = msg_id
+                yield data
+
+            if not rows:
+                self._sleep(self._poll_interval)
+
+    def _sleep(self, seconds: float) -> None:
+        if self.server is not None:
+            self.server.sleep(seconds)
+        else:
+            time.sleep(seconds)
@@ -22,6 +22,7 @@ from ..meta import (
     CommandReplyMetaInformation,
     EventMetaInformation,
 )
+from ...metrics import MetricsRegistry, SIZE_BUCKETS
 from ....component import BackendComponentData
 from ....utils import UnitID
 
@@ -73,6 +74,8 @@ class NetworkEngine:
 
         self._filters = NetworkFilters()
 
+        self._metrics = MetricsRegistry()
+
     def _create_client(self) -> Client:
         from ..composers import MessageBuilder
 
@@ -101,6 +104,7 @@ class NetworkEngine:
                     MessageMetaInformation.Entrypoint.SERVER, msg_name, data, payload
                 )
             )
+            self._server.set_forward_handler(self._handle_forwarded_message)
             self._server.run()
 
         if self.has_client:
@@ -137,6 +141,7 @@ class NetworkEngine:
         except NetworkRouter.RoutingError as exc:
             self._routing_error(str(exc), message=str(msg))
         else:
+            self._record_message("out", msg)
             self._route_message(
                 msg,
                 msg_meta,
@@ -169,8 +174,11 @@ class NetworkEngine:
         else:
             from ...logging import debug
 
+            self._record_message("in", msg, len(data))
+
             debug(
-                f"Received message: {msg}",
+                "Received message: %s",
+                msg,
                 scope="network",
                 entrypoint=entrypoint.name,
             )
@@ -188,7 +196,11 @@ class NetworkEngine:
                 if self._router.check_local_routing(
                     NetworkRouter.Direction.IN, msg, msg_meta
                 ):
-                    self._message_bus.dispatch(msg, msg_meta)
+                    if self._is_foreign_reply(msg):
+                        # The command was issued by another server process, so let that process handle the reply
+                        self._server.forward_message(msg_name, data, payload)
+                    else:
+                        self._message_bus.dispatch(msg, msg_meta)
 
                 # Perform rerouting
                 msg = dataclasses.replace(msg, sender=self._comp_data.comp_id)
@@ -199,16 +211,40 @@ class NetworkEngine:
                     skip_components=[self._comp_data.comp_id, msg.sender],
                 )
 
-    def _unpack_message(self, msg_name: str, data: str, payload: Payload) -> Message:
-        # Look up the actual message via its name
-        from .. import MessageTypesCatalog
+    def _handle_forwarded_message(
+        self, msg_name: str, data: str, payload: Payload
+    ) -> None:
+        # Forwarded messages have already been filtered and rerouted by the receiving process
+        try:
+            msg = self._unpack_message(msg_name, data, payload)
+            msg_meta = self._create_message_meta_information(
+                msg, MessageMetaInformation.Entrypoint.SERVER
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._routing_error(str(exc), data=data)
+        else:
+            if isinstance(msg, CommandReply) and self._message_bus.has_pending_command(
+                msg.unique
+            ):
+                from ...logging import debug
+
+                debug("Received forwarded message: %s", msg, scope="network")
 
-        msg_type = MessageTypesCatalog.find_item(msg_name)
-        if msg_type is None:
-            raise RuntimeError(f"The message type '{msg_name}' is unknown")
+                self._message_bus.dispatch(msg, msg_meta)
+
+    def _is_foreign_reply(self, msg: Message) -> bool:
+        return (
+            self.has_server
+            and self._server.is_scaled_out
+            and isinstance(msg, CommandReply)
+            and not self._message_bus.has_pending_command(msg.unique)
+        )
 
-        # Unpack the message into its actual type
-        msg = typing.cast(Message, msg_type.schema().loads(data))
+    def _unpack_message(self, msg_name: str, data: str, payload: Payload) -> Message:
+        # Unpack the message into its actual type using the codec registered for its name
+        from ..codecs import decode_message
+
+        msg = decode_message(msg_name, data)
         self._router.verify_message(NetworkRouter.Direction.IN, msg)
 
         msg.hops.append(self._comp_data.comp_id)
@@ -261,6 +297,32 @@ class NetworkEngine:
 
         raise RuntimeError("No meta information type associated with message type")
 
+    def _record_message(
+        self, direction: str, msg: Message, data_size: int | None = None
+    ) -> None:
+        self._metrics.counter(
+            "rds_network_messages_total",
+            "Number of messages sent or received over the network",
+            direction=direction,
+            message=msg.name,
+        ).inc()
+        self._metrics.histogram(
+            "rds_network_payload_bytes",
+            "Size of the binary payloads of messages sent or received over the network",
+            buckets=SIZE_BUCKETS,
+            direction=direction,
+            message=msg.name,
+        ).observe(msg.payload.size)
+
+        if data_size is not None:
+            self._metrics.histogram(
+                "rds_network_message_bytes",
+                "Size of the encoded messages received over the network (excluding payloads)",
+                buckets=SIZE_BUCKETS,
+                direction=direction,
+                message=msg.name,
+            ).observe(data_size)
+
     def _routing_error(self, msg: str, **kwargs) -> None:
         from ...logging import error
 
@@ -0,0 +1,152 @@
+import dataclasses
+import tempfile
+import threading
+import time
+import typing
+
+from .payload_stream_sender import STREAM_REFERENCE_KEY
+from .. import Payload, PayloadStream
+
+
+class PayloadStreamReceiver:
+    """
+    Reassembles streamed payload items from their incoming chunks.
+
+    The chunks of a stream always arrive before the message referencing it; once that message arrives, all stream references in its
+    payload are replaced by ``PayloadStream`` items holding the received data. Streams that aren't claimed by any message in time are
+    discarded.
+
+    Each stream is written to a temporary file that is only kept in memory as long as it doesn't exceed the spool size, so large
+    payloads never have to be held in memory as a whole; handlers can read them chunk by chunk (see ``MessagePayload.stream``). Since
+    stream IDs are chosen by the sending side, streams are kept per connection.
+
+    Notes:
+        The receiver is thread-safe.
+    """
+
+    @dataclasses.dataclass
+    class _IncomingStream:
+        data: typing.BinaryIO
+        size: int = 0
+        next_index: int = 0
+        last_activity: float = dataclasses.field(default_factory=lambda: time.time())
+
+    def __init__(self, timeout: float, *, spool_size: int = 0):
+        """
+        Args:
+            timeout: The time (in seconds) after which unclaimed streams are discarded.
+            spool_size: The size (in bytes) up to which a stream is kept in memory before being written to disk.
+        """
+        self._timeout = timeout
+        self._spool_size = spool_size
+
+        self._streams: typing.Dict[
+            typing.Tuple[str, str], PayloadStreamReceiver._IncomingStream
+        ] = {}
+
+        self._lock = threading.Lock()
+
+    def add_chunk(
+        self, stream_id: str, index: int, chunk: bytes, *, connection: str = ""
+    ) -> None:
+        """
+        Adds an incoming chunk.
+
+        Args:
+            stream_id: The ID of the stream.
+            index: The index of the chunk within the stream.
+            chunk: The chunk data.
+            connection: The connection (e.g., the SID of a client) the chunk was received from.
+
+        Raises:
+            ValueError: If the chunk is out of sequence.
+        """
+        with self._lock:
+            if (stream := self._streams.get((connection, stream_id), None)) is None:
+                stream = PayloadStreamReceiver._IncomingStream(
+                    data=typing.cast(
+                        typing.BinaryIO,
+                        tempfile.SpooledTemporaryFile(max_size=self._spool_size),
+                    )
+                )
+                self._streams[(connection, stream_id)] = stream
+
+            if index != stream.next_index:
+                self._streams.pop((connection, stream_id)).data.close()
+                raise ValueError(
+                    f"Chunk {index} of stream {stream_id} is out of sequence (expected {stream.next_index})"
+                )
+
+            stream.data.write(chunk)
+            stream.size += len(chunk)
+            stream.next_index += 1
+            stream.last_activity = time.time()
+
+    def resolve(self, payload: Payload, *, connection: str = "") -> Payload:
+        """
+        Replaces all stream references of a payload with the received streams.
+
+        Args:
+            payload: The incoming payload.
+            connection: The connection (e.g., the SID of a client) the payload was received from.
+
+        Returns:
+            The resolved payload.
+
+        Raises:
+            ValueError: If a referenced stream is missing or incomplete.
+        """
+        if not any(self._is_reference(data) for data in payload.values()):
+            return payload
+
+        resolved: Payload = {}
+
+        with self._lock:
+            for key, data in payload.items():
+                if self._is_reference(data):
+                    stream = self._streams.pop(
+                        (connection, data[STREAM_REFERENCE_KEY]), None
+                    )
+                    if stream is None or stream.size != data.get("size", -1):
+                        if stream is not None:
+                            stream.data.close()
+
+                        raise ValueError(
+                            f"The payload stream of item '{key}' is missing or incomplete"
+                        )
+
+                    # The temporary file is removed once the stream has been closed (or garbage-collected)
+                    stream.data.seek(0)
+                    data = PayloadStream(stream.data, size=stream.size)
+
+                resolved[key] = data
+
+        return resolved
+
+    def discard(self, connection: str) -> None:
+        """
+        Discards all streams of a connection (e.g., after it has been closed).
+
+        Args:
+            connection: The connection.
+        """
+        with self._lock:
+            for key in [key for key in self._streams if key[0] == connection]:
+                self._streams.pop(key).data.close()
+
+    def purge(self) -> None:
+        """
+        Discards all streams that haven't been claimed in time.
+        """
+        with self._lock:
+            now = time.time()
+            for key in [
+                key
+                for key, stream in self._streams.items()
+                if now - stream.last_activity > self._timeout
+            ]:
+                self._streams.pop(key).data.close()
+
+    @staticmethod
+    def _is_reference(data: typing.Any) -> bool:
+        return isinstance(data, dict) and STREAM_REFERENCE_KEY in data
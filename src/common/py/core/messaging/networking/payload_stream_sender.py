@@ -0,0 +1,94 @@
+import threading
+import typing
+import uuid
+
+from .. import MessagePayload, Payload, PayloadStream
+
+STREAM_CHUNK_EVENT = "$payload/chunk"
+STREAM_REFERENCE_KEY = "$stream"
+
+PayloadStreamChunkEmitter = typing.Callable[
+    [typing.Tuple[str, int, bytes], typing.Callable[..., None]], None
+]
+
+
+class PayloadStreamSender:
+    """
+    Prepares and sends streamed payload items in separate chunks.
+
+    Each streamed item is replaced by a reference (holding the stream ID and its size) in the payload of the message; its data is then sent
+    as a sequence of chunk frames *before* the message itself. Every chunk needs to be acknowledged by the receiver, and only a limited
+    number of chunks (the *window*) are in-flight at any time, so memory usage stays bounded regardless of the size of the data.
+    """
+
+    def __init__(self, chunk_size: int, window_size: int, timeout: float):
+        """
+        Args:
+            chunk_size: The (maximum) size of each chunk.
+            window_size: The maximum number of unacknowledged chunks.
+            timeout: The time (in seconds) to wait for chunks to be acknowledged.
+        """
+        self._chunk_size = chunk_size
+        self._window_size = max(window_size, 1)
+        self._timeout = timeout
+
+    def prepare(
+        self, payload: MessagePayload, *, allow_streams: bool = True
+    ) -> typing.Tuple[Payload, typing.List[typing.Tuple[str, PayloadStream]]]:
+        """
+        Prepares a payload for sending, replacing all items to be streamed with references.
+
+        Streamed items not exceeding the chunk size, as well as all streams if streaming isn't allowed (e.g., when broadcasting a message),
+        are sent inline instead.
+
+        Args:
+            payload: The message payload.
+            allow_streams: Whether items may be streamed.
+
+        Returns:
+            The encoded payload and all streams that need to be sent.
+        """
+        encoded: Payload = {}
+        streams: typing.List[typing.Tuple[str, PayloadStream]] = []
+
+        for key, data in payload.encode().items():
+            if isinstance(data, (bytes, bytearray)) and len(data) > self._chunk_size:
+                data = PayloadStream(data)
+
+            if isinstance(data, PayloadStream):
+                if allow_streams and data.size > self._chunk_size:
+                    stream_id = str(uuid.uuid4())
+                    streams.append((stream_id, data))
+                    data = {STREAM_REFERENCE_KEY: stream_id, "size": data.size}
+                else:
+                    data = data.read()
+
+            encoded[key] = data
+
+        return encoded, streams
+
+    def send(
+        self,
+        emitter: PayloadStreamChunkEmitter,
+        streams: typing.List[typing.Tuple[str, PayloadStream]],
+    ) -> None:
+        """
+        Sends the chunks of all streams, blocking while the window is full.
+
+        Args:
+            emitter: Function emitting a single chunk; the passed callback must be invoked once the chunk has been acknowledged.
+            streams: The streams to send.
+
+        Raises:
+            TimeoutError: If chunks weren't acknowledged in time.
+        """
+        window = threading.BoundedSemaphore(self._window_size)
+
+        for stream_id, stream in streams:
+            for index, chunk in enumerate(stream.chunks(self._chunk_size)):
+                if not window.acquire(timeout=self._timeout):
+                    raise TimeoutError(
+                        f"Chunk {index} of stream {stream_id} wasn't acknowledged in time"
+                    )
+
+                emitter((stream_id, index, chunk), lambda *_: window.release())
@@ -1,4 +1,6 @@
 import dataclasses
+import heapq
+import itertools
 import threading
 import time
 import typing
@@ -7,8 +9,12 @@ from enum import IntEnum, auto
 import socketio
 
 from .. import Message, Payload
+from ..codecs import encode_message
 from ..composers import MessageBuilder
-from ...logging import info, warning, debug
+from .cluster import ClusterManager, ForwardHandler
+from .payload_stream_receiver import PayloadStreamReceiver
+from .payload_stream_sender import PayloadStreamSender, STREAM_CHUNK_EVENT
+from ...logging import info, warning, error, debug
 from ....utils import UnitID
 from ....utils.config import Configuration
 
@@ -18,6 +24,14 @@ ServerMessageHandler = typing.Callable[[str, str, Payload], None]
 class Server(socketio.Server):
     """
     The server connection, based on ``socketio.Server``.
+
+    Connected components are indexed both by their component ID and their session ID (SID), so that all lookups are done in constant
+    time. Idle timeouts are tracked using a heap of deadlines, so only components that are actually due are checked. The internal lock
+    only guards these indexes; emitting messages and handling incoming ones happen outside of it.
+
+    If a client manager is configured, the server can be scaled out across multiple processes sharing the same message queue. Each
+    connected component then joins a room named after its component ID, so direct messages reach the process holding the target's
+    connection even if the component isn't connected to the current process.
     """
 
     class SendTarget(IntEnum):
@@ -35,15 +49,18 @@ class Server(socketio.Server):
         timeout: float = 0.0
         last_activity: float = dataclasses.field(default_factory=lambda: time.time())
 
+        @property
+        def deadline(self) -> float:
+            """
+            The time at which the connected component times out.
+            """
+            return self.last_activity + self.timeout
+
         def has_timed_out(self) -> bool:
             """
             Whether the connected component has timed out.
             """
-            return (
-                time.time() - self.last_activity > self.timeout
-                if self.timeout > 0.0
-                else False
-            )
+            return time.time() > self.deadline if self.timeout > 0.0 else False
 
     def __init__(
         self, comp_id: UnitID, config: Configuration, message_builder: MessageBuilder
@@ -59,16 +76,35 @@ class Server(socketio.Server):
 
         self._message_builder = message_builder
 
+        self._client_manager = self._create_client_manager()
+
         super().__init__(
+            client_manager=self._client_manager,
             async_mode="gevent",
             cors_allowed_origins=self._get_allowed_origins(),
             cors_credentials=True,
         )
 
         self._connected_components: typing.Dict[UnitID, Server._ComponentEntry] = {}
+        self._connected_clients: typing.Dict[str, UnitID] = {}
+        # Heap entries carry a sequence number, so entries with equal deadlines never need to compare their component IDs
+        self._timeout_deadlines: typing.List[typing.Tuple[float, int, str, UnitID]] = []
+        self._timeout_sequence = itertools.count()
 
         self._message_handler: ServerMessageHandler | None = None
 
+        from ....settings import NetworkSettingIDs
+
+        self._stream_sender = PayloadStreamSender(
+            chunk_size=self._config.value(NetworkSettingIDs.TRANSMISSION_CHUNK_SIZE),
+            window_size=self._config.value(NetworkSettingIDs.TRANSMISSION_WINDOW_SIZE),
+            timeout=self._config.value(NetworkSettingIDs.REGULAR_COMMAND_TIMEOUT),
+        )
+        self._stream_receiver = PayloadStreamReceiver(
+            timeout=self._config.value(NetworkSettingIDs.REGULAR_COMMAND_TIMEOUT),
+            spool_size=self._config.value(NetworkSettingIDs.TRANSMISSION_SPOOL_SIZE),
+        )
+
         self._lock = threading.RLock()
 
         self._connect_events()
@@ -76,6 +112,7 @@ class Server(socketio.Server):
     def _connect_events(self) -> None:
         self.on("connect", self._on_connect)
         self.on("disconnect", self._on_disconnect)
+        self.on(STREAM_CHUNK_EVENT, self._on_stream_chunk)
         self.on("*", self._on_message)
 
     def set_message_handler(self, msg_handler: ServerMessageHandler) -> None:
@@ -87,6 +124,16 @@ class Server(socketio.Server):
         """
         self._message_handler = msg_handler
 
+    def set_forward_handler(self, forward_handler: ForwardHandler) -> None:
+        """
+        Sets a handler that gets called when a message forwarded by another server process arrives.
+
+        Args:
+            forward_handler: The handler to be called.
+        """
+        if self._client_manager is not None:
+            self._client_manager.set_forward_handler(forward_handler)
+
     def run(self) -> None:
         """
         So far, does exactly nothing.
@@ -94,32 +141,33 @@ class Server(socketio.Server):
 
     def process(self) -> None:
         """
-        Periodically purges timed out clients.
+        Periodically purges timed out clients and unclaimed payload streams.
         """
+        self._stream_receiver.purge()
+
         with self._lock:
-            for timed_out_component in self._find_timed_out_components():
-                if timed_out_component in self._connected_components:
-                    debug(
-                        "Component timed out, disconnecting",
-                        scope="server",
-                        component=str(timed_out_component),
-                        timeout=self._connected_components[timed_out_component].timeout,
-                    )
-
-                    from .. import Channel
-                    from ....api.network import ServerTimeoutEvent
-
-                    component = self._connected_components[timed_out_component]
-
-                    ServerTimeoutEvent.build(
-                        self._message_builder,
-                        comp_id=timed_out_component,
-                        client_id=component.sid,
-                    ).emit(Channel.local())
-
-                    self.disconnect(
-                        component.sid
-                    )  # This will trigger _on_disconnect, removing the client from the connected components
+            timed_out_components = self._find_timed_out_components()
+
+        from .. import Channel
+        from ....api.network import ServerTimeoutEvent
+
+        for comp_id, component in timed_out_components:
+            debug(
+                "Component timed out, disconnecting",
+                scope="server",
+                component=str(comp_id),
+                timeout=component.timeout,
+            )
+
+            ServerTimeoutEvent.build(
+                self._message_builder,
+                comp_id=comp_id,
+                client_id=component.sid,
+            ).emit(Channel.local())
+
+            self.disconnect(
+                component.sid
+            )  # This will trigger _on_disconnect, removing the client from the connected components
 
     def send_message(
         self, msg: Message, *, skip_components: typing.List[UnitID] | None = None
@@ -127,31 +175,73 @@ class Server(socketio.Server):
         """
         Sends a message to one or more clients.
 
-        For this, the message will be encoded as *JSON* first.
+        For this, the message will be encoded as *JSON* first. Large binary payload items are streamed in chunks beforehand if the message
+        is sent to a single client.
 
         Args:
             msg: The message to send.
             skip_components: A list of components (clients) to be excluded from the targets.
         """
-        with self._lock:
-            debug(f"Sending message: {msg}", scope="server")
+        debug("Sending message: %s", msg, scope="server")
 
+        with self._lock:
             if msg.target.is_direct and msg.target.target_id is not None:
                 self._timestamp_component(msg.target.target_id)
 
             send_to = self._get_message_recipient(msg)
+            skip_sid = self._component_ids_to_clients(skip_components)
+
+        # Streams require acknowledgements, which only work for clients connected to this process
+        payload, streams = self._stream_sender.prepare(
+            msg.payload, allow_streams=send_to is not None
+        )
+
+        if send_to is None and self._is_remote_target(msg):
+            send_to = self._component_room(msg.target.target_id)
+
+        try:
+            self._stream_sender.send(
+                lambda chunk, callback: self.emit(
+                    STREAM_CHUNK_EVENT, data=chunk, to=send_to, callback=callback
+                ),
+                streams,
+            )
+        except TimeoutError as exc:
+            error(
+                f"Unable to stream the payload of message {msg.name}: {str(exc)}",
+                scope="server",
+            )
+        else:
             self.emit(
                 msg.name,
-                data=(msg.to_json(), msg.payload.encode()),
+                data=(encode_message(msg), payload),
                 to=send_to,
-                skip_sid=self._component_ids_to_clients(skip_components),
-            )
-            return (
-                Server.SendTarget.DIRECT
-                if msg.target.is_direct and send_to is not None
-                else Server.SendTarget.SPREAD
+                skip_sid=skip_sid,
             )
 
+        return (
+            Server.SendTarget.DIRECT
+            if msg.target.is_direct and send_to is not None
+            else Server.SendTarget.SPREAD
+        )
+
+    def forward_message(self, msg_name: str, data: str, payload: Payload) -> None:
+        """
+        Forwards a received message to all other server processes.
+
+        Args:
+            msg_name: The message name.
+            data: The encoded message.
+            payload: The message payload.
+
+        Raises:
+            RuntimeError: If the server isn't scaled out.
+        """
+        if self._client_manager is None:
+            raise RuntimeError("Messages can only be forwarded using a client manager")
+
+        self._client_manager.forward(msg_name, data, payload)
+
     def _on_connect(self, sid: str, _, auth: typing.Dict[str, typing.Any]) -> None:
         with self._lock:
             try:
@@ -178,23 +268,29 @@ class Server(socketio.Server):
             from ....settings import NetworkServerSettingIDs
             from ....component import ComponentType
 
-            self._connected_components[comp_id] = Server._ComponentEntry(
-                sid,
-                timeout=(
-                    self._config.value(NetworkServerSettingIDs.IDLE_TIMEOUT)
-                    if comp_id.type == ComponentType.WEB
-                    else 0.0
+            self._add_client(
+                comp_id,
+                Server._ComponentEntry(
+                    sid,
+                    timeout=(
+                        self._config.value(NetworkServerSettingIDs.IDLE_TIMEOUT)
+                        if comp_id.type == ComponentType.WEB
+                        else 0.0
+                    ),
                 ),
             )
 
-            from .. import Channel
-            from ....api.network import ServerConnectedEvent
+        if self.is_scaled_out:
+            self.enter_room(sid, self._component_room(comp_id))
 
-            ServerConnectedEvent.build(
-                self._message_builder, comp_id=comp_id, client_id=sid
-            ).emit(Channel.local())
+        from .. import Channel
+        from ....api.network import ServerConnectedEvent
 
-            info("Client connected", scope="server", session=sid, component=comp_id)
+        ServerConnectedEvent.build(
+            self._message_builder, comp_id=comp_id, client_id=sid
+        ).emit(Channel.local())
+
+        info("Client connected", scope="server", session=sid, component=comp_id)
 
     def _on_disconnect(self, sid: str) -> None:
         with self._lock:
@@ -202,60 +298,109 @@ class Server(socketio.Server):
 
             self._purge_client(sid)
 
-            from .. import Channel
-            from ....api.network import ServerDisconnectedEvent
+        self._stream_receiver.discard(sid)
 
-            ServerDisconnectedEvent.build(
-                self._message_builder, comp_id=comp_id, client_id=sid
-            ).emit(Channel.local())
+        from .. import Channel
+        from ....api.network import ServerDisconnectedEvent
+
+        ServerDisconnectedEvent.build(
+            self._message_builder, comp_id=comp_id, client_id=sid
+        ).emit(Channel.local())
+
+        info("Client disconnected", scope="server", session=sid)
+
+    def _on_stream_chunk(
+        self, sid: str, stream_id: str, index: int, chunk: bytes
+    ) -> bool:
+        try:
+            self._stream_receiver.add_chunk(stream_id, index, chunk, connection=sid)
+        except ValueError as exc:
+            warning(str(exc), scope="server", session=sid)
+            return False
 
-            info("Client disconnected", scope="server", session=sid)
+        return True
 
     def _on_message(self, msg_name: str, sid: str, data: str, payload: Payload) -> None:
-        with self._lock:
-            if (comp_id := self._lookup_client(sid)) is not None:
-                self._timestamp_component(comp_id)
+        try:
+            payload = self._stream_receiver.resolve(payload, connection=sid)
+        except ValueError as exc:
+            error(
+                f"Dropping message {msg_name}: {str(exc)}", scope="server", session=sid
+            )
+            return
 
-            if self._message_handler is not None:
-                self._message_handler(msg_name, data, payload)
+        if (comp_id := self._lookup_client(sid)) is not None:
+            self._timestamp_component(comp_id)
+
+        if self._message_handler is not None:
+            self._message_handler(msg_name, data, payload)
 
     def _timestamp_component(self, comp_id: UnitID) -> None:
-        if comp_id in self._connected_components:
-            self._connected_components[comp_id].last_activity = time.time()
+        # Only the activity is updated here; the deadlines heap is corrected lazily once an entry becomes due
+        if (entry := self._connected_components.get(comp_id, None)) is not None:
+            entry.last_activity = time.time()
 
-    def _find_timed_out_components(self) -> typing.List[UnitID]:
+    def _find_timed_out_components(
+        self,
+    ) -> typing.List[typing.Tuple[UnitID, "Server._ComponentEntry"]]:
         """
         Finds all components that have timed out already.
 
+        Only entries whose (possibly outdated) deadline has passed are checked; entries that were active in the meantime are
+        re-scheduled using their actual deadline.
+
         Returns:
             A list of all timed out components.
         """
-        return [
-            comp_id
-            for comp_id, entry in self._connected_components.items()
-            if entry.has_timed_out()
-        ]
+        timed_out: typing.List[typing.Tuple[UnitID, Server._ComponentEntry]] = []
+        now = time.time()
+
+        while self._timeout_deadlines and self._timeout_deadlines[0][0] <= now:
+            _, _, sid, comp_id = heapq.heappop(self._timeout_deadlines)
+
+            entry = self._connected_components.get(comp_id, None)
+            if entry is None or entry.sid != sid:
+                continue  # The client is gone or has reconnected in the meantime
+
+            if entry.has_timed_out():
+                timed_out.append((comp_id, entry))
+            else:
+                heapq.heappush(
+                    self._timeout_deadlines,
+                    (entry.deadline, next(self._timeout_sequence), sid, comp_id),
+                )
+
+        return timed_out
+
+    def _add_client(self, comp_id: UnitID, entry: "Server._ComponentEntry") -> None:
+        if (previous := self._connected_components.get(comp_id, None)) is not None:
+            self._connected_clients.pop(previous.sid, None)
+
+        self._connected_components[comp_id] = entry
+        self._connected_clients[entry.sid] = comp_id
+
+        if entry.timeout > 0.0:
+            heapq.heappush(
+                self._timeout_deadlines,
+                (entry.deadline, next(self._timeout_sequence), entry.sid, comp_id),
+            )
 
     def _purge_client(self, sid: str) -> bool:
-        if (comp_id := self._lookup_client(sid)) is not None:
-            self._connected_components.pop(comp_id)
+        if (comp_id := self._connected_clients.pop(sid, None)) is not None:
+            # Stale entries in the deadlines heap are skipped once they become due
+            entry = self._connected_components.get(comp_id, None)
+            if entry is not None and entry.sid == sid:
+                self._connected_components.pop(comp_id)
             return True
 
         return False
 
     def _lookup_client(self, sid: str) -> UnitID | None:
-        for comp_id, client_entry in self._connected_components.items():
-            if client_entry.sid == sid:
-                return comp_id
-
-        return None
+        return self._connected_clients.get(sid, None)
 
     def _component_id_to_client(self, comp_id: UnitID) -> str | None:
-        return (
-            self._connected_components[comp_id].sid
-            if comp_id in self._connected_components
-            else None
-        )
+        entry = self._connected_components.get(comp_id, None)
+        return entry.sid if entry is not None else None
 
     def _component_ids_to_clients(
         self, comp_ids: typing.List[UnitID]
@@ -266,7 +411,7 @@ class Server(socketio.Server):
                 for sid in map(self._component_id_to_client, comp_ids)
                 if sid is not None
             ]
-            if len(comp_ids) > 0
+            if comp_ids
             else None
         )
 
@@ -276,6 +421,31 @@ class Server(socketio.Server):
 
         return None
 
+    def _is_remote_target(self, msg: Message) -> bool:
+        return (
+            self.is_scaled_out
+            and msg.target.is_direct
+            and msg.target.target_id is not None
+        )
+
+    @staticmethod
+    def _component_room(comp_id: UnitID) -> str:
+        return f"component:{comp_id}"
+
+    def _create_client_manager(self) -> ClusterManager | None:
+        from ....settings import NetworkServerSettingIDs
+        from .cluster import create_client_manager
+
+        url: str = self._config.value(NetworkServerSettingIDs.CLIENT_MANAGER)
+        if (client_manager := create_client_manager(url)) is not None:
+            info(
+                "Scaling out using a client manager",
+                scope="server",
+                manager=client_manager.name,
+            )
+
+        return typing.cast(ClusterManager | None, client_manager)
+
     def _get_allowed_origins(self) -> str | typing.List[str] | None:
         from ....settings import NetworkServerSettingIDs
 
@@ -286,3 +456,10 @@ class Server(socketio.Server):
             return "*" if allowed_origins == "*" else allowed_origins.split(",")
 
         return None
+
+    @property
+    def is_scaled_out(self) -> bool:
+        """
+        Whether the server shares its clients with other server processes.
+        """
+        return self._client_manager is not None
@@ -0,0 +1,94 @@
+import io
+import typing
+
+PayloadStreamSource = bytes | bytearray | memoryview | typing.BinaryIO
+
+
+class PayloadStream:
+    """
+    A binary payload item that is transmitted across the network in separate chunks.
+
+    Large binary data would otherwise be sent as a single network frame alongside its message; this frame needs to be held in memory
+    completely (often multiple times) and blocks the connection while being transmitted. Streams are instead sent as a sequence of
+    chunks right before their message, with only a limited number of chunks being in-flight at any time. The receiving side
+    reassembles the data, so message handlers get the complete data just like with any other payload item.
+
+    A stream either wraps data that already resides in memory (which is only copied chunk by chunk) or a readable and seekable binary
+    file (which is read chunk by chunk, starting at its position when the stream was created).
+    """
+
+    def __init__(self, source: PayloadStreamSource, *, size: int | None = None):
+        """
+        Args:
+            source: The data or binary file to stream.
+            size: The size of the data; if not specified, it will be determined automatically.
+        """
+        self._source = source
+        self._offset = (
+            0 if isinstance(source, (bytes, bytearray, memoryview)) else source.tell()
+        )
+        self._size = size if size is not None else self._determine_size()
+
+    def _determine_size(self) -> int:
+        if isinstance(self._source, (bytes, bytearray, memoryview)):
+            return memoryview(self._source).nbytes
+
+        size = self._source.seek(0, io.SEEK_END) - self._offset
+        self._source.seek(self._offset)
+        return size
+
+    def chunks(self, chunk_size: int) -> typing.Generator[bytes, None, None]:
+        """
+        Iterates over the data of the stream in chunks.
+
+        Args:
+            chunk_size: The (maximum) size of each chunk.
+
+        Returns:
+            A generator yielding the chunks.
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be positive")
+
+        if isinstance(self._source, (bytes, bytearray, memoryview)):
+            view = memoryview(self._source).cast("B")
+            for offset in range(0, self._size, chunk_size):
+                yield bytes(view[offset : offset + chunk_size])
+        else:
+            self._source.seek(self._offset)
+            remaining = self._size
+            while remaining > 0 and (
+                chunk := self._source.read(min(chunk_size, remaining))
+            ):
+                remaining -= len(chunk)
+                yield chunk
+
+    def read(self) -> bytes:
+        """
+        Reads the entire data of the stream.
+
+        Returns:
+            The data.
+        """
+        if isinstance(self._source, (bytes, bytearray, memoryview)):
+            return bytes(self._source)
+
+        self._source.seek(self._offset)
+        return self._source.read(self._size)
+
+    def close(self) -> None:
+        """
+        Closes the underlying file (if any).
+        """
+        if not isinstance(self._source, (bytes, bytearray, memoryview)):
+            self._source.close()
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the data.
+        """
+        return self._size
+
+    def __str__(self) -> str:
+        return f"<stream of {self._size} bytes>"
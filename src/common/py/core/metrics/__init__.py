@@ -0,0 +1,4 @@
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram, LATENCY_BUCKETS, SIZE_BUCKETS
+from .metrics_registry import MetricsRegistry, MetricsCollector
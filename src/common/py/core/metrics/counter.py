@@ -0,0 +1,31 @@
+import threading
+
+
+class Counter:
+    """
+    A monotonically increasing value.
+
+    Notes:
+        The counter is thread-safe; each counter has its own lock, so contention only arises between threads updating the same counter.
+    """
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increases the counter.
+
+        Args:
+            amount: The amount to add.
+        """
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """
+        The current value.
+        """
+        return self._value
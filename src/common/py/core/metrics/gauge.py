@@ -0,0 +1,26 @@
+class Gauge:
+    """
+    A value that can arbitrarily go up and down.
+
+    Notes:
+        Setting a gauge is atomic, so no locking is required.
+    """
+
+    def __init__(self):
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Sets the gauge.
+
+        Args:
+            value: The new value.
+        """
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        """
+        The current value.
+        """
+        return self._value
@@ -0,0 +1,90 @@
+import bisect
+import threading
+import typing
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = (
+    256,
+    1024,
+    4 * 1024,
+    16 * 1024,
+    64 * 1024,
+    256 * 1024,
+    1024 * 1024,
+    4 * 1024 * 1024,
+    16 * 1024 * 1024,
+    64 * 1024 * 1024,
+)
+
+
+class Histogram:
+    """
+    Counts observed values in buckets of configurable upper bounds.
+
+    Notes:
+        The histogram is thread-safe; each histogram has its own lock, so contention only arises between threads updating the same
+        histogram.
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            buckets: The (ascending) upper bounds of the buckets; an implicit bucket catches all larger values.
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+
+        self._sum = 0.0
+        self._count = 0
+
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Records a new value.
+
+        Args:
+            value: The observed value.
+        """
+        index = bisect.bisect_left(self._buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(
+        self,
+    ) -> typing.Tuple[typing.List[typing.Tuple[float, int]], float, int]:
+        """
+        Gets a consistent snapshot of the histogram.
+
+        Returns:
+            The cumulative counts per upper bound (including infinity), the sum and the number of all observed values.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+
+        cumulative: typing.List[typing.Tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self._buckets + (float("inf"),), counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+
+        return cumulative, total, count
@@ -0,0 +1,206 @@
+import dataclasses
+import threading
+import typing
+
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram, LATENCY_BUCKETS
+
+MetricsCollector = typing.Callable[["MetricsRegistry"], None]
+
+
+class MetricsRegistry:
+    """
+    Global registry of all metrics, exported in the *Prometheus* text format.
+
+    Metrics are grouped into families (sharing a name, type and help text) and identified within a family by their labels. Looking up an
+    existing metric doesn't acquire any lock; only creating a new one does. Collectors can be registered to update gauges right before
+    the metrics are rendered.
+
+    Notes:
+        The registry is thread-safe; its state is shared among all instances.
+    """
+
+    LabelsKey = typing.Tuple[typing.Tuple[str, str], ...]
+
+    @dataclasses.dataclass
+    class _Family:
+        metric_type: str
+        help: str
+
+        metrics: typing.Dict["MetricsRegistry.LabelsKey", typing.Any] = (
+            dataclasses.field(default_factory=dict)
+        )
+
+    _families: typing.Dict[str, _Family] = {}
+    _collectors: typing.List[MetricsCollector] = []
+    _lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        """
+        Gets (or creates) a counter.
+
+        Args:
+            name: The metric name.
+            help_text: A description of the metric.
+            **labels: The labels identifying the counter.
+
+        Returns:
+            The counter.
+        """
+        return self._get_metric(name, "counter", help_text, labels, Counter)
+
+    def gauge(self, name: str, help_text: str, **labels: str) -> Gauge:
+        """
+        Gets (or creates) a gauge.
+
+        Args:
+            name: The metric name.
+            help_text: A description of the metric.
+            **labels: The labels identifying the gauge.
+
+        Returns:
+            The gauge.
+        """
+        return self._get_metric(name, "gauge", help_text, labels, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        *,
+        buckets: typing.Sequence[float] = LATENCY_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """
+        Gets (or creates) a histogram.
+
+        Args:
+            name: The metric name.
+            help_text: A description of the metric.
+            buckets: The upper bounds of the buckets; only used when creating a new histogram.
+            **labels: The labels identifying the histogram.
+
+        Returns:
+            The histogram.
+        """
+        return self._get_metric(
+            name, "histogram", help_text, labels, lambda: Histogram(buckets)
+        )
+
+    def add_collector(self, collector: MetricsCollector) -> None:
+        """
+        Adds a collector that is called before rendering the metrics.
+
+        Collectors are registered for the entire process; adding the same collector again has no effect.
+
+        Args:
+            collector: The collector.
+        """
+        with MetricsRegistry._lock:
+            if collector not in MetricsRegistry._collectors:
+                MetricsRegistry._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the *Prometheus* text exposition format.
+
+        Returns:
+            The rendered metrics.
+        """
+        from ..logging import error
+
+        with MetricsRegistry._lock:
+            collectors = list(MetricsRegistry._collectors)
+
+        for collector in collectors:
+            try:
+                collector(self)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                error(f"Unable to collect metrics: {str(exc)}", scope="metrics")
+
+        with MetricsRegistry._lock:
+            families = [
+                (name, family, list(family.metrics.items()))
+                for name, family in sorted(MetricsRegistry._families.items())
+            ]
+
+        lines: typing.List[str] = []
+        for name, family, metrics in families:
+            lines.append(f"# HELP {name} {self._escape(family.help, False)}")
+            lines.append(f"# TYPE {name} {family.metric_type}")
+
+            for labels, metric in metrics:
+                if isinstance(metric, Histogram):
+                    buckets, total, count = metric.snapshot()
+                    for bound, bucket_count in buckets:
+                        lines.append(
+                            f"{name}_bucket{self._format_labels(labels + (('le', self._format_value(bound)),))} {bucket_count}"
+                        )
+                    lines.append(
+                        f"{name}_sum{self._format_labels(labels)} {self._format_value(total)}"
+                    )
+                    lines.append(f"{name}_count{self._format_labels(labels)} {count}")
+                else:
+                    lines.append(
+                        f"{name}{self._format_labels(labels)} {self._format_value(metric.value)}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+    def _get_metric(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        labels: typing.Dict[str, str],
+        factory: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        key = tuple(sorted(labels.items()))
+
+        # Fast path: Existing metrics are looked up without locking
+        if (family := MetricsRegistry._families.get(name, None)) is not None and (
+            metric := family.metrics.get(key, None)
+        ) is not None:
+            return metric
+
+        with MetricsRegistry._lock:
+            family = MetricsRegistry._families.setdefault(
+                name, MetricsRegistry._Family(metric_type, help_text)
+            )
+            if family.metric_type != metric_type:
+                raise ValueError(
+                    f"The metric {name} has already been registered as a {family.metric_type}"
+                )
+
+            if (metric := family.metrics.get(key, None)) is None:
+                metric = factory()
+                family.metrics[key] = metric
+
+            return metric
+
+    @staticmethod
+    def _format_labels(labels: "MetricsRegistry.LabelsKey") -> str:
+        if not labels:
+            return ""
+
+        return (
+            "{"
+            + ",".join(
+                f'{name}="{MetricsRegistry._escape(str(value), True)}"'
+                for name, value in labels
+            )
+            + "}"
+        )
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if value == float("inf"):
+            return "+Inf"
+
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+    @staticmethod
+    def _escape(text: str, quotes: bool) -> str:
+        text = text.replace("\\", "\\\\").replace("\n", "\\n")
+        return text.replace('"', '\\"') if quotes else text
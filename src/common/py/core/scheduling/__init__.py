@@ -0,0 +1,2 @@
+from .scheduled_job import ScheduledJob, ScheduledJobCallback, OverlapPolicy
+from .scheduler import Scheduler
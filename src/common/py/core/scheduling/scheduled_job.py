@@ -0,0 +1,46 @@
+import dataclasses
+import typing
+from enum import IntEnum, auto
+
+ScheduledJobCallback = typing.Callable[[], None]
+
+
+class OverlapPolicy(IntEnum):
+    """
+    Defines what happens if a job becomes due while its previous run is still active.
+    """
+
+    SKIP = auto()  # The due run is skipped
+    ALLOW = auto()  # The job is run concurrently
+
+
+@dataclasses.dataclass(kw_only=True)
+class ScheduledJob:
+    """
+    A job that is run periodically by the ``Scheduler``.
+
+    Attributes:
+        name: The name of the job.
+        callback: The function to call.
+        interval: The interval (in seconds) between two runs.
+        jitter: A random delay (in seconds, up to this value) added to each run to avoid synchronized load peaks.
+        overlap: How to handle runs that become due while the previous one is still active.
+        dedicated: Whether the job is run by its own worker instead of the shared worker pool.
+        next_run: The time of the next run.
+        active_runs: The number of currently active runs.
+        skipped_runs: The number of runs skipped due to the overlap policy.
+        cancelled: Whether the job has been cancelled.
+    """
+
+    name: str
+    callback: ScheduledJobCallback
+
+    interval: float
+    jitter: float = 0.0
+    overlap: OverlapPolicy = OverlapPolicy.SKIP
+    dedicated: bool = False
+
+    next_run: float = 0.0
+    active_runs: int = 0
+    skipped_runs: int = 0
+    cancelled: bool = False
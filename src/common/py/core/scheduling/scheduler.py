@@ -0,0 +1,208 @@
+import heapq
+import random
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from .scheduled_job import ScheduledJob, ScheduledJobCallback, OverlapPolicy
+
+
+class Scheduler:
+    """
+    Runs jobs periodically.
+
+    All jobs are kept in a heap ordered by their next run; a single scheduler thread sleeps until the earliest job becomes due and
+    hands it over to a (bounded) pool of worker threads. Each job has its own interval, an optional jitter and a policy defining what
+    happens if it becomes due while its previous run is still active.
+
+    Jobs that must run on time regardless of the load of the shared pool (e.g., the periodic ticks of the message bus) can be run by a
+    dedicated worker instead; runs of such a job never overlap.
+
+    Notes:
+        The scheduler is thread-safe.
+    """
+
+    def __init__(self, *, max_workers: int = 4):
+        """
+        Args:
+            max_workers: The maximum number of jobs running concurrently.
+        """
+        self._jobs: typing.List[typing.Tuple[float, int, ScheduledJob]] = []
+        self._jobs_counter = 0
+
+        self._thread_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scheduler"
+        )
+        self._dedicated_pools: typing.Dict[int, ThreadPoolExecutor] = {}
+        self._thread: threading.Thread | None = None
+
+        self._running = False
+        self._condition = threading.Condition()
+
+    def schedule(
+        self,
+        name: str,
+        callback: ScheduledJobCallback,
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        overlap: OverlapPolicy = OverlapPolicy.SKIP,
+        delay: float = 0.0,
+        dedicated: bool = False,
+    ) -> ScheduledJob:
+        """
+        Schedules a new periodic job.
+
+        Args:
+            name: The name of the job.
+            callback: The function to call.
+            interval: The interval (in seconds) between two runs.
+            jitter: A random delay (in seconds, up to this value) added to each run.
+            overlap: How to handle runs that become due while the previous one is still active.
+            delay: The delay (in seconds) before the first run.
+            dedicated: Whether the job is run by its own worker instead of the shared worker pool.
+
+        Returns:
+            The scheduled job.
+
+        Raises:
+            ValueError: If the interval isn't positive.
+        """
+        if interval <= 0.0:
+            raise ValueError(f"The interval of job {name} must be positive")
+
+        job = ScheduledJob(
+            name=name,
+            callback=callback,
+            interval=interval,
+            jitter=max(jitter, 0.0),
+            overlap=overlap,
+            dedicated=dedicated,
+            next_run=time.time() + delay + self._jitter(jitter),
+        )
+
+        with self._condition:
+            if dedicated:
+                self._dedicated_pools[id(job)] = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"scheduler-{name}"
+                )
+
+            self._push_job(job)
+            self._condition.notify()
+
+        return job
+
+    def cancel(self, job: ScheduledJob) -> None:
+        """
+        Cancels a job; active runs are not interrupted.
+
+        Args:
+            job: The job to cancel.
+        """
+        with self._condition:
+            job.cancelled = True
+
+            if (pool := self._dedicated_pools.pop(id(job), None)) is not None:
+                pool.shutdown(wait=False)
+
+    def run(self) -> None:
+        """
+        Starts the scheduler thread.
+        """
+        with self._condition:
+            if self._running:
+                return
+
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._loop, name="scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        """
+        Stops the scheduler thread and waits for all active runs to finish.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+        with self._condition:
+            pools = [self._thread_pool, *self._dedicated_pools.values()]
+            self._dedicated_pools = {}
+
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _loop(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+
+                now = time.time()
+                due_jobs: typing.List[ScheduledJob] = []
+
+                while self._jobs and self._jobs[0][0] <= now:
+                    _, _, job = heapq.heappop(self._jobs)
+                    if job.cancelled:
+                        continue
+
+                    if job.overlap == OverlapPolicy.SKIP and job.active_runs > 0:
+                        job.skipped_runs += 1
+                    else:
+                        job.active_runs += 1
+                        due_jobs.append(job)
+
+                    # Runs that have been missed (e.g., due to a blocked scheduler) aren't caught up on
+                    job.next_run = max(job.next_run + job.interval, now) + self._jitter(
+                        job.jitter
+                    )
+                    self._push_job(job)
+
+                if not due_jobs:
+                    self._condition.wait(
+                        timeout=self._jobs[0][0] - now if self._jobs else None
+                    )
+                    continue
+
+                pools = [
+                    self._dedicated_pools.get(id(job), self._thread_pool)
+                    for job in due_jobs
+                ]
+
+            for job, pool in zip(due_jobs, pools):
+                try:
+                    pool.submit(self._execute, job)
+                except RuntimeError:
+                    # The pool has been shut down (the job was cancelled meanwhile)
+                    with self._condition:
+                        job.active_runs -= 1
+
+    def _execute(self, job: ScheduledJob) -> None:
+        try:
+            job.callback()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            import traceback
+            from ..logging import error, debug
+
+            error(
+                f"An exception occurred within a scheduled job: {str(exc)}",
+                scope="scheduler",
+                job=job.name,
+                exception=type(exc),
+            )
+            debug(f"Traceback:\n{''.join(traceback.format_exc())}", scope="scheduler")
+        finally:
+            with self._condition:
+                job.active_runs -= 1
+
+    def _push_job(self, job: ScheduledJob) -> None:
+        # The counter keeps jobs with identical run times from being compared
+        self._jobs_counter += 1
+        heapq.heappush(self._jobs, (job.next_run, self._jobs_counter, job))
+
+    @staticmethod
+    def _jitter(jitter: float) -> float:
+        return random.uniform(0.0, jitter) if jitter > 0.0 else 0.0
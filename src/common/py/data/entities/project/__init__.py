@@ -1,5 +1,10 @@
 from .project import Project, ProjectID
 from .project_job import ProjectJob, ProjectJobID
+from .project_summary import ProjectSummary
 
-from .project_utils import find_project_by_id, apply_project_features_update
+from .project_utils import (
+    find_project_by_id,
+    apply_project_features_update,
+    create_project_summary,
+)
 from .project_job_utils import combine_project_job_id
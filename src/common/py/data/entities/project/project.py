@@ -29,6 +29,7 @@ class Project:
         project_id: The unique project identifier.
         user_id: The ID of the user this project belongs to.
         creation_time: A UNIX timestamp of the project creation time.
+        update_time: A UNIX timestamp of the last change of the project data, its features or logbook.
         resources_path: The resources path of the project.
         title: The title of the project.
         description: An optional project description.
@@ -106,6 +107,7 @@ class Project:
     user_id: UserID
 
     creation_time: float
+    update_time: float = 0.0
 
     resources_path: str
 
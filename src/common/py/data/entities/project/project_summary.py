@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from dataclasses_json import dataclass_json
+
+from .logbook import ProjectJobHistoryRecord
+from .project import Project, ProjectID
+from ..connector import ConnectorInstanceID
+from ..user import UserID
+
+
+@dataclass_json
+@dataclass(kw_only=True)
+class ProjectSummary:
+    """
+    A lightweight summary of a **Project**, used for project lists.
+
+    Leaves out the (potentially large) project features and only includes the unseen records of the job history; these can be
+    fetched separately for a single project when needed.
+
+    Attributes:
+        project_id: The unique project identifier.
+        user_id: The ID of the user this project belongs to.
+        creation_time: A UNIX timestamp of the project creation time.
+        update_time: A UNIX timestamp of the last change of the project data, its features or logbook.
+        resources_path: The resources path of the project.
+        title: The title of the project.
+        description: An optional project description.
+        status: The project status.
+        options: All project options.
+        job_counts: The number of successful jobs per connector instance.
+        unseen_job_history: All job history records not seen by the user yet.
+    """
+
+    @dataclass_json
+    @dataclass(kw_only=True)
+    class JobCount:
+        """
+        The number of successful jobs of a single connector instance.
+
+        Attributes:
+            connector_instance: The connector instance ID.
+            count: The number of successful jobs.
+        """
+
+        connector_instance: ConnectorInstanceID
+        count: int = 0
+
+    project_id: ProjectID
+    user_id: UserID
+
+    creation_time: float
+    update_time: float = 0.0
+
+    resources_path: str
+
+    title: str
+    description: str
+
+    status: Project.Status = Project.Status.ACTIVE
+
+    options: Project.Options = field(default_factory=Project.Options)
+
+    job_counts: List[JobCount] = field(default_factory=list)
+    unseen_job_history: List[ProjectJobHistoryRecord] = field(default_factory=list)
@@ -2,6 +2,8 @@ import typing
 
 from .features import ProjectFeatureID
 from .project import Project, ProjectID
+from .project_summary import ProjectSummary
+from ..connector import ConnectorInstanceID
 
 
 def find_project_by_id(
@@ -55,3 +57,40 @@ def apply_project_features_update(
 
     if apply_to is None or DataManagementPlanFeature.feature_id in apply_to:
         project.features.dmp.plan = updated_features.dmp.plan
+
+
+def create_project_summary(project: Project) -> ProjectSummary:
+    """
+    Creates the summary of a project.
+
+    Args:
+        project: The project.
+
+    Returns:
+        The project summary.
+    """
+    job_counts: typing.Dict[ConnectorInstanceID, int] = {}
+    for record in project.logbook.job_history:
+        if record.success:
+            job_counts[record.connector_instance] = (
+                job_counts.get(record.connector_instance, 0) + 1
+            )
+
+    return ProjectSummary(
+        project_id=project.project_id,
+        user_id=project.user_id,
+        creation_time=project.creation_time,
+        update_time=project.update_time,
+        resources_path=project.resources_path,
+        title=project.title,
+        description=project.description,
+        status=project.status,
+        options=project.options,
+        job_counts=[
+            ProjectSummary.JobCount(connector_instance=instance, count=count)
+            for instance, count in job_counts.items()
+        ],
+        unseen_job_history=[
+            record for record in project.logbook.job_history if not record.seen
+        ],
+    )
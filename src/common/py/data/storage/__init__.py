@@ -1,3 +1,4 @@
+from .storage_condition import StorageCondition
 from .storage_exception import StorageException
 
 from .authorization_token_storage import AuthorizationTokenStorage
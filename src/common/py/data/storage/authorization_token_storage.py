@@ -24,3 +24,15 @@ class AuthorizationTokenStorage(
         Returns:
             The matching tokens list.
         """
+
+    @abc.abstractmethod
+    def filter_by_expiration(self, timestamp: float) -> typing.List[AuthorizationToken]:
+        """
+        Returns all tokens that expire at or before the specified time; tokens without an expiration time are ignored.
+
+        Args:
+            timestamp: The expiration timestamp.
+
+        Returns:
+            The matching tokens list.
+        """
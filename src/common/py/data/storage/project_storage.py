@@ -2,7 +2,7 @@ import abc
 import typing
 
 from .storage import Storage
-from ..entities.project import Project, ProjectID
+from ..entities.project import Project, ProjectID, ProjectSummary
 from ..entities.user import UserID
 
 
@@ -22,3 +22,17 @@ class ProjectStorage(Storage[Project, ProjectID], abc.ABC):
         Returns:
             The matching projects list.
         """
+
+    @abc.abstractmethod
+    def filter_summaries_by_user(self, user_id: UserID) -> typing.List[ProjectSummary]:
+        """
+        Returns the summaries of all projects associated with the specified user.
+
+        Unlike ``filter_by_user``, this doesn't load the project features and the full logbooks.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            The matching project summaries.
+        """
@@ -2,6 +2,9 @@ import abc
 import threading
 import typing
 
+from .storage_condition import StorageCondition
+from .storage_exception import StorageException
+
 EntityType = typing.TypeVar("EntityType")  # pylint: disable=invalid-name
 EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
 
@@ -9,20 +12,21 @@ EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
 class Storage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
     """
     Defines a general storage interface for basic CRUD operations.
-    """
 
-    @abc.abstractmethod
-    def next_id(self) -> EntityKeyType:
-        """
-        Gets the next ID to use for a new entity.
-        """
-        raise NotImplementedError()
+    Besides single entities, entities can also be accessed in bulk. The default implementations of these operations simply process one
+    entity after another; storages should override them using native bulk operations where possible.
+    """
 
     @abc.abstractmethod
-    def add(self, entity: EntityType) -> None:
+    def add(self, entity: EntityType) -> EntityKeyType:
         """
         Adds a new entity or updates an existing one.
 
+        Storages that generate IDs automatically assign a new ID to an entity whose ID is unset (i.e., 0).
+
+        Returns:
+            The ID of the entity.
+
         Raises:
               StorageException: If the entity couldn't be added.
         """
@@ -63,3 +67,63 @@ class Storage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
             StorageException: If the entities couldn't be listed.
         """
         raise NotImplementedError()
+
+    def get_many(self, keys: typing.Iterable[EntityKeyType]) -> typing.List[EntityType]:
+        """
+        Retrieves all entities identified by the given keys.
+
+        Returns:
+            The found entities, in the order of their keys; keys without a matching entity are skipped.
+
+        Raises:
+            StorageException: If the entities couldn't be fetched.
+        """
+        return [entity for key in keys if (entity := self.get(key)) is not None]
+
+    def add_many(
+        self, entities: typing.Iterable[EntityType]
+    ) -> typing.List[EntityKeyType]:
+        """
+        Adds new entities or updates existing ones.
+
+        Returns:
+            The IDs of the entities.
+
+        Raises:
+              StorageException: If the entities couldn't be added.
+        """
+        return [self.add(entity) for entity in entities]
+
+    def remove_many(self, entities: typing.Iterable[EntityType]) -> None:
+        """
+        Removes multiple entities; entities that don't exist (anymore) are ignored.
+
+        Raises:
+              StorageException: If the entities couldn't be removed.
+        """
+        for entity in entities:
+            try:
+                self.remove(entity)
+            except StorageException:
+                pass
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        """
+        Removes all entities fulfilling all the given conditions.
+
+        Args:
+            conditions: The conditions to check.
+
+        Returns:
+            The number of removed entities.
+
+        Raises:
+              StorageException: If the entities couldn't be removed.
+        """
+        entities = [
+            entity
+            for entity in self.list()
+            if all(condition.matches(entity) for condition in conditions)
+        ]
+        self.remove_many(entities)
+        return len(entities)
@@ -0,0 +1,70 @@
+import dataclasses
+import operator
+import typing
+from enum import StrEnum
+
+
+@dataclasses.dataclass(frozen=True)
+class StorageCondition:
+    """
+    A condition on an attribute of stored entities.
+
+    Conditions are independent of the actual storage: They can be checked against entities directly, but also be translated into
+    native queries (e.g., SQL statements) by a storage.
+
+    Examples:
+        ```
+        StorageCondition("announce_timestamp", StorageCondition.Operator.LESS, time.time() - max_age)
+        ```
+
+    Attributes:
+        attribute: The name of the entity attribute.
+        op: The comparison operator.
+        value: The value to compare the attribute with; for ``IN``, this must be a collection of values.
+    """
+
+    class Operator(StrEnum):
+        """
+        The supported comparison operators.
+        """
+
+        EQUAL = "=="
+        NOT_EQUAL = "!="
+        LESS = "<"
+        LESS_EQUAL = "<="
+        GREATER = ">"
+        GREATER_EQUAL = ">="
+        IN = "in"
+
+    attribute: str
+    op: Operator
+    value: typing.Any
+
+    def matches(self, entity: typing.Any) -> bool:
+        """
+        Checks whether an entity fulfills this condition.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            Whether the condition is fulfilled.
+        """
+        value = getattr(entity, self.attribute)
+
+        if self.op == StorageCondition.Operator.IN:
+            return value in self.value
+
+        return _OPERATORS[self.op](value, self.value)
+
+
+_OPERATORS: typing.Dict[
+    StorageCondition.Operator, typing.Callable[[typing.Any, typing.Any], bool]
+] = {
+    StorageCondition.Operator.EQUAL: operator.eq,
+    StorageCondition.Operator.NOT_EQUAL: operator.ne,
+    StorageCondition.Operator.LESS: operator.lt,
+    StorageCondition.Operator.LESS_EQUAL: operator.le,
+    StorageCondition.Operator.GREATER: operator.gt,
+    StorageCondition.Operator.GREATER_EQUAL: operator.ge,
+}
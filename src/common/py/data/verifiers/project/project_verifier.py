@@ -13,7 +13,7 @@ class ProjectVerifier(Verifier):
         self._user = user
 
     def verify_create(self) -> None:
-        self._verify_id()
+        # The project ID is only assigned when the project is stored
         self._verify_user_id()
         self._verify_title()
         self._verify_resource()
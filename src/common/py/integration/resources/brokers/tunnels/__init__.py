@@ -1 +1,2 @@
 from .memory_broker_tunnel import MemoryBrokerTunnel
+from .spooled_broker_tunnel import SpooledBrokerTunnel
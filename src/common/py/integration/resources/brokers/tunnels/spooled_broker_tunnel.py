@@ -0,0 +1,80 @@
+import tempfile
+
+from typing_extensions import Buffer
+
+from .. import ResourcesBrokerTunnel
+from .....data.entities.resource import Resource
+
+
+class SpooledBrokerTunnel(ResourcesBrokerTunnel):
+    """
+    Tunnel buffering small data in memory and larger data in a temporary file.
+
+    Memory usage thus stays bounded regardless of the size of the transferred resource.
+    """
+
+    def __init__(self, resource: Resource, *, max_memory_size: int):
+        """
+        Args:
+            resource: The resource.
+            max_memory_size: The maximum size (in bytes) of data kept in memory before it is written to a temporary file.
+        """
+        super().__init__(resource)
+
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+        self._data_ready = False
+
+    def seek(self, *args, **kwargs):
+        if self._data_ready:  # We only support seek during reads
+            return self._buffer.seek(*args, **kwargs)
+
+        return super().seek(*args, **kwargs)
+
+    def seekable(self) -> bool:
+        # We only support seek during reads
+        return self._data_ready
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def readable(self) -> bool:
+        return self._data_ready
+
+    def read(self, size: int = -1) -> bytes | None:
+        if not self.readable():
+            raise RuntimeError("Tried to read from an unfinished spooled broker tunnel")
+
+        return self._buffer.read(size)
+
+    def readall(self) -> bytes | None:
+        return self.read()
+
+    def writable(self) -> bool:
+        return not self._data_ready
+
+    def write(self, data: Buffer) -> int | None:
+        if self.readable():
+            raise RuntimeError("Tried to write to a finished spooled broker tunnel")
+
+        bytes_written = self._buffer.write(data)
+        self._progress(bytes_written)
+        return bytes_written
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._data_ready = False
+
+        super().close()
+
+    def _done(self) -> None:
+        self._buffer.seek(0)
+        self._data_ready = True
+
+        super()._done()
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes written to the tunnel.
+        """
+        return self._bytes_written
@@ -1,4 +1,5 @@
 from .client_service_context import ClientServiceContext
+from ..core.messaging.executors import HandlerLane
 from .service import Service, ServiceContext
 from ..component import BackendComponent
 
@@ -14,9 +15,9 @@ def create_component_service(comp: BackendComponent) -> Service:
         The newly created service.
     """
     from ..core.messaging import Channel
-    from ..api.component import ComponentInformationEvent, ComponentProcessEvent
+    from ..api.component import ComponentInformationEvent
 
-    svc = comp.create_service("Component service")
+    svc = comp.create_service("Component service", lane=HandlerLane.CONTROL)
 
     @svc.message_handler(ComponentInformationEvent)
     def component_information(
@@ -37,9 +38,4 @@ def create_component_service(comp: BackendComponent) -> Service:
                 chain=msg,
             ).emit(remote_channel)
 
-    @svc.message_handler(ComponentProcessEvent)
-    def component_process(msg: ComponentProcessEvent, ctx: ServiceContext) -> None:
-        # Listen to this event to avoid complains about unhandled messages
-        pass
-
     return svc
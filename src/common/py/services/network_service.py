@@ -1,4 +1,5 @@
 from .client_service_context import ClientServiceContext
+from ..core.messaging.executors import HandlerLane
 from .service import Service, ServiceContext
 from ..component import BackendComponent
 
@@ -26,7 +27,7 @@ def create_network_service(comp: BackendComponent) -> Service:
     )
     from ..api.component import ComponentInformationEvent
 
-    svc = comp.create_service("Network service")
+    svc = comp.create_service("Network service", lane=HandlerLane.CONTROL)
 
     @svc.message_handler(PingCommand)
     def ping(msg: PingCommand, ctx: ServiceContext) -> None:
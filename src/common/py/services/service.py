@@ -3,8 +3,13 @@ import typing
 from .service_context import ServiceContextType, ServiceContext
 from ..core.messaging import Message, MessageType, MessageBusProtocol
 from ..core.messaging.composers import MessageBuilder
+from ..core.messaging.executors import HandlerLane
 from ..core.messaging.handlers import MessageHandler, MessageService
+from ..core.scheduling import Scheduler, ScheduledJob, OverlapPolicy
 from ..utils import UnitID
+from ..utils.config import Configuration
+
+PeriodicJob = typing.Callable[[ServiceContextType], None]
 
 
 @typing.final
@@ -24,6 +29,12 @@ class Service(MessageService):
         @svc.message_handler("msg/event", Event)
         def h(msg: Event, ctx: ServiceContext) -> None:
             ctx.logger.info(f"EVENT HANDLER CALLED")
+
+    Recurring tasks are defined using the ``periodic_job`` decorator; each run receives its own service context::
+
+        @svc.periodic_job(60.0)
+        def j(ctx: ServiceContext) -> None:
+            ctx.logger.info(f"PERIODIC JOB CALLED")
     """
 
     def __init__(
@@ -32,18 +43,28 @@ class Service(MessageService):
         name: str,
         *,
         message_bus: MessageBusProtocol,
+        scheduler: Scheduler,
+        config: Configuration,
         context_type: type[ServiceContextType] = ServiceContext,
+        lane: HandlerLane = HandlerLane.INTERACTIVE,
     ):
         """
         Args:
             comp_id: The global component identifier.
             name: The service name.
             message_bus: The global message bus.
+            scheduler: The global scheduler.
+            config: The global component configuration.
             context_type: The type to use when creating a service context.
+            lane: The default lane (executor) asynchronous message handlers of this service are run in.
         """
         super().__init__(comp_id, message_bus=message_bus, context_type=context_type)
 
         self._name = name
+        self._lane = lane
+
+        self._scheduler = scheduler
+        self._config = config
 
         self._state = type("", (), {})()
 
@@ -54,6 +75,7 @@ class Service(MessageService):
         *,
         name_filter: str = "",
         is_async: bool = True,
+        lane: HandlerLane | None = None,
     ) -> typing.Callable[[MessageHandler], MessageHandler]:
         """
         A decorator to declare a message handler.
@@ -68,6 +90,7 @@ class Service(MessageService):
             message_type: The type of the message.
             name_filter: A more generic message name filter to match against; wildcards (*) are supported as well.
             is_async: Whether to execute the handler asynchronously in its own thread.
+            lane: The lane (executor) to run an asynchronous handler in; defaults to the lane of the service.
         """
 
         def decorator(handler: MessageHandler) -> MessageHandler:
@@ -76,11 +99,78 @@ class Service(MessageService):
                 handler,
                 message_type,
                 is_async,
+                lane if lane is not None else self._lane,
             )
             return handler
 
         return decorator
 
+    def periodic_job(
+        self,
+        /,
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        overlap: OverlapPolicy = OverlapPolicy.SKIP,
+        delay: float = 0.0,
+    ) -> typing.Callable[[PeriodicJob], PeriodicJob]:
+        """
+        A decorator to declare a job that is run periodically by the global scheduler.
+
+        To define a new periodic job, use the following pattern::
+
+            @svc.periodic_job(60.0)
+            def j(ctx: ServiceContext) -> None:
+                ctx.logger.info(f"PERIODIC JOB CALLED")
+
+        Args:
+            interval: The interval (in seconds) between two runs.
+            jitter: A random delay (in seconds, up to this value) added to each run.
+            overlap: How to handle runs that become due while the previous one is still active; by default, such runs are skipped.
+            delay: The delay (in seconds) before the first run.
+        """
+
+        def decorator(job: PeriodicJob) -> PeriodicJob:
+            self._schedule_job(
+                job, interval, jitter=jitter, overlap=overlap, delay=delay
+            )
+            return job
+
+        return decorator
+
+    def _schedule_job(
+        self,
+        job: PeriodicJob,
+        interval: float,
+        *,
+        jitter: float,
+        overlap: OverlapPolicy,
+        delay: float,
+    ) -> ScheduledJob:
+        from ..core.logging import LoggerProtocol, LoggerProxy, default_logger
+        from ..core.messaging.meta import EventMetaInformation
+
+        def _run_job() -> None:
+            ctx = self.create_context(
+                EventMetaInformation(entrypoint=EventMetaInformation.Entrypoint.LOCAL),
+                self._component_id,
+                logger=typing.cast(LoggerProtocol, LoggerProxy(default_logger())),
+                config=self._config,
+            )
+
+            # Any exception is logged by the context and passed on to the scheduler
+            with ctx(requires_reply=False):
+                job(ctx)
+
+        return self._scheduler.schedule(
+            f"{self._name}/{job.__name__}",
+            _run_job,
+            interval,
+            jitter=jitter,
+            overlap=overlap,
+            delay=delay,
+        )
+
     @property
     def name(self) -> str:
         """
@@ -1,5 +1,6 @@
 from .general_setting_ids import GeneralSettingIDs
 from .component_setting_ids import ComponentSettingIDs
+from .executors_setting_ids import ExecutorsSettingIDs
 from .network_setting_ids import (
     NetworkSettingIDs,
     NetworkServerSettingIDs,
@@ -12,6 +12,7 @@ def get_default_settings() -> typing.Dict[SettingID, typing.Any]:
         A dictionary mapping the setting identifiers to their default values.
     """
     from .component_setting_ids import ComponentSettingIDs
+    from .executors_setting_ids import ExecutorsSettingIDs
     from .general_setting_ids import GeneralSettingIDs
     from .integration_setting_ids import IntegrationSettingIDs
     from .network_setting_ids import (
@@ -28,12 +29,27 @@ def get_default_settings() -> typing.Dict[SettingID, typing.Any]:
         # Network settings
         NetworkSettingIDs.API_KEY: "",
         NetworkSettingIDs.TRANSMISSION_CHUNK_SIZE: 1 * 1024 * 1024,
+        NetworkSettingIDs.TRANSMISSION_WINDOW_SIZE: 4,
+        NetworkSettingIDs.TRANSMISSION_SPOOL_SIZE: 8 * 1024 * 1024,
         NetworkSettingIDs.REGULAR_COMMAND_TIMEOUT: 10,
+        NetworkSettingIDs.COMMAND_TIMEOUT_RESOLUTION: 0.1,
         NetworkSettingIDs.EXTERNAL_REQUESTS_TIMEOUT: 15,
         NetworkServerSettingIDs.ALLOWED_ORIGINS: "",
         NetworkServerSettingIDs.IDLE_TIMEOUT: 30 * 60,
+        NetworkServerSettingIDs.CLIENT_MANAGER: "",
         NetworkClientSettingIDs.SERVER_ADDRESS: "",
         NetworkClientSettingIDs.CONNECTION_TIMEOUT: 10,
+        # Executors settings
+        ExecutorsSettingIDs.CONTROL_WORKERS: 4,
+        ExecutorsSettingIDs.CONTROL_QUEUE_SIZE: 256,
+        ExecutorsSettingIDs.CONTROL_POLICY: "block",
+        ExecutorsSettingIDs.INTERACTIVE_WORKERS: 16,
+        ExecutorsSettingIDs.INTERACTIVE_QUEUE_SIZE: 1024,
+        ExecutorsSettingIDs.INTERACTIVE_POLICY: "block",
+        ExecutorsSettingIDs.BULK_WORKERS: 4,
+        ExecutorsSettingIDs.BULK_QUEUE_SIZE: 64,
+        ExecutorsSettingIDs.BULK_POLICY: "reject",
+        ExecutorsSettingIDs.BLOCK_TIMEOUT: 5.0,
         # Integration settings
         IntegrationSettingIDs.DEFAULT_ROOT_PATH: "/",
     }
@@ -0,0 +1,37 @@
+from ..utils.config import SettingID
+
+
+class ExecutorsSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for the settings of the executors running asynchronous message handlers.
+
+    Each handler lane (control, interactive and bulk) has its own executor; the rejection policy is either ``block``, ``reject`` or
+    ``caller_runs``. Handlers dispatched from a worker of a blocking lane into the same lane never wait, but are run in that worker if
+    the lane is full.
+
+    Attributes:
+        CONTROL_WORKERS: The number of workers of the control lane (value type: ``int``).
+        CONTROL_QUEUE_SIZE: The maximum number of queued handlers of the control lane; set to 0 for an unbounded queue (value type: ``int``).
+        CONTROL_POLICY: The rejection policy of the control lane (value type: ``string``).
+        INTERACTIVE_WORKERS: The number of workers of the interactive lane (value type: ``int``).
+        INTERACTIVE_QUEUE_SIZE: The maximum number of queued handlers of the interactive lane; set to 0 for an unbounded queue (value type: ``int``).
+        INTERACTIVE_POLICY: The rejection policy of the interactive lane (value type: ``string``).
+        BULK_WORKERS: The number of workers of the bulk lane (value type: ``int``).
+        BULK_QUEUE_SIZE: The maximum number of queued handlers of the bulk lane; set to 0 for an unbounded queue (value type: ``int``).
+        BULK_POLICY: The rejection policy of the bulk lane (value type: ``string``).
+        BLOCK_TIMEOUT: The time (in seconds) a blocked caller waits before a handler is rejected; set to 0 to wait indefinitely (value type: ``float``).
+    """
+    CONTROL_WORKERS = SettingID("executors.control", "workers")
+    CONTROL_QUEUE_SIZE = SettingID("executors.control", "queue_size")
+    CONTROL_POLICY = SettingID("executors.control", "policy")
+
+    INTERACTIVE_WORKERS = SettingID("executors.interactive", "workers")
+    INTERACTIVE_QUEUE_SIZE = SettingID("executors.interactive", "queue_size")
+    INTERACTIVE_POLICY = SettingID("executors.interactive", "policy")
+
+    BULK_WORKERS = SettingID("executors.bulk", "workers")
+    BULK_QUEUE_SIZE = SettingID("executors.bulk", "queue_size")
+    BULK_POLICY = SettingID("executors.bulk", "policy")
+
+    BLOCK_TIMEOUT = SettingID("executors", "block_timeout")
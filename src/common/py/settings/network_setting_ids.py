@@ -9,14 +9,20 @@ class NetworkSettingIDs:
     Attributes:
         API_KEY: An arbitrary API key to access protected resources (value type: ``string``).
         TRANSMISSION_CHUNK_SIZE: The size (in bytes) for network transmissions (value type: ``int``).
+        TRANSMISSION_WINDOW_SIZE: The maximum number of unacknowledged chunks when streaming large payloads (value type: ``int``).
+        TRANSMISSION_SPOOL_SIZE: The size (in bytes) up to which received payload streams are kept in memory before being written to a temporary file (value type: ``int``).
         REGULAR_COMMAND_TIMEOUT: The timeout (in seconds) for commands (value type: ``float``).
+        COMMAND_TIMEOUT_RESOLUTION: The interval (in seconds) in which command timeouts are checked (value type: ``float``).
         EXTERNAL_REQUESTS_TIMEOUT: The maximum time (in seconds) for requests to external services; set to 0 to disable (value type: ``float``).
     """
     API_KEY = SettingID("network", "api_key")
 
     TRANSMISSION_CHUNK_SIZE = SettingID("network", "transmission_chunnk_size")
+    TRANSMISSION_WINDOW_SIZE = SettingID("network", "transmission_window_size")
+    TRANSMISSION_SPOOL_SIZE = SettingID("network", "transmission_spool_size")
 
     REGULAR_COMMAND_TIMEOUT = SettingID("network", "regular_command_timeout")
+    COMMAND_TIMEOUT_RESOLUTION = SettingID("network", "command_timeout_resolution")
     EXTERNAL_REQUESTS_TIMEOUT = SettingID("network", "external_requests_timeout")
 
 
@@ -28,9 +34,11 @@ class NetworkServerSettingIDs:
     Attributes:
         ALLOWED_ORIGINS: A comma-separated list of allowed origins; use the asterisk (*) to allow all (value type: ``string``).
         IDLE_TIMEOUT: The time (in seconds) until idle clients will be disconnected automatically; set to 0 to disable (value type: ``float``).
+        CLIENT_MANAGER: The URL of a message queue used to share clients among multiple server processes, e.g. *redis://host:6379/0* or *sqlite:///path/to/broker.db*; leave empty to run a single server process (value type: ``string``).
     """
     ALLOWED_ORIGINS = SettingID("network.server", "allowed_origins")
     IDLE_TIMEOUT = SettingID("network.server", "idle_timeout")
+    CLIENT_MANAGER = SettingID("network.server", "client_manager")
 
 
 class NetworkClientSettingIDs:
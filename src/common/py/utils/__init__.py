@@ -1,8 +1,8 @@
-from .entry_guard import EntryGuard
 from .files import get_mime_type
 from .items_catalog import ItemsCatalog
 from .paths import relativize_path
 from .random import generate_random_string
+from .read_write_lock import ReadWriteLock
 from .request_data import RequestData
 from .strings import ensure_starts_with, format_elapsed_time, human_readable_file_size
 from .unit_id import UnitID
@@ -1,3 +1,4 @@
+import types
 import typing
 import os
 
@@ -23,6 +24,10 @@ class Configuration:
 
         General.Debug -> RDS_GENERAL_DEBUG
 
+    All settings with a default value are resolved (including the type conversion of environment variables) into an immutable, flat
+    snapshot whenever defaults are added or settings are (re-)loaded, so accessing a setting is a single dictionary lookup. Changes of
+    environment variables are only picked up by an explicit ``reload``, which swaps the snapshot atomically.
+
     Notes:
         When accessing a setting value, a default value must *always* be present. This means that before a setting can be accessed,
         a default value must be added using ``add_defaults``.
@@ -37,9 +42,14 @@ class Configuration:
 
         self._settings = {}
         self._defaults = {}
+        self._default_keys: typing.Set[SettingID] = set()
 
         self._env_prefix = env_prefix
 
+        self._snapshot: typing.Mapping[SettingID, typing.Any] = types.MappingProxyType(
+            {}
+        )
+
     def load(self, filename: str) -> None:
         """
         Loads settings from a *TOML* file.
@@ -51,14 +61,21 @@ class Configuration:
             FileNotFoundError: If the specified file doesn't exist or couldn't be opened.
         """
         self._settings_file = filename
+        self._settings = self._load_settings(filename)
 
-        if os.path.exists(filename):
-            with open(filename, "rb") as file:
-                import tomllib
+        self._update_snapshot()
 
-                self._settings = tomllib.load(file)
-        else:
-            raise FileNotFoundError("Configuration file doesn't exist")
+    def reload(self) -> None:
+        """
+        Reloads the settings file (if any) and the environment variables, replacing all current settings at once.
+
+        Raises:
+            FileNotFoundError: If the settings file doesn't exist anymore or couldn't be opened.
+        """
+        if self._settings_file != "":
+            self._settings = self._load_settings(self._settings_file)
+
+        self._update_snapshot()
 
     def add_defaults(self, defaults: typing.Dict[SettingID, typing.Any]) -> None:
         """
@@ -77,6 +94,9 @@ class Configuration:
             self._unfold_dict_item(key.split(), values, value)
             self._defaults = always_merger.merge(self._defaults, values)
 
+        self._default_keys.update(defaults.keys())
+        self._update_snapshot()
+
     def value(self, key: SettingID) -> typing.Any:
         """
         Gets the value of a setting.
@@ -93,8 +113,11 @@ class Configuration:
         Raises:
             KeyError: The setting identifier was not found in the defaults.
         """
-        default = self._traverse_dict(key.split(), self._defaults)
-        return self._value(key, default)
+        try:
+            return self._snapshot[key]
+        except KeyError:
+            # Settings not contained in the snapshot (e.g., entire sections) are resolved directly
+            return self._resolve(key)
 
     def value_with_default(self, key: SettingID, default: typing.Any) -> typing.Any:
         """
@@ -111,6 +134,25 @@ class Configuration:
         """
         return self._value(key, default)
 
+    def _load_settings(self, filename: str) -> typing.Dict[str, typing.Any]:
+        if os.path.exists(filename):
+            with open(filename, "rb") as file:
+                import tomllib
+
+                return tomllib.load(file)
+        else:
+            raise FileNotFoundError("Configuration file doesn't exist")
+
+    def _update_snapshot(self) -> None:
+        # The new snapshot is built completely before replacing the current one, so readers always see a consistent state
+        self._snapshot = types.MappingProxyType(
+            {key: self._resolve(key) for key in self._default_keys}
+        )
+
+    def _resolve(self, key: SettingID) -> typing.Any:
+        default = self._traverse_dict(key.split(), self._defaults)
+        return self._value(key, default)
+
     def _value(self, key: SettingID, default: typing.Any) -> typing.Any:
         env_key = key.env_name(self._env_prefix)
         if env_key in os.environ:
@@ -122,8 +164,9 @@ class Configuration:
             return default
 
     def _traverse_dict(self, path: typing.List[str], dct: typing.Dict) -> typing.Any:
-        dct = dct[path[0]]
-        return dct if len(path) == 1 else self._traverse_dict(path[1:], dct)
+        for name in path:
+            dct = dct[name]
+        return dct
 
     def _unfold_dict_item(
         self, path: typing.List[str], dct: typing.Dict, value: typing.Any
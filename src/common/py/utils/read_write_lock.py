@@ -0,0 +1,141 @@
+import contextlib
+import threading
+import typing
+
+
+class ReadWriteLock:
+    """
+    A lock that allows multiple concurrent readers but only a single writer.
+
+    Writers are preferred: Once a writer is waiting, new readers are held back until it is done, so that writers cannot starve.
+    Both read and write locks are reentrant, and a thread holding the write lock may also acquire the read lock; upgrading a read
+    lock to a write lock is not possible, though.
+
+    Examples:
+        ```
+        lock = ReadWriteLock()
+
+        with lock.read():
+            ...
+
+        with lock.write():
+            ...
+        ```
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+        # Each thread keeps track of its own read locks; nested read locks aren't counted as additional readers
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def read(self) -> typing.Generator[None, None, None]:
+        """
+        Context manager holding the read lock.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write(self) -> typing.Generator[None, None, None]:
+        """
+        Context manager holding the write lock.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def acquire_read(self) -> None:
+        """
+        Acquires the read lock, blocking while a writer holds or waits for the lock.
+        """
+        reads = self._thread_reads()
+
+        if self._writer == threading.get_ident() or reads:
+            reads.append(False)
+            return
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._writer is None and self._writers_waiting == 0
+            )
+            self._readers += 1
+
+        reads.append(True)
+
+    def release_read(self) -> None:
+        """
+        Releases the read lock.
+
+        Raises:
+            RuntimeError: If the read lock isn't held by the calling thread.
+        """
+        reads = self._thread_reads()
+        if not reads:
+            raise RuntimeError("Released a read lock that wasn't acquired")
+
+        if reads.pop():
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquires the write lock, blocking while any other thread holds the lock.
+
+        Raises:
+            RuntimeError: If the calling thread holds a read lock.
+        """
+        ident = threading.get_ident()
+
+        with self._condition:
+            if self._writer == ident:
+                self._writer_depth += 1
+                return
+
+            if any(self._thread_reads()):
+                raise RuntimeError("A read lock can't be upgraded to a write lock")
+
+            self._writers_waiting += 1
+            try:
+                self._condition.wait_for(
+                    lambda: self._writer is None and self._readers == 0
+                )
+            finally:
+                self._writers_waiting -= 1
+
+            self._writer = ident
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """
+        Releases the write lock.
+
+        Raises:
+            RuntimeError: If the write lock isn't held by the calling thread.
+        """
+        with self._condition:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Released a write lock that wasn't acquired")
+
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
+
+    def _thread_reads(self) -> typing.List[bool]:
+        if not hasattr(self._local, "reads"):
+            self._local.reads = []
+        return self._local.reads
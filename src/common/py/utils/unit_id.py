@@ -1,3 +1,4 @@
+import functools
 import typing
 from dataclasses import dataclass
 
@@ -14,6 +15,9 @@ class UnitID:
     belonging to the overall infrastructure), the ``unit`` name itself (e.g., *'server'*), and an ``instance`` specifier (used to
     distinguish multiple instances of the same unit).
     
+    Identifiers are used as dictionary keys and formatted as strings all the time, so both their string representation and hash are
+    computed only once (but never pickled). Identifiers created using ``intern`` or ``from_string`` are additionally shared among all users.
+    
     Attributes:
         type: The unit type.
         unit: The unit name.
@@ -46,6 +50,23 @@ class UnitID:
         return True
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def intern(type_: str, unit: str, instance: str | None = None) -> 'UnitID':
+        """
+        Gets a shared ``UnitID`` instance.
+        
+        Args:
+            type_: The unit type.
+            unit: The unit name.
+            instance: The instance specifier.
+
+        Returns:
+            The (shared) ``UnitID``.
+        """
+        return UnitID(type_, unit, instance)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def from_string(id_str: str) -> 'UnitID':
         """
         Creates a new ``UnitID`` from a string.
@@ -61,16 +82,40 @@ class UnitID:
         Raises:
             ValueError: If the passed string is invalid.
         """
-        from pathlib import PurePosixPath
-        path = PurePosixPath(id_str).parts
+        # Empty and current-directory parts are skipped, just like a path would treat them
+        path = [part for part in id_str.split("/") if part not in ("", ".")]
         if len(path) == 3:
-            return UnitID(path[0], path[1], path[2])
+            return UnitID.intern(path[0], path[1], path[2])
         if len(path) == 2:
-            return UnitID(path[0], path[1])
+            return UnitID.intern(path[0], path[1])
             
         raise ValueError(f"The unit ID '{id_str}' is invalid")
     
+    def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
+        
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        
+        return self.type == other.type and self.unit == other.unit and self.instance == other.instance
+    
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        # The cached hash depends on the hash seed of the current process, so it must never be pickled
+        return {"type": self.type, "unit": self.unit, "instance": self.instance}
+    
+    def __hash__(self) -> int:
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            value = hash((self.type, self.unit, self.instance))
+            object.__setattr__(self, "_hash", value)
+            return value
+    
     def __str__(self) -> str:
-        from pathlib import PurePosixPath
-        path = PurePosixPath(self.type, self.unit, self.instance) if self.instance is not None else PurePosixPath(self.type, self.unit)
-        return str(path)
+        try:
+            return self.__dict__["_str"]
+        except KeyError:
+            value = f"{self.type}/{self.unit}/{self.instance}" if self.instance is not None else f"{self.type}/{self.unit}"
+            object.__setattr__(self, "_str", value)
+            return value
@@ -6,13 +6,17 @@ import { CommandComposer } from "../../core/messaging/composers/CommandComposer"
 import { CommandReplyComposer } from "../../core/messaging/composers/CommandReplyComposer";
 import { MessageBuilder } from "../../core/messaging/composers/MessageBuilder";
 import { Message } from "../../core/messaging/Message";
+import { ProjectFeatures } from "../../data/entities/project/features/ProjectFeatures";
+import { ProjectLogbook } from "../../data/entities/project/logbook/ProjectLogbook";
 import { type RecordID } from "../../data/entities/project/logbook/ProjectLogbookRecord";
 import { ProjectLogbookType } from "../../data/entities/project/logbook/ProjectLogbookType";
-import { Project, type ProjectID } from "../../data/entities/project/Project";
+import { type ProjectID } from "../../data/entities/project/Project";
 import { ProjectOptions } from "../../data/entities/project/ProjectOptions";
+import { ProjectSummary } from "../../data/entities/project/ProjectSummary";
 
 /**
  * Command to fetch all projects of the current user. Requires a ``ListProjectsReply`` reply.
+ * Only project summaries are sent; the details of a project can be fetched using ``GetProjectDetailsCommand``.
  */
 @Message.define("command/project/list")
 export class ListProjectsCommand extends Command {
@@ -27,13 +31,13 @@ export class ListProjectsCommand extends Command {
 /**
  * Reply to ``ListProjectsCommand``.
  *
- * @param projects - The projects list.
+ * @param projects - The project summaries list.
  */
 @Message.define("command/project/list/reply")
 export class ListProjectsReply extends CommandReply {
     // @ts-ignore
-    @Type(() => Project)
-    public readonly projects: Project[] = [];
+    @Type(() => ProjectSummary)
+    public readonly projects: ProjectSummary[] = [];
 
     /**
      * Helper function to easily build this message.
@@ -41,7 +45,7 @@ export class ListProjectsReply extends CommandReply {
     public static build(
         messageBuilder: MessageBuilder,
         cmd: ListProjectsCommand,
-        projects: Project[],
+        projects: ProjectSummary[],
         success: boolean = true,
         message: string = "",
     ): CommandReplyComposer<ListProjectsReply> {
@@ -49,6 +53,60 @@ export class ListProjectsReply extends CommandReply {
     }
 }
 
+/**
+ * Command to fetch the details of a project of the current user, which aren't part of its summary. Requires a ``GetProjectDetailsReply`` reply.
+ *
+ * @param project_id - The ID of the project.
+ */
+@Message.define("command/project/details")
+export class GetProjectDetailsCommand extends Command {
+    public readonly project_id: ProjectID = 0;
+
+    /**
+     * Helper function to easily build this message.
+     */
+    public static build(messageBuilder: MessageBuilder, projectID: ProjectID, chain: Message | null = null): CommandComposer<GetProjectDetailsCommand> {
+        return messageBuilder.buildCommand(GetProjectDetailsCommand, { project_id: projectID }, chain);
+    }
+}
+
+/**
+ * Reply to ``GetProjectDetailsCommand``.
+ *
+ * @param project_id - The ID of the project.
+ * @param features - All project features.
+ * @param logbook - The project's logbook.
+ */
+@Message.define("command/project/details/reply")
+export class GetProjectDetailsReply extends CommandReply {
+    public readonly project_id: ProjectID = 0;
+
+    // @ts-ignore
+    @Type(() => ProjectFeatures)
+    public readonly features: ProjectFeatures = new ProjectFeatures();
+    // @ts-ignore
+    @Type(() => ProjectLogbook)
+    public readonly logbook: ProjectLogbook = new ProjectLogbook();
+
+    /**
+     * Helper function to easily build this message.
+     */
+    public static build(
+        messageBuilder: MessageBuilder,
+        cmd: GetProjectDetailsCommand,
+        features: ProjectFeatures,
+        logbook: ProjectLogbook,
+        success: boolean = true,
+        message: string = "",
+    ): CommandReplyComposer<GetProjectDetailsReply> {
+        return messageBuilder.buildCommandReply(GetProjectDetailsReply, cmd, success, message, {
+            project_id: cmd.project_id,
+            features: features,
+            logbook: logbook,
+        });
+    }
+}
+
 /**
  * Command to create a project. Requires a ``CreateProjectReply`` reply.
  *
@@ -5,23 +5,24 @@ import { MessageBuilder } from "../../core/messaging/composers/MessageBuilder";
 import { Event } from "../../core/messaging/Event";
 import { Message } from "../../core/messaging/Message";
 import { ProjectLogbook } from "../../data/entities/project/logbook/ProjectLogbook";
-import { Project, type ProjectID } from "../../data/entities/project/Project";
+import { type ProjectID } from "../../data/entities/project/Project";
+import { ProjectSummary } from "../../data/entities/project/ProjectSummary";
 
 /**
  * Emitted whenever the user's projects list has been updated.
  *
- * @param projects - The projects list.
+ * @param projects - The project summaries list.
  */
 @Message.define("event/project/list")
 export class ProjectsListEvent extends Event {
     // @ts-ignore
-    @Type(() => Project)
-    public readonly projects: Project[] = [];
+    @Type(() => ProjectSummary)
+    public readonly projects: ProjectSummary[] = [];
 
     /**
      * Helper function to easily build this message.
      */
-    public static build(messageBuilder: MessageBuilder, projects: Project[], chain: Message | null = null): EventComposer<ProjectsListEvent> {
+    public static build(messageBuilder: MessageBuilder, projects: ProjectSummary[], chain: Message | null = null): EventComposer<ProjectsListEvent> {
         return messageBuilder.buildEvent(ProjectsListEvent, { projects: projects }, chain);
     }
 }
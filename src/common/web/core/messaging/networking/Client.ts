@@ -1,7 +1,7 @@
 import { io, Socket } from "socket.io-client";
 
 import { ClientConnectedEvent, ClientConnectionErrorEvent, ClientDisconnectedEvent } from "../../../api/network/NetworkEvents";
-import { NetworkClientSettingIDs } from "../../../settings/NetworkSettingIDs";
+import { NetworkClientSettingIDs, NetworkSettingIDs } from "../../../settings/NetworkSettingIDs";
 import { Configuration } from "../../../utils/config/Configuration";
 import { UnitID } from "../../../utils/UnitID";
 import logging from "../../logging/Logging";
@@ -9,6 +9,7 @@ import { MessageBuilder } from "../composers/MessageBuilder";
 import { Channel } from "../Channel";
 import { Message } from "../Message";
 import { type Payload } from "../MessagePayload";
+import { PayloadStreamReceiver, StreamChunkEvent } from "./PayloadStreamReceiver";
 
 type ClientMessageHandler = (msgName: string, data: string, payload: Payload) => void;
 
@@ -21,6 +22,7 @@ export class Client {
 
     private readonly _socket: Socket;
     private readonly _messageBuilder: MessageBuilder;
+    private readonly _streamReceiver: PayloadStreamReceiver;
 
     private readonly _serverAddress: string;
     private readonly _connectionTimeout: number;
@@ -41,6 +43,7 @@ export class Client {
 
         this._socket = this.createSocket();
         this._messageBuilder = messageBuilder;
+        this._streamReceiver = new PayloadStreamReceiver(this._config.value<number>(NetworkSettingIDs.RegularCommandTimeout));
 
         this.connectEvents();
     }
@@ -64,7 +67,14 @@ export class Client {
         this._socket.on("connect", () => this.onConnect());
         this._socket.on("connect_error", (reason: any) => this.onConnectError(reason));
         this._socket.on("disconnect", () => this.onDisconnect());
-        this._socket.onAny((msgName: string, data: string, payload: Payload) => this.onMessage(msgName, data, payload));
+        this._socket.on(StreamChunkEvent, (streamID: string, index: number, chunk: ArrayBuffer, ack: (result: boolean) => void) =>
+            this.onStreamChunk(streamID, index, chunk, ack)
+        );
+        this._socket.onAny((msgName: string, data: string, payload: Payload) => {
+            if (msgName != StreamChunkEvent) {
+                this.onMessage(msgName, data, payload);
+            }
+        });
     }
 
     /**
@@ -77,7 +87,9 @@ export class Client {
     /**
      * Periodically performs certain tasks.
      */
-    public process(): void {}
+    public process(): void {
+        this._streamReceiver.purge();
+    }
 
     /**
      * Establishes the connection to the server.
@@ -135,7 +147,24 @@ export class Client {
         logging.info("Disconnected from server", "client");
     }
 
+    private onStreamChunk(streamID: string, index: number, chunk: ArrayBuffer, ack: (result: boolean) => void): void {
+        try {
+            this._streamReceiver.addChunk(streamID, index, chunk);
+            ack(true);
+        } catch (err) {
+            logging.warning(String(err), "client");
+            ack(false);
+        }
+    }
+
     private onMessage(msgName: string, data: string, payload: Payload): void {
+        try {
+            payload = this._streamReceiver.resolve(payload);
+        } catch (err) {
+            logging.error(`Dropping message ${msgName}: ${String(err)}`, "client");
+            return;
+        }
+
         if (this._messageHandler) {
             this._messageHandler(msgName, data, payload);
         }
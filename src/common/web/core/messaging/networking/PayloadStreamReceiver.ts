@@ -0,0 +1,110 @@
+import { type Payload } from "../MessagePayload";
+
+export const StreamChunkEvent = "$payload/chunk";
+export const StreamReferenceKey = "$stream";
+
+interface IncomingStream {
+    chunks: Uint8Array[];
+    nextIndex: number;
+    lastActivity: number;
+}
+
+/**
+ * Reassembles streamed payload items from their incoming chunks.
+ *
+ * The chunks of a stream always arrive before the message referencing it; once that message arrives, all stream references in its
+ * payload are replaced by the reassembled data. Streams that aren't claimed by any message in time are discarded.
+ */
+export class PayloadStreamReceiver {
+    private readonly _timeout: number;
+
+    private _streams = new Map<string, IncomingStream>();
+
+    /**
+     * @param timeout - The time (in seconds) after which unclaimed streams are discarded.
+     */
+    public constructor(timeout: number) {
+        this._timeout = timeout;
+    }
+
+    /**
+     * Adds an incoming chunk.
+     *
+     * @param streamID - The ID of the stream.
+     * @param index - The index of the chunk within the stream.
+     * @param chunk - The chunk data.
+     *
+     * @throws Error - If the chunk is out of sequence.
+     */
+    public addChunk(streamID: string, index: number, chunk: ArrayBuffer): void {
+        let stream = this._streams.get(streamID);
+        if (!stream) {
+            stream = { chunks: [], nextIndex: 0, lastActivity: 0 };
+            this._streams.set(streamID, stream);
+        }
+
+        if (index != stream.nextIndex) {
+            this._streams.delete(streamID);
+            throw new Error(`Chunk ${index} of stream ${streamID} is out of sequence (expected ${stream.nextIndex})`);
+        }
+
+        stream.chunks.push(new Uint8Array(chunk));
+        stream.nextIndex += 1;
+        stream.lastActivity = Date.now();
+    }
+
+    /**
+     * Replaces all stream references of a payload with the reassembled data.
+     *
+     * @param payload - The incoming payload.
+     *
+     * @returns - The resolved payload.
+     *
+     * @throws Error - If a referenced stream is missing or incomplete.
+     */
+    public resolve(payload: Payload): Payload {
+        if (!Object.values(payload).some((data) => this.isReference(data))) {
+            return payload;
+        }
+
+        const resolved: Payload = {};
+        for (const [key, data] of Object.entries(payload)) {
+            resolved[key] = this.isReference(data) ? this.assemble(key, data[StreamReferenceKey], data.size) : data;
+        }
+        return resolved;
+    }
+
+    /**
+     * Discards all streams that haven't been claimed in time.
+     */
+    public purge(): void {
+        const now = Date.now();
+        for (const [streamID, stream] of this._streams.entries()) {
+            if (now - stream.lastActivity > this._timeout * 1000) {
+                this._streams.delete(streamID);
+            }
+        }
+    }
+
+    private assemble(key: string, streamID: string, size: number): ArrayBuffer {
+        const stream = this._streams.get(streamID);
+        this._streams.delete(streamID);
+
+        const totalSize = stream ? stream.chunks.reduce((total, chunk) => total + chunk.byteLength, 0) : -1;
+        if (!stream || totalSize != size) {
+            throw new Error(`The payload stream of item '${key}' is missing or incomplete`);
+        }
+
+        const data = new Uint8Array(totalSize);
+        let offset = 0;
+        for (const chunk of stream.chunks) {
+            data.set(chunk, offset);
+            offset += chunk.byteLength;
+        }
+        return data.buffer;
+    }
+
+    private isReference(data: any): boolean {
+        return !!data && typeof data === "object" && StreamReferenceKey in data;
+    }
+}
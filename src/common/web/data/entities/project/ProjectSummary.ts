@@ -0,0 +1,62 @@
+import { Type } from "class-transformer";
+
+import { type ConnectorInstanceID } from "../connector/ConnectorInstance";
+import { type UserID } from "../user/User";
+import { ProjectJobHistoryRecord } from "./logbook/ProjectJobHistoryRecord";
+import { type ProjectID, ProjectStatus } from "./Project";
+import { ProjectOptions } from "./ProjectOptions";
+
+/**
+ * The number of successful jobs of a single connector instance.
+ *
+ * @param connector_instance - The connector instance ID.
+ * @param count - The number of successful jobs.
+ */
+export class ProjectJobCount {
+    public readonly connector_instance: ConnectorInstanceID = "";
+    public readonly count: number = 0;
+}
+
+/**
+ * A lightweight summary of a **Project**, used for project lists.
+ *
+ * Leaves out the (potentially large) project features and only includes the unseen records of the job history; these can be
+ * fetched separately for a single project when needed.
+ *
+ * @param project_id - The unique project identifier.
+ * @param user_id - The ID of the user.
+ * @param creation_time - A UNIX timestamp of the project creation time.
+ * @param update_time - A UNIX timestamp of the last change of the project data, its features or logbook.
+ * @param resources_path - The resources path of the project.
+ * @param title - The title of the project.
+ * @param description - An optional project description.
+ * @param status - The project status.
+ * @param options - All project options.
+ * @param job_counts - The number of successful jobs per connector instance.
+ * @param unseen_job_history - All job history records not seen by the user yet.
+ */
+export class ProjectSummary {
+    public readonly project_id: ProjectID = 0;
+    public readonly user_id: UserID = "";
+
+    public readonly creation_time: number = 0;
+    public readonly update_time: number = 0;
+
+    public readonly resources_path: string = "";
+
+    public readonly title: string = "";
+    public readonly description: string = "";
+
+    public readonly status: ProjectStatus = ProjectStatus.Active;
+
+    // @ts-ignore
+    @Type(() => ProjectOptions)
+    public readonly options: ProjectOptions = new ProjectOptions();
+
+    // @ts-ignore
+    @Type(() => ProjectJobCount)
+    public readonly job_counts: ProjectJobCount[] = [];
+    // @ts-ignore
+    @Type(() => ProjectJobHistoryRecord)
+    public readonly unseen_job_history: ProjectJobHistoryRecord[] = [];
+}
@@ -1,4 +1,7 @@
+import { ProjectFeatures } from "./features/ProjectFeatures";
+import { ProjectLogbook } from "./logbook/ProjectLogbook";
 import { Project, type ProjectID } from "./Project";
+import { ProjectSummary } from "./ProjectSummary";
 
 /**
  * Searches for a project by its ID within a list of projects.
@@ -11,3 +14,28 @@ import { Project, type ProjectID } from "./Project";
 export function findProjectByID(projects: Project[], projectID: ProjectID): Project | undefined {
     return projects.find((project) => project.project_id == projectID);
 }
+
+/**
+ * Creates a project from its summary.
+ *
+ * The features and logbook of the project are taken from another project instance (usually an outdated instance of the same
+ * project) if provided; otherwise, the project will have empty features and only include the unseen records of its job history.
+ *
+ * @param summary - The project summary.
+ * @param details - An optional project to take the features and logbook from.
+ *
+ * @returns - The new project.
+ */
+export function createProjectFromSummary(summary: ProjectSummary, details?: Project): Project {
+    const project = new Project(
+        summary.project_id,
+        summary.creation_time,
+        summary.resources_path,
+        summary.title,
+        summary.description,
+        details ? details.features : new ProjectFeatures(),
+        summary.options,
+        details ? details.logbook : new ProjectLogbook(summary.unseen_job_history),
+    );
+    return Object.assign(project, { user_id: summary.user_id, status: summary.status });
+}
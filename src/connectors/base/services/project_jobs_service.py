@@ -1,7 +1,6 @@
 from common.py.component import BackendComponent
 from common.py.core.logging import info
 from common.py.services import Service
-from common.py.utils import EntryGuard
 
 from ..data.entities.connector import ConnectorJob
 
@@ -17,7 +16,6 @@ def create_project_jobs_service(comp: BackendComponent) -> Service:
         The newly created service.
     """
 
-    from common.py.api.component import ComponentProcessEvent
     from common.py.api.project import StartProjectJobCommand, StartProjectJobReply
 
     from .connector_service_context import ConnectorServiceContext
@@ -61,14 +59,8 @@ def create_project_jobs_service(comp: BackendComponent) -> Service:
             message=message,
         ).emit()
 
-    @svc.message_handler(ComponentProcessEvent)
-    def process_engine(
-        msg: ComponentProcessEvent, ctx: ConnectorServiceContext
-    ) -> None:
-        with EntryGuard("process_engine") as guard:
-            if not guard.can_execute:
-                return
-
-            ctx.jobs_engine.process()
+    @svc.periodic_job(1.0)
+    def process_engine(ctx: ConnectorServiceContext) -> None:
+        ctx.jobs_engine.process()
 
     return svc
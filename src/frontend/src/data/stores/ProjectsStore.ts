@@ -2,18 +2,63 @@ import { defineStore } from "pinia";
 import { ref } from "vue";
 
 import { Project, type ProjectID } from "@common/data/entities/project/Project";
+import { ProjectSummary } from "@common/data/entities/project/ProjectSummary";
+import { createProjectFromSummary } from "@common/data/entities/project/ProjectUtils";
 
 /**
  * The projects store for all project-specific data.
  *
+ * Projects are created from their summaries; their details (features and logbook) are only available after they have been
+ * fetched separately. Fetched details are dropped once the project has been changed (e.g., by another session), so that they
+ * are fetched anew.
+ *
  * @param projects - List of all projects.
+ * @param summaries - List of all project summaries.
+ * @param detailedProjects - List of all projects whose details have been fetched.
  */
 export const useProjectsStore = defineStore("projectsStore", () => {
     const projects = ref<Project[]>([]);
+    const summaries = ref<ProjectSummary[]>([]);
+    const detailedProjects = ref<ProjectID[]>([]);
     const activeProject = ref<ProjectID | null | undefined>(undefined);
 
     let pendingDeletions = ref<ProjectID[]>([]);
 
+    function applySummaries(projectSummaries: ProjectSummary[]): void {
+        // Projects whose details have already been fetched keep them, unless they have been changed meanwhile
+        const outdatedProjects = projectSummaries
+            .filter((summary) => findSummary(summary.project_id)?.update_time !== summary.update_time)
+            .map((summary) => summary.project_id);
+        detailedProjects.value = detailedProjects.value.filter(
+            (projectID) => !outdatedProjects.includes(projectID) && projectSummaries.find((summary) => summary.project_id === projectID),
+        );
+
+        projects.value = projectSummaries.map((summary) => {
+            const project = projects.value.find((proj) => proj.project_id === summary.project_id);
+            return createProjectFromSummary(summary, project && hasDetails(summary.project_id) ? project : undefined);
+        });
+        summaries.value = projectSummaries;
+    }
+
+    function applyDetails(projectID: ProjectID, details: Pick<Project, "features" | "logbook">): void {
+        const project = projects.value.find((proj) => proj.project_id === projectID);
+        if (project) {
+            Object.assign(project, { features: details.features, logbook: details.logbook });
+
+            if (!hasDetails(projectID)) {
+                detailedProjects.value = [...detailedProjects.value, projectID];
+            }
+        }
+    }
+
+    function hasDetails(projectID: ProjectID): boolean {
+        return detailedProjects.value.includes(projectID);
+    }
+
+    function findSummary(projectID: ProjectID): ProjectSummary | undefined {
+        return summaries.value.find((summary) => summary.project_id === projectID);
+    }
+
     function resolveActiveProject(): Project | undefined {
         if (activeProject) {
             const project = projects.value.find(proj => proj.project_id === activeProject.value);
@@ -40,6 +85,8 @@ export const useProjectsStore = defineStore("projectsStore", () => {
 
     function reset(): void {
         projects.value = [] as Project[];
+        summaries.value = [] as ProjectSummary[];
+        detailedProjects.value = [] as ProjectID[];
         activeProject.value = undefined;
 
         pendingDeletions.value = [] as ProjectID[];
@@ -51,8 +98,14 @@ export const useProjectsStore = defineStore("projectsStore", () => {
 
     return {
         projects,
+        summaries,
+        detailedProjects,
         activeProject,
         pendingDeletions,
+        applySummaries,
+        applyDetails,
+        hasDetails,
+        findSummary,
         resolveActiveProject,
         markForDeletion,
         unmarkForDeletion,
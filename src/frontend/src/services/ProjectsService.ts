@@ -1,4 +1,4 @@
-import { CreateProjectReply, DeleteProjectReply, ListProjectsReply, UpdateProjectReply } from "@common/api/project/ProjectCommands";
+import { CreateProjectReply, DeleteProjectReply, GetProjectDetailsReply, ListProjectsReply, UpdateProjectReply } from "@common/api/project/ProjectCommands";
 import { ProjectLogbookEvent, ProjectsListEvent } from "@common/api/project/ProjectEvents";
 import { Service } from "@common/services/Service";
 
@@ -21,8 +21,7 @@ export default function (comp: FrontendComponent): Service {
                     ctx.logger.debug("Retrieved projects list", "projects", { projects: JSON.stringify(msg.projects) });
 
                     ctx.projectsStore.resetPendingDeletions();
-                    // @ts-ignore
-                    ctx.projectsStore.projects = msg.projects;
+                    ctx.projectsStore.applySummaries(msg.projects);
                 } else {
                     ctx.logger.error("Unable to retrieve the projects list", "projects", { reason: msg.message });
                 }
@@ -32,8 +31,17 @@ export default function (comp: FrontendComponent): Service {
                 ctx.logger.debug("Projects list update received", "projects", { projects: JSON.stringify(msg.projects) });
 
                 ctx.projectsStore.resetPendingDeletions();
-                // @ts-ignore
-                ctx.projectsStore.projects = msg.projects;
+                ctx.projectsStore.applySummaries(msg.projects);
+            });
+
+            svc.messageHandler(GetProjectDetailsReply, (msg: GetProjectDetailsReply, ctx: FrontendServiceContext) => {
+                if (msg.success) {
+                    ctx.logger.debug(`Retrieved details of project ${msg.project_id}`, "projects");
+
+                    ctx.projectsStore.applyDetails(msg.project_id, msg);
+                } else {
+                    ctx.logger.error(`Unable to retrieve details of project ${msg.project_id}`, "projects", { reason: msg.message });
+                }
             });
 
             svc.messageHandler(ProjectLogbookEvent, (msg: ProjectLogbookEvent, ctx: FrontendServiceContext) => {
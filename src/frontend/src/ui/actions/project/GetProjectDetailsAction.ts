@@ -0,0 +1,33 @@
+import { GetProjectDetailsCommand } from "@common/api/project/ProjectCommands";
+import { CommandComposer } from "@common/core/messaging/composers/CommandComposer";
+import { Project } from "@common/data/entities/project/Project";
+import { ActionState } from "@common/ui/actions/ActionBase";
+import { ActionNotifier } from "@common/ui/actions/notifiers/ActionNotifier";
+import { OverlayNotifier } from "@common/ui/actions/notifiers/OverlayNotifier";
+import { OverlayNotificationType } from "@common/ui/notifications/OverlayNotifications";
+
+import { FrontendCommandAction } from "@/ui/actions/FrontendCommandAction";
+
+/**
+ * Action to retrieve the details (features and logbook) of a project.
+ */
+export class GetProjectDetailsAction extends FrontendCommandAction<GetProjectDetailsCommand, CommandComposer<GetProjectDetailsCommand>> {
+    public prepare(project: Project): CommandComposer<GetProjectDetailsCommand> {
+        this.prepareNotifiers(project.title);
+
+        this._composer = GetProjectDetailsCommand.build(this.messageBuilder, project.project_id);
+        return this._composer;
+    }
+
+    protected addDefaultNotifiers(title: string): void {
+        this.addNotifier(
+            ActionState.Failed,
+            new OverlayNotifier(
+                OverlayNotificationType.Error,
+                "Error fetching project",
+                `An error occurred while downloading project '${title}': ${ActionNotifier.MessagePlaceholder}.`,
+                true,
+            ),
+        );
+    }
+}
@@ -1,8 +1,11 @@
+import { GetProjectDetailsReply } from "@common/api/project/ProjectCommands";
 import { Project } from "@common/data/entities/project/Project";
 
 import { FrontendComponent } from "@/component/FrontendComponent";
+import { useProjectsStore } from "@/data/stores/ProjectsStore";
 import { CreateProjectAction } from "@/ui/actions/project/CreateProjectAction";
 import { DeleteProjectAction } from "@/ui/actions/project/DeleteProjectAction";
+import { GetProjectDetailsAction } from "@/ui/actions/project/GetProjectDetailsAction";
 import { UpdateProjectAction } from "@/ui/actions/project/UpdateProjectAction";
 import { publishProjectDialog, type PublishProjectDialogData } from "@/ui/dialogs/project/publish/PublishProjectDialog";
 
@@ -27,7 +30,33 @@ export function useProjectTools(comp: FrontendComponent) {
     }
 
     function publishProject(project: Project): Promise<PublishProjectDialogData> {
-        return publishProjectDialog(comp, project);
+        // The publishing dialog needs the project's logbook
+        return loadProjectDetails(project).then(() => publishProjectDialog(comp, project));
+    }
+
+    function loadProjectDetails(project: Project): Promise<void> {
+        const projStore = useProjectsStore();
+        if (projStore.hasDetails(project.project_id)) {
+            return Promise.resolve();
+        }
+
+        return new Promise<void>((resolve, reject) => {
+            const action = new GetProjectDetailsAction(comp);
+            action
+                .prepare(project)
+                .done((reply: GetProjectDetailsReply, success, msg) => {
+                    if (success) {
+                        projStore.applyDetails(project.project_id, reply);
+                        resolve();
+                    } else {
+                        reject(msg);
+                    }
+                })
+                .failed((_, msg) => {
+                    reject(msg);
+                });
+            action.execute();
+        });
     }
 
     function deleteProject(project: Project): void {
@@ -42,6 +71,7 @@ export function useProjectTools(comp: FrontendComponent) {
         newProject,
         editProject,
         publishProject,
-        deleteProject
+        deleteProject,
+        loadProjectDetails
     };
 }
@@ -6,7 +6,7 @@ from common.py.component import (
     BackendComponent,
 )
 from common.py.component.roles import ServerRole
-from common.py.core.logging import error, info, debug
+from common.py.core.logging import error, info, debug, warning
 from common.py.utils import UnitID
 
 from ..data.exporters import register_project_exporters
@@ -30,6 +30,7 @@ class ServerComponent(BackendComponent):
 
         self._add_server_settings()
         self._prepare_storage_pool()
+        self._prepare_session_store()
 
         self._server_data = ServerData()
 
@@ -89,6 +90,12 @@ class ServerComponent(BackendComponent):
                 raise RuntimeError(f"The storage driver {driver} couldn't be found")
 
             storage_type.prepare(self.data.config)
+
+            if self.data.config.value(StorageSettingIDs.CACHE):
+                from ..data.storage.caching import CachingStoragePool
+
+                CachingStoragePool.prepare(self.data.config)
+
             info(f"Prepared storage: {driver}", scope="server")
         except Exception as exc:  # pylint: disable=broad-exception-caught
             error(
@@ -98,6 +105,33 @@ class ServerComponent(BackendComponent):
 
             raise exc
 
+    def _prepare_session_store(self) -> None:
+        from ..networking.session import SessionManager
+
+        try:
+            SessionManager.prepare(self.data.config)
+            info(
+                f"Prepared session store: {SessionManager().store.name}", scope="server"
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error(f"Unable to prepare session store: {str(exc)}")
+
+            raise exc
+
+        if self._core.message_bus.network.server.is_scaled_out:
+            from ..settings import StorageSettingIDs
+
+            if not SessionManager().store.is_shared:
+                warning(
+                    "The server is scaled out, but sessions are not shared among processes",
+                    scope="server",
+                )
+            if self.data.config.value(StorageSettingIDs.DRIVER) == "memory":
+                warning(
+                    "The server is scaled out, but the storage is not shared among processes",
+                    scope="server",
+                )
+
     @property
     def server_data(self) -> ServerData:
         """
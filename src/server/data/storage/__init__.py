@@ -1,4 +1,5 @@
 from .storage_pools_catalog import StoragePoolsCatalog
+from .storage_pool_factory import create_storage_pool
 
 # Import all storage pool drivers to automatically add them to the catalog
 from .memory import *
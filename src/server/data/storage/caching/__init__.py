@@ -0,0 +1,2 @@
+from .caching_storage_pool import CachingStoragePool
+from .storage_cache import StorageCache
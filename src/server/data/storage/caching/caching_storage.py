@@ -0,0 +1,197 @@
+import abc
+import dataclasses
+import pickle
+import typing
+
+from common.py.data.storage import StorageCondition
+from common.py.data.storage.storage import Storage
+
+from .storage_cache import StorageCache
+
+EntityType = typing.TypeVar("EntityType")  # pylint: disable=invalid-name
+EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
+
+
+class CachingStorage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
+    """
+    Base class for storages caching the entities of another storage.
+
+    The cache is shared by all storage pool instances and holds pickled copies of the entities, so cached entities never belong to
+    any specific pool (or database session). Each caching storage keeps track of all entities it has handed out: The same key always
+    yields the same entity within a pool instance, and since entities are usually modified in place, all of them are checked for
+    changes when the pool is closed. Changed copies are written back to the underlying storage, and all changed, added or removed
+    entities are removed from the cache.
+    """
+
+    _LIST_KEY = "*"
+
+    def __init__(
+        self, storage: Storage[EntityType, EntityKeyType], cache: StorageCache
+    ):
+        """
+        Args:
+            storage: The underlying storage.
+            cache: The cache shared by all pool instances.
+        """
+        self._storage = storage
+        self._cache = cache
+
+        # All entities handed out, along with their state when they were handed out and whether they are copies from the cache
+        self._entities: typing.Dict[
+            EntityKeyType, typing.Tuple[EntityType, tuple | None, bool]
+        ] = {}
+        self._invalidated: typing.Set[EntityKeyType] = set()
+        self._invalidated_all = False
+
+    def add(self, entity: EntityType) -> EntityKeyType:
+        key = self._storage.add(entity)
+        self._entities[key] = (entity, None, False)
+        self._invalidated.add(key)
+        return key
+
+    def remove(self, entity: EntityType) -> None:
+        key = self.key_from_entity(entity)
+        self._storage.remove(entity)
+        self._entities.pop(key, None)
+        self._invalidated.add(key)
+
+    def get(self, key: EntityKeyType) -> EntityType | None:
+        if key in self._entities:
+            return self._entities[key][0]
+
+        # Entities added or removed through this storage must not be taken from the cache anymore
+        use_cache = key not in self._invalidated and not self._invalidated_all
+
+        if use_cache and (data := self._cache.get(key)) is not None:
+            return self._hand_out(key, pickle.loads(data), True)
+
+        version = self._cache.version
+        if (entity := self._storage.get(key)) is not None:
+            if use_cache:
+                self._cache.put(
+                    key, pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL), version
+                )
+            return self._hand_out(key, entity, False)
+
+        return None
+
+    def list(self) -> typing.List[EntityType]:
+        if (
+            not self._invalidated
+            and not self._invalidated_all
+            and (keys := self._cache.get(CachingStorage._LIST_KEY)) is not None
+        ):
+            entities = [self.get(key) for key in keys]
+            if None not in entities:
+                return typing.cast(typing.List[EntityType], entities)
+
+        version = self._cache.version
+        entities = self._hand_out_all(self._storage.list())
+        if not self._invalidated and not self._invalidated_all:
+            self._cache.put(
+                CachingStorage._LIST_KEY,
+                [self.key_from_entity(entity) for entity in entities],
+                version,
+            )
+        return entities
+
+    def get_many(self, keys: typing.Iterable[EntityKeyType]) -> typing.List[EntityType]:
+        return [entity for key in keys if (entity := self.get(key)) is not None]
+
+    def add_many(
+        self, entities: typing.Iterable[EntityType]
+    ) -> typing.List[EntityKeyType]:
+        entities = list(entities)
+        keys = self._storage.add_many(entities)
+        for key, entity in zip(keys, entities):
+            self._entities[key] = (entity, None, False)
+            self._invalidated.add(key)
+        return keys
+
+    def remove_many(self, entities: typing.Iterable[EntityType]) -> None:
+        entities = list(entities)
+        self._storage.remove_many(entities)
+        for entity in entities:
+            key = self.key_from_entity(entity)
+            self._entities.pop(key, None)
+            self._invalidated.add(key)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        count = self._storage.remove_where(*conditions)
+
+        # The removed keys are unknown, so the entire cache is invalidated; removed entities must not be written back
+        self._entities = {
+            key: value
+            for key, value in self._entities.items()
+            if not all(condition.matches(value[0]) for condition in conditions)
+        }
+        self._invalidated_all = True
+        return count
+
+    def commit(self, save_changes: bool) -> None:
+        """
+        Writes all changed copies back to the underlying storage and collects the keys of all changed entities.
+
+        Args:
+            save_changes: Whether changes should be written back at all.
+        """
+        for key, (entity, state, is_copy) in self._entities.items():
+            if state is None or self._get_state(entity) != state:
+                if is_copy and save_changes:
+                    self._storage.add(entity)
+
+                self._invalidated.add(key)
+
+    def invalidate(self) -> None:
+        """
+        Removes all changed entities from the cache; this must be done once all changes have been committed.
+        """
+        if self._invalidated_all:
+            self._cache.clear()
+        elif self._invalidated:
+            for key in self._invalidated:
+                self._cache.invalidate(key)
+            self._cache.invalidate(CachingStorage._LIST_KEY)
+
+        self._entities.clear()
+        self._invalidated.clear()
+        self._invalidated_all = False
+
+    @abc.abstractmethod
+    def key_from_entity(self, entity: EntityType) -> EntityKeyType:
+        """
+        Gets the key of an entity.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            The key of the entity.
+        """
+        raise NotImplementedError()
+
+    def _hand_out(
+        self, key: EntityKeyType, entity: EntityType, is_copy: bool
+    ) -> EntityType:
+        self._entities[key] = (entity, self._get_state(entity), is_copy)
+        return entity
+
+    def _hand_out_all(
+        self, entities: typing.List[EntityType]
+    ) -> typing.List[EntityType]:
+        # Entities already handed out are kept, so that the same key always yields the same entity
+        handed_out: typing.List[EntityType] = []
+        for entity in entities:
+            key = self.key_from_entity(entity)
+            handed_out.append(
+                self._entities[key][0]
+                if key in self._entities
+                else self._hand_out(key, entity, False)
+            )
+        return handed_out
+
+    @staticmethod
+    def _get_state(entity: EntityType) -> tuple:
+        # Only the (deep-copied) field values are compared, not their pickled form: Entities of a database storage also carry internal
+        # state, and values might cache data that doesn't count as a change (e.g., the string and hash of a unit ID)
+        return dataclasses.astuple(entity)
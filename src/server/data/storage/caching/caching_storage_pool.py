@@ -0,0 +1,112 @@
+import typing
+
+from common.py.data.storage import (
+    StoragePool,
+    AuthorizationTokenStorage,
+    ConnectorStorage,
+    ProjectStorage,
+    ProjectJobStorage,
+    UserStorage,
+)
+from common.py.utils.config import Configuration
+
+from .caching_storage import CachingStorage
+from .caching_storages import (
+    CachingAuthorizationTokenStorage,
+    CachingConnectorStorage,
+    CachingUserStorage,
+)
+from .storage_cache import StorageCache
+
+
+class CachingStoragePool(StoragePool):
+    """
+    A storage pool caching frequently read entities of another storage pool.
+
+    Connectors, users and authorization tokens are read by almost every message handler, but rarely change; these are kept in caches
+    shared by all pool instances (see ``CachingStorage``). Projects and project jobs are always accessed through the underlying pool.
+
+    Notes:
+        Changes made by other processes (e.g., when the server is scaled out) only become visible once the cached entities expire.
+    """
+
+    _caches: typing.Dict[str, StorageCache] = {}
+
+    @staticmethod
+    def prepare(config: Configuration) -> None:
+        from ....settings import StorageSettingIDs
+
+        size = config.value(StorageSettingIDs.CACHE_SIZE)
+        ttl = config.value(StorageSettingIDs.CACHE_TTL)
+
+        CachingStoragePool._caches = {
+            name: StorageCache(name, size=size, ttl=ttl)
+            for name in ("connectors", "users", "authorization_tokens")
+        }
+
+    def __init__(self, pool: StoragePool):
+        """
+        Args:
+            pool: The underlying storage pool.
+        """
+        super().__init__(pool.name)
+
+        self._pool = pool
+
+        self._connector_storage = CachingConnectorStorage(
+            pool.connector_storage, CachingStoragePool._caches["connectors"]
+        )
+        self._user_storage = CachingUserStorage(
+            pool.user_storage, CachingStoragePool._caches["users"]
+        )
+        self._authorization_token_storage = CachingAuthorizationTokenStorage(
+            pool.authorization_token_storage,
+            CachingStoragePool._caches["authorization_tokens"],
+        )
+
+    def begin(self) -> None:
+        self._pool.begin()
+
+    def close(self, save_changes: bool = True) -> None:
+        storages: typing.List[CachingStorage] = [
+            self._connector_storage,
+            self._user_storage,
+            self._authorization_token_storage,
+        ]
+
+        try:
+            for storage in storages:
+                storage.commit(save_changes)
+
+            self._pool.close(save_changes)
+        finally:
+            # Cached entities are removed even if committing failed, as the cache might not reflect the actual state anymore
+            for storage in storages:
+                storage.invalidate()
+
+    @staticmethod
+    def caches() -> typing.Dict[str, StorageCache]:
+        """
+        All caches, associated with the kind of entities they hold.
+        """
+        return CachingStoragePool._caches
+
+    @property
+    def connector_storage(self) -> ConnectorStorage:
+        return self._connector_storage
+
+    @property
+    def user_storage(self) -> UserStorage:
+        return self._user_storage
+
+    @property
+    def project_storage(self) -> ProjectStorage:
+        return self._pool.project_storage
+
+    @property
+    def project_job_storage(self) -> ProjectJobStorage:
+        return self._pool.project_job_storage
+
+    @property
+    def authorization_token_storage(self) -> AuthorizationTokenStorage:
+        return self._authorization_token_storage
@@ -0,0 +1,79 @@
+import typing
+
+from common.py.data.entities.authorization import (
+    AuthorizationToken,
+    AuthorizationTokenID,
+)
+from common.py.data.entities.connector import Connector, ConnectorID
+from common.py.data.entities.user import User, UserID
+from common.py.data.storage import (
+    AuthorizationTokenStorage,
+    ConnectorStorage,
+    UserStorage,
+)
+
+from .caching_storage import CachingStorage
+from .storage_cache import StorageCache
+
+
+class CachingConnectorStorage(CachingStorage[Connector, ConnectorID], ConnectorStorage):
+    """
+    Caching storage for connectors.
+    """
+
+    def __init__(self, storage: ConnectorStorage, cache: StorageCache):
+        """
+        Args:
+            storage: The underlying storage.
+            cache: The cache shared by all pool instances.
+        """
+        super().__init__(storage, cache)
+
+    def key_from_entity(self, entity: Connector) -> ConnectorID:
+        return entity.connector_id
+
+
+class CachingUserStorage(CachingStorage[User, UserID], UserStorage):
+    """
+    Caching storage for users.
+    """
+
+    def __init__(self, storage: UserStorage, cache: StorageCache):
+        """
+        Args:
+            storage: The underlying storage.
+            cache: The cache shared by all pool instances.
+        """
+        super().__init__(storage, cache)
+
+    def key_from_entity(self, entity: User) -> UserID:
+        return entity.user_id
+
+
+class CachingAuthorizationTokenStorage(
+    CachingStorage[AuthorizationToken, AuthorizationTokenID], AuthorizationTokenStorage
+):
+    """
+    Caching storage for authorization tokens.
+
+    Filtering tokens always uses the underlying storage.
+    """
+
+    def __init__(self, storage: AuthorizationTokenStorage, cache: StorageCache):
+        """
+        Args:
+            storage: The underlying storage.
+            cache: The cache shared by all pool instances.
+        """
+        super().__init__(storage, cache)
+
+        self._token_storage = storage
+
+    def filter_by_user(self, user_id: UserID) -> typing.List[AuthorizationToken]:
+        return self._hand_out_all(self._token_storage.filter_by_user(user_id))
+
+    def filter_by_expiration(self, timestamp: float) -> typing.List[AuthorizationToken]:
+        return self._hand_out_all(self._token_storage.filter_by_expiration(timestamp))
+
+    def key_from_entity(self, entity: AuthorizationToken) -> AuthorizationTokenID:
+        return entity.user_id, entity.auth_id
@@ -0,0 +1,135 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+
+class StorageCache:
+    """
+    A bounded, thread-safe cache for the entities of a single storage.
+
+    Entries are evicted in least-recently-used order once the cache is full, and expire after a certain time, so that changes made
+    outside of this process become visible eventually. Hits and misses are counted and reported to the global metrics registry.
+
+    A value read from the underlying storage might already be outdated when it is added to the cache (if the entity was changed
+    concurrently); to prevent this, ``put`` only accepts values that were read before the last invalidation (see ``version``).
+    """
+
+    def __init__(self, name: str, *, size: int, ttl: float):
+        """
+        Args:
+            name: The name of the cache (usually the entity kind), used for reporting.
+            size: The maximum number of entries.
+            ttl: The time (in seconds) after which an entry expires.
+        """
+        from common.py.core.metrics import MetricsRegistry
+
+        self._name = name
+        self._size = size
+        self._ttl = ttl
+
+        self._entries: OrderedDict[typing.Any, typing.Tuple[typing.Any, float]] = (
+            OrderedDict()
+        )
+        self._version = 0
+        self._lock = threading.Lock()
+
+        self._hits = MetricsRegistry().counter(
+            "rds_storage_cache_hits_total",
+            "Total number of storage cache hits",
+            storage=name,
+        )
+        self._misses = MetricsRegistry().counter(
+            "rds_storage_cache_misses_total",
+            "Total number of storage cache misses",
+            storage=name,
+        )
+
+    def get(self, key: typing.Any) -> typing.Any | None:
+        """
+        Gets the value of an entry.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The value, or ``None`` if there is no (valid) entry.
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                value, expiration = entry
+                if expiration > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits.inc()
+                    return value
+
+                del self._entries[key]
+
+            self._misses.inc()
+            return None
+
+    def put(self, key: typing.Any, value: typing.Any, version: int) -> None:
+        """
+        Adds or replaces an entry.
+
+        Args:
+            key: The key of the entry.
+            value: The value.
+            version: The cache version before the value was read; if entries have been invalidated since, the value is discarded.
+        """
+        with self._lock:
+            if version != self._version:
+                return
+
+            self._entries[key] = (value, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: typing.Any) -> None:
+        """
+        Removes an entry.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._version += 1
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+        The current version of the cache, increased whenever entries are invalidated.
+        """
+        return self._version
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the cache.
+        """
+        return self._name
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of cache hits.
+        """
+        return int(self._hits.value)
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of cache misses.
+        """
+        return int(self._misses.value)
@@ -9,7 +9,7 @@ from common.py.data.entities.authorization import (
     AuthorizationTokenID,
 )
 from common.py.data.entities.user import UserID
-from common.py.data.storage import AuthorizationTokenStorage
+from common.py.data.storage import AuthorizationTokenStorage, StorageCondition
 
 from .database_storage_accessor import DatabaseStorageAccessor
 
@@ -19,23 +19,26 @@ class DatabaseAuthorizationTokenStorage(AuthorizationTokenStorage):
     Database storage for authorization tokens.
     """
 
-    _lock = threading.RLock()
-
-    def __init__(self, session: Session, table: Table):
+    def __init__(self, session: Session, table: Table, lock: threading.RLock):
+        """
+        Args:
+            session: The database session.
+            table: The storage table.
+            lock: The lock guarding the database session.
+        """
         super().__init__()
 
         self._session = session
         self._table = table
+        self._lock = lock
 
         self._accessor = DatabaseStorageAccessor[
             AuthorizationToken, AuthorizationTokenID
         ](AuthorizationToken, self._session, self._lock)
 
-    def next_id(self) -> AuthorizationTokenID:
-        raise NotImplementedError("Authorization tokens do not support automatic IDs")
-
-    def add(self, entity: AuthorizationToken) -> None:
+    def add(self, entity: AuthorizationToken) -> AuthorizationTokenID:
         self._accessor.add(entity)
+        return (entity.user_id, entity.auth_id)
 
     def remove(self, entity: AuthorizationToken) -> None:
         self._accessor.remove(entity)
@@ -46,5 +49,22 @@ class DatabaseAuthorizationTokenStorage(AuthorizationTokenStorage):
     def list(self) -> typing.List[AuthorizationToken]:
         return self._accessor.list()
 
+    def get_many(
+        self, keys: typing.Iterable[AuthorizationTokenID]
+    ) -> typing.List[AuthorizationToken]:
+        return self._accessor.get_many(keys)
+
+    def remove_many(self, entities: typing.Iterable[AuthorizationToken]) -> None:
+        self._accessor.remove_many(entities)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        return self._accessor.remove_where(*conditions)
+
     def filter_by_user(self, user_id: UserID) -> typing.List[AuthorizationToken]:
         return self._accessor.filter(self._table.c.user_id == user_id)
+
+    def filter_by_expiration(self, timestamp: float) -> typing.List[AuthorizationToken]:
+        return self._accessor.filter(
+            (self._table.c.expiration_timestamp > 0)
+            & (self._table.c.expiration_timestamp <= timestamp)
+        )
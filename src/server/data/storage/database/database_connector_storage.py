@@ -5,7 +5,7 @@ from sqlalchemy import Table
 from sqlalchemy.orm import Session
 
 from common.py.data.entities.connector import ConnectorID, Connector
-from common.py.data.storage import ConnectorStorage
+from common.py.data.storage import ConnectorStorage, StorageCondition
 
 from .database_storage_accessor import DatabaseStorageAccessor
 
@@ -15,23 +15,26 @@ class DatabaseConnectorStorage(ConnectorStorage):
     Database storage for connectors.
     """
 
-    _lock = threading.RLock()
-
-    def __init__(self, session: Session, table: Table):
+    def __init__(self, session: Session, table: Table, lock: threading.RLock):
+        """
+        Args:
+            session: The database session.
+            table: The storage table.
+            lock: The lock guarding the database session.
+        """
         super().__init__()
 
         self._session = session
         self._table = table
+        self._lock = lock
 
         self._accessor = DatabaseStorageAccessor[Connector, ConnectorID](
             Connector, self._session, self._lock
         )
 
-    def next_id(self) -> ConnectorID:
-        raise NotImplementedError("Connectors do not support automatic IDs")
-
-    def add(self, entity: Connector) -> None:
+    def add(self, entity: Connector) -> ConnectorID:
         self._accessor.add(entity)
+        return entity.connector_id
 
     def remove(self, entity: Connector) -> None:
         self._accessor.remove(entity)
@@ -41,3 +44,12 @@ class DatabaseConnectorStorage(ConnectorStorage):
 
     def list(self) -> typing.List[Connector]:
         return self._accessor.list()
+
+    def get_many(self, keys: typing.Iterable[ConnectorID]) -> typing.List[Connector]:
+        return self._accessor.get_many(keys)
+
+    def remove_many(self, entities: typing.Iterable[Connector]) -> None:
+        self._accessor.remove_many(entities)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        return self._accessor.remove_where(*conditions)
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from common.py.data.entities.project import ProjectJob, ProjectJobID, ProjectID
 from common.py.data.entities.user import UserID
-from common.py.data.storage import ProjectJobStorage
+from common.py.data.storage import ProjectJobStorage, StorageCondition
 
 from .database_storage_accessor import DatabaseStorageAccessor
 
@@ -16,23 +16,26 @@ class DatabaseProjectJobStorage(ProjectJobStorage):
     Database storage for project jobs.
     """
 
-    _lock = threading.RLock()
-
-    def __init__(self, session: Session, table: Table):
+    def __init__(self, session: Session, table: Table, lock: threading.RLock):
+        """
+        Args:
+            session: The database session.
+            table: The storage table.
+            lock: The lock guarding the database session.
+        """
         super().__init__()
 
         self._session = session
         self._table = table
+        self._lock = lock
 
         self._accessor = DatabaseStorageAccessor[ProjectJob, ProjectJobID](
             ProjectJob, self._session, self._lock
         )
 
-    def next_id(self) -> ProjectJobID:
-        raise NotImplementedError("Project jobs do not support automatic IDs")
-
-    def add(self, entity: ProjectJob) -> None:
+    def add(self, entity: ProjectJob) -> ProjectJobID:
         self._accessor.add(entity)
+        return (entity.project_id, entity.connector_instance)
 
     def remove(self, entity: ProjectJob) -> None:
         self._accessor.remove(entity)
@@ -43,6 +46,15 @@ class DatabaseProjectJobStorage(ProjectJobStorage):
     def list(self) -> typing.List[ProjectJob]:
         return self._accessor.list()
 
+    def get_many(self, keys: typing.Iterable[ProjectJobID]) -> typing.List[ProjectJob]:
+        return self._accessor.get_many(keys)
+
+    def remove_many(self, entities: typing.Iterable[ProjectJob]) -> None:
+        self._accessor.remove_many(entities)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        return self._accessor.remove_where(*conditions)
+
     def filter_by_user(self, user_id: UserID) -> typing.List[ProjectJob]:
         return self._accessor.filter(self._table.c.user_id == user_id)
 
@@ -1,12 +1,13 @@
 import threading
 import typing
 
-from sqlalchemy import Table, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Table, func, select
+from sqlalchemy.orm import Session, lazyload
 
-from common.py.data.entities.project import Project, ProjectID
+from common.py.data.entities.project import Project, ProjectID, ProjectSummary
+from common.py.data.entities.project.logbook import ProjectJobHistoryRecord
 from common.py.data.entities.user import UserID
-from common.py.data.storage import ProjectStorage
+from common.py.data.storage import ProjectStorage, StorageCondition
 
 from .database_storage_accessor import DatabaseStorageAccessor
 
@@ -16,29 +17,44 @@ class DatabaseProjectStorage(ProjectStorage):
     Database storage for projects.
     """
 
-    _lock = threading.RLock()
-
-    def __init__(self, session: Session, table: Table):
+    def __init__(
+        self,
+        session: Session,
+        table: Table,
+        job_history_table: Table,
+        lock: threading.RLock,
+    ):
+        """
+        Args:
+            session: The database session.
+            table: The storage table.
+            job_history_table: The table of the job history logbook.
+            lock: The lock guarding the database session.
+        """
         super().__init__()
 
         self._session = session
         self._table = table
+        self._job_history_table = job_history_table
+        self._lock = lock
 
         self._accessor = DatabaseStorageAccessor[Project, ProjectID](
             Project, self._session, self._lock
         )
 
-    def next_id(self) -> ProjectID:
-        from sqlalchemy import func
-
-        statement = select(func.max(self._table.c.project_id))
-        if (proj_id := self._session.execute(statement).scalar_one()) is not None:
-            return typing.cast(ProjectID, proj_id + 1)
-
-        return 1
+    def add(self, entity: Project) -> ProjectID:
+        if entity.project_id == 0:
+            # Let the database generate the ID; it is only known after flushing the new row
+            entity.project_id = typing.cast(ProjectID, None)
+            try:
+                self._accessor.add(entity, flush=True)
+            except Exception:
+                entity.project_id = 0
+                raise
+        else:
+            self._accessor.add(entity)
 
-    def add(self, entity: Project) -> None:
-        self._accessor.add(entity)
+        return entity.project_id
 
     def remove(self, entity: Project) -> None:
         self._accessor.remove(entity)
@@ -49,5 +65,79 @@ class DatabaseProjectStorage(ProjectStorage):
     def list(self) -> typing.List[Project]:
         return self._accessor.list()
 
+    def get_many(self, keys: typing.Iterable[ProjectID]) -> typing.List[Project]:
+        return self._accessor.get_many(keys)
+
+    def remove_many(self, entities: typing.Iterable[Project]) -> None:
+        self._accessor.remove_many(entities)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        return self._accessor.remove_where(*conditions)
+
     def filter_by_user(self, user_id: UserID) -> typing.List[Project]:
         return self._accessor.filter(self._table.c.user_id == user_id)
+
+    def filter_summaries_by_user(self, user_id: UserID) -> typing.List[ProjectSummary]:
+        # Skip loading the features and logbooks, so only the main table is queried for the projects themselves
+        projects = self._accessor.filter(
+            self._table.c.user_id == user_id,
+            lazyload(Project.features),
+            lazyload(Project.logbook),
+        )
+        if not projects:
+            return []
+
+        job_history = self._job_history_table
+        user_projects = select(self._table.c.project_id).where(
+            self._table.c.user_id == user_id
+        )
+
+        with self._lock:
+            job_counts = self._session.execute(
+                select(
+                    job_history.c.project_id,
+                    job_history.c.connector_instance,
+                    func.count(),
+                )
+                .where(
+                    job_history.c.project_id.in_(user_projects),
+                    job_history.c.success.is_(True),
+                )
+                .group_by(job_history.c.project_id, job_history.c.connector_instance)
+            ).all()
+
+            unseen_records = self._session.execute(
+                select(ProjectJobHistoryRecord, job_history.c.project_id).where(
+                    job_history.c.project_id.in_(user_projects),
+                    job_history.c.seen.is_not(True),
+                )
+            ).all()
+
+        summaries = {
+            project.project_id: ProjectSummary(
+                project_id=project.project_id,
+                user_id=project.user_id,
+                creation_time=project.creation_time,
+                update_time=project.update_time,
+                resources_path=project.resources_path,
+                title=project.title,
+                description=project.description,
+                status=project.status,
+                options=project.options,
+            )
+            for project in projects
+        }
+
+        for project_id, connector_instance, count in job_counts:
+            if (summary := summaries.get(project_id, None)) is not None:
+                summary.job_counts.append(
+                    ProjectSummary.JobCount(
+                        connector_instance=connector_instance, count=count
+                    )
+                )
+
+        for record, project_id in unseen_records:
+            if (summary := summaries.get(project_id, None)) is not None:
+                summary.unseen_job_history.append(record)
+
+        return list(summaries.values())
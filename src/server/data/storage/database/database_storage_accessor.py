@@ -2,8 +2,11 @@ import typing
 from threading import RLock
 from typing import TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, and_, delete, inspect, select, true, tuple_
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
+
+from common.py.data.storage import StorageCondition, StorageException
 
 EntityType = TypeVar("EntityType")  # pylint: disable=invalid-name
 EntityKeyType = TypeVar("EntityKeyType")  # pylint: disable=invalid-name
@@ -12,19 +15,39 @@ EntityKeyType = TypeVar("EntityKeyType")  # pylint: disable=invalid-name
 class DatabaseStorageAccessor(typing.Generic[EntityType, EntityKeyType]):
     """
     A storage-like helper class to access database objects.
+
+    Bulk operations are performed using a single statement per batch of keys (see ``BATCH_SIZE``). Entities with relationships are
+    removed through the session instead, so that their related objects are removed as well. Adding multiple entities needs no special
+    handling, as the session already inserts them in batches when being flushed.
     """
 
+    BATCH_SIZE = 500
+
     def __init__(self, entity_type: typing.Type, session: Session, lock: RLock):
         self._entity_type = entity_type
         self._session = session
         self._lock = lock
 
-    def add(self, entity: EntityType) -> None:
+        self._mapper = inspect(entity_type)
+        self._key_columns = self._mapper.primary_key
+        self._has_relationships = len(self._mapper.relationships) > 0
+
+    def add(self, entity: EntityType, *, flush: bool = False) -> None:
         with self._lock:
-            self._session.add(entity)
+            # Detached entities (e.g., restored from a cache) are merged into the session instead
+            if inspect(entity).detached:
+                entity = self._session.merge(entity)
+            else:
+                self._session.add(entity)
+
+            if flush:
+                self._session.flush([entity])
 
     def remove(self, entity: EntityType) -> None:
         with self._lock:
+            if inspect(entity).detached:
+                entity = self._session.merge(entity)
+
             self._session.delete(entity)
 
     def get(self, key: EntityKeyType) -> EntityType | None:
@@ -38,11 +61,108 @@ class DatabaseStorageAccessor(typing.Generic[EntityType, EntityKeyType]):
                 self._session.execute(select(self._entity_type)).scalars().all(),
             )
 
-    def filter(self, predicate: typing.Any) -> typing.List[EntityType]:
+    def filter(
+        self, predicate: typing.Any, *options: ExecutableOption
+    ) -> typing.List[EntityType]:
         with self._lock:
             return typing.cast(
                 typing.List[EntityType],
-                self._session.execute(select(self._entity_type).where(predicate))
+                self._session.execute(
+                    select(self._entity_type).where(predicate).options(*options)
+                )
+                .unique()
                 .scalars()
                 .all(),
             )
+
+    def get_many(self, keys: typing.Iterable[EntityKeyType]) -> typing.List[EntityType]:
+        keys = list(keys)
+        entities: typing.Dict[EntityKeyType, EntityType] = {}
+
+        with self._lock:
+            for batch in self._batches(keys):
+                for entity in (
+                    self._session.execute(
+                        select(self._entity_type).where(self._key_column.in_(batch))
+                    )
+                    .unique()
+                    .scalars()
+                ):
+                    entities[self._key_from_entity(entity)] = entity
+
+        return [entities[key] for key in keys if key in entities]
+
+    def remove_many(self, entities: typing.Iterable[EntityType]) -> None:
+        with self._lock:
+            if self._has_relationships:
+                for entity in entities:
+                    self.remove(entity)
+                return
+
+            keys = [self._key_from_entity(entity) for entity in entities]
+            for batch in self._batches(keys):
+                self._session.execute(
+                    delete(self._entity_type).where(self._key_column.in_(batch))
+                )
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        predicates = [self._translate_condition(condition) for condition in conditions]
+
+        with self._lock:
+            if self._has_relationships:
+                entities = self.filter(and_(true(), *predicates))
+                for entity in entities:
+                    self.remove(entity)
+                return len(entities)
+
+            result = self._session.execute(
+                delete(self._entity_type).where(*predicates),
+                execution_options={"synchronize_session": "fetch"},
+            )
+            return result.rowcount
+
+    @property
+    def _key_column(self) -> typing.Any:
+        return (
+            self._key_columns[0]
+            if len(self._key_columns) == 1
+            else tuple_(*self._key_columns)
+        )
+
+    def _key_from_entity(self, entity: EntityType) -> EntityKeyType:
+        key = self._mapper.primary_key_from_instance(entity)
+        return key[0] if len(key) == 1 else tuple(key)
+
+    def _translate_condition(self, condition: StorageCondition) -> ColumnElement:
+        # Only attributes mapped to a single column can be compared
+        if condition.attribute not in self._mapper.columns:
+            raise StorageException(
+                f"The attribute {condition.attribute} can't be used in conditions"
+            )
+
+        column = getattr(self._entity_type, condition.attribute)
+
+        match condition.op:
+            case StorageCondition.Operator.EQUAL:
+                return column == condition.value
+            case StorageCondition.Operator.NOT_EQUAL:
+                return column != condition.value
+            case StorageCondition.Operator.LESS:
+                return column < condition.value
+            case StorageCondition.Operator.LESS_EQUAL:
+                return column <= condition.value
+            case StorageCondition.Operator.GREATER:
+                return column > condition.value
+            case StorageCondition.Operator.GREATER_EQUAL:
+                return column >= condition.value
+            case StorageCondition.Operator.IN:
+                return column.in_(condition.value)
+
+        raise StorageException(f"Unsupported condition operator {condition.op}")
+
+    @staticmethod
+    def _batches(
+        keys: typing.List[typing.Any],
+    ) -> typing.Iterator[typing.List[typing.Any]]:
+        for start in range(0, len(keys), DatabaseStorageAccessor.BATCH_SIZE):
+            yield keys[start : start + DatabaseStorageAccessor.BATCH_SIZE]
@@ -1,4 +1,7 @@
-from sqlalchemy import Engine
+import threading
+import typing
+
+from sqlalchemy import Engine, StaticPool
 from sqlalchemy.orm import Session
 
 from common.py.data.storage import StoragePool
@@ -15,44 +18,86 @@ from .schema import DatabaseSchema
 class DatabaseStoragePool(StoragePool):
     """
     Multi-backend database storage pool, based on SQLAlchemy.
+
+    Each pool instance uses its own database session; the session is guarded by a lock owned by the pool and shared by all of its
+    storages, so concurrent pools (e.g., of different message handlers) never block each other. Only if the engine uses a single
+    connection for all sessions (like in-memory SQLite databases do), a lock shared by all pools is used instead.
     """
 
-    _engine: Engine
+    _engine: Engine | None = None
     _schema: DatabaseSchema
 
+    _shared_lock = threading.RLock()
+    _shares_connection = False
+
     @staticmethod
     def prepare(config: Configuration) -> None:
         from .engines import create_database_engine
 
         DatabaseStoragePool._engine = create_database_engine(config)
+        DatabaseStoragePool._shares_connection = isinstance(
+            DatabaseStoragePool._engine.pool, StaticPool
+        )
         DatabaseStoragePool._schema = DatabaseSchema(DatabaseStoragePool._engine)
 
-        DatabaseStoragePool._schema.prepare()
+        from common.py.settings import NetworkServerSettingIDs
+
+        # When scaled out, other server processes might already be using the transient data
+        DatabaseStoragePool._schema.prepare(
+            purge_transient_data=config.value(NetworkServerSettingIDs.CLIENT_MANAGER)
+            == ""
+        )
+
+    @staticmethod
+    def shared_engine() -> typing.Tuple[Engine | None, "threading.RLock | None"]:
+        """
+        Gets the engine used by all pools, so that other database users can share its connections.
+
+        Returns:
+            The engine (or *None* if the pool hasn't been prepared) and the lock to hold while using it if all sessions share a single
+            connection.
+        """
+        return DatabaseStoragePool._engine, (
+            DatabaseStoragePool._shared_lock
+            if DatabaseStoragePool._shares_connection
+            else None
+        )
 
     def __init__(self):
         super().__init__("Database")
 
         self._session = Session(DatabaseStoragePool._engine)
+        self._lock = (
+            DatabaseStoragePool._shared_lock
+            if DatabaseStoragePool._shares_connection
+            else threading.RLock()
+        )
 
         self._connector_storage = DatabaseConnectorStorage(
-            self._session, DatabaseStoragePool._schema.connectors_table
+            self._session, DatabaseStoragePool._schema.connectors_table, self._lock
         )
         self._user_storage = DatabaseUserStorage(
-            self._session, DatabaseStoragePool._schema.users_table
+            self._session, DatabaseStoragePool._schema.users_table, self._lock
         )
         self._project_storage = DatabaseProjectStorage(
-            self._session, DatabaseStoragePool._schema.projects_table
+            self._session,
+            DatabaseStoragePool._schema.projects_table,
+            DatabaseStoragePool._schema.project_job_history_table,
+            self._lock,
         )
         self._project_job_storage = DatabaseProjectJobStorage(
-            self._session, DatabaseStoragePool._schema.project_jobs_table
+            self._session, DatabaseStoragePool._schema.project_jobs_table, self._lock
         )
         self._authorization_token_storage = DatabaseAuthorizationTokenStorage(
-            self._session, DatabaseStoragePool._schema.authorization_tokens_table
+            self._session,
+            DatabaseStoragePool._schema.authorization_tokens_table,
+            self._lock,
         )
 
     def close(self, save_changes: bool = True) -> None:
-        self._session.commit() if save_changes else self._session.rollback()
-        self._session.close()
+        with self._lock:
+            self._session.commit() if save_changes else self._session.rollback()
+            self._session.close()
 
     @property
     def connector_storage(self) -> DatabaseConnectorStorage:
@@ -5,7 +5,7 @@ from sqlalchemy import Table
 from sqlalchemy.orm import Session
 
 from common.py.data.entities.user import UserID, User
-from common.py.data.storage import UserStorage
+from common.py.data.storage import UserStorage, StorageCondition
 
 from .database_storage_accessor import DatabaseStorageAccessor
 
@@ -15,23 +15,26 @@ class DatabaseUserStorage(UserStorage):
     Database storage for users.
     """
 
-    _lock = threading.RLock()
-
-    def __init__(self, session: Session, table: Table):
+    def __init__(self, session: Session, table: Table, lock: threading.RLock):
+        """
+        Args:
+            session: The database session.
+            table: The storage table.
+            lock: The lock guarding the database session.
+        """
         super().__init__()
 
         self._session = session
         self._table = table
+        self._lock = lock
 
         self._accessor = DatabaseStorageAccessor[User, UserID](
             User, self._session, self._lock
         )
 
-    def next_id(self) -> UserID:
-        raise NotImplementedError("Users do not support automatic IDs")
-
-    def add(self, entity: User) -> None:
+    def add(self, entity: User) -> UserID:
         self._accessor.add(entity)
+        return entity.user_id
 
     def remove(self, entity: User) -> None:
         self._accessor.remove(entity)
@@ -41,3 +44,12 @@ class DatabaseUserStorage(UserStorage):
 
     def list(self) -> typing.List[User]:
         return self._accessor.list()
+
+    def get_many(self, keys: typing.Iterable[UserID]) -> typing.List[User]:
+        return self._accessor.get_many(keys)
+
+    def remove_many(self, entities: typing.Iterable[User]) -> None:
+        self._accessor.remove_many(entities)
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        return self._accessor.remove_where(*conditions)
@@ -1 +1,3 @@
 from .engines import create_database_engine
+from .engine_utils import add_database_column, create_database_tables
+from .engine_instrumentation import QueryCounter, instrument_database_engine
@@ -0,0 +1,81 @@
+import threading
+import typing
+
+from sqlalchemy import Engine, event
+
+
+class QueryCounter:
+    """
+    Counts the SQL statements issued through a database engine.
+
+    The counter is used as a context manager; all statements executed while the context is active are counted, regardless of
+    the thread issuing them::
+
+        with QueryCounter(engine) as counter:
+            storage.filter_by_user(user_id)
+
+        print(counter.count)
+    """
+
+    def __init__(self, engine: Engine):
+        """
+        Args:
+            engine: The database engine.
+        """
+        self._engine = engine
+
+        self._count = 0
+        self._statements: typing.List[str] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "QueryCounter":
+        with self._lock:
+            self._count = 0
+            self._statements = []
+
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, _conn, _cursor, statement: str, *_) -> None:
+        with self._lock:
+            self._count += 1
+            self._statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        """
+        The number of statements executed.
+        """
+        with self._lock:
+            return self._count
+
+    @property
+    def statements(self) -> typing.List[str]:
+        """
+        All statements executed.
+        """
+        with self._lock:
+            return self._statements.copy()
+
+
+def instrument_database_engine(engine: Engine) -> None:
+    """
+    Records the number of SQL statements issued through an engine, grouped by their type (e.g., *SELECT*).
+
+    Args:
+        engine: The database engine.
+    """
+    from common.py.core.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(_conn, _cursor, statement: str, *_) -> None:
+        metrics.counter(
+            "rds_database_queries_total",
+            "Total number of SQL statements issued",
+            statement=statement.lstrip().split(" ", 1)[0].upper(),
+        ).inc()
@@ -3,9 +3,20 @@ from .engine_utils import format_database_url
 
 
 def get_engine_parameters_mariadb(
-    host: str, port: int, database: str, user: str, password: str
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    password: str,
+    statement_timeout: float,
 ) -> EngineParameters:
     db_url = "mariadb+mariadbconnector://" + format_database_url(
         host, port, database, user, password
     )
-    return db_url, {}, {}
+    connect_args = {}
+    if statement_timeout > 0.0:
+        connect_args["init_command"] = (
+            f"SET SESSION max_statement_time={statement_timeout}"
+        )
+
+    return db_url, connect_args, {}
@@ -3,9 +3,21 @@ from .engine_utils import format_database_url
 
 
 def get_engine_parameters_mysql(
-    host: str, port: int, database: str, user: str, password: str
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    password: str,
+    statement_timeout: float,
 ) -> EngineParameters:
     db_url = "mysql+mysqlconnector://" + format_database_url(
         host, port, database, user, password
     )
-    return db_url, {}, {}
+    connect_args = {}
+    if statement_timeout > 0.0:
+        # Only applies to read-only SELECT statements
+        connect_args["init_command"] = (
+            f"SET SESSION MAX_EXECUTION_TIME={int(statement_timeout * 1000)}"
+        )
+
+    return db_url, connect_args, {}
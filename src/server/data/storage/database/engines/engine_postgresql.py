@@ -3,9 +3,20 @@ from .engine_utils import format_database_url
 
 
 def get_engine_parameters_postgresql(
-    host: str, port: int, database: str, user: str, password: str
+    host: str,
+    port: int,
+    database: str,
+    user: str,
+    password: str,
+    statement_timeout: float,
 ) -> EngineParameters:
     db_url = "postgresql+psycopg://" + format_database_url(
         host, port, database, user, password
     )
-    return db_url, {}, {}
+    connect_args = {}
+    if statement_timeout > 0.0:
+        connect_args["options"] = (
+            f"-c statement_timeout={int(statement_timeout * 1000)}"
+        )
+
+    return db_url, connect_args, {}
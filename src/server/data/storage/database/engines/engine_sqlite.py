@@ -1,10 +1,14 @@
 import os
 import pathlib
 
+from sqlalchemy import Engine
+
 from .engine import EngineParameters
 
 
-def get_engine_parameters_sqlite(filename: str) -> EngineParameters:
+def get_engine_parameters_sqlite(
+    filename: str, busy_timeout: float
+) -> EngineParameters:
     from sqlalchemy import StaticPool
 
     if filename == "":
@@ -14,7 +18,44 @@ def get_engine_parameters_sqlite(filename: str) -> EngineParameters:
         os.makedirs(str(pathlib.PurePosixPath(filename).parent), exist_ok=True)
 
     db_url = f"sqlite:///{filename}"
-    connect_args = {"check_same_thread": False}
-    engine_args = {"poolclass": StaticPool}
+    connect_args = {"check_same_thread": False, "timeout": busy_timeout}
+    engine_args = {}
+
+    if is_sqlite_in_memory(filename):
+        # An in-memory database only lives as long as its connection, so all threads need to share a single one
+        engine_args["poolclass"] = StaticPool
 
     return db_url, connect_args, engine_args
+
+
+def is_sqlite_in_memory(filename: str) -> bool:
+    """
+    Checks whether an SQLite filename refers to an in-memory database.
+
+    Args:
+        filename: The filename.
+
+    Returns:
+        Whether the database is kept in memory.
+    """
+    return filename.lstrip("/") == ":memory:"
+
+
+def prepare_engine_sqlite(engine: Engine) -> None:
+    """
+    Sets up an engine using an SQLite database file for concurrent access.
+
+    The database is switched to *WAL* journaling, which lets readers proceed while a write is in progress; since the *WAL* file
+    itself is crash-safe, synchronizing the database file only on checkpoints (*synchronous=NORMAL*) suffices.
+
+    Args:
+        engine: The database engine.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
@@ -1,3 +1,10 @@
+import random
+import time
+
+from sqlalchemy import Column, Connection, Engine, MetaData, inspect, text
+from sqlalchemy.exc import DBAPIError
+
+
 def format_database_url(
     host: str, port: int, database: str, user: str, password: str
 ) -> str:
@@ -24,3 +31,53 @@ def format_database_url(
         url += f":{port}"
     url += f"/{database}"
     return url
+
+
+def create_database_tables(
+    metadata: MetaData, engine: Engine, *, attempts: int = 10
+) -> None:
+    """
+    Creates all tables of the given metadata that don't exist yet.
+
+    Multiple server processes might be creating the same tables concurrently, making single statements fail; in this case, the
+    creation is retried after a short delay.
+
+    Args:
+        metadata: The metadata holding all tables.
+        engine: The database engine.
+        attempts: The maximum number of attempts.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            metadata.create_all(engine)
+            return
+        except DBAPIError:
+            if attempt == attempts:
+                raise
+
+            time.sleep(random.uniform(0.05, 0.25))
+
+
+def add_database_column(conn: Connection, column: Column) -> bool:
+    """
+    Adds a column to an existing table if it doesn't exist yet.
+
+    Args:
+        conn: The database connection.
+        column: The column (which must belong to a table) to add.
+
+    Returns:
+        Whether the column has been added.
+    """
+    table = column.table
+    if column.name in {col["name"] for col in inspect(conn).get_columns(table.name)}:
+        return False
+
+    preparer = conn.dialect.identifier_preparer
+    conn.execute(
+        text(
+            f"ALTER TABLE {preparer.format_table(table)} "
+            f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(conn.dialect)}"
+        )
+    )
+    return True
@@ -1,3 +1,5 @@
+import typing
+
 from sqlalchemy import Engine, create_engine
 from sqlalchemy_utils import database_exists, create_database
 
@@ -14,7 +16,8 @@ def create_database_engine(config: Configuration) -> Engine:
             from .engine_sqlite import get_engine_parameters_sqlite
 
             db_url, connect_args, engine_args = get_engine_parameters_sqlite(
-                config.value(DatabaseStorageSettingIDs.SQLite.FILE)
+                config.value(DatabaseStorageSettingIDs.SQLite.FILE),
+                config.value(DatabaseStorageSettingIDs.SQLite.BUSY_TIMEOUT),
             )
         case "postgresql":
             from .engine_postgresql import get_engine_parameters_postgresql
@@ -25,6 +28,7 @@ def create_database_engine(config: Configuration) -> Engine:
                 config.value(DatabaseStorageSettingIDs.PostgreSQL.DATABASE),
                 config.value(DatabaseStorageSettingIDs.PostgreSQL.USER),
                 config.value(DatabaseStorageSettingIDs.PostgreSQL.PASSWORD),
+                config.value(DatabaseStorageSettingIDs.STATEMENT_TIMEOUT),
             )
         case "mysql":
             from .engine_mysql import get_engine_parameters_mysql
@@ -35,6 +39,7 @@ def create_database_engine(config: Configuration) -> Engine:
                 config.value(DatabaseStorageSettingIDs.MySQL.DATABASE),
                 config.value(DatabaseStorageSettingIDs.MySQL.USER),
                 config.value(DatabaseStorageSettingIDs.MySQL.PASSWORD),
+                config.value(DatabaseStorageSettingIDs.STATEMENT_TIMEOUT),
             )
         case "mariadb":
             from .engine_mariadb import get_engine_parameters_mariadb
@@ -45,6 +50,7 @@ def create_database_engine(config: Configuration) -> Engine:
                 config.value(DatabaseStorageSettingIDs.MariaDB.DATABASE),
                 config.value(DatabaseStorageSettingIDs.MariaDB.USER),
                 config.value(DatabaseStorageSettingIDs.MariaDB.PASSWORD),
+                config.value(DatabaseStorageSettingIDs.STATEMENT_TIMEOUT),
             )
         case _:
             raise RuntimeError(f"Unknown database engine '{engine}'")
@@ -57,9 +63,35 @@ def create_database_engine(config: Configuration) -> Engine:
     if not database_exists(db_url):
         create_database(db_url)
 
-    return create_engine(
+    if "poolclass" not in engine_args:
+        engine_args.update(_get_pool_parameters(config))
+
+    db_engine = create_engine(
         db_url,
         echo=config.value(DatabaseStorageSettingIDs.DUMP_SQL),
         connect_args=connect_args,
         **engine_args,
     )
+
+    if engine == "sqlite" and "poolclass" not in engine_args:
+        from .engine_sqlite import prepare_engine_sqlite
+
+        prepare_engine_sqlite(db_engine)
+
+    from .engine_instrumentation import instrument_database_engine
+
+    instrument_database_engine(db_engine)
+
+    return db_engine
+
+
+def _get_pool_parameters(config: Configuration) -> typing.Dict[str, typing.Any]:
+    from .....settings.storage_setting_ids import DatabaseStorageSettingIDs
+
+    recycle = config.value(DatabaseStorageSettingIDs.RECYCLE)
+    return {
+        "pool_size": config.value(DatabaseStorageSettingIDs.POOL_SIZE),
+        "max_overflow": config.value(DatabaseStorageSettingIDs.MAX_OVERFLOW),
+        "pool_pre_ping": config.value(DatabaseStorageSettingIDs.PRE_PING),
+        "pool_recycle": recycle if recycle > 0 else -1,
+    }
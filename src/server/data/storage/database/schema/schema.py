@@ -6,11 +6,16 @@ from .table_connectors import register_connectors_tables
 from .table_users import register_users_tables
 from .table_projects import register_projects_tables
 from .table_project_jobs import register_project_jobs_tables
+from .schema_migrations import get_schema_migrations
+from .schema_migrator import SchemaMigrator
 
 
 class DatabaseSchema:
     """
     The overall database schema.
+
+    New databases are always created using the current schema; existing databases are upgraded in place when being prepared (see
+    ``SchemaMigrator``).
     """
 
     def __init__(self, engine: Engine):
@@ -32,10 +37,25 @@ class DatabaseSchema:
             self._metadata, self._registry
         )
 
+        self._migrator = SchemaMigrator(self._metadata, get_schema_migrations())
+
         # Create all registered tables
-        self._metadata.create_all(self._engine)
+        from ..engines import create_database_tables
+
+        create_database_tables(self._metadata, self._engine)
+
+    def prepare(self, *, purge_transient_data: bool = True) -> None:
+        """
+        Prepares the database for use, applying all pending schema migrations first.
+
+        Args:
+            purge_transient_data: Whether to delete data that isn't kept across restarts (connectors and project jobs).
+        """
+        self._migrator.migrate(self._engine)
+
+        if not purge_transient_data:
+            return
 
-    def prepare(self) -> None:
         with Session(self._engine) as session, session.begin():
             # Delete all connectors from the table, as they are always added anew on restart
             session.execute(self._connectors_tables.main.delete())
@@ -55,6 +75,10 @@ class DatabaseSchema:
     def projects_table(self) -> Table:
         return self._projects_tables.main
 
+    @property
+    def project_job_history_table(self) -> Table:
+        return self._projects_tables.logbook_job_history
+
     @property
     def project_jobs_table(self) -> Table:
         return self._project_jobs_tables.main
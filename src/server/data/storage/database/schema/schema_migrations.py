@@ -0,0 +1,68 @@
+import typing
+
+from sqlalchemy import Connection, MetaData, func, select, update
+
+from .schema_migrator import SchemaMigration
+from ..engines import add_database_column
+
+
+def _create_missing_indexes(conn: Connection, metadata: MetaData) -> None:
+    # Indexes are only created along with their tables, so existing tables lack indexes added later on
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _align_project_id_sequence(conn: Connection, metadata: MetaData) -> None:
+    # Projects used to be added with explicit IDs, so the sequence generating their IDs (only used by PostgreSQL) never advanced
+    if conn.dialect.name != "postgresql":
+        return
+
+    table = metadata.tables["projects"]
+    conn.execute(
+        select(
+            func.setval(
+                func.pg_get_serial_sequence(table.name, table.c.project_id.name),
+                func.coalesce(func.max(table.c.project_id), 0) + 1,
+                False,
+            )
+        )
+    )
+
+
+def _add_project_update_time(conn: Connection, metadata: MetaData) -> None:
+    table = metadata.tables["projects"]
+    column = table.c.update_time
+
+    add_database_column(conn, column)
+
+    # Existing projects are considered unchanged since their creation
+    conn.execute(
+        update(table).where(column.is_(None)).values({column: table.c.creation_time})
+    )
+
+
+def get_schema_migrations() -> typing.List[SchemaMigration]:
+    """
+    Gets all schema migrations.
+
+    Returns:
+        The list of all migrations.
+    """
+    return [
+        SchemaMigration(
+            version=1,
+            description="Add indexes on frequently queried columns",
+            upgrade=_create_missing_indexes,
+        ),
+        SchemaMigration(
+            version=2,
+            description="Let the project ID sequence continue after existing projects",
+            upgrade=_align_project_id_sequence,
+        ),
+        SchemaMigration(
+            version=3,
+            description="Record the time of the last change of projects",
+            upgrade=_add_project_update_time,
+        ),
+    ]
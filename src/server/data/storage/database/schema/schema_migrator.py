@@ -0,0 +1,124 @@
+import dataclasses
+import random
+import time
+import typing
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    Integer,
+    MetaData,
+    Numeric,
+    Table,
+    Text,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.exc import DBAPIError
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SchemaMigration:
+    """
+    A single schema migration.
+
+    Migrations are applied to existing databases only if they haven't been applied yet. Since new databases are always created using
+    the current schema, migrations should check whether their changes are already present (e.g., by using ``checkfirst``).
+
+    Attributes:
+        version: The schema version reached by this migration; versions must be strictly increasing.
+        description: A short description of the migration.
+        upgrade: The function performing the migration.
+    """
+
+    version: int
+    description: str
+    upgrade: typing.Callable[[Connection, MetaData], None]
+
+
+class SchemaMigrator:
+    """
+    Upgrades existing databases to the current schema by applying all pending migrations.
+
+    All applied migrations are recorded in a separate table; the schema version of a database is the highest recorded version.
+    """
+
+    def __init__(self, metadata: MetaData, migrations: typing.List[SchemaMigration]):
+        """
+        Args:
+            metadata: The metadata holding all tables; the migrations table is added to it.
+            migrations: All schema migrations.
+        """
+        self._metadata = metadata
+        self._migrations = sorted(migrations, key=lambda migration: migration.version)
+
+        self._table = Table(
+            "schema_migrations",
+            metadata,
+            Column("version", Integer, primary_key=True),
+            Column("description", Text),
+            Column("applied_at", Numeric(32, 8, asdecimal=False)),
+        )
+
+    def migrate(self, engine: Engine, *, attempts: int = 10) -> typing.List[int]:
+        """
+        Applies all pending migrations, each one in its own transaction.
+
+        Multiple server processes might be migrating the same database concurrently, making single migrations fail; in this case,
+        the migration is retried after a short delay (and skipped if it has been applied by another process meanwhile).
+
+        Args:
+            engine: The database engine.
+            attempts: The maximum number of attempts per migration.
+
+        Returns:
+            The versions of all applied migrations.
+        """
+        from common.py.core.logging import info
+
+        applied: typing.List[int] = []
+
+        for migration in self._migrations:
+            for attempt in range(1, attempts + 1):
+                try:
+                    with engine.begin() as conn:
+                        if self.version(conn) >= migration.version:
+                            break
+
+                        migration.upgrade(conn, self._metadata)
+                        conn.execute(
+                            insert(self._table).values(
+                                version=migration.version,
+                                description=migration.description,
+                                applied_at=time.time(),
+                            )
+                        )
+
+                    applied.append(migration.version)
+                    info(
+                        f"Applied database schema migration: {migration.description}",
+                        scope="storage",
+                        version=migration.version,
+                    )
+                    break
+                except DBAPIError:
+                    if attempt == attempts:
+                        raise
+
+                    time.sleep(random.uniform(0.05, 0.25))
+
+        return applied
+
+    def version(self, conn: Connection) -> int:
+        """
+        Gets the current schema version of a database.
+
+        Args:
+            conn: The database connection.
+
+        Returns:
+            The schema version, or 0 if no migrations have been applied.
+        """
+        return conn.execute(select(func.max(self._table.c.version))).scalar() or 0
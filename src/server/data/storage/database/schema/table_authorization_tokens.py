@@ -9,6 +9,7 @@ from sqlalchemy import (
     Numeric,
     String,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import registry
 
@@ -54,6 +55,8 @@ def register_authorization_tokens_tables(
         Column("strategy", Text),
         Column("token", JSONEncodedDataType),
         Column("data", JSONEncodedDataType),
+        # Indexes
+        Index("ix_authorization_tokens_expiration_timestamp", "expiration_timestamp"),
     )
 
     reg.map_imperatively(
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Uuid,
     Numeric,
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy.orm import registry
@@ -48,6 +49,8 @@ def register_project_jobs_tables(
         # Progress
         Column("progress", Numeric(32, 8, asdecimal=False)),
         Column("message", Text),
+        # Indexes
+        Index("ix_project_jobs_user_id", "user_id"),
     )
 
     reg.map_imperatively(
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Text,
     Boolean,
     ForeignKey,
+    Index,
     String,
     Uuid,
     Numeric,
@@ -64,6 +65,7 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
         Column("project_id", Integer, primary_key=True),
         Column("user_id", String(256), ForeignKey("users.user_id")),
         Column("creation_time", Numeric(32, 8, asdecimal=False)),
+        Column("update_time", Numeric(32, 8, asdecimal=False)),
         Column("resources_path", Text),
         Column("title", Text),
         Column("description", Text),
@@ -76,6 +78,10 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
             ArrayType[ConnectorInstanceID](value_conv=uuid.UUID),
         ),
         Column("opt__ui", JSONEncodedDataType),
+        # Indexes
+        Index("ix_projects_user_id", "user_id"),
+        # Never reuse IDs of deleted projects
+        sqlite_autoincrement=True,
     )
 
     # -- Features
@@ -151,9 +157,12 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
         Column("success", Boolean),
         Column("message", Text),
         Column("ext_data", JSONEncodedDataType),
+        # The history is loaded by project, which isn't the leading column of the primary key
+        Index("ix_project_logbook_job_history_project_id", "project_id"),
     )
 
-    # Map all tables
+    # Map all tables; all one-to-one relations are loaded along with their parent using joins, while the job history is loaded
+    # using a single additional query for all loaded projects (instead of one query per project)
 
     reg.map_imperatively(
         Project,
@@ -164,6 +173,7 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
                 backref="projects",
                 uselist=False,
                 cascade="all, delete",
+                lazy="joined",
             ),
             "options": composite(
                 Project.Options,
@@ -177,6 +187,7 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
                 backref="projects",
                 uselist=False,
                 cascade="all, delete",
+                lazy="joined",
             ),
         },
     )
@@ -190,18 +201,21 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
                 backref="project_features",
                 uselist=False,
                 cascade="all, delete",
+                lazy="joined",
             ),
             "resources_metadata": relationship(
                 ResourcesMetadataFeature,
                 backref="project_features",
                 uselist=False,
                 cascade="all, delete",
+                lazy="joined",
             ),
             "dmp": relationship(
                 DataManagementPlanFeature,
                 backref="project_features",
                 uselist=False,
                 cascade="all, delete",
+                lazy="joined",
             ),
         },
     )
@@ -229,6 +243,7 @@ def register_projects_tables(metadata: MetaData, reg: registry) -> ProjectsTable
                 ProjectJobHistoryRecord,
                 backref="project_logbook",
                 cascade="all, delete",
+                lazy="selectin",
             ),
         },
     )
@@ -1,4 +1,3 @@
-import threading
 import typing
 
 from common.py.data.entities.authorization import (
@@ -7,58 +6,86 @@ from common.py.data.entities.authorization import (
 )
 from common.py.data.entities.user import UserID
 from common.py.data.storage import AuthorizationTokenStorage
+from common.py.utils import ReadWriteLock
 
+from .memory_index import MemoryIndex
+from .memory_storage import MemoryStorage
 
-class MemoryAuthorizationTokenStorage(AuthorizationTokenStorage):
+
+class MemoryAuthorizationTokenStorage(
+    MemoryStorage[AuthorizationToken, AuthorizationTokenID], AuthorizationTokenStorage
+):
     """
     In-memory storage for authorization tokens.
     """
 
+    kind = "authorization_tokens"
+    entity_type = AuthorizationToken
+
     _tokens: typing.Dict[AuthorizationTokenID, AuthorizationToken] = {}
-    _lock = threading.RLock()
+    _user_index: MemoryIndex[UserID, AuthorizationTokenID] = MemoryIndex()
+    _lock = ReadWriteLock()
 
-    def next_id(self) -> AuthorizationTokenID:
-        raise NotImplementedError("Authorization tokens do not support automatic IDs")
+    def add(self, entity: AuthorizationToken) -> AuthorizationTokenID:
+        key = self.key_from_entity(entity)
+        with MemoryAuthorizationTokenStorage._lock.write():
+            MemoryAuthorizationTokenStorage._tokens[key] = entity
+            MemoryAuthorizationTokenStorage._user_index.add(entity.user_id, key)
 
-    def add(self, entity: AuthorizationToken) -> None:
-        with MemoryAuthorizationTokenStorage._lock:
-            MemoryAuthorizationTokenStorage._tokens[self._key_from_entity(entity)] = (
-                entity
-            )
+        self._track(entity)
+        return key
 
     def remove(self, entity: AuthorizationToken) -> None:
-        with MemoryAuthorizationTokenStorage._lock:
+        key = self.key_from_entity(entity)
+        with MemoryAuthorizationTokenStorage._lock.write():
             try:
-                del MemoryAuthorizationTokenStorage._tokens[
-                    self._key_from_entity(entity)
-                ]
+                del MemoryAuthorizationTokenStorage._tokens[key]
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 from common.py.data.storage import StorageException
 
                 raise StorageException(
-                    f"An authorization token with ID {self._key_from_entity(entity)} was not found"
+                    f"An authorization token with ID {key} was not found"
                 ) from exc
 
+            MemoryAuthorizationTokenStorage._user_index.remove(key)
+
+        self._track_removal(entity)
+
     def get(self, key: AuthorizationTokenID) -> AuthorizationToken | None:
-        with MemoryAuthorizationTokenStorage._lock:
-            return (
+        with MemoryAuthorizationTokenStorage._lock.read():
+            return self._track(
                 MemoryAuthorizationTokenStorage._tokens[key]
                 if key in MemoryAuthorizationTokenStorage._tokens
                 else None
             )
 
     def list(self) -> typing.List[AuthorizationToken]:
-        with MemoryAuthorizationTokenStorage._lock:
-            return list(MemoryAuthorizationTokenStorage._tokens.values())
+        with MemoryAuthorizationTokenStorage._lock.read():
+            return self._track_all(
+                list(MemoryAuthorizationTokenStorage._tokens.values())
+            )
 
     def filter_by_user(self, user_id: UserID) -> typing.List[AuthorizationToken]:
-        with MemoryAuthorizationTokenStorage._lock:
-            return list(
-                filter(
-                    lambda token: token.user_id == user_id,
-                    MemoryAuthorizationTokenStorage._tokens.values(),
-                )
+        with MemoryAuthorizationTokenStorage._lock.read():
+            return self._track_all(
+                [
+                    MemoryAuthorizationTokenStorage._tokens[key]
+                    for key in MemoryAuthorizationTokenStorage._user_index.find(user_id)
+                ]
+            )
+
+    def filter_by_expiration(self, timestamp: float) -> typing.List[AuthorizationToken]:
+        with MemoryAuthorizationTokenStorage._lock.read():
+            return self._track_all(
+                [
+                    token
+                    for token in MemoryAuthorizationTokenStorage._tokens.values()
+                    if 0 < token.expiration_timestamp <= timestamp
+                ]
             )
 
-    def _key_from_entity(self, entity: AuthorizationToken) -> AuthorizationTokenID:
-        return entity.user_id, entity.token_id
+    def key_from_entity(self, entity: AuthorizationToken) -> AuthorizationTokenID:
+        return entity.user_id, entity.auth_id
+
+    def _stored_entities(self) -> typing.List[AuthorizationToken]:
+        return list(MemoryAuthorizationTokenStorage._tokens.values())
@@ -0,0 +1,61 @@
+import typing
+
+
+class MemoryChangeTracker:
+    """
+    Keeps track of all entities of a single storage pool instance that might have been changed or were removed.
+
+    Entities are handed out by reference and usually modified in place, so every entity retrieved from or added to a storage must be
+    considered as changed.
+    """
+
+    ChangeKey = typing.Tuple[str, typing.Any]
+
+    def __init__(self):
+        self._changed: typing.Dict[MemoryChangeTracker.ChangeKey, typing.Any] = {}
+        self._removed: typing.Dict[MemoryChangeTracker.ChangeKey, typing.Any] = {}
+
+    def track(self, kind: str, key: typing.Any, entity: typing.Any) -> None:
+        """
+        Tracks an entity that might have been changed.
+
+        Args:
+            kind: The kind of the entity (i.e., the name of its storage).
+            key: The key of the entity.
+            entity: The entity.
+        """
+        self._removed.pop((kind, key), None)
+        self._changed[(kind, key)] = entity
+
+    def track_removal(self, kind: str, key: typing.Any, entity: typing.Any) -> None:
+        """
+        Tracks an entity that has been removed.
+
+        Args:
+            kind: The kind of the entity (i.e., the name of its storage).
+            key: The key of the entity.
+            entity: The entity.
+        """
+        self._changed.pop((kind, key), None)
+        self._removed[(kind, key)] = entity
+
+    def clear(self) -> None:
+        """
+        Forgets all tracked entities.
+        """
+        self._changed.clear()
+        self._removed.clear()
+
+    @property
+    def changed(self) -> typing.Dict[ChangeKey, typing.Any]:
+        """
+        All entities that might have been changed.
+        """
+        return self._changed
+
+    @property
+    def removed(self) -> typing.Dict[ChangeKey, typing.Any]:
+        """
+        All entities that have been removed.
+        """
+        return self._removed
@@ -1,27 +1,32 @@
-import threading
 import typing
 
 from common.py.data.entities.connector import ConnectorID, Connector
 from common.py.data.storage import ConnectorStorage
+from common.py.utils import ReadWriteLock
 
+from .memory_storage import MemoryStorage
 
-class MemoryConnectorStorage(ConnectorStorage):
+
+class MemoryConnectorStorage(MemoryStorage[Connector, ConnectorID], ConnectorStorage):
     """
     In-memory storage for connectors.
     """
 
-    _connectors: typing.Dict[ConnectorID, Connector] = {}
-    _lock = threading.RLock()
+    kind = "connectors"
+    entity_type = Connector
 
-    def next_id(self) -> ConnectorID:
-        raise NotImplementedError("Connectors do not support automatic IDs")
+    _connectors: typing.Dict[ConnectorID, Connector] = {}
+    _lock = ReadWriteLock()
 
-    def add(self, entity: Connector) -> None:
-        with MemoryConnectorStorage._lock:
+    def add(self, entity: Connector) -> ConnectorID:
+        with MemoryConnectorStorage._lock.write():
             MemoryConnectorStorage._connectors[entity.connector_id] = entity
 
+        self._track(entity)
+        return entity.connector_id
+
     def remove(self, entity: Connector) -> None:
-        with MemoryConnectorStorage._lock:
+        with MemoryConnectorStorage._lock.write():
             try:
                 del MemoryConnectorStorage._connectors[entity.connector_id]
             except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -31,14 +36,22 @@ class MemoryConnectorStorage(ConnectorStorage):
                     f"A connector with ID {entity.connector_id} was not found"
                 ) from exc
 
+        self._track_removal(entity)
+
     def get(self, key: ConnectorID) -> Connector | None:
-        with MemoryConnectorStorage._lock:
-            return (
+        with MemoryConnectorStorage._lock.read():
+            return self._track(
                 MemoryConnectorStorage._connectors[key]
                 if key in MemoryConnectorStorage._connectors
                 else None
             )
 
     def list(self) -> typing.List[Connector]:
-        with MemoryConnectorStorage._lock:
-            return list(MemoryConnectorStorage._connectors.values())
+        with MemoryConnectorStorage._lock.read():
+            return self._track_all(list(MemoryConnectorStorage._connectors.values()))
+
+    def key_from_entity(self, entity: Connector) -> ConnectorID:
+        return entity.connector_id
+
+    def _stored_entities(self) -> typing.List[Connector]:
+        return list(MemoryConnectorStorage._connectors.values())
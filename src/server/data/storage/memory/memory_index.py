@@ -0,0 +1,71 @@
+import typing
+
+IndexValueType = typing.TypeVar("IndexValueType")  # pylint: disable=invalid-name
+EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
+
+
+class MemoryIndex(typing.Generic[IndexValueType, EntityKeyType]):
+    """
+    A secondary index for in-memory storages, mapping an attribute value (e.g., a user ID) to the keys of all entities having it.
+
+    Keys are returned in the order in which they were first added.
+
+    Notes:
+        The index isn't thread-safe; it must be guarded by the lock of its storage.
+    """
+
+    def __init__(self):
+        self._keys: typing.Dict[IndexValueType, typing.Dict[EntityKeyType, None]] = {}
+        self._values: typing.Dict[EntityKeyType, IndexValueType] = {}
+
+    def add(self, value: IndexValueType, key: EntityKeyType) -> None:
+        """
+        Adds an entity key to the index, replacing its previous value (if any).
+
+        Args:
+            value: The indexed value.
+            key: The entity key.
+        """
+        if key in self._values:
+            if self._values[key] == value:
+                return
+
+            self.remove(key)
+
+        self._keys.setdefault(value, {})[key] = None
+        self._values[key] = value
+
+    def remove(self, key: EntityKeyType) -> None:
+        """
+        Removes an entity key from the index.
+
+        Args:
+            key: The entity key.
+        """
+        if key not in self._values:
+            return
+
+        value = self._values.pop(key)
+        keys = self._keys[value]
+        del keys[key]
+        if not keys:
+            del self._keys[value]
+
+    def find(self, value: IndexValueType) -> typing.List[EntityKeyType]:
+        """
+        Finds the keys of all entities having the given value.
+
+        Args:
+            value: The indexed value.
+
+        Returns:
+            The keys of all matching entities.
+        """
+        return list(self._keys[value]) if value in self._keys else []
+
+    def clear(self) -> None:
+        """
+        Removes all keys from the index.
+        """
+        self._keys.clear()
+        self._values.clear()
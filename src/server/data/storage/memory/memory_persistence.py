@@ -0,0 +1,311 @@
+import os
+import pickle
+import struct
+import threading
+import time
+import typing
+import zlib
+
+from .memory_change_tracker import MemoryChangeTracker
+from .memory_storage import MemoryStorage
+
+
+class MemoryPersistence:
+    """
+    Persists the in-memory storages using an append-only journal and periodic snapshots.
+
+    Whenever a storage pool instance is closed, all entities it has changed or removed are appended to the journal as a single
+    entry. Once the journal has grown beyond a certain number of entries, a compacted snapshot of all storages is written and the
+    journal is started anew. When the storages are restored, the latest snapshot is loaded and all subsequent journal entries are
+    replayed.
+
+    Journals are numbered by generation; a snapshot records the first generation that needs to be replayed on top of it. Since a snapshot
+    is only written in the background after switching to a new journal, writing to the journal never has to wait for a snapshot.
+
+    All data is stored as pickled records, each preceded by its length and checksum.
+
+    Notes:
+        Entities are always written as a whole, so replaying a journal entry that is already contained in a snapshot is harmless.
+    """
+
+    _SNAPSHOT_FILE = "snapshot.bin"
+    _JOURNAL_FILE = "journal-{generation}.bin"
+
+    _RECORD_HEADER = struct.Struct("<II")
+
+    def __init__(
+        self,
+        path: str,
+        storages: typing.List[MemoryStorage],
+        *,
+        snapshot_threshold: int = 1000,
+        sync: bool = True,
+    ):
+        """
+        Args:
+            path: The folder to store all files in.
+            storages: All storages to persist.
+            snapshot_threshold: The number of journal entries after which a new snapshot is written.
+            sync: Whether each journal entry is flushed to disk immediately.
+        """
+        self._path = path
+        self._storages = {storage.kind: storage for storage in storages}
+
+        self._snapshot_threshold = snapshot_threshold
+        self._sync = sync
+
+        self._generation = 0
+        self._journal: typing.BinaryIO | None = None
+        self._journal_entries = 0
+
+        # Hashes of the last written state of each entity, used to skip entities that haven't been changed; this relies on unchanged
+        # entities always being pickled the same way (e.g., unit IDs never pickle their cached, per-process hash)
+        self._states: typing.Dict[MemoryChangeTracker.ChangeKey, int] = {}
+
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+
+    def restore(self) -> None:
+        """
+        Restores all storages from the latest snapshot and journal.
+
+        Afterward, a new snapshot containing the restored state is written.
+        """
+        from common.py.core.logging import info
+
+        start = time.perf_counter()
+
+        self._generation = self._load_snapshot()
+        entries = 0
+
+        for generation in self._journal_generations():
+            if generation >= self._generation:
+                entries += self._replay_journal(generation)
+                self._generation = generation
+
+        info(
+            "Restored memory storage",
+            scope="storage",
+            path=self._path,
+            journal_entries=entries,
+            duration=f"{time.perf_counter() - start:.3f}s",
+        )
+
+        with self._lock:
+            self._rotate_journal()
+        self.snapshot()
+
+    def commit(self, tracker: MemoryChangeTracker) -> None:
+        """
+        Appends all changes recorded by a tracker to the journal.
+
+        Args:
+            tracker: The change tracker.
+        """
+        changes: typing.List[typing.Tuple[str, str, bytes]] = []
+        states: typing.Dict[MemoryChangeTracker.ChangeKey, int | None] = {}
+
+        for (kind, key), entity in tracker.changed.items():
+            data = pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL)
+            if self._states.get((kind, key)) != (state := hash(data)):
+                changes.append(("put", kind, data))
+                states[(kind, key)] = state
+
+        for (kind, key), entity in tracker.removed.items():
+            changes.append(
+                ("remove", kind, pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL))
+            )
+            states[(kind, key)] = None
+
+        if not changes:
+            return
+
+        record = self._encode_record(changes)
+
+        with self._lock:
+            self._journal.write(record)
+            self._journal.flush()
+            if self._sync:
+                os.fsync(self._journal.fileno())
+
+            for change_key, state in states.items():
+                if state is not None:
+                    self._states[change_key] = state
+                else:
+                    self._states.pop(change_key, None)
+
+            self._journal_entries += 1
+            if self._journal_entries < self._snapshot_threshold:
+                return
+
+            self._rotate_journal()
+
+        threading.Thread(target=self._snapshot_in_background, daemon=True).start()
+
+    def snapshot(self) -> None:
+        """
+        Writes a snapshot of all storages, deleting all journals contained in it.
+        """
+        from common.py.core.logging import debug
+
+        with self._snapshot_lock:
+            with self._lock:
+                generation = self._generation
+
+            start = time.perf_counter()
+            filename = os.path.join(self._path, MemoryPersistence._SNAPSHOT_FILE)
+
+            # All entries of the previous journals have already been applied to the storages, so they are contained in the snapshot
+            with open(filename + ".tmp", "wb") as file:
+                file.write(self._encode_record(generation))
+
+                for kind, storage in self._storages.items():
+                    file.write(self._encode_record((kind, storage.list())))
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(filename + ".tmp", filename)
+            self._sync_folder()
+
+            for journal_generation in self._journal_generations():
+                if journal_generation < generation:
+                    os.remove(self._journal_filename(journal_generation))
+
+            debug(
+                "Wrote memory storage snapshot",
+                scope="storage",
+                generation=generation,
+                duration=f"{time.perf_counter() - start:.3f}s",
+            )
+
+    def close(self) -> None:
+        """
+        Closes the journal.
+        """
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def _snapshot_in_background(self) -> None:
+        from common.py.core.logging import error
+
+        try:
+            self.snapshot()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # The journals are only deleted after a successful snapshot, so nothing is lost
+            error(
+                f"Unable to write memory storage snapshot: {str(exc)}", scope="storage"
+            )
+
+    def _load_snapshot(self) -> int:
+        filename = os.path.join(self._path, MemoryPersistence._SNAPSHOT_FILE)
+        if not os.path.exists(filename):
+            return 0
+
+        with open(filename, "rb") as file:
+            generation = self._read_record(file)
+            if generation is None:
+                raise RuntimeError(f"The snapshot {filename} is corrupt")
+
+            while (record := self._read_record(file)) is not None:
+                kind, entities = record
+                for entity in entities:
+                    self._apply("put", kind, entity)
+
+        return generation
+
+    def _replay_journal(self, generation: int) -> int:
+        from common.py.core.logging import warning
+
+        entries = 0
+
+        with open(self._journal_filename(generation), "rb") as file:
+            while (changes := self._read_record(file)) is not None:
+                for op, kind, data in changes:
+                    self._apply(op, kind, pickle.loads(data))
+                entries += 1
+
+            # Only the last entry can be incomplete (if writing it was interrupted)
+            if file.read(1) != b"":
+                warning(
+                    "Skipped an incomplete journal entry",
+                    scope="storage",
+                    generation=generation,
+                )
+
+        return entries
+
+    def _apply(self, op: str, kind: str, entity: typing.Any) -> None:
+        from common.py.data.storage import StorageException
+
+        storage = self._storages[kind]
+        change_key = (kind, storage.key_from_entity(entity))
+
+        if op == "put":
+            storage.add(entity)
+            self._states[change_key] = hash(
+                pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        elif op == "remove":
+            try:
+                storage.remove(entity)
+            except StorageException:
+                pass
+
+            self._states.pop(change_key, None)
+
+    @staticmethod
+    def _encode_record(value: typing.Any) -> bytes:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return MemoryPersistence._RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data
+
+    @staticmethod
+    def _read_record(file: typing.BinaryIO) -> typing.Any | None:
+        header = file.read(MemoryPersistence._RECORD_HEADER.size)
+        if len(header) < MemoryPersistence._RECORD_HEADER.size:
+            file.seek(-len(header), os.SEEK_CUR)
+            return None
+
+        size, checksum = MemoryPersistence._RECORD_HEADER.unpack(header)
+        data = file.read(size)
+        if len(data) < size or zlib.crc32(data) != checksum:
+            file.seek(-len(header) - len(data), os.SEEK_CUR)
+            return None
+
+        return pickle.loads(data)
+
+    def _rotate_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+
+        self._generation += 1
+        self._journal = open(self._journal_filename(self._generation), "ab")
+        self._journal_entries = 0
+
+    def _journal_generations(self) -> typing.List[int]:
+        prefix, suffix = MemoryPersistence._JOURNAL_FILE.split("{generation}")
+        return sorted(
+            int(filename[len(prefix) : -len(suffix)])
+            for filename in os.listdir(self._path)
+            if filename.startswith(prefix) and filename.endswith(suffix)
+        )
+
+    def _journal_filename(self, generation: int) -> str:
+        return os.path.join(
+            self._path, MemoryPersistence._JOURNAL_FILE.format(generation=generation)
+        )
+
+    def _sync_folder(self) -> None:
+        # Persist the renaming of the snapshot file (not supported on all platforms)
+        try:
+            fd = os.open(self._path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
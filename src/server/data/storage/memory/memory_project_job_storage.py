@@ -1,4 +1,3 @@
-import threading
 import typing
 
 from common.py.data.entities.project import (
@@ -8,65 +7,86 @@ from common.py.data.entities.project import (
 )
 from common.py.data.entities.user import UserID
 from common.py.data.storage import ProjectJobStorage
+from common.py.utils import ReadWriteLock
 
+from .memory_index import MemoryIndex
+from .memory_storage import MemoryStorage
 
-class MemoryProjectJobStorage(ProjectJobStorage):
+
+class MemoryProjectJobStorage(
+    MemoryStorage[ProjectJob, ProjectJobID], ProjectJobStorage
+):
     """
     In-memory storage for project jobs.
     """
 
+    kind = "project_jobs"
+    entity_type = ProjectJob
+
     _project_jobs: typing.Dict[ProjectJobID, ProjectJob] = {}
-    _lock = threading.RLock()
+    _user_index: MemoryIndex[UserID, ProjectJobID] = MemoryIndex()
+    _project_index: MemoryIndex[ProjectID, ProjectJobID] = MemoryIndex()
+    _lock = ReadWriteLock()
 
-    def next_id(self) -> ProjectJobID:
-        raise NotImplementedError("Project jobs do not support automatic IDs")
+    def add(self, entity: ProjectJob) -> ProjectJobID:
+        key = self.key_from_entity(entity)
+        with MemoryProjectJobStorage._lock.write():
+            MemoryProjectJobStorage._project_jobs[key] = entity
+            MemoryProjectJobStorage._user_index.add(entity.user_id, key)
+            MemoryProjectJobStorage._project_index.add(entity.project_id, key)
 
-    def add(self, entity: ProjectJob) -> None:
-        with MemoryProjectJobStorage._lock:
-            MemoryProjectJobStorage._project_jobs[self._key_from_entity(entity)] = (
-                entity
-            )
+        self._track(entity)
+        return key
 
     def remove(self, entity: ProjectJob) -> None:
-        with MemoryProjectJobStorage._lock:
+        key = self.key_from_entity(entity)
+        with MemoryProjectJobStorage._lock.write():
             try:
-                del MemoryProjectJobStorage._project_jobs[self._key_from_entity(entity)]
+                del MemoryProjectJobStorage._project_jobs[key]
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 from common.py.data.storage import StorageException
 
                 raise StorageException(
-                    f"A project job with ID {self._key_from_entity(entity)} was not found"
+                    f"A project job with ID {key} was not found"
                 ) from exc
 
+            MemoryProjectJobStorage._user_index.remove(key)
+            MemoryProjectJobStorage._project_index.remove(key)
+
+        self._track_removal(entity)
+
     def get(self, key: ProjectJobID) -> ProjectJob | None:
-        with MemoryProjectJobStorage._lock:
-            return (
+        with MemoryProjectJobStorage._lock.read():
+            return self._track(
                 MemoryProjectJobStorage._project_jobs[key]
                 if key in MemoryProjectJobStorage._project_jobs
                 else None
             )
 
     def list(self) -> typing.List[ProjectJob]:
-        with MemoryProjectJobStorage._lock:
-            return list(MemoryProjectJobStorage._project_jobs.values())
+        with MemoryProjectJobStorage._lock.read():
+            return self._track_all(list(MemoryProjectJobStorage._project_jobs.values()))
 
     def filter_by_user(self, user_id: UserID) -> typing.List[ProjectJob]:
-        with MemoryProjectJobStorage._lock:
-            return list(
-                filter(
-                    lambda job: job.user_id == user_id,
-                    MemoryProjectJobStorage._project_jobs.values(),
-                )
+        with MemoryProjectJobStorage._lock.read():
+            return self._track_all(
+                [
+                    MemoryProjectJobStorage._project_jobs[key]
+                    for key in MemoryProjectJobStorage._user_index.find(user_id)
+                ]
             )
 
     def filter_by_project(self, project_id: ProjectID) -> typing.List[ProjectJob]:
-        with MemoryProjectJobStorage._lock:
-            return list(
-                filter(
-                    lambda job: job.project_id == project_id,
-                    MemoryProjectJobStorage._project_jobs.values(),
-                )
+        with MemoryProjectJobStorage._lock.read():
+            return self._track_all(
+                [
+                    MemoryProjectJobStorage._project_jobs[key]
+                    for key in MemoryProjectJobStorage._project_index.find(project_id)
+                ]
             )
 
-    def _key_from_entity(self, entity: ProjectJob) -> ProjectJobID:
+    def key_from_entity(self, entity: ProjectJob) -> ProjectJobID:
         return entity.project_id, entity.connector_instance
+
+    def _stored_entities(self) -> typing.List[ProjectJob]:
+        return list(MemoryProjectJobStorage._project_jobs.values())
@@ -1,33 +1,48 @@
-import threading
 import typing
 
-from common.py.data.entities.project import Project, ProjectID
+from common.py.data.entities.project import (
+    Project,
+    ProjectID,
+    ProjectSummary,
+    create_project_summary,
+)
 from common.py.data.entities.user import UserID
 from common.py.data.storage import ProjectStorage
+from common.py.utils import ReadWriteLock
 
+from .memory_index import MemoryIndex
+from .memory_storage import MemoryStorage
 
-class MemoryProjectStorage(ProjectStorage):
+
+class MemoryProjectStorage(MemoryStorage[Project, ProjectID], ProjectStorage):
     """
     In-memory storage for projects.
     """
 
+    kind = "projects"
+    entity_type = Project
+
     _projects: typing.Dict[ProjectID, Project] = {}
-    _lock = threading.RLock()
-
-    def next_id(self) -> ProjectID:
-        with MemoryProjectStorage._lock:
-            ids = MemoryProjectStorage._projects.keys()
-            if len(ids) > 0:
-                return max(ids) + 1
-            else:
-                return 1000
-
-    def add(self, entity: Project) -> None:
-        with MemoryProjectStorage._lock:
+    _user_index: MemoryIndex[UserID, ProjectID] = MemoryIndex()
+    _next_id: ProjectID = 1000
+    _lock = ReadWriteLock()
+
+    def add(self, entity: Project) -> ProjectID:
+        with MemoryProjectStorage._lock.write():
+            if entity.project_id == 0:
+                entity.project_id = MemoryProjectStorage._next_id
+            MemoryProjectStorage._next_id = max(
+                MemoryProjectStorage._next_id, entity.project_id + 1
+            )
+
             MemoryProjectStorage._projects[entity.project_id] = entity
+            MemoryProjectStorage._user_index.add(entity.user_id, entity.project_id)
+
+        self._track(entity)
+        return entity.project_id
 
     def remove(self, entity: Project) -> None:
-        with MemoryProjectStorage._lock:
+        with MemoryProjectStorage._lock.write():
             try:
                 del MemoryProjectStorage._projects[entity.project_id]
             except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -37,23 +52,40 @@ class MemoryProjectStorage(ProjectStorage):
                     f"A project with ID {entity.project_id} was not found"
                 ) from exc
 
+            MemoryProjectStorage._user_index.remove(entity.project_id)
+
+        self._track_removal(entity)
+
     def get(self, key: ProjectID) -> Project | None:
-        with MemoryProjectStorage._lock:
-            return (
+        with MemoryProjectStorage._lock.read():
+            return self._track(
                 MemoryProjectStorage._projects[key]
                 if key in MemoryProjectStorage._projects
                 else None
             )
 
     def list(self) -> typing.List[Project]:
-        with MemoryProjectStorage._lock:
-            return list(MemoryProjectStorage._projects.values())
+        with MemoryProjectStorage._lock.read():
+            return self._track_all(list(MemoryProjectStorage._projects.values()))
 
     def filter_by_user(self, user_id: UserID) -> typing.List[Project]:
-        with MemoryProjectStorage._lock:
-            return list(
-                filter(
-                    lambda proj: proj.user_id == user_id,
-                    MemoryProjectStorage._projects.values(),
-                )
-            )
+        return self._track_all(self._filter_by_user(user_id))
+
+    def filter_summaries_by_user(self, user_id: UserID) -> typing.List[ProjectSummary]:
+        # Summaries are copies, so the projects don't need to be tracked
+        return [
+            create_project_summary(project) for project in self._filter_by_user(user_id)
+        ]
+
+    def key_from_entity(self, entity: Project) -> ProjectID:
+        return entity.project_id
+
+    def _filter_by_user(self, user_id: UserID) -> typing.List[Project]:
+        with MemoryProjectStorage._lock.read():
+            return [
+                MemoryProjectStorage._projects[key]
+                for key in MemoryProjectStorage._user_index.find(user_id)
+            ]
+
+    def _stored_entities(self) -> typing.List[Project]:
+        return list(MemoryProjectStorage._projects.values())
@@ -0,0 +1,102 @@
+import abc
+import typing
+
+from common.py.data.storage import StorageCondition, StorageException
+from common.py.utils import ReadWriteLock
+
+from .memory_change_tracker import MemoryChangeTracker
+
+EntityType = typing.TypeVar("EntityType")  # pylint: disable=invalid-name
+EntityKeyType = typing.TypeVar("EntityKeyType")  # pylint: disable=invalid-name
+
+
+class MemoryStorage(typing.Generic[EntityType, EntityKeyType], abc.ABC):
+    """
+    Base class for all in-memory storages.
+
+    If a change tracker is used, all entities handed out by or added to the storage are reported to it.
+
+    Bulk operations are performed while holding the lock of the storage only once, so they are atomic.
+
+    Attributes:
+        kind: The kind of entities stored, used to identify the storage.
+        entity_type: The type of the stored entities.
+    """
+
+    kind: typing.ClassVar[str]
+    entity_type: typing.ClassVar[type]
+
+    _lock: typing.ClassVar[ReadWriteLock]
+
+    def __init__(self, tracker: MemoryChangeTracker | None = None):
+        """
+        Args:
+            tracker: An optional change tracker.
+        """
+        self._tracker = tracker
+
+    def get_many(self, keys: typing.Iterable[EntityKeyType]) -> typing.List[EntityType]:
+        with self._lock.read():
+            return [entity for key in keys if (entity := self.get(key)) is not None]
+
+    def add_many(
+        self, entities: typing.Iterable[EntityType]
+    ) -> typing.List[EntityKeyType]:
+        with self._lock.write():
+            return [self.add(entity) for entity in entities]
+
+    def remove_many(self, entities: typing.Iterable[EntityType]) -> None:
+        with self._lock.write():
+            for entity in entities:
+                try:
+                    self.remove(entity)
+                except StorageException:
+                    pass
+
+    def remove_where(self, *conditions: StorageCondition) -> int:
+        with self._lock.write():
+            entities = [
+                entity
+                for entity in self._stored_entities()
+                if all(condition.matches(entity) for condition in conditions)
+            ]
+
+            for entity in entities:
+                self.remove(entity)
+
+        return len(entities)
+
+    @abc.abstractmethod
+    def key_from_entity(self, entity: EntityType) -> EntityKeyType:
+        """
+        Gets the key of an entity.
+
+        Args:
+            entity: The entity.
+
+        Returns:
+            The key of the entity.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def _stored_entities(self) -> typing.List[EntityType]:
+        """
+        Gets all stored entities without reporting them to the change tracker; the lock of the storage must be held.
+        """
+        raise NotImplementedError()
+
+    def _track(self, entity: EntityType | None) -> EntityType | None:
+        if self._tracker is not None and entity is not None:
+            self._tracker.track(self.kind, self.key_from_entity(entity), entity)
+        return entity
+
+    def _track_all(self, entities: typing.List[EntityType]) -> typing.List[EntityType]:
+        if self._tracker is not None:
+            for entity in entities:
+                self._tracker.track(self.kind, self.key_from_entity(entity), entity)
+        return entities
+
+    def _track_removal(self, entity: EntityType) -> None:
+        if self._tracker is not None:
+            self._tracker.track_removal(self.kind, self.key_from_entity(entity), entity)
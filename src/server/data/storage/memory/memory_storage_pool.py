@@ -1,7 +1,10 @@
 from common.py.data.storage import StoragePool, AuthorizationTokenStorage
+from common.py.utils.config import Configuration
 
 from .memory_authorization_token_storage import MemoryAuthorizationTokenStorage
+from .memory_change_tracker import MemoryChangeTracker
 from .memory_connector_storage import MemoryConnectorStorage
+from .memory_persistence import MemoryPersistence
 from .memory_project_job_storage import MemoryProjectJobStorage
 from .memory_project_storage import MemoryProjectStorage
 from .memory_user_storage import MemoryUserStorage
@@ -9,17 +12,58 @@ from .memory_user_storage import MemoryUserStorage
 
 class MemoryStoragePool(StoragePool):
     """
-    A simple, non-persistent in-memory storage pool.
+    A simple in-memory storage pool.
+
+    The storages can optionally be persisted to disk (see ``MemoryPersistence``); in this case, all changes made through a pool
+    instance are written when it is closed.
     """
 
+    _persistence: MemoryPersistence | None = None
+
+    @staticmethod
+    def prepare(config: Configuration) -> None:
+        from ....settings import MemoryStorageSettingIDs
+
+        path = config.value(MemoryStorageSettingIDs.PERSISTENCE_PATH)
+        if path == "":
+            return
+
+        MemoryStoragePool._persistence = MemoryPersistence(
+            path,
+            [
+                MemoryConnectorStorage(),
+                MemoryUserStorage(),
+                MemoryProjectStorage(),
+                MemoryProjectJobStorage(),
+                MemoryAuthorizationTokenStorage(),
+            ],
+            snapshot_threshold=config.value(MemoryStorageSettingIDs.SNAPSHOT_THRESHOLD),
+            sync=config.value(MemoryStorageSettingIDs.SYNC),
+        )
+        MemoryStoragePool._persistence.restore()
+
     def __init__(self):
         super().__init__("Memory")
 
-        self._connector_storage = MemoryConnectorStorage()
-        self._project_storage = MemoryProjectStorage()
-        self._project_job_storage = MemoryProjectJobStorage()
-        self._user_storage = MemoryUserStorage()
-        self._authorization_token_storage = MemoryAuthorizationTokenStorage()
+        self._tracker = (
+            MemoryChangeTracker()
+            if MemoryStoragePool._persistence is not None
+            else None
+        )
+
+        self._connector_storage = MemoryConnectorStorage(self._tracker)
+        self._project_storage = MemoryProjectStorage(self._tracker)
+        self._project_job_storage = MemoryProjectJobStorage(self._tracker)
+        self._user_storage = MemoryUserStorage(self._tracker)
+        self._authorization_token_storage = MemoryAuthorizationTokenStorage(
+            self._tracker
+        )
+
+    def close(self, save_changes: bool = True) -> None:
+        # Changes are applied to the storages immediately, so they are always persisted to keep the disk and memory in sync
+        if self._tracker is not None:
+            MemoryStoragePool._persistence.commit(self._tracker)
+            self._tracker.clear()
 
     @property
     def connector_storage(self) -> MemoryConnectorStorage:
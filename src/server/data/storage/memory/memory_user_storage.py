@@ -1,27 +1,32 @@
-import threading
 import typing
 
 from common.py.data.entities.user import UserID, User
 from common.py.data.storage import UserStorage
+from common.py.utils import ReadWriteLock
 
+from .memory_storage import MemoryStorage
 
-class MemoryUserStorage(UserStorage):
+
+class MemoryUserStorage(MemoryStorage[User, UserID], UserStorage):
     """
     In-memory storage for users.
     """
 
-    _users: typing.Dict[UserID, User] = {}
-    _lock = threading.RLock()
+    kind = "users"
+    entity_type = User
 
-    def next_id(self) -> UserID:
-        raise NotImplementedError("Users do not support automatic IDs")
+    _users: typing.Dict[UserID, User] = {}
+    _lock = ReadWriteLock()
 
-    def add(self, entity: User) -> None:
-        with MemoryUserStorage._lock:
+    def add(self, entity: User) -> UserID:
+        with MemoryUserStorage._lock.write():
             MemoryUserStorage._users[entity.user_id] = entity
 
+        self._track(entity)
+        return entity.user_id
+
     def remove(self, entity: User) -> None:
-        with MemoryUserStorage._lock:
+        with MemoryUserStorage._lock.write():
             try:
                 del MemoryUserStorage._users[entity.user_id]
             except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -31,14 +36,22 @@ class MemoryUserStorage(UserStorage):
                     f"A user with ID {entity.user_id} was not found"
                 ) from exc
 
+        self._track_removal(entity)
+
     def get(self, key: UserID) -> User | None:
-        with MemoryUserStorage._lock:
-            return (
+        with MemoryUserStorage._lock.read():
+            return self._track(
                 MemoryUserStorage._users[key]
                 if key in MemoryUserStorage._users
                 else None
             )
 
     def list(self) -> typing.List[User]:
-        with MemoryUserStorage._lock:
-            return list(MemoryUserStorage._users.values())
+        with MemoryUserStorage._lock.read():
+            return self._track_all(list(MemoryUserStorage._users.values()))
+
+    def key_from_entity(self, entity: User) -> UserID:
+        return entity.user_id
+
+    def _stored_entities(self) -> typing.List[User]:
+        return list(MemoryUserStorage._users.values())
@@ -0,0 +1,37 @@
+import typing
+
+from common.py.data.storage import StoragePool
+from common.py.utils.config import Configuration
+
+
+def create_storage_pool(config: Configuration) -> StoragePool:
+    """
+    Creates a new storage pool instance using the configured storage driver.
+
+    If caching is enabled, the pool is wrapped in a ``CachingStoragePool``.
+
+    Args:
+        config: The global configuration.
+
+    Returns:
+        The new storage pool.
+
+    Raises:
+        RuntimeError: If the configured storage driver couldn't be found.
+    """
+    from .storage_pools_catalog import StoragePoolsCatalog
+    from ...settings import StorageSettingIDs
+
+    driver = config.value(StorageSettingIDs.DRIVER)
+    storage_type = StoragePoolsCatalog.find_item(driver)
+    if storage_type is None:
+        raise RuntimeError(f"The storage driver {driver} couldn't be found")
+
+    storage_pool = typing.cast(StoragePool, storage_type())
+
+    if config.value(StorageSettingIDs.CACHE):
+        from .caching import CachingStoragePool
+
+        storage_pool = CachingStoragePool(storage_pool)
+
+    return storage_pool
@@ -0,0 +1 @@
+from .event_coalescer import EventCoalescer, EventSender
@@ -0,0 +1,123 @@
+import dataclasses
+import threading
+import time
+import typing
+
+from common.py.core.logging import error
+from common.py.data.storage import StoragePool
+from common.py.utils import UnitID
+from common.py.utils.config import Configuration
+
+EventSender = typing.Callable[[StoragePool], None]
+
+
+class EventCoalescer:
+    """
+    Collapses repeated (list) events sent to the same session.
+
+    Events like the projects or jobs lists are sent in full whenever a single entry changes, which can happen many times per second
+    (e.g., while a job reports its progress). Instead of building and sending each of these events, they are submitted to the coalescer
+    as a *sender* function, keyed by their target and event type: If no such event has been sent within the coalescing window, it is
+    sent right away; otherwise, it replaces any pending event of the same key and is sent once the window has passed.
+
+    Senders are always invoked with a fresh storage pool, so the latest state is sent even if the event has been deferred. Events can also
+    be flushed immediately (e.g., for terminal events like a job completion), replacing any pending event.
+
+    Notes:
+        The coalescer is thread-safe; its state is shared among all instances.
+    """
+
+    EventKey = typing.Tuple[UnitID, str, str]
+
+    @dataclasses.dataclass
+    class _Entry:
+        last_sent: float = 0.0
+
+        pending: EventSender | None = None
+        timer: threading.Timer | None = None
+
+    _entries: typing.Dict[EventKey, _Entry] = {}
+    _lock = threading.RLock()
+
+    def __init__(self, config: Configuration):
+        """
+        Args:
+            config: The global configuration.
+        """
+        from ...settings import EventsSettingIDs
+
+        self._config = config
+        self._window: float = config.value(EventsSettingIDs.COALESCING_WINDOW)
+
+    def submit(
+        self, key: EventKey, sender: EventSender, *, flush: bool = False
+    ) -> None:
+        """
+        Submits an event.
+
+        Args:
+            key: The key of the event, consisting of its target, type name and an optional discriminator (e.g., a project ID).
+            sender: Function that builds and sends the event using a storage pool.
+            flush: Whether to send the event immediately.
+        """
+        with EventCoalescer._lock:
+            entry = EventCoalescer._entries.setdefault(key, EventCoalescer._Entry())
+            delay = entry.last_sent + self._window - time.time()
+
+            if flush or delay <= 0.0:
+                self._cancel_pending(entry)
+                entry.last_sent = time.time()
+            else:
+                entry.pending = sender
+                if entry.timer is None:
+                    entry.timer = threading.Timer(delay, self._flush, args=(key,))
+                    entry.timer.daemon = True
+                    entry.timer.start()
+                return
+
+        self._send(sender)
+
+    def purge(self, target: UnitID) -> None:
+        """
+        Discards all events (including pending ones) of a target.
+
+        Args:
+            target: The target, usually a disconnected session.
+        """
+        with EventCoalescer._lock:
+            for key in [key for key in EventCoalescer._entries if key[0] == target]:
+                self._cancel_pending(EventCoalescer._entries.pop(key))
+
+    def _flush(self, key: EventKey) -> None:
+        with EventCoalescer._lock:
+            if (entry := EventCoalescer._entries.get(key, None)) is None:
+                return
+
+            sender = entry.pending
+            entry.pending = None
+            entry.timer = None
+            entry.last_sent = time.time()
+
+        if sender is not None:
+            self._send(sender)
+
+    def _send(self, sender: EventSender) -> None:
+        from ...data.storage import create_storage_pool
+
+        try:
+            storage_pool = create_storage_pool(self._config)
+            storage_pool.begin()
+            try:
+                sender(storage_pool)
+            finally:
+                storage_pool.close(False)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error(f"Unable to send coalesced event: {str(exc)}", scope="server")
+
+    @staticmethod
+    def _cancel_pending(entry: _Entry) -> None:
+        if entry.timer is not None:
+            entry.timer.cancel()
+
+        entry.pending = None
+        entry.timer = None
@@ -8,6 +8,7 @@ from common.py.utils import UnitID, generate_random_string
 
 SessionID = UnitID
 SessionData = typing.Dict[str, typing.Any]
+SessionChangedCallback = typing.Callable[["Session"], None]
 
 
 class Session:
@@ -15,7 +16,8 @@ class Session:
     Manages the data of a single session.
 
     Notes:
-        Values are accessed and handled like dictionary items.
+        Values are accessed and handled like dictionary items. Whenever the session is modified, an (optional) callback is invoked,
+        allowing session stores to persist the changes.
     """
 
     class Status(Enum):
@@ -26,7 +28,17 @@ class Session:
         DEFAULT = auto()
         AUTHENTICATED = auto()
 
-    def __init__(self, session_id: UnitID):
+    def __init__(
+        self,
+        session_id: UnitID,
+        *,
+        on_changed: SessionChangedCallback | None = None,
+    ):
+        """
+        Args:
+            session_id: The session ID.
+            on_changed: Callback invoked whenever the session has been modified.
+        """
         self._session_id = session_id
 
         self._user_token: UserToken | None = None
@@ -39,6 +51,8 @@ class Session:
         self._data: SessionData = {}
         self._lock = threading.RLock()
 
+        self._on_changed = on_changed
+
     def authenticate(self, user_token: UserToken, user_origin: UnitID) -> bool:
         """
         Assigns a user token to this session.
@@ -53,7 +67,9 @@ class Session:
 
             self._user_token = user_token
             self._user_origin = user_origin
-            return True
+
+        self._changed()
+        return True
 
     def __getitem__(self, key: str) -> typing.Any:
         """
@@ -81,6 +97,8 @@ class Session:
         with self._lock:
             self._data[key] = value
 
+        self._changed()
+
     def __contains__(self, key: str) -> bool:
         """
         Checks if a certain value is stored in this session.
@@ -99,8 +117,12 @@ class Session:
             key: The value name.
         """
         with self._lock:
-            if key in self._data:
-                del self._data[key]
+            if key not in self._data:
+                return
+
+            del self._data[key]
+
+        self._changed()
 
     @property
     def status(self) -> Status:
@@ -144,7 +166,10 @@ class Session:
 
     @broker_token.setter
     def broker_token(self, value: ResourcesBrokerToken | None) -> None:
-        self._broker_token = value
+        with self._lock:
+            self._broker_token = value
+
+        self._changed()
 
     @property
     def fingerprint(self) -> str:
@@ -153,3 +178,77 @@ class Session:
         """
         with self._lock:
             return self._fingerprint
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Converts the session into a dictionary, e.g., to persist it.
+
+        Returns:
+            The session as a dictionary.
+        """
+        with self._lock:
+            return {
+                "session_id": str(self._session_id),
+                "user_token": (
+                    self._user_token.to_dict() if self._user_token else None
+                ),
+                "user_origin": str(self._user_origin) if self._user_origin else None,
+                "broker_token": (
+                    self._broker_token.to_dict() if self._broker_token else None
+                ),
+                "fingerprint": self._fingerprint,
+                "data": self._data,
+            }
+
+    @staticmethod
+    def from_dict(
+        data: typing.Dict[str, typing.Any],
+        *,
+        on_changed: SessionChangedCallback | None = None,
+    ) -> "Session":
+        """
+        Creates a session from a dictionary previously created by ``to_dict``.
+
+        Args:
+            data: The session dictionary.
+            on_changed: Callback invoked whenever the session has been modified.
+
+        Returns:
+            The new session.
+        """
+        session = Session(UnitID.from_string(data["session_id"]), on_changed=on_changed)
+        session.assign(data)
+        return session
+
+    def assign(self, data: typing.Dict[str, typing.Any]) -> None:
+        """
+        Replaces the contents of this session with a dictionary previously created by ``to_dict``.
+
+        The session ID is kept, and the change callback is not invoked.
+
+        Args:
+            data: The session dictionary.
+        """
+        with self._lock:
+            self._user_token = (
+                UserToken.from_dict(user_token)
+                if (user_token := data.get("user_token", None)) is not None
+                else None
+            )
+            self._user_origin = (
+                UnitID.from_string(user_origin)
+                if (user_origin := data.get("user_origin", None)) is not None
+                else None
+            )
+            self._broker_token = (
+                ResourcesBrokerToken.from_dict(broker_token)
+                if (broker_token := data.get("broker_token", None)) is not None
+                else None
+            )
+
+            self._fingerprint = data.get("fingerprint", self._fingerprint)
+            self._data = data.get("data", {})
+
+    def _changed(self) -> None:
+        if self._on_changed is not None:
+            self._on_changed(self)
@@ -2,18 +2,36 @@ import threading
 import typing
 
 from common.py.data.entities.user import UserID
+from common.py.utils.config import Configuration
 
 from .session import SessionID, Session
+from .stores import SessionStore
 
 
 class SessionManager:
     """
-    Manages in-memory sessions.
+    Manages all sessions using the configured session store.
+
+    Notes:
+        The store is shared among all manager instances; it needs to be set up once using ``prepare``.
     """
 
-    _sessions: typing.Dict[SessionID, Session] = {}
+    _store: SessionStore | None = None
     _lock = threading.RLock()
 
+    @staticmethod
+    def prepare(config: Configuration) -> None:
+        """
+        Creates the global session store.
+
+        Args:
+            config: The global configuration.
+        """
+        from .stores import create_session_store
+
+        with SessionManager._lock:
+            SessionManager._store = create_session_store(config)
+
     def __getitem__(self, session_id: SessionID) -> Session:
         """
         Gets the session for the given id; if none exists yet, a new one is created.
@@ -27,10 +45,13 @@ class SessionManager:
         Returns:
             The session object.
         """
-        with SessionManager._lock:
-            if session_id not in SessionManager._sessions:
-                SessionManager._sessions[session_id] = Session(session_id)
-            return SessionManager._sessions[session_id]
+        if (session := self.store.get(session_id)) is None:
+            # Only creating a new session needs to be serialized
+            with SessionManager._lock:
+                if (session := self.store.get(session_id)) is None:
+                    session = self.store.create(session_id)
+
+        return session
 
     def __delitem__(self, session_id: SessionID) -> None:
         """
@@ -39,9 +60,7 @@ class SessionManager:
         Args:
             session_id: The session ID.
         """
-        with SessionManager._lock:
-            if session_id in SessionManager._sessions:
-                del SessionManager._sessions[session_id]
+        self.store.remove(session_id)
 
     def __contains__(self, session_id: SessionID) -> bool:
         """
@@ -50,8 +69,7 @@ class SessionManager:
         Args:
             session_id: The session ID.
         """
-        with SessionManager._lock:
-            return session_id in SessionManager._sessions
+        return self.store.contains(session_id)
 
     def find_user_sessions(self, user_id: UserID) -> typing.List[Session]:
         """
@@ -63,9 +81,26 @@ class SessionManager:
         Returns:
             All associated sessions.
         """
-        with SessionManager._lock:
-            sessions: typing.List[Session] = []
-            for _, session in SessionManager._sessions.items():
-                if session.user_token and session.user_token.user_id == user_id:
-                    sessions.append(session)
-            return sessions
+        return self.store.find_user_sessions(user_id)
+
+    def purge_idle_sessions(self) -> int:
+        """
+        Removes all sessions that haven't been accessed within the configured idle timeout.
+
+        Returns:
+            The number of removed sessions.
+        """
+        return self.store.purge_idle_sessions()
+
+    @property
+    def store(self) -> SessionStore:
+        """
+        The global session store.
+
+        Raises:
+            RuntimeError: If no store has been prepared.
+        """
+        if SessionManager._store is None:
+            raise RuntimeError("No session store has been prepared")
+
+        return SessionManager._store
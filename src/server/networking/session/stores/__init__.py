@@ -0,0 +1,9 @@
+from .session_store import SessionStore
+from .session_stores_catalog import SessionStoresCatalog
+from .session_store_factory import create_session_store
+
+from .memory_session_store import MemorySessionStore
+from .database_session_store import DatabaseSessionStore
+
+SessionStoresCatalog.register_item("memory", MemorySessionStore)
+SessionStoresCatalog.register_item("database", DatabaseSessionStore)
@@ -0,0 +1,315 @@
+import contextlib
+import copy
+import threading
+import time
+import typing
+import weakref
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    Float,
+    Integer,
+    JSON,
+    MetaData,
+    StaticPool,
+    String,
+    Table,
+    delete,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+
+from common.py.data.entities.user import UserID
+from common.py.utils.config import Configuration
+
+from .session_store import SessionStore
+from ..session import Session, SessionID
+
+
+class DatabaseSessionStore(SessionStore):
+    """
+    Keeps all sessions in the configured database, so that they can be shared among multiple server processes.
+
+    Sessions are loaded anew whenever they are accessed; any modification of a session is written back immediately. As sessions are
+    persisted, they (including their assigned broker tokens) also survive restarts of the server.
+
+    The time of the last access is only written back once it is outdated by more than a minute (or a tenth of the idle timeout), so
+    reading sessions doesn't cause a write each time.
+
+    Each stored session carries a version that is increased with every write; a session is only written back if its stored version is
+    still the one it was loaded with. Otherwise, another process has modified the session meanwhile, so both changes are merged (per
+    session attribute and data key) and written again, making sure that no update gets lost.
+
+    If the database storage driver is used, its engine (and thus its connections) is shared with the storage pool.
+    """
+
+    _TOUCH_INTERVAL: float = 60.0
+
+    _engine: Engine | None = None
+    _engine_lock: "threading.RLock | None" = None
+    _table: Table | None = None
+
+    _lock = threading.Lock()
+
+    def __init__(self, config: Configuration):
+        super().__init__("Database", config)
+
+        with DatabaseSessionStore._lock:
+            if DatabaseSessionStore._engine is None:
+                self._create_table(config)
+
+        # The stored version and contents of each session as it was last loaded or saved
+        self._states: weakref.WeakKeyDictionary[
+            Session, typing.Tuple[int, typing.Dict[str, typing.Any]]
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _create_table(config: Configuration) -> None:
+        from ....data.storage.database import DatabaseStoragePool
+        from ....data.storage.database.engines import (
+            add_database_column,
+            create_database_engine,
+            create_database_tables,
+        )
+
+        metadata = MetaData()
+        table = Table(
+            "sessions",
+            metadata,
+            Column("session_id", String(256), primary_key=True),
+            Column("user_id", String(256), index=True),
+            Column("session_data", JSON),
+            Column("last_access", Float, index=True),
+            Column("version", Integer),
+        )
+
+        engine, engine_lock = DatabaseStoragePool.shared_engine()
+        if engine is None:
+            engine = create_database_engine(config)
+            if isinstance(engine.pool, StaticPool):
+                # All sessions share a single connection, so accessing it needs to be serialized
+                engine_lock = threading.RLock()
+
+        create_database_tables(metadata, engine)
+
+        with engine_lock or contextlib.nullcontext():
+            with engine.begin() as conn:
+                # Sessions stored before versioning was introduced start with the first version
+                if add_database_column(conn, table.c.version):
+                    conn.execute(update(table).values(version=1))
+
+        DatabaseSessionStore._engine = engine
+        DatabaseSessionStore._engine_lock = engine_lock
+        DatabaseSessionStore._table = table
+
+    def get(self, session_id: SessionID) -> Session | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                select(
+                    self._table.c.session_data,
+                    self._table.c.version,
+                    self._table.c.last_access,
+                ).where(self._table.c.session_id == str(session_id))
+            ).first()
+
+        if row is None:
+            return None
+
+        if time.time() - (row[2] or 0.0) >= self._touch_interval:
+            with self._connect(begin=True) as conn:
+                conn.execute(
+                    update(self._table)
+                    .where(self._table.c.session_id == str(session_id))
+                    .values(last_access=time.time())
+                )
+
+        return self._load_session(row[0], row[1])
+
+    def create(self, session_id: SessionID) -> Session:
+        session = Session(session_id, on_changed=self._save_session)
+        self._save_session(session)
+
+        if self.max_sessions > 0:
+            self._evict_sessions(self.max_sessions)
+
+        return session
+
+    def remove(self, session_id: SessionID) -> None:
+        with self._connect(begin=True) as conn:
+            conn.execute(
+                delete(self._table).where(self._table.c.session_id == str(session_id))
+            )
+
+    def contains(self, session_id: SessionID) -> bool:
+        with self._connect() as conn:
+            return (
+                conn.execute(
+                    select(self._table.c.session_id).where(
+                        self._table.c.session_id == str(session_id)
+                    )
+                ).first()
+                is not None
+            )
+
+    def find_user_sessions(self, user_id: UserID) -> typing.List[Session]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                select(self._table.c.session_data, self._table.c.version).where(
+                    self._table.c.user_id == user_id
+                )
+            ).all()
+
+        return [self._load_session(row[0], row[1]) for row in rows]
+
+    def purge_idle_sessions(self) -> int:
+        if self.idle_timeout <= 0.0:
+            return 0
+
+        with self._connect(begin=True) as conn:
+            return conn.execute(
+                delete(self._table).where(
+                    self._table.c.last_access < time.time() - self.idle_timeout
+                )
+            ).rowcount
+
+    def _evict_sessions(self, max_sessions: int) -> None:
+        # Remove the least recently used sessions exceeding the limit
+        with self._connect(begin=True) as conn:
+            if (
+                cutoff := conn.execute(
+                    select(self._table.c.last_access)
+                    .order_by(self._table.c.last_access.desc())
+                    .offset(max_sessions)
+                    .limit(1)
+                ).scalar()
+            ) is not None:
+                conn.execute(
+                    delete(self._table).where(self._table.c.last_access <= cutoff)
+                )
+
+    @contextlib.contextmanager
+    def _connect(
+        self, *, begin: bool = False
+    ) -> typing.Generator[Connection, None, None]:
+        with DatabaseSessionStore._engine_lock or contextlib.nullcontext():
+            with (
+                DatabaseSessionStore._engine.begin()
+                if begin
+                else DatabaseSessionStore._engine.connect()
+            ) as conn:
+                yield conn
+
+    @property
+    def _touch_interval(self) -> float:
+        if self.idle_timeout > 0.0:
+            return min(DatabaseSessionStore._TOUCH_INTERVAL, self.idle_timeout / 10)
+
+        return DatabaseSessionStore._TOUCH_INTERVAL
+
+    def _load_session(
+        self, data: typing.Dict[str, typing.Any], version: int
+    ) -> Session:
+        session = Session.from_dict(data, on_changed=self._save_session)
+        self._states[session] = (version, copy.deepcopy(data))
+        return session
+
+    def _save_session(self, session: Session) -> None:
+        session_id = str(session.session_id)
+
+        while True:
+            version, base = self._states.get(session, (0, None))
+            data = copy.deepcopy(session.to_dict())
+
+            if self._write_session(session_id, data, version):
+                self._states[session] = (version + 1, data)
+                return
+
+            # Another process has modified (or removed) the session meanwhile, so its changes need to be merged with ours
+            with self._connect() as conn:
+                row = conn.execute(
+                    select(self._table.c.session_data, self._table.c.version).where(
+                        self._table.c.session_id == session_id
+                    )
+                ).first()
+
+            if row is None:
+                self._states.pop(session, None)
+            else:
+                session.assign(self._merge_session_data(data, base or {}, row[0]))
+                self._states[session] = (row[1], copy.deepcopy(row[0]))
+
+    def _write_session(
+        self, session_id: str, data: typing.Dict[str, typing.Any], version: int
+    ) -> bool:
+        values = {
+            "user_id": (
+                user_token["user_id"]
+                if (user_token := data.get("user_token", None))
+                else None
+            ),
+            "session_data": data,
+            "last_access": time.time(),
+            "version": version + 1,
+        }
+
+        try:
+            with self._connect(begin=True) as conn:
+                # A session that hasn't been stored before (version 0) is inserted; otherwise, the stored version must be unchanged
+                if version == 0:
+                    conn.execute(
+                        insert(self._table).values(session_id=session_id, **values)
+                    )
+                    return True
+
+                return (
+                    conn.execute(
+                        update(self._table)
+                        .where(
+                            self._table.c.session_id == session_id,
+                            self._table.c.version == version,
+                        )
+                        .values(**values)
+                    ).rowcount
+                    > 0
+                )
+        except IntegrityError:
+            # Another process has inserted the session meanwhile
+            return False
+
+    @staticmethod
+    def _merge_session_data(
+        ours: typing.Dict[str, typing.Any],
+        base: typing.Dict[str, typing.Any],
+        theirs: typing.Dict[str, typing.Any],
+    ) -> typing.Dict[str, typing.Any]:
+        # Everything we have changed compared to the base wins, anything else is taken from the stored session
+        def _merge(
+            ours: typing.Dict[str, typing.Any],
+            base: typing.Dict[str, typing.Any],
+            theirs: typing.Dict[str, typing.Any],
+        ) -> typing.Dict[str, typing.Any]:
+            merged = copy.deepcopy(theirs)
+            for key in ours.keys() | base.keys():
+                if key not in ours:
+                    merged.pop(key, None)
+                elif key not in base or ours[key] != base[key]:
+                    merged[key] = ours[key]
+            return merged
+
+        merged = _merge(
+            {key: value for key, value in ours.items() if key != "data"},
+            {key: value for key, value in base.items() if key != "data"},
+            theirs,
+        )
+        merged["data"] = _merge(
+            ours.get("data", {}), base.get("data", {}), theirs.get("data", None) or {}
+        )
+        return merged
+
+    @property
+    def is_shared(self) -> bool:
+        return True
@@ -0,0 +1,107 @@
+import collections
+import threading
+import time
+import typing
+
+from common.py.data.entities.user import UserID
+from common.py.utils.config import Configuration
+
+from .session_store import SessionStore
+from ..session import Session, SessionID
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Keeps all sessions in memory; they are only available to the current process.
+
+    Sessions are kept in least-recently-used order, so idle sessions can be evicted without scanning all of them, and the number of sessions
+    can be bounded by evicting the least recently used ones. An additional index maps user IDs to their sessions.
+    """
+
+    def __init__(self, config: Configuration):
+        super().__init__("Memory", config)
+
+        self._sessions: collections.OrderedDict[
+            SessionID, typing.Tuple[Session, float]
+        ] = collections.OrderedDict()
+        self._user_sessions: typing.Dict[UserID, typing.Set[SessionID]] = {}
+        self._session_users: typing.Dict[SessionID, UserID] = {}
+
+        self._lock = threading.RLock()
+
+    def get(self, session_id: SessionID) -> Session | None:
+        with self._lock:
+            if (entry := self._sessions.get(session_id, None)) is None:
+                return None
+
+            # Accessing a session marks it as the most recently used one
+            self._sessions[session_id] = (entry[0], time.time())
+            self._sessions.move_to_end(session_id)
+            return entry[0]
+
+    def create(self, session_id: SessionID) -> Session:
+        with self._lock:
+            self.remove(session_id)
+
+            session = Session(session_id, on_changed=self._update_user_index)
+            self._sessions[session_id] = (session, time.time())
+
+            if self.max_sessions > 0:
+                while len(self._sessions) > self.max_sessions:
+                    self.remove(next(iter(self._sessions)))
+
+            return session
+
+    def remove(self, session_id: SessionID) -> None:
+        with self._lock:
+            if self._sessions.pop(session_id, None) is not None:
+                self._unindex_user(session_id)
+
+    def contains(self, session_id: SessionID) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def find_user_sessions(self, user_id: UserID) -> typing.List[Session]:
+        with self._lock:
+            return [
+                self._sessions[session_id][0]
+                for session_id in self._user_sessions.get(user_id, ())
+            ]
+
+    def purge_idle_sessions(self) -> int:
+        if self.idle_timeout <= 0.0:
+            return 0
+
+        purged = 0
+        deadline = time.time() - self.idle_timeout
+
+        with self._lock:
+            while self._sessions:
+                session_id, (_, last_access) = next(iter(self._sessions.items()))
+                if last_access >= deadline:
+                    break
+
+                self.remove(session_id)
+                purged += 1
+
+        return purged
+
+    def _update_user_index(self, session: Session) -> None:
+        with self._lock:
+            entry = self._sessions.get(session.session_id, None)
+            if entry is None or entry[0] is not session:
+                return  # The session has been removed or replaced in the meantime
+
+            self._unindex_user(session.session_id)
+
+            if session.user_token is not None and session.user_token.user_id != "":
+                user_id = session.user_token.user_id
+                self._user_sessions.setdefault(user_id, set()).add(session.session_id)
+                self._session_users[session.session_id] = user_id
+
+    def _unindex_user(self, session_id: SessionID) -> None:
+        if (user_id := self._session_users.pop(session_id, None)) is not None:
+            sessions = self._user_sessions[user_id]
+            sessions.discard(session_id)
+            if not sessions:
+                del self._user_sessions[user_id]
@@ -0,0 +1,128 @@
+import abc
+import typing
+
+from common.py.data.entities.user import UserID
+from common.py.utils.config import Configuration
+
+from ..session import Session, SessionID
+
+
+class SessionStore(abc.ABC):
+    """
+    Base class for all session stores.
+
+    A session store keeps the sessions of all connected clients; stores that are shared among multiple server processes allow the
+    server to be scaled out. Sessions that haven't been accessed for a configurable time are evicted by ``purge_idle_sessions``, and
+    the number of sessions kept can be limited (evicting the least recently used ones).
+    """
+
+    def __init__(self, name: str, config: Configuration):
+        """
+        Args:
+            name: The name of the store.
+            config: The global configuration.
+        """
+        self._name = name
+        self._config = config
+
+        from ....settings import SessionSettingIDs
+
+        self._idle_timeout: float = config.value(SessionSettingIDs.IDLE_TIMEOUT)
+        self._max_sessions: int = config.value(SessionSettingIDs.MAX_SESSIONS)
+
+    @abc.abstractmethod
+    def get(self, session_id: SessionID) -> Session | None:
+        """
+        Gets the session with the given ID.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The session, if any.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def create(self, session_id: SessionID) -> Session:
+        """
+        Creates a new session, replacing any existing one.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The new session.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def remove(self, session_id: SessionID) -> None:
+        """
+        Removes a session.
+
+        Args:
+            session_id: The session ID.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def contains(self, session_id: SessionID) -> bool:
+        """
+        Checks whether a session with the given ID exists.
+
+        Args:
+            session_id: The session ID.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_user_sessions(self, user_id: UserID) -> typing.List[Session]:
+        """
+        Finds all sessions associated with the user ID.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            All associated sessions.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def purge_idle_sessions(self) -> int:
+        """
+        Removes all sessions that haven't been accessed within the idle timeout.
+
+        Returns:
+            The number of removed sessions.
+        """
+        raise NotImplementedError()
+
+    @property
+    def name(self) -> str:
+        """
+        The name of this store.
+        """
+        return self._name
+
+    @property
+    def idle_timeout(self) -> float:
+        """
+        The time (in seconds) after which idle sessions are removed; 0 if sessions are never removed.
+        """
+        return self._idle_timeout
+
+    @property
+    def max_sessions(self) -> int:
+        """
+        The maximum number of sessions kept; 0 if unlimited.
+        """
+        return self._max_sessions
+
+    @property
+    def is_shared(self) -> bool:
+        """
+        Whether the store is shared among multiple server processes.
+        """
+        return False
@@ -0,0 +1,29 @@
+import typing
+
+from common.py.utils.config import Configuration
+
+from .session_store import SessionStore
+
+
+def create_session_store(config: Configuration) -> SessionStore:
+    """
+    Creates a new session store instance using the configured driver.
+
+    Args:
+        config: The global configuration.
+
+    Returns:
+        The new session store.
+
+    Raises:
+        RuntimeError: If the configured session store driver couldn't be found.
+    """
+    from .session_stores_catalog import SessionStoresCatalog
+    from ....settings import SessionSettingIDs
+
+    driver = config.value(SessionSettingIDs.DRIVER)
+    store_type = SessionStoresCatalog.find_item(driver)
+    if store_type is None:
+        raise RuntimeError(f"The session store driver {driver} couldn't be found")
+
+    return typing.cast(SessionStore, store_type(config))
@@ -0,0 +1,12 @@
+from common.py.utils import ItemsCatalog
+
+from .session_store import SessionStore
+
+
+@ItemsCatalog.define()
+class SessionStoresCatalog(ItemsCatalog[type[SessionStore]]):
+    """
+    Global catalog of all registered session store types.
+
+    This is a globally accessible list of all session store types, associated with their respective names.
+    """
@@ -1,10 +1,11 @@
 import time
+import typing
 
 from common.py.core import logging
+from common.py.core.messaging.executors import HandlerLane
 from common.py.data.entities.authorization import (
     AuthorizationToken,
     get_host_authorization_token_id,
-    has_authorization_token_expired,
 )
 from common.py.data.verifiers.authorization import AuthorizationTokenVerifier
 from common.py.integration.authorization.strategies import (
@@ -12,12 +13,13 @@ from common.py.integration.authorization.strategies import (
     create_authorization_strategy,
 )
 from common.py.services import Service
-from common.py.utils import EntryGuard
 
 from .tools import handle_authorization_token_changes
 from ..component import ServerComponent
 from ..settings import AuthorizationSettingIDs
 
+_REFRESH_INTERVAL = 5.0
+
 
 def create_authorization_service(comp: ServerComponent) -> Service:
     """
@@ -38,7 +40,6 @@ def create_authorization_service(comp: ServerComponent) -> Service:
         GetAuthorizationTokenCommand,
         GetAuthorizationTokenReply,
     )
-    from common.py.api.component import ComponentProcessEvent
 
     from .server_service_context import ServerServiceContext
 
@@ -162,7 +163,7 @@ def create_authorization_service(comp: ServerComponent) -> Service:
         # Suppress warnings about this message not being handled
         pass
 
-    @svc.message_handler(GetAuthorizationTokenCommand)
+    @svc.message_handler(GetAuthorizationTokenCommand, lane=HandlerLane.CONTROL)
     def get_authorization_token(
         msg: GetAuthorizationTokenCommand, ctx: ServerServiceContext
     ) -> None:
@@ -184,53 +185,55 @@ def create_authorization_service(comp: ServerComponent) -> Service:
             ),
         ).emit()
 
-    @svc.message_handler(ComponentProcessEvent)
-    def refresh_expired_tokens(
-        msg: ComponentProcessEvent, ctx: ServerServiceContext
-    ) -> None:
-        with EntryGuard("refresh_expired_tokens") as guard:
-            if not guard.can_execute:
-                return
-
-            def _attempt_refresh(token: AuthorizationToken) -> bool:
-                return (
-                    token.refresh_attempts == 0
-                    or token.timestamp + refresh_attempts_delay <= time.time()
-                )
-
-            for auth_token in ctx.storage_pool.authorization_token_storage.list():
-                if has_authorization_token_expired(auth_token) and _attempt_refresh(
-                    auth_token
-                ):
-                    try:
-                        AuthorizationTokenVerifier(auth_token).verify_update()
-
-                        strategy = _create_auth_strategy(
-                            ctx, auth_token.strategy, auth_token=auth_token
-                        )
-                        strategy.refresh_authorization(auth_token)
+    @svc.periodic_job(_REFRESH_INTERVAL, jitter=_REFRESH_INTERVAL / 5)
+    def refresh_expired_tokens(ctx: ServerServiceContext) -> None:
+        def _attempt_refresh(token: AuthorizationToken) -> bool:
+            return (
+                token.refresh_attempts == 0
+                or token.timestamp + refresh_attempts_delay <= time.time()
+            )
 
-                        logging.debug(
-                            "Refreshed authorization token",
+        expired_tokens = (
+            ctx.storage_pool.authorization_token_storage.filter_by_expiration(
+                time.time()
+            )
+        )
+        removed_tokens: typing.List[AuthorizationToken] = []
+
+        for auth_token in expired_tokens:
+            if _attempt_refresh(auth_token):
+                try:
+                    AuthorizationTokenVerifier(auth_token).verify_update()
+
+                    strategy = _create_auth_strategy(
+                        ctx, auth_token.strategy, auth_token=auth_token
+                    )
+                    strategy.refresh_authorization(auth_token)
+
+                    logging.debug(
+                        "Refreshed authorization token",
+                        scope="authorization",
+                        user_id=auth_token.user_id,
+                        auth_id=auth_token.auth_id,
+                        strategy=auth_token.strategy,
+                    )
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    if 0 < refresh_attempts_limit <= auth_token.refresh_attempts:
+                        logging.warning(
+                            "Unable to refresh authorization token - removing token",
                             scope="authorization",
                             user_id=auth_token.user_id,
                             auth_id=auth_token.auth_id,
                             strategy=auth_token.strategy,
+                            error=str(exc),
                         )
-                    except Exception as exc:  # pylint: disable=broad-exception-caught
-                        if 0 < refresh_attempts_limit <= auth_token.refresh_attempts:
-                            logging.warning(
-                                "Unable to refresh authorization token - removing token",
-                                scope="authorization",
-                                user_id=auth_token.user_id,
-                                auth_id=auth_token.auth_id,
-                                strategy=auth_token.strategy,
-                                error=str(exc),
-                            )
-
-                            ctx.storage_pool.authorization_token_storage.remove(
-                                auth_token
-                            )
-                            handle_authorization_token_changes(auth_token, msg, ctx)
+
+                        removed_tokens.append(auth_token)
+
+        if removed_tokens:
+            ctx.storage_pool.authorization_token_storage.remove_many(removed_tokens)
+
+            for auth_token in removed_tokens:
+                handle_authorization_token_changes(auth_token, None, ctx)
 
     return svc
@@ -4,13 +4,13 @@ from common.py.core.logging import info, debug, warning
 from common.py.data.entities.connector import Connector
 from common.py.data.verifiers.connector import ConnectorVerifier
 from common.py.services import Service
-from common.py.utils import EntryGuard
 
 from ..component import ServerComponent
 
 _MAX_CONNECTOR_AGE = (
     2.5 * 3600
 )  # If no connector announce has been received within the last 2.5 hours, it will be purged
+_PURGE_INTERVAL = 60.0
 
 
 def create_connectors_service(comp: ServerComponent) -> Service:
@@ -24,7 +24,6 @@ def create_connectors_service(comp: ServerComponent) -> Service:
         The newly created service.
     """
 
-    from common.py.api.component import ComponentProcessEvent
     from common.py.api.connector import (
         ConnectorAnnounceEvent,
         ListConnectorsCommand,
@@ -93,25 +92,24 @@ def create_connectors_service(comp: ServerComponent) -> Service:
                 error=str(exc),
             )
 
-    @svc.message_handler(ComponentProcessEvent)
-    def purge_obsolete_connectors(
-        msg: ComponentProcessEvent, ctx: ServerServiceContext
-    ) -> None:
-        with EntryGuard("purge_obsolete_connectors") as guard:
-            if not guard.can_execute:
-                return
-
-            connectors = ctx.storage_pool.connector_storage.list()
-
-            for connector in connectors:
-                if msg.timestamp - connector.announce_timestamp >= _MAX_CONNECTOR_AGE:
-                    ctx.storage_pool.connector_storage.remove(connector)
-                    warning(
-                        "Connector removed due to obsolescence",
-                        scope="connectors",
-                        id=connector.connector_id,
-                        name=connector.name,
-                    )
+    @svc.periodic_job(_PURGE_INTERVAL, jitter=_PURGE_INTERVAL / 10)
+    def purge_obsolete_connectors(ctx: ServerServiceContext) -> None:
+        obsolete_connectors = [
+            connector
+            for connector in ctx.storage_pool.connector_storage.list()
+            if time.time() - connector.announce_timestamp >= _MAX_CONNECTOR_AGE
+        ]
+
+        if obsolete_connectors:
+            ctx.storage_pool.connector_storage.remove_many(obsolete_connectors)
+
+            for connector in obsolete_connectors:
+                warning(
+                    "Connector removed due to obsolescence",
+                    scope="connectors",
+                    id=connector.connector_id,
+                    name=connector.name,
+                )
 
     @svc.message_handler(ListConnectorsCommand)
     def list_connectors(msg: ListConnectorsCommand, ctx: ServerServiceContext) -> None:
@@ -1,5 +1,6 @@
 import typing
 
+from common.py.core.messaging.executors import HandlerLane
 from common.py.data.exporters import ProjectExporterDescriptor
 from common.py.services import Service
 
@@ -24,6 +25,8 @@ def create_project_exporters_service(comp: ServerComponent) -> Service:
         ExportProjectReply,
     )
 
+    from common.py.core.messaging import PayloadStream
+
     from .server_service_context import ServerServiceContext
 
     svc = comp.create_service(
@@ -42,7 +45,7 @@ def create_project_exporters_service(comp: ServerComponent) -> Service:
             ctx.message_builder, msg, exporters=exporters
         ).emit()
 
-    @svc.message_handler(ExportProjectCommand)
+    @svc.message_handler(ExportProjectCommand, lane=HandlerLane.BULK)
     def export_project(msg: ExportProjectCommand, ctx: ServerServiceContext) -> None:
         if not ctx.ensure_user(msg, ExportProjectReply, mimetype="", data=bytes()):
             return
@@ -50,7 +53,7 @@ def create_project_exporters_service(comp: ServerComponent) -> Service:
         def _reply(
             *,
             mimetype: str = "",
-            data: bytes = bytes(),
+            data: bytes | PayloadStream = bytes(),
             success: bool = True,
             message: msg = "",
         ) -> None:
@@ -79,7 +82,8 @@ def create_project_exporters_service(comp: ServerComponent) -> Service:
 
         try:
             result = exporter.export(project, msg.scope)
-            _reply(mimetype=result.mimetype, data=result.data)
+            # Exports can get large, so stream them to the client
+            _reply(mimetype=result.mimetype, data=PayloadStream(result.data))
         except Exception as exc:  # pylint: disable=broad-exception-caught
             _reply(success=False, message=str(exc))
 
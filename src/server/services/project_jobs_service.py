@@ -1,3 +1,5 @@
+import time
+
 from common.py.core.logging import debug, error
 from common.py.core.messaging import Channel
 from common.py.data.entities.project import Project, ProjectJob
@@ -11,6 +13,7 @@ from .tools import (
     send_project_jobs_list,
     handle_project_job_message,
     send_project_logbook,
+    send_projects_list,
 )
 from ..component import ServerComponent
 from ..data.verifiers.project import ProjectJobVerifier
@@ -58,6 +61,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
                     message=f"Job start failed: {message}",
                 ),
             )
+            project.update_time = time.time()
 
         ctx.storage_pool.project_job_storage.remove(job)
 
@@ -96,7 +100,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
                 ctx.message_builder, msg, success=success, message=message
             ).emit()
 
-            send_project_jobs_list(msg, ctx)
+            send_project_jobs_list(msg, ctx, flush=True)
 
         from common.py.data.entities.connector import find_connector_by_instance_id
         from common.py.data.entities.project import find_project_by_id
@@ -208,7 +212,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
 
         def notify_job(job: ProjectJob, session: Session) -> None:
             if project is not None:
-                send_project_logbook(msg, ctx, project, session=session)
+                send_project_logbook(msg, ctx, project, session=session, flush=True)
 
         handle_project_job_message(
             (msg.project_id, msg.connector_instance),
@@ -216,6 +220,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
             ctx,
             update_callback=update_job,
             notify_callback=notify_job,
+            flush=True,
         )
 
     @svc.message_handler(ProjectJobProgressEvent)
@@ -251,6 +256,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
                         ext_data=msg.ext_data if msg.ext_data is not None else {},
                     ),
                 )
+                project.update_time = time.time()
 
             ctx.storage_pool.project_job_storage.remove(job)
 
@@ -276,9 +282,10 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
                 chain=msg,
             ).emit(Channel.direct(session.user_origin))
 
-            # Send the updated project logbook to the client
+            # Send the updated project logbook to the client; the job counts of the project summary have changed as well
             if project is not None:
-                send_project_logbook(msg, ctx, project, session=session)
+                send_project_logbook(msg, ctx, project, session=session, flush=True)
+                send_projects_list(msg, ctx, session=session)
 
         handle_project_job_message(
             (msg.project_id, msg.connector_instance),
@@ -286,6 +293,7 @@ def create_project_jobs_service(comp: ServerComponent) -> Service:
             ctx,
             update_callback=update_job,
             notify_callback=notify_job,
+            flush=True,
         )
 
     return svc
@@ -20,6 +20,8 @@ def create_projects_service(comp: ServerComponent) -> Service:
     from common.py.api.project import (
         ListProjectsCommand,
         ListProjectsReply,
+        GetProjectDetailsCommand,
+        GetProjectDetailsReply,
         CreateProjectCommand,
         CreateProjectReply,
         UpdateProjectCommand,
@@ -33,6 +35,7 @@ def create_projects_service(comp: ServerComponent) -> Service:
     )
     from common.py.data.entities import clone_entity
     from common.py.data.entities.project import Project
+    from common.py.data.storage import StorageCondition
     from common.py.data.verifiers.project import (
         ProjectVerifier,
         ProjectFeaturesVerifier,
@@ -50,7 +53,36 @@ def create_projects_service(comp: ServerComponent) -> Service:
         ListProjectsReply.build(
             ctx.message_builder,
             msg,
-            projects=ctx.storage_pool.project_storage.filter_by_user(ctx.user.user_id),
+            projects=ctx.storage_pool.project_storage.filter_summaries_by_user(
+                ctx.user.user_id
+            ),
+        ).emit()
+
+    @svc.message_handler(GetProjectDetailsCommand)
+    def get_project_details(
+        msg: GetProjectDetailsCommand, ctx: ServerServiceContext
+    ) -> None:
+        if not ctx.ensure_user(msg, GetProjectDetailsReply, project_id=0):
+            return
+
+        if (
+            project := ctx.storage_pool.project_storage.get(msg.project_id)
+        ) is None or project.user_id != ctx.user.user_id:
+            GetProjectDetailsReply.build(
+                ctx.message_builder,
+                msg,
+                project_id=msg.project_id,
+                success=False,
+                message=f"A project with ID {msg.project_id} was not found",
+            ).emit()
+            return
+
+        GetProjectDetailsReply.build(
+            ctx.message_builder,
+            msg,
+            project_id=msg.project_id,
+            features=project.features,
+            logbook=project.logbook,
         ).emit()
 
     @svc.message_handler(CreateProjectCommand)
@@ -62,7 +94,7 @@ def create_projects_service(comp: ServerComponent) -> Service:
         message = ""
 
         project = Project(
-            project_id=ctx.storage_pool.project_storage.next_id(),
+            project_id=0,
             user_id=ctx.user.user_id,
             creation_time=time.time(),
             resources_path=msg.resources_path,
@@ -113,6 +145,7 @@ def create_projects_service(comp: ServerComponent) -> Service:
                 ProjectVerifier(project_upd, ctx.user).verify_update()
 
                 _apply_update(project)
+                project.update_time = time.time()
                 success = True
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 message = str(exc)
@@ -157,6 +190,7 @@ def create_projects_service(comp: ServerComponent) -> Service:
                 apply_project_features_update(
                     project, msg.features, msg.updated_features
                 )
+                project.update_time = time.time()
                 success = True
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 message = str(exc)
@@ -249,10 +283,13 @@ def create_projects_service(comp: ServerComponent) -> Service:
             try:
                 ProjectVerifier(project, ctx.user).verify_delete()
 
-                for job in ctx.storage_pool.project_job_storage.filter_by_project(
-                    project.project_id
-                ):
-                    ctx.storage_pool.project_job_storage.remove(job)
+                ctx.storage_pool.project_job_storage.remove_where(
+                    StorageCondition(
+                        "project_id",
+                        StorageCondition.Operator.EQUAL,
+                        project.project_id,
+                    )
+                )
 
                 ctx.storage_pool.project_storage.remove(project)
 
@@ -1,5 +1,6 @@
 import pathlib
 
+from common.py.core.messaging.executors import HandlerLane
 from common.py.data.entities.authorization import (
     get_host_authorization_token_id,
 )
@@ -12,7 +13,7 @@ from common.py.integration.resources.brokers import (
     create_resources_broker,
     ResourcesBroker,
 )
-from common.py.integration.resources.brokers.tunnels import MemoryBrokerTunnel
+from common.py.integration.resources.brokers.tunnels import SpooledBrokerTunnel
 from common.py.services import Service
 
 from ..component import ServerComponent
@@ -88,7 +89,7 @@ def create_resources_service(comp: ServerComponent) -> Service:
             ctx.message_builder, msg, success=success, message=message
         ).emit()
 
-    @svc.message_handler(ListResourcesCommand)
+    @svc.message_handler(ListResourcesCommand, lane=HandlerLane.BULK)
     def list_resources(msg: ListResourcesCommand, ctx: ServerServiceContext) -> None:
         if not ctx.ensure_user(
             msg, ListResourcesReply, resources=ResourcesList(resource=msg.root)
@@ -127,35 +128,48 @@ def create_resources_service(comp: ServerComponent) -> Service:
             message=message,
         ).emit()
 
-    @svc.message_handler(GetResourceCommand)
+    @svc.message_handler(GetResourceCommand, lane=HandlerLane.BULK)
     def get_resource(msg: GetResourceCommand, ctx: ServerServiceContext) -> None:
         if not ctx.ensure_user(
             msg, GetResourceReply, resource=msg.resource, size=0, mime_type="", data=""
         ):
             return
 
-        data: bytes | None = None
+        from common.py.core.messaging import PayloadStream
+        from common.py.settings import NetworkSettingIDs
+
+        data: PayloadStream | None = None
         success = False
         message = ""
 
+        # Larger resources are spooled to disk and streamed to the client in chunks, keeping memory usage bounded
+        tunnel = SpooledBrokerTunnel(
+            msg.resource,
+            max_memory_size=comp.data.config.value(
+                NetworkSettingIDs.TRANSMISSION_CHUNK_SIZE
+            ),
+        )
+
         try:
-            # For resource requests, we always use a simple memory broker tunnel
-            tunnel = MemoryBrokerTunnel(msg.resource)
             broker = _create_broker(ctx)
             broker.download_resource(msg.resource, tunnel=tunnel)
-            data = tunnel.readall()
+            data = PayloadStream(tunnel, size=tunnel.size)
 
             success = True
         except Exception as exc:  # pylint: disable=broad-exception-caught
             message = str(exc)
 
-        GetResourceReply.build(
-            ctx.message_builder,
-            msg,
-            resource=msg.resource,
-            data=data,
-            success=success,
-            message=message,
-        ).emit()
+        try:
+            GetResourceReply.build(
+                ctx.message_builder,
+                msg,
+                resource=msg.resource,
+                data=data,
+                success=success,
+                message=message,
+            ).emit()
+        finally:
+            # The data has either been streamed or handed to local receivers in memory by now
+            tunnel.close()
 
     return svc
@@ -1,7 +1,7 @@
 import typing
 
 from common.py.core.logging import LoggerProtocol, error
-from common.py.core.messaging import Command, CommandReplyType
+from common.py.core.messaging import Command, CommandReplyType, EventType
 from common.py.core.messaging.composers import MessageBuilder
 from common.py.core.messaging.meta import MessageMetaInformation
 from common.py.data.entities.user import User
@@ -10,12 +10,16 @@ from common.py.services import ServiceContext
 from common.py.utils import UnitID
 from common.py.utils.config import Configuration
 
+from ..networking.events import EventCoalescer, EventSender
 from ..networking.session import SessionManager, Session
 
 
 class ServerServiceContext(ServiceContext):
     """
     Service context specific to the server.
+
+    The storage pool is only created (and begun) once it is accessed for the first time; handlers that never touch any storage don't
+    pay for it, and only pools that have actually been used are closed again.
     """
 
     def __init__(
@@ -32,36 +36,65 @@ class ServerServiceContext(ServiceContext):
         )
 
         self._session_manager = SessionManager()
-        self._storage_pool = self._create_storage_pool()
+        self._session: Session | None = None
+        self._storage_pool: StoragePool | None = None
 
-    def _create_storage_pool(self) -> StoragePool:
-        from ..settings import StorageSettingIDs
+        self._event_coalescer = EventCoalescer(config)
+        self._coalesced_events: typing.List[
+            typing.Tuple[EventCoalescer.EventKey, EventSender, bool]
+        ] = []
 
-        driver = self.config.value(StorageSettingIDs.DRIVER)
+    def _create_storage_pool(self) -> StoragePool:
         try:
-            from ..data.storage import StoragePoolsCatalog
+            from ..data.storage import create_storage_pool
 
-            storage_type = StoragePoolsCatalog.find_item(driver)
-            if storage_type is None:
-                raise RuntimeError(f"The storage driver {driver} couldn't be found")
-
-            return typing.cast(StoragePool, storage_type())
+            return create_storage_pool(self.config)
         except Exception as exc:  # pylint: disable=broad-exception-caught
+            from ..settings import StorageSettingIDs
+
             error(
                 f"Unable to create storage: {str(exc)}",
-                driver=driver,
+                driver=self.config.value(StorageSettingIDs.DRIVER),
             )
 
             raise exc
 
-    def __enter__(self) -> typing.Self:
-        self._storage_pool.begin()
-        return super().__enter__()
-
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        self._storage_pool.close(exc_type is None)
+        if self._storage_pool is not None:
+            self._storage_pool.close(exc_type is None)
+
+        # Coalesced events are submitted only after all changes have been committed
+        for key, sender, flush in self._coalesced_events:
+            self._event_coalescer.submit(key, sender, flush=flush)
+        self._coalesced_events = []
+
         return super().__exit__(exc_type, exc_val, exc_tb)
 
+    def coalesce_event(
+        self,
+        target: UnitID,
+        event_type: type[EventType],
+        sender: EventSender,
+        *,
+        discriminator: str = "",
+        flush: bool = False,
+    ) -> None:
+        """
+        Sends an event through the global event coalescer once the current message has been handled.
+
+        Repeated events of the same type (and discriminator) for the same target are collapsed, always sending the latest state.
+
+        Args:
+            target: The target of the event.
+            event_type: The event type.
+            sender: Function that builds and sends the event using a storage pool.
+            discriminator: Distinguishes events of the same type (e.g., by a project ID).
+            flush: Whether to send the event immediately, replacing any pending one.
+        """
+        self._coalesced_events.append(
+            ((target, event_type.message_name(), discriminator), sender, flush)
+        )
+
     def ensure_user(
         self,
         msg: Command,
@@ -109,9 +142,12 @@ class ServerServiceContext(ServiceContext):
     @property
     def session(self) -> Session:
         """
-        The session for this context.
+        The session for this context; it is loaded on first access.
         """
-        return self._session_manager[self.origin]
+        if self._session is None:
+            self._session = self._session_manager[self.origin]
+
+        return self._session
 
     @property
     def session_manager(self) -> SessionManager:
@@ -120,9 +156,21 @@ class ServerServiceContext(ServiceContext):
         """
         return self._session_manager
 
+    @property
+    def event_coalescer(self) -> EventCoalescer:
+        """
+        The global event coalescer.
+        """
+        return self._event_coalescer
+
     @property
     def storage_pool(self) -> StoragePool:
         """
-        The global storage pool.
+        The global storage pool; it is created on first access.
         """
+        if self._storage_pool is None:
+            storage_pool = self._create_storage_pool()
+            storage_pool.begin()
+            self._storage_pool = storage_pool
+
         return self._storage_pool
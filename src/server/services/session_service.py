@@ -5,11 +5,14 @@ from common.py.api.session import (
     SetSessionValueCommand,
     SetSessionValueReply,
 )
+from common.py.core.messaging.executors import HandlerLane
 from common.py.services import Service
 
 from .server_service_context import ServerServiceContext
 from ..component import ServerComponent
 
+_PURGE_INTERVAL = 60.0
+
 
 def create_session_service(comp: ServerComponent) -> Service:
     """
@@ -22,7 +25,9 @@ def create_session_service(comp: ServerComponent) -> Service:
         The newly created service.
     """
 
-    svc = comp.create_service("Session service", context_type=ServerServiceContext)
+    svc = comp.create_service(
+        "Session service", context_type=ServerServiceContext, lane=HandlerLane.CONTROL
+    )
 
     @svc.message_handler(ServerTimeoutEvent)
     def server_timeout(msg: ServerTimeoutEvent, ctx: ServerServiceContext) -> None:
@@ -32,6 +37,12 @@ def create_session_service(comp: ServerComponent) -> Service:
 
         # A timeout automatically deletes the session for that client
         del ctx.session_manager[msg.comp_id]
+        ctx.event_coalescer.purge(msg.comp_id)
+
+    @svc.periodic_job(_PURGE_INTERVAL, jitter=_PURGE_INTERVAL / 10)
+    def purge_idle_sessions(ctx: ServerServiceContext) -> None:
+        if (purged := ctx.session_manager.purge_idle_sessions()) > 0:
+            ctx.logger.debug("Removed idle sessions", scope="session", sessions=purged)
 
     @svc.message_handler(GetSessionValueCommand)
     def get_session_value(
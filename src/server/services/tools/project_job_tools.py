@@ -2,6 +2,7 @@ import typing
 
 from common.py.core.messaging import Message, Channel
 from common.py.data.entities.project import ProjectJobID, ProjectJob
+from common.py.data.storage import StoragePool
 
 from .. import ServerServiceContext
 from ...networking.session import Session
@@ -15,29 +16,39 @@ def send_project_jobs_list(
     ctx: ServerServiceContext,
     *,
     session: Session | None = None,
+    flush: bool = False,
 ) -> None:
     """
     Sends the project job list to the currently authenticated user.
 
+    The list is sent through the event coalescer, so repeated lists sent within a short time (e.g., due to progress updates) are collapsed.
+
     Args:
         msg: Original message for chaining.
         ctx: The service context.
         session: Override the user ID and target to use using a user's session.
+        flush: Whether to send the list immediately.
     """
     from common.py.api.project import ProjectJobsListEvent
 
     if ctx.user is None and (session or session.user_token) is None:
         raise RuntimeError("Sending project jobs list without an authenticated user")
 
-    ProjectJobsListEvent.build(
-        ctx.message_builder,
-        jobs=ctx.storage_pool.project_job_storage.filter_by_user(
-            session.user_token.user_id
-            if session and session.user_token
-            else ctx.user.user_id
-        ),
-        chain=msg,
-    ).emit(Channel.direct(session.user_origin if session else msg.origin))
+    user_id = (
+        session.user_token.user_id
+        if session and session.user_token
+        else ctx.user.user_id
+    )
+    target = session.user_origin if session else msg.origin
+
+    def _send(storage_pool: StoragePool) -> None:
+        ProjectJobsListEvent.build(
+            ctx.message_builder,
+            jobs=storage_pool.project_job_storage.filter_by_user(user_id),
+            chain=msg,
+        ).emit(Channel.direct(target))
+
+    ctx.coalesce_event(target, ProjectJobsListEvent, _send, flush=flush)
 
 
 def handle_project_job_message(
@@ -47,6 +58,7 @@ def handle_project_job_message(
     *,
     update_callback: ModifyProjectJobCallback | None = None,
     notify_callback: NotifyProjectJobCallback | None = None,
+    flush: bool = False,
 ) -> None:
     """
     Modifies a project job via a callback and sends the updated jobs list to the user.
@@ -57,6 +69,7 @@ def handle_project_job_message(
         notify_callback: Callback function to notify users about the updated job (called per user session).
         msg: Original message.
         ctx: The service context.
+        flush: Whether to send the updated jobs list immediately (e.g., for terminal job states).
     """
     if (job := ctx.storage_pool.project_job_storage.get(job_id)) is not None:
         if update_callback is not None:
@@ -66,4 +79,4 @@ def handle_project_job_message(
             if notify_callback is not None:
                 notify_callback(job, session)
 
-            send_project_jobs_list(msg, ctx, session=session)
+            send_project_jobs_list(msg, ctx, session=session, flush=flush)
@@ -1,5 +1,6 @@
 from common.py.core.messaging import Message, Channel
 from common.py.data.entities.project import Project
+from common.py.data.storage import StoragePool
 
 from .. import ServerServiceContext
 from ...networking.session import Session
@@ -11,24 +12,41 @@ def send_project_logbook(
     project: Project,
     *,
     session: Session | None = None,
+    flush: bool = False,
 ) -> None:
     """
     Sends the logbook of a project to the currently authenticated user.
 
+    The logbook is sent through the event coalescer, so repeated logbooks of the same project sent within a short time are collapsed.
+
     Args:
         msg: Original message for chaining.
         ctx: The service context.
         project: The project.
         session: Override the user ID and target to use using a user's session.
+        flush: Whether to send the logbook immediately.
     """
     from common.py.api.project import ProjectLogbookEvent
 
     if ctx.user is None and (session or session.user_token) is None:
         raise RuntimeError("Sending project logbook without an authenticated user")
 
-    ProjectLogbookEvent.build(
-        ctx.message_builder,
-        project_id=project.project_id,
-        logbook=project.logbook,
-        chain=msg,
-    ).emit(Channel.direct(session.user_origin if session else msg.origin))
+    project_id = project.project_id
+    target = session.user_origin if session else msg.origin
+
+    def _send(storage_pool: StoragePool) -> None:
+        if (current := storage_pool.project_storage.get(project_id)) is not None:
+            ProjectLogbookEvent.build(
+                ctx.message_builder,
+                project_id=project_id,
+                logbook=current.logbook,
+                chain=msg,
+            ).emit(Channel.direct(target))
+
+    ctx.coalesce_event(
+        target,
+        ProjectLogbookEvent,
+        _send,
+        discriminator=str(project_id),
+        flush=flush,
+    )
@@ -1,4 +1,5 @@
 from common.py.core.messaging import Message, Channel
+from common.py.data.storage import StoragePool
 
 from .. import ServerServiceContext
 from ...networking.session import Session
@@ -9,26 +10,36 @@ def send_projects_list(
     ctx: ServerServiceContext,
     *,
     session: Session | None = None,
+    flush: bool = False,
 ) -> None:
     """
-    Sends the project list to the currently authenticated user.
+    Sends the project list (consisting of project summaries) to the currently authenticated user.
+
+    The list is sent through the event coalescer, so repeated lists sent within a short time are collapsed.
 
     Args:
         msg: Original message for chaining.
         ctx: The service context.
         session: Override the user ID and target to use using a user's session.
+        flush: Whether to send the list immediately.
     """
     from common.py.api.project import ProjectsListEvent
 
     if ctx.user is None and (session or session.user_token) is None:
         raise RuntimeError("Sending projects list without an authenticated user")
 
-    ProjectsListEvent.build(
-        ctx.message_builder,
-        projects=ctx.storage_pool.project_storage.filter_by_user(
-            session.user_token.user_id
-            if session and session.user_token
-            else ctx.user.user_id
-        ),
-        chain=msg,
-    ).emit(Channel.direct(session.user_origin if session else msg.origin))
+    user_id = (
+        session.user_token.user_id
+        if session and session.user_token
+        else ctx.user.user_id
+    )
+    target = session.user_origin if session else msg.origin
+
+    def _send(storage_pool: StoragePool) -> None:
+        ProjectsListEvent.build(
+            ctx.message_builder,
+            projects=storage_pool.project_storage.filter_summaries_by_user(user_id),
+            chain=msg,
+        ).emit(Channel.direct(target))
+
+    ctx.coalesce_event(target, ProjectsListEvent, _send, flush=flush)
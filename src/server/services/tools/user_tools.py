@@ -30,7 +30,7 @@ def get_user_authorizations(
 
 
 def send_user_authorizations(
-    msg: Message,
+    msg: Message | None,
     ctx: ServerServiceContext,
     *,
     session: Session | None = None,
@@ -39,7 +39,7 @@ def send_user_authorizations(
     Sends all granted authorizations to the currently authenticated user.
 
     Args:
-        msg: Original message for chaining.
+        msg: Original message for chaining; can only be omitted if a session is provided.
         ctx: The service context.
         session: Override the user ID and target to use using a user's session.
     """
@@ -64,7 +64,7 @@ def send_user_authorizations(
 
 def handle_authorization_token_changes(
     auth_token: AuthorizationToken,
-    msg: Message,
+    msg: Message | None,
     ctx: ServerServiceContext,
 ) -> None:
     """
@@ -72,7 +72,7 @@ def handle_authorization_token_changes(
 
     Args:
         auth_token: The authorization token.
-        msg: Original message.
+        msg: Original message, if any.
         ctx: The service context.
     """
     for session in ctx.session_manager.find_user_sessions(auth_token.user_id):
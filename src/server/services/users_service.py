@@ -1,3 +1,4 @@
+from common.py.core.messaging.executors import HandlerLane
 from common.py.data.entities import clone_entity
 from common.py.data.entities.authorization import AuthorizationState
 from common.py.data.entities.user import User
@@ -36,7 +37,7 @@ def create_users_service(comp: ServerComponent) -> Service:
 
     svc = comp.create_service("Users service", context_type=ServerServiceContext)
 
-    @svc.message_handler(AuthenticateUserCommand)
+    @svc.message_handler(AuthenticateUserCommand, lane=HandlerLane.CONTROL)
     def authenticate_user(
         msg: AuthenticateUserCommand, ctx: ServerServiceContext
     ) -> None:
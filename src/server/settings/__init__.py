@@ -1,4 +1,10 @@
 from .authorization_setting_ids import AuthorizationSettingIDs
-from .storage_setting_ids import StorageSettingIDs, DatabaseStorageSettingIDs
+from .events_setting_ids import EventsSettingIDs
+from .session_setting_ids import SessionSettingIDs
+from .storage_setting_ids import (
+    StorageSettingIDs,
+    MemoryStorageSettingIDs,
+    DatabaseStorageSettingIDs,
+)
 
 from .server_settings import get_server_settings
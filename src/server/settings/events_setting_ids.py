@@ -0,0 +1,12 @@
+from common.py.utils.config import SettingID
+
+
+class EventsSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for settings regarding events sent to users.
+
+    Attributes:
+        COALESCING_WINDOW: The time window (in seconds) in which repeated list events for the same session are collapsed; set to 0 to disable (value type: ``float``).
+    """
+    COALESCING_WINDOW = SettingID("events", "coalescing_window")
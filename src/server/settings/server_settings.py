@@ -11,19 +11,44 @@ def get_server_settings() -> typing.Dict[SettingID, typing.Any]:
         A dictionary mapping the setting identifiers to their default values.
     """
     from .authorization_setting_ids import AuthorizationSettingIDs
-    from .storage_setting_ids import StorageSettingIDs, DatabaseStorageSettingIDs
+    from .events_setting_ids import EventsSettingIDs
+    from .session_setting_ids import SessionSettingIDs
+    from .storage_setting_ids import (
+        StorageSettingIDs,
+        MemoryStorageSettingIDs,
+        DatabaseStorageSettingIDs,
+    )
 
     return {
         # Authorization
         AuthorizationSettingIDs.REFRESH_ATTEMPTS_DELAY: 5,
         AuthorizationSettingIDs.REFRESH_ATTEMPTS_LIMIT: 3,
+        # Events
+        EventsSettingIDs.COALESCING_WINDOW: 0.5,
+        # Sessions
+        SessionSettingIDs.DRIVER: "memory",
+        SessionSettingIDs.IDLE_TIMEOUT: 24 * 60 * 60,
+        SessionSettingIDs.MAX_SESSIONS: 10000,
         # Storage
         StorageSettingIDs.DRIVER: "memory",
+        StorageSettingIDs.CACHE: False,
+        StorageSettingIDs.CACHE_SIZE: 10000,
+        StorageSettingIDs.CACHE_TTL: 60.0,
+        # Memory storage
+        MemoryStorageSettingIDs.PERSISTENCE_PATH: "",
+        MemoryStorageSettingIDs.SNAPSHOT_THRESHOLD: 1000,
+        MemoryStorageSettingIDs.SYNC: True,
         # Database storage
         DatabaseStorageSettingIDs.ENGINE: "sqlite",
         DatabaseStorageSettingIDs.DUMP_SQL: False,
+        DatabaseStorageSettingIDs.POOL_SIZE: 10,
+        DatabaseStorageSettingIDs.MAX_OVERFLOW: 20,
+        DatabaseStorageSettingIDs.PRE_PING: True,
+        DatabaseStorageSettingIDs.RECYCLE: 3600,
+        DatabaseStorageSettingIDs.STATEMENT_TIMEOUT: 0.0,
         # Database storage: SQLite
         DatabaseStorageSettingIDs.SQLite.FILE: ":memory:",
+        DatabaseStorageSettingIDs.SQLite.BUSY_TIMEOUT: 5.0,
         # Database storage: PostgreSQL
         DatabaseStorageSettingIDs.PostgreSQL.HOST: "",
         DatabaseStorageSettingIDs.PostgreSQL.PORT: 0,
@@ -0,0 +1,16 @@
+from common.py.utils.config import SettingID
+
+
+class SessionSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for session settings.
+
+    Attributes:
+        DRIVER: The session store to use; possible values are *memory* or *database*. The latter is required when scaling out the server across multiple processes (value type: ``string``).
+        IDLE_TIMEOUT: The time (in seconds) after which sessions that haven't been accessed are removed; set to 0 to disable (value type: ``float``).
+        MAX_SESSIONS: The maximum number of sessions to keep, removing the least recently used ones first; set to 0 to disable (value type: ``int``).
+    """
+    DRIVER = SettingID("session", "driver")
+    IDLE_TIMEOUT = SettingID("session", "idle_timeout")
+    MAX_SESSIONS = SettingID("session", "max_sessions")
@@ -8,8 +8,30 @@ class StorageSettingIDs:
 
     Attributes:
         DRIVER: The driver to use for the storage; possible values are *memory* or *database* (value type: ``string``).
+        CACHE: Whether to cache connectors, users and authorization tokens (value type: ``bool``).
+        CACHE_SIZE: The maximum number of cached entities per entity type (value type: ``int``).
+        CACHE_TTL: The time (in seconds) after which cached entities expire (value type: ``float``).
     """
     DRIVER = SettingID("storage", "driver")
+    CACHE = SettingID("storage", "cache")
+    CACHE_SIZE = SettingID("storage", "cache_size")
+    CACHE_TTL = SettingID("storage", "cache_ttl")
+
+
+class MemoryStorageSettingIDs:
+    # pylint: disable=too-few-public-methods
+    """
+    Identifiers for memory storage settings.
+
+    Attributes:
+        PERSISTENCE_PATH: The folder to persist the storage in; if empty, the storage is not persisted (value type: ``string``).
+        SNAPSHOT_THRESHOLD: The number of journal entries after which a new snapshot is written (value type: ``int``).
+        SYNC: Whether each journal entry is flushed to disk immediately (value type: ``bool``).
+    """
+
+    PERSISTENCE_PATH = SettingID("storage.memory", "persistence_path")
+    SNAPSHOT_THRESHOLD = SettingID("storage.memory", "snapshot_threshold")
+    SYNC = SettingID("storage.memory", "sync")
 
 
 class DatabaseStorageSettingIDs:
@@ -20,10 +42,20 @@ class DatabaseStorageSettingIDs:
     Attributes:
         ENGINE: The database backend to use; can be *sqlite*, *postgresql*, *mysql* or *mariadb* (value type: ``string``).
         DUMP_SQL: If enabled, SQL statements executed will be echoed (value type: ``bool``).
+        POOL_SIZE: The number of connections kept open in the connection pool (value type: ``int``).
+        MAX_OVERFLOW: The number of connections that may be opened in addition to the pool size (value type: ``int``).
+        PRE_PING: Whether to test connections for liveness before using them (value type: ``bool``).
+        RECYCLE: The time (in seconds) after which connections are replaced; 0 disables recycling (value type: ``int``).
+        STATEMENT_TIMEOUT: The maximum time (in seconds) a single statement may take; 0 disables the timeout (value type: ``float``).
     """
 
     ENGINE = SettingID("storage.database", "engine")
     DUMP_SQL = SettingID("storage.database", "dump_sql")
+    POOL_SIZE = SettingID("storage.database", "pool_size")
+    MAX_OVERFLOW = SettingID("storage.database", "max_overflow")
+    PRE_PING = SettingID("storage.database", "pre_ping")
+    RECYCLE = SettingID("storage.database", "recycle")
+    STATEMENT_TIMEOUT = SettingID("storage.database", "statement_timeout")
 
     class SQLite:
         """
@@ -31,9 +63,11 @@ class DatabaseStorageSettingIDs:
 
         Attributes:
             FILE: The (absolute) filename; if not set, an in-memory database will be used.
+            BUSY_TIMEOUT: The time (in seconds) to wait for a locked database file to become available.
         """
 
         FILE = SettingID("storage.database.sqlite", "file")
+        BUSY_TIMEOUT = SettingID("storage.database.sqlite", "busy_timeout")
 
     class PostgreSQL:
         """